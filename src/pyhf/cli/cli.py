@@ -46,6 +46,7 @@ def pyhf():
 pyhf.add_command(spec.combine)
 pyhf.add_command(spec.digest)
 pyhf.add_command(spec.sort)
+pyhf.add_command(spec.json2npz)
 
 # pyhf.add_command(infer.cli)
 pyhf.add_command(infer.fit)
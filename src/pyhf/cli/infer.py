@@ -3,11 +3,14 @@
 
 import click
 import json
+from contextlib import ExitStack
 
+from pyhf.cli.spec import _load_workspace
 from pyhf.utils import EqDelimStringParamType
 from pyhf.infer import hypotest
 from pyhf.infer import mle
-from pyhf.workspace import Workspace
+from pyhf.infer.calculators import _toy_executor
+from pyhf.pdf import ModelCache
 from pyhf import get_backend, set_backend, optimize
 
 log = logging.getLogger(__name__)
@@ -41,11 +44,16 @@ def cli():
 )
 @click.option(
     "--optimizer",
-    type=click.Choice(["scipy", "minuit"]),
+    type=click.Choice(["scipy", "minuit", "newton"]),
     help="The optimizer used for the calculation.",
     default="scipy",
 )
 @click.option("--optconf", type=EqDelimStringParamType(), multiple=True)
+@click.option(
+    "--model-cache-dir",
+    help="A directory to cache the built models in across invocations.",
+    default=None,
+)
 def fit(
     workspace,
     output_file,
@@ -55,6 +63,7 @@ def fit(
     backend,
     optimizer,
     optconf,
+    model_cache_dir,
 ):
     """
     Perform a maximum likelihood fit for a given pyhf workspace.
@@ -99,14 +108,13 @@ def fit(
         )
         set_backend(tensorlib, new_optimizer(**optconf))
 
-    with click.open_file(workspace, "r") as specstream:
-        spec = json.load(specstream)
-    ws = Workspace(spec)
+    ws = _load_workspace(workspace)
     patches = [json.loads(click.open_file(pfile, "r").read()) for pfile in patch]
 
     model = ws.model(
         measurement_name=measurement,
         patches=patches,
+        model_cache=ModelCache(cache_dir=model_cache_dir) if model_cache_dir else None,
     )
     data = ws.data(model)
 
@@ -152,11 +160,28 @@ def fit(
 )
 @click.option(
     "--optimizer",
-    type=click.Choice(["scipy", "minuit"]),
+    type=click.Choice(["scipy", "minuit", "newton"]),
     help="The optimizer used for the calculation.",
     default="scipy",
 )
 @click.option('--optconf', type=EqDelimStringParamType(), multiple=True)
+@click.option(
+    '--n-toys',
+    type=click.IntRange(min=1),
+    help='The number of toys to generate (only used with --calctype toybased).',
+    default=2000,
+)
+@click.option(
+    '--n-workers',
+    type=click.IntRange(min=1),
+    help='The number of worker processes used to fit the toys (only used with --calctype toybased).',
+    default=1,
+)
+@click.option(
+    '--model-cache-dir',
+    help='A directory to cache the built models in across invocations.',
+    default=None,
+)
 def cls(
     workspace,
     output_file,
@@ -168,6 +193,9 @@ def cls(
     optimizer,
     calctype,
     optconf,
+    n_toys,
+    n_workers,
+    model_cache_dir,
 ):
     """
     Compute CLs value(s) for a given pyhf workspace.
@@ -190,15 +218,13 @@ def cls(
             "CLs_obs": 0.3599845631401915
         }
     """
-    with click.open_file(workspace, 'r') as specstream:
-        spec = json.load(specstream)
-
-    ws = Workspace(spec)
+    ws = _load_workspace(workspace)
 
     patches = [json.loads(click.open_file(pfile, 'r').read()) for pfile in patch]
     model = ws.model(
         measurement_name=measurement,
         patches=patches,
+        model_cache=ModelCache(cache_dir=model_cache_dir) if model_cache_dir else None,
         modifier_settings={
             'normsys': {'interpcode': 'code4'},
             'histosys': {'interpcode': 'code4p'},
@@ -225,14 +251,24 @@ def cls(
         )
         set_backend(tensorlib, new_optimizer(**optconf))
 
-    result = hypotest(
-        test_poi,
-        ws.data(model),
-        model,
-        test_stat=test_stat,
-        calctype=calctype,
-        return_expected_set=True,
-    )
+    with ExitStack() as stack:
+        calculator_kwargs = {}
+        if calctype == 'toybased':
+            calculator_kwargs['ntoys'] = n_toys
+            if n_workers > 1:
+                # the workers receive the model once when they start
+                calculator_kwargs['executor'] = stack.enter_context(
+                    _toy_executor(model, max_workers=n_workers)
+                )
+        result = hypotest(
+            test_poi,
+            ws.data(model),
+            model,
+            test_stat=test_stat,
+            calctype=calctype,
+            return_expected_set=True,
+            **calculator_kwargs,
+        )
     result = {
         'CLs_obs': tensorlib.tolist(result[0]),
         'CLs_exp': [tensorlib.tolist(tensor) for tensor in result[-1]],
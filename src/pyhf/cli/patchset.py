@@ -4,8 +4,9 @@
 import click
 import json
 
+from pyhf.cli.spec import _load_workspace
 from pyhf.patchset import PatchSet
-from pyhf.workspace import Workspace
+from pyhf import utils
 
 logging.basicConfig()
 log = logging.getLogger(__name__)
@@ -79,10 +80,7 @@ def apply(background_only, patchset, name, output_file):
     Returns:
         workspace (:class:`~pyhf.workspace.Workspace`): The patched background-only workspace.
     """
-    with click.open_file(background_only, 'r') as specstream:
-        spec = json.load(specstream)
-
-    ws = Workspace(spec)
+    ws = _load_workspace(background_only)
 
     with click.open_file(patchset, 'r') as fstream:
         patchset_spec = json.load(fstream)
@@ -92,10 +90,18 @@ def apply(background_only, patchset, name, output_file):
 
     if output_file:
         with open(output_file, 'w+') as out_file:
-            json.dump(patched_ws, out_file, indent=4, sort_keys=True)
+            json.dump(
+                patched_ws,
+                out_file,
+                indent=4,
+                sort_keys=True,
+                default=utils._to_jsonable,
+            )
         log.debug(f"Written to {output_file:s}")
     else:
-        click.echo(json.dumps(patched_ws, indent=4, sort_keys=True))
+        click.echo(
+            json.dumps(patched_ws, indent=4, sort_keys=True, default=utils._to_jsonable)
+        )
 
 
 @cli.command()
@@ -111,10 +117,7 @@ def verify(background_only, patchset):
     Returns:
         None
     """
-    with click.open_file(background_only, 'r') as specstream:
-        spec = json.load(specstream)
-
-    ws = Workspace(spec)
+    ws = _load_workspace(background_only)
 
     with click.open_file(patchset, 'r') as fstream:
         patchset_spec = json.load(fstream)
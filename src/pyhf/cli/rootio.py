@@ -4,8 +4,12 @@
 import click
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from pathlib import Path
-import jsonpatch
+
+from pyhf.cli.spec import _load_workspace
+from pyhf.workspace import _apply_patch
 
 log = logging.getLogger(__name__)
 
@@ -29,7 +33,13 @@ def cli():
     default=None,
 )
 @click.option('--track-progress/--hide-progress', default=True)
-def xml2json(entrypoint_xml, basedir, output_file, track_progress):
+@click.option(
+    '--n-workers',
+    type=click.IntRange(min=1),
+    help='The number of threads used to import the channels.',
+    default=1,
+)
+def xml2json(entrypoint_xml, basedir, output_file, track_progress, n_workers):
     """Entrypoint XML: The top-level XML file for the PDF definition."""
     try:
         import uproot
@@ -43,7 +53,18 @@ def xml2json(entrypoint_xml, basedir, output_file, track_progress):
         )
     from pyhf import readxml
 
-    spec = readxml.parse(entrypoint_xml, basedir, track_progress=track_progress)
+    with ExitStack() as stack:
+        executor = (
+            stack.enter_context(ThreadPoolExecutor(max_workers=n_workers))
+            if n_workers > 1
+            else None
+        )
+        spec = readxml.parse(
+            entrypoint_xml,
+            basedir,
+            track_progress=track_progress,
+            executor=executor,
+        )
     if output_file is None:
         click.echo(json.dumps(spec, indent=4, sort_keys=True))
     else:
@@ -59,7 +80,13 @@ def xml2json(entrypoint_xml, basedir, output_file, track_progress):
 @click.option('--dataroot', default='data')
 @click.option('--resultprefix', default='FitConfig')
 @click.option('-p', '--patch', multiple=True)
-def json2xml(workspace, output_dir, specroot, dataroot, resultprefix, patch):
+@click.option(
+    '--n-workers',
+    type=click.IntRange(min=1),
+    help='The number of threads used to write the channel XML files.',
+    default=1,
+)
+def json2xml(workspace, output_dir, specroot, dataroot, resultprefix, patch, n_workers):
     """Convert pyhf JSON back to XML + ROOT files."""
     try:
         import uproot
@@ -74,21 +101,26 @@ def json2xml(workspace, output_dir, specroot, dataroot, resultprefix, patch):
     from pyhf import writexml
 
     os.makedirs(output_dir, exist_ok=True)
-    with click.open_file(workspace, 'r') as specstream:
-        spec = json.load(specstream)
-        for pfile in patch:
-            patch = json.loads(click.open_file(pfile, 'r').read())
-            spec = jsonpatch.JsonPatch(patch).apply(spec)
-        os.makedirs(Path(output_dir).joinpath(specroot), exist_ok=True)
-        os.makedirs(Path(output_dir).joinpath(dataroot), exist_ok=True)
-        with click.open_file(
-            Path(output_dir).joinpath(f'{resultprefix}.xml'), 'w'
-        ) as outstream:
-            outstream.write(
-                writexml.writexml(
-                    spec,
-                    Path(output_dir).joinpath(specroot),
-                    Path(output_dir).joinpath(dataroot),
-                    resultprefix,
-                ).decode('utf-8')
-            )
+    spec = _load_workspace(workspace)
+    for pfile in patch:
+        patch = json.loads(click.open_file(pfile, 'r').read())
+        spec = _apply_patch(spec, patch)
+    os.makedirs(Path(output_dir).joinpath(specroot), exist_ok=True)
+    os.makedirs(Path(output_dir).joinpath(dataroot), exist_ok=True)
+    with click.open_file(
+        Path(output_dir).joinpath(f'{resultprefix}.xml'), 'w'
+    ) as outstream, ExitStack() as stack:
+        executor = (
+            stack.enter_context(ThreadPoolExecutor(max_workers=n_workers))
+            if n_workers > 1
+            else None
+        )
+        outstream.write(
+            writexml.writexml(
+                spec,
+                Path(output_dir).joinpath(specroot),
+                Path(output_dir).joinpath(dataroot),
+                resultprefix,
+                executor=executor,
+            ).decode('utf-8')
+        )
@@ -3,6 +3,7 @@
 
 import click
 import json
+import zipfile
 
 from pyhf.workspace import Workspace
 from pyhf import modifiers
@@ -12,6 +13,14 @@
 log = logging.getLogger(__name__)
 
 
+def _load_workspace(workspace):
+    """Load a workspace from JSON or a columnar file written by :meth:`~pyhf.workspace.Workspace.to_npz`."""
+    if workspace != '-' and zipfile.is_zipfile(workspace):
+        return Workspace.from_npz(workspace)
+    with click.open_file(workspace, 'r') as specstream:
+        return Workspace(json.load(specstream))
+
+
 @click.group(name='spec')
 def cli():
     """Spec CLI group."""
@@ -60,10 +69,7 @@ def inspect(workspace, output_file, measurement):
         (*) Measurement            mu            (none)
 
     """
-    with click.open_file(workspace, 'r') as specstream:
-        spec = json.load(specstream)
-
-    ws = Workspace(spec)
+    ws = _load_workspace(workspace)
     default_measurement = ws.get_measurement()
 
     result = {}
@@ -189,10 +195,7 @@ def prune(
 
     See :func:`pyhf.workspace.Workspace.prune` for more information.
     """
-    with click.open_file(workspace, 'r') as specstream:
-        spec = json.load(specstream)
-
-    ws = Workspace(spec)
+    ws = _load_workspace(workspace)
     pruned_ws = ws.prune(
         channels=channel,
         samples=sample,
@@ -202,10 +205,18 @@ def prune(
     )
 
     if output_file is None:
-        click.echo(json.dumps(pruned_ws, indent=4, sort_keys=True))
+        click.echo(
+            json.dumps(pruned_ws, indent=4, sort_keys=True, default=utils._to_jsonable)
+        )
     else:
         with open(output_file, 'w+') as out_file:
-            json.dump(pruned_ws, out_file, indent=4, sort_keys=True)
+            json.dump(
+                pruned_ws,
+                out_file,
+                indent=4,
+                sort_keys=True,
+                default=utils._to_jsonable,
+            )
         log.debug(f"Written to {output_file:s}")
 
 
@@ -253,10 +264,7 @@ def rename(workspace, output_file, channel, sample, modifier, measurement):
 
     See :func:`pyhf.workspace.Workspace.rename` for more information.
     """
-    with click.open_file(workspace, 'r') as specstream:
-        spec = json.load(specstream)
-
-    ws = Workspace(spec)
+    ws = _load_workspace(workspace)
     renamed_ws = ws.rename(
         channels=dict(channel),
         samples=dict(sample),
@@ -265,10 +273,18 @@ def rename(workspace, output_file, channel, sample, modifier, measurement):
     )
 
     if output_file is None:
-        click.echo(json.dumps(renamed_ws, indent=4, sort_keys=True))
+        click.echo(
+            json.dumps(renamed_ws, indent=4, sort_keys=True, default=utils._to_jsonable)
+        )
     else:
         with open(output_file, 'w+') as out_file:
-            json.dump(renamed_ws, out_file, indent=4, sort_keys=True)
+            json.dump(
+                renamed_ws,
+                out_file,
+                indent=4,
+                sort_keys=True,
+                default=utils._to_jsonable,
+            )
         log.debug(f"Written to {output_file:s}")
 
 
@@ -298,23 +314,27 @@ def combine(workspace_one, workspace_two, join, output_file, merge_channels):
 
     See :func:`pyhf.workspace.Workspace.combine` for more information.
     """
-    with click.open_file(workspace_one, 'r') as specstream:
-        spec_one = json.load(specstream)
-
-    with click.open_file(workspace_two, 'r') as specstream:
-        spec_two = json.load(specstream)
-
-    ws_one = Workspace(spec_one)
-    ws_two = Workspace(spec_two)
+    ws_one = _load_workspace(workspace_one)
+    ws_two = _load_workspace(workspace_two)
     combined_ws = Workspace.combine(
         ws_one, ws_two, join=join, merge_channels=merge_channels
     )
 
     if output_file is None:
-        click.echo(json.dumps(combined_ws, indent=4, sort_keys=True))
+        click.echo(
+            json.dumps(
+                combined_ws, indent=4, sort_keys=True, default=utils._to_jsonable
+            )
+        )
     else:
         with open(output_file, 'w+') as out_file:
-            json.dump(combined_ws, out_file, indent=4, sort_keys=True)
+            json.dump(
+                combined_ws,
+                out_file,
+                indent=4,
+                sort_keys=True,
+                default=utils._to_jsonable,
+            )
         log.debug(f"Written to {output_file:s}")
 
 
@@ -347,10 +367,7 @@ def digest(workspace, algorithm, output_json):
         $ curl -sL https://raw.githubusercontent.com/scikit-hep/pyhf/master/docs/examples/json/2-bin_1-channel.json | pyhf digest
         sha256:dad8822af55205d60152cbe4303929042dbd9d4839012e055e7c6b6459d68d73
     """
-    with click.open_file(workspace, 'r') as specstream:
-        spec = json.load(specstream)
-
-    workspace = Workspace(spec)
+    workspace = _load_workspace(workspace)
 
     digests = {
         hash_alg: utils.digest(workspace, algorithm=hash_alg) for hash_alg in algorithm
@@ -393,15 +410,47 @@ def sort(workspace, output_file):
 
 
     """
-    with click.open_file(workspace, 'r') as specstream:
-        spec = json.load(specstream)
-
-    workspace = Workspace(spec)
+    workspace = _load_workspace(workspace)
     sorted_ws = Workspace.sorted(workspace)
 
     if output_file is None:
-        click.echo(json.dumps(sorted_ws, indent=4, sort_keys=True))
+        click.echo(
+            json.dumps(sorted_ws, indent=4, sort_keys=True, default=utils._to_jsonable)
+        )
     else:
         with open(output_file, 'w+') as out_file:
-            json.dump(sorted_ws, out_file, indent=4, sort_keys=True)
+            json.dump(
+                sorted_ws,
+                out_file,
+                indent=4,
+                sort_keys=True,
+                default=utils._to_jsonable,
+            )
         log.debug(f"Written to {output_file}")
+
+
+@cli.command()
+@click.argument('workspace', default='-')
+@click.option(
+    '--output-file',
+    help='The location of the output npz file.',
+    required=True,
+)
+def json2npz(workspace, output_file):
+    """
+    Convert the workspace to the binary columnar format.
+
+    The written file can be passed to all commands that take a workspace,
+    which then memory-map its histograms instead of parsing them from JSON.
+    See :func:`pyhf.workspace.Workspace.to_npz` for more information.
+
+    Example:
+
+    .. code-block:: shell
+
+        $ curl -sL https://raw.githubusercontent.com/scikit-hep/pyhf/master/docs/examples/json/2-bin_1-channel.json | pyhf json2npz --output-file 2-bin_1-channel.npz
+        $ pyhf fit 2-bin_1-channel.npz
+    """
+    ws = _load_workspace(workspace)
+    ws.to_npz(output_file)
+    log.debug(f"Written to {output_file}")
@@ -17,6 +17,54 @@ def _check_hypotest_prerequisites(pdf, data, init_pars, par_bounds, fixed_params
         )
 
 
+def _hypotest_results(
+    poi_test,
+    calc,
+    is_q0,
+    return_tail_probs=False,
+    return_expected=False,
+    return_expected_set=False,
+    return_calculator=False,
+):
+    """
+    Compute the :func:`hypotest` results for ``poi_test`` with an existing calculator.
+    """
+    teststat = calc.teststatistic(poi_test)
+    sig_plus_bkg_distribution, bkg_only_distribution = calc.distributions(poi_test)
+
+    tb, _ = get_backend()
+    CLsb_obs, CLb_obs, CLs_obs = tuple(
+        tb.astensor(pvalue)
+        for pvalue in calc.pvalues(
+            teststat, sig_plus_bkg_distribution, bkg_only_distribution
+        )
+    )
+    CLsb_exp, CLb_exp, CLs_exp = calc.expected_pvalues(
+        sig_plus_bkg_distribution, bkg_only_distribution
+    )
+
+    _returns = [CLsb_obs if is_q0 else CLs_obs]
+    if return_tail_probs:
+        if is_q0:
+            _returns.append([CLb_obs])
+        else:
+            _returns.append([CLsb_obs, CLb_obs])
+
+    pvalues_exp_band = [
+        tb.astensor(pvalue) for pvalue in (CLsb_exp if is_q0 else CLs_exp)
+    ]
+    if return_expected_set:
+        if return_expected:
+            _returns.append(tb.astensor(pvalues_exp_band[2]))
+        _returns.append(pvalues_exp_band)
+    elif return_expected:
+        _returns.append(tb.astensor(pvalues_exp_band[2]))
+    if return_calculator:
+        _returns.append(calc)
+    # Enforce a consistent return type of the observed CLs
+    return tuple(_returns) if len(_returns) > 1 else _returns[0]
+
+
 def hypotest(
     poi_test,
     data,
@@ -53,8 +101,20 @@ def hypotest(
         >>> CLs_exp_band
         [array(0.00260626), array(0.01382005), array(0.06445321), array(0.23525644), array(0.57303621)]
 
+        For the asymptotic calculator several values of the POI can be tested at once
+        by passing them as a 1D tensor, in which case the fixed-POI fits of all values
+        are run as a single fit of a batched model.
+
+        >>> mu_tests = pyhf.tensorlib.astensor([0.5, 1.0, 1.5])
+        >>> CLs_obs, CLs_exp_band = pyhf.infer.hypotest(
+        ...     mu_tests, data, model, return_expected_set=True, test_stat="qtilde"
+        ... )
+        >>> CLs_obs
+        array([0.31548917, 0.05251497, 0.00464804])
+
     Args:
-        poi_test (Number or Tensor): The value of the parameter of interest (POI)
+        poi_test (Number or Tensor): The value of the parameter of interest (POI),
+            or a 1D tensor of values for the asymptotic calculator
         data (Number or Tensor): The data considered
         pdf (~pyhf.pdf.Model): The statistical model adhering to the schema ``model.json``
         init_pars (:obj:`tensor` of :obj:`float`): The starting values of the model parameters for minimization.
@@ -166,42 +226,16 @@ def hypotest(
         **kwargs,
     )
 
-    teststat = calc.teststatistic(poi_test)
-    sig_plus_bkg_distribution, bkg_only_distribution = calc.distributions(poi_test)
-
-    tb, _ = get_backend()
-    CLsb_obs, CLb_obs, CLs_obs = tuple(
-        tb.astensor(pvalue)
-        for pvalue in calc.pvalues(
-            teststat, sig_plus_bkg_distribution, bkg_only_distribution
-        )
-    )
-    CLsb_exp, CLb_exp, CLs_exp = calc.expected_pvalues(
-        sig_plus_bkg_distribution, bkg_only_distribution
-    )
-
     is_q0 = kwargs.get('test_stat', 'qtilde') == 'q0'
-
-    _returns = [CLsb_obs if is_q0 else CLs_obs]
-    if return_tail_probs:
-        if is_q0:
-            _returns.append([CLb_obs])
-        else:
-            _returns.append([CLsb_obs, CLb_obs])
-
-    pvalues_exp_band = [
-        tb.astensor(pvalue) for pvalue in (CLsb_exp if is_q0 else CLs_exp)
-    ]
-    if return_expected_set:
-        if return_expected:
-            _returns.append(tb.astensor(pvalues_exp_band[2]))
-        _returns.append(pvalues_exp_band)
-    elif return_expected:
-        _returns.append(tb.astensor(pvalues_exp_band[2]))
-    if return_calculator:
-        _returns.append(calc)
-    # Enforce a consistent return type of the observed CLs
-    return tuple(_returns) if len(_returns) > 1 else _returns[0]
+    return _hypotest_results(
+        poi_test,
+        calc,
+        is_q0,
+        return_tail_probs=return_tail_probs,
+        return_expected=return_expected,
+        return_expected_set=return_expected_set,
+        return_calculator=return_calculator,
+    )
 
 
 from pyhf.infer import intervals  # noqa: F401
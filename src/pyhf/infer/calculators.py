@@ -7,13 +7,24 @@
 
 Using the calculators hypothesis tests can then be performed.
 """
-from pyhf.infer.mle import fixed_poi_fit
-from pyhf import get_backend
+from pyhf.infer.mle import (
+    _batched_fit,
+    _LRUFitResults,
+    fit,
+    fit_cache,
+    fixed_poi_fit,
+)
+from pyhf import get_backend, set_backend
+from pyhf.pdf import Model
 from pyhf.infer import utils
 import tqdm
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from dataclasses import dataclass
 import logging
+import math
+import os
+import weakref
 
 log = logging.getLogger(__name__)
 
@@ -82,6 +93,92 @@ def generate_asimov_data(
     return asimov_data
 
 
+def _batched_model(pdf, batch_size):
+    """
+    Build a copy of ``pdf`` that evaluates ``batch_size`` parameter sets at once.
+    """
+    return Model(
+        pdf._spec,
+        modifier_set=pdf.modifier_set,
+        batch_size=batch_size,
+        validate=False,
+        poi_name=pdf.config.poi_name or "",
+        modifier_settings=pdf.config.modifier_settings,
+        schema=pdf.schema,
+        version=pdf.version,
+    )
+
+
+# the models the workers of the executors of _toy_executor were initialized with
+_toy_executor_models = weakref.WeakKeyDictionary()
+_toy_worker_model = None
+# the batched copies of the model of a worker by their batch size
+_toy_worker_batched_models = {}
+
+
+def _init_toy_worker(pdf):
+    """Keep the model of the toys in a worker of a :func:`_toy_executor`."""
+    global _toy_worker_model
+    _toy_worker_model = pdf
+    _toy_worker_batched_models.clear()
+
+
+def _toy_worker_batched_model(batch_size):
+    """
+    The batched copy of the model of a worker of a :func:`_toy_executor`,
+    which is only built once for all the chunks of toys of that batch size.
+    """
+    if batch_size not in _toy_worker_batched_models:
+        _toy_worker_batched_models[batch_size] = _batched_model(
+            _toy_worker_model, batch_size
+        )
+    return _toy_worker_batched_models[batch_size]
+
+
+def _toy_executor(pdf, max_workers):
+    """
+    A :class:`~concurrent.futures.ProcessPoolExecutor` for the toys of
+    :class:`ToyCalculator` whose workers receive ``pdf`` once when they
+    start, instead of with every chunk of toys.
+    """
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_toy_worker, initargs=(pdf,)
+    )
+    _toy_executor_models[executor] = pdf
+    return executor
+
+
+def _toy_teststatistics_task(backend, calculator_kwargs, poi_test, samples):
+    """
+    Evaluate the test statistic for a chunk of toys in a worker of an executor.
+
+    A ``pdf`` of ``None`` refers to the model the worker was initialized with,
+    whose batched copies are then reused between the chunks.
+    """
+    if get_backend() != backend:
+        set_backend(*backend)
+    tensorlib, _ = get_backend()
+    worker_pdf = calculator_kwargs['pdf'] is None
+    if worker_pdf:
+        calculator_kwargs = dict(calculator_kwargs, pdf=_toy_worker_model)
+
+    samples = tensorlib.astensor(samples)
+    ntoys = tensorlib.shape(samples)[0]
+    calculator = ToyCalculator(**calculator_kwargs, ntoys=ntoys, track_progress=False)
+    if worker_pdf and calculator.batch_size:
+        calculator._batched_pdf = _toy_worker_batched_model(
+            min(calculator.batch_size, ntoys)
+        )
+    teststats = calculator._toy_teststatistics(
+        poi_test,
+        samples,
+        utils.get_test_stat(calculator.test_stat),
+        dict(disable=True),
+        desc=None,
+    )
+    return tensorlib.tolist(tensorlib.astensor(teststats))
+
+
 class AsymptoticTestStatDistribution:
     r"""
     The distribution the test statistic in the asymptotic case.
@@ -234,6 +331,10 @@ def __init__(
         r"""
         Asymptotic Calculator.
 
+        A calculator can be reused for several values of the parameter of interest.
+        The Asimov dataset and the fits that do not depend on the tested value
+        are then only computed once.
+
         Args:
             data (:obj:`tensor`): The observed data.
             pdf (~pyhf.pdf.Model): The statistical model adhering to the schema ``model.json``.
@@ -282,6 +383,14 @@ def __init__(
         self.calc_base_dist = calc_base_dist
         self.sqrtqmuA_v = None
         self.fitted_pars = None
+        self._asimov_data = None
+        self._asimov_pars = None
+        # the free fits shared between the tested POI values are the most
+        # recently used entries, while the fixed-POI fits age out
+        self._fit_cache = _LRUFitResults(maxsize=8)
+        self._batched_pdf = None
+        # whether the fixed-POI fits start from those of the previous POI value
+        self._warm_start = False
 
     def distributions(self, poi_test):
         r"""
@@ -354,7 +463,9 @@ def teststatistic(self, poi_test):
             array([0.        , 1.00304893, 0.96263365])
 
         Args:
-            poi_test (:obj:`float` or :obj:`tensor`): The value for the parameter of interest.
+            poi_test (:obj:`float` or :obj:`tensor`): The value for the parameter of interest,
+              or a 1D tensor of values whose fixed-POI fits are run as a single fit
+              of a batched model.
 
         Returns:
             Tensor: The value of the test statistic.
@@ -362,42 +473,42 @@ def teststatistic(self, poi_test):
         """
         tensorlib, _ = get_backend()
 
-        teststat_func = utils.get_test_stat(self.test_stat)
+        batched = len(tensorlib.shape(tensorlib.astensor(poi_test))) == 1
 
-        qmu_v, (mubhathat, muhatbhat) = teststat_func(
-            poi_test,
-            self.data,
-            self.pdf,
-            self.init_pars,
-            self.par_bounds,
-            self.fixed_params,
-            return_fitted_pars=True,
+        warm_start = (
+            self._warm_start
+            and not batched
+            and self.test_stat != 'q0'
+            and self.fitted_pars is not None
         )
-        sqrtqmu_v = tensorlib.sqrt(qmu_v)
-
-        asimov_mu = 1.0 if self.test_stat == 'q0' else 0.0
+        # the free fits are shared between the tested POI values
+        with fit_cache(self._fit_cache):
+            qmu_v, (mubhathat, muhatbhat) = self._profile_teststatistic(
+                poi_test,
+                self.data,
+                self.fitted_pars.fixed_poi_fit_to_data if warm_start else None,
+            )
+            sqrtqmu_v = tensorlib.sqrt(qmu_v)
 
-        asimov_data, asimov_mubhathat = generate_asimov_data(
-            asimov_mu,
-            self.data,
-            self.pdf,
-            self.init_pars,
-            self.par_bounds,
-            self.fixed_params,
-            return_fitted_pars=True,
-        )
-        qmuA_v, (mubhathat_A, muhatbhat_A) = teststat_func(
-            poi_test,
-            asimov_data,
-            self.pdf,
-            self.init_pars,
-            self.par_bounds,
-            self.fixed_params,
-            return_fitted_pars=True,
-        )
+            if self._asimov_data is None:
+                asimov_mu = 1.0 if self.test_stat == 'q0' else 0.0
+                self._asimov_data, self._asimov_pars = generate_asimov_data(
+                    asimov_mu,
+                    self.data,
+                    self.pdf,
+                    self.init_pars,
+                    self.par_bounds,
+                    self.fixed_params,
+                    return_fitted_pars=True,
+                )
+            qmuA_v, (mubhathat_A, muhatbhat_A) = self._profile_teststatistic(
+                poi_test,
+                self._asimov_data,
+                self.fitted_pars.fixed_poi_fit_to_asimov if warm_start else None,
+            )
         self.sqrtqmuA_v = tensorlib.sqrt(qmuA_v)
         self.fitted_pars = HypoTestFitResults(
-            asimov_pars=asimov_mubhathat,
+            asimov_pars=self._asimov_pars,
             free_fit_to_data=muhatbhat,
             free_fit_to_asimov=muhatbhat_A,
             fixed_poi_fit_to_data=mubhathat,
@@ -406,6 +517,14 @@ def teststatistic(self, poi_test):
 
         if self.test_stat in ["q", "q0"]:  # qmu or q0
             teststat = sqrtqmu_v - self.sqrtqmuA_v
+        elif batched:  # qtilde for several POI values
+            qmu = tensorlib.power(sqrtqmu_v, 2)
+            qmu_A = tensorlib.power(self.sqrtqmuA_v, 2)
+            teststat = tensorlib.where(
+                sqrtqmu_v < self.sqrtqmuA_v,
+                sqrtqmu_v - self.sqrtqmuA_v,
+                (qmu - qmu_A) / (2 * self.sqrtqmuA_v),
+            )
         else:  # qtilde
 
             def _true_case():
@@ -423,6 +542,100 @@ def _false_case():
             )
         return tensorlib.astensor(teststat)
 
+    def _profile_teststatistic(self, poi_test, data, fixed_poi_init_pars=None):
+        """
+        Evaluate the profile likelihood based test statistic and its fits.
+
+        For a 1D tensor of POI values the fixed-POI fits of all values are run
+        as a single fit of a batched model. The fixed-POI fit of a single POI
+        value starts from ``fixed_poi_init_pars`` if given, while the free fit
+        keeps starting from ``init_pars`` so that it is shared through the fit
+        cache.
+        """
+        tensorlib, _ = get_backend()
+        teststat_func = utils.get_test_stat(self.test_stat)
+        poi_index = self.pdf.config.poi_index
+        if fixed_poi_init_pars is not None:
+            mubhathat, fixed_poi_fit_lhood_val = fixed_poi_fit(
+                poi_test,
+                data,
+                self.pdf,
+                tensorlib.tolist(fixed_poi_init_pars),
+                self.par_bounds,
+                self.fixed_params,
+                return_fitted_val=True,
+            )
+            return self._qmu_like_from_fits(
+                poi_test, data, mubhathat, fixed_poi_fit_lhood_val
+            )
+
+        if len(tensorlib.shape(tensorlib.astensor(poi_test))) == 0:
+            return teststat_func(
+                poi_test,
+                data,
+                self.pdf,
+                self.init_pars,
+                self.par_bounds,
+                self.fixed_params,
+                return_fitted_pars=True,
+            )
+
+        poi_test = tensorlib.astensor(poi_test)
+        batch_size = tensorlib.shape(poi_test)[0]
+        if self.test_stat == 'q0':
+            # q0 tests the background-only hypothesis for every POI value
+            q0_v, fitted_pars = self._profile_teststatistic(0.0, data)
+            return tensorlib.ones((batch_size,)) * q0_v, fitted_pars
+
+        if self._batched_pdf is None or self._batched_pdf.batch_size != batch_size:
+            self._batched_pdf = _batched_model(self.pdf, batch_size)
+
+        init_pars = [[*self.init_pars] for _ in range(batch_size)]
+        for batch_init_pars, poi_value in zip(init_pars, tensorlib.tolist(poi_test)):
+            batch_init_pars[poi_index] = poi_value
+        fixed_params = [*self.fixed_params]
+        fixed_params[poi_index] = True
+
+        data = tensorlib.astensor(data)
+        mubhathat, fixed_poi_fit_lhood_val = _batched_fit(
+            tensorlib.tile(
+                tensorlib.reshape(data, (1, tensorlib.shape(data)[0])),
+                (batch_size, 1),
+            ),
+            self._batched_pdf,
+            init_pars,
+            self.par_bounds,
+            fixed_params,
+            return_fitted_val=True,
+        )
+        return self._qmu_like_from_fits(
+            poi_test, data, mubhathat, fixed_poi_fit_lhood_val
+        )
+
+    def _qmu_like_from_fits(self, poi_test, data, mubhathat, fixed_poi_fit_lhood_val):
+        """
+        Complete the fixed-POI fits with the free fit to ``data`` into the
+        clipped profile likelihood test statistic.
+        """
+        tensorlib, _ = get_backend()
+        muhatbhat, unconstrained_fit_lhood_val = fit(
+            data,
+            self.pdf,
+            self.init_pars,
+            self.par_bounds,
+            self.fixed_params,
+            return_fitted_val=True,
+        )
+        tmu_like_stat = tensorlib.clip(
+            fixed_poi_fit_lhood_val - unconstrained_fit_lhood_val, 0.0, max_value=None
+        )
+        qmu_like_stat = tensorlib.where(
+            muhatbhat[..., self.pdf.config.poi_index] > poi_test,
+            tensorlib.astensor(0.0),
+            tmu_like_stat,
+        )
+        return qmu_like_stat, (mubhathat, muhatbhat)
+
     def pvalues(self, teststat, sig_plus_bkg_distribution, bkg_only_distribution):
         r"""
         Calculate the :math:`p`-values for the observed test statistic under the
@@ -673,6 +886,8 @@ def __init__(
         test_stat="qtilde",
         ntoys=2000,
         track_progress=True,
+        batch_size=None,
+        executor=None,
     ):
         r"""
         Toy-based Calculator.
@@ -696,6 +911,15 @@ def __init__(
               the discovery test statistic :math:`q_{0}` (:func:`~pyhf.infer.test_statistics.q0`).
             ntoys (:obj:`int`): Number of toys to use (how many times to sample the underlying distributions).
             track_progress (:obj:`bool`): Whether to display the `tqdm` progress bar or not (outputs to `stderr`).
+            batch_size (:obj:`None` or :obj:`int`): Number of toys whose test statistics
+              are evaluated simultaneously with a batched copy of ``pdf``.
+              Default is ``None``, which evaluates the toys one at a time.
+            executor (:class:`concurrent.futures.Executor`): Executor (e.g. a
+              :class:`~concurrent.futures.ProcessPoolExecutor`) used to evaluate
+              chunks of toys in parallel.
+              The toys are still sampled in the calling process, so the results
+              do not depend on the number of workers.
+              Default is ``None``, which evaluates all toys in the calling process.
 
         Returns:
             ~pyhf.infer.calculators.ToyCalculator: The calculator for toy-based quantities.
@@ -709,6 +933,9 @@ def __init__(
         self.fixed_params = fixed_params or pdf.config.suggested_fixed()
         self.test_stat = test_stat
         self.track_progress = track_progress
+        self.batch_size = batch_size
+        self.executor = executor
+        self._batched_pdf = None
 
     def distributions(self, poi_test, track_progress=None):
         """
@@ -786,9 +1013,39 @@ def distributions(self, poi_test, track_progress=None):
             unit='toy',
         )
 
-        signal_teststat = []
-        for sample in tqdm.tqdm(signal_sample, **tqdm_options, desc='Signal-like'):
-            signal_teststat.append(
+        signal_teststat = self._toy_teststatistics(
+            poi_test, signal_sample, teststat_func, tqdm_options, desc='Signal-like'
+        )
+        bkg_teststat = self._toy_teststatistics(
+            poi_test, bkg_sample, teststat_func, tqdm_options, desc='Background-like'
+        )
+
+        s_plus_b = EmpiricalDistribution(tensorlib.astensor(signal_teststat))
+        b_only = EmpiricalDistribution(tensorlib.astensor(bkg_teststat))
+        return s_plus_b, b_only
+
+    def _toy_teststatistics(self, poi_test, samples, teststat_func, tqdm_options, desc):
+        """
+        Evaluate the test statistic for each of the sampled toys.
+
+        If ``batch_size`` is set the toys are processed in blocks of that size
+        with a batched copy of the model, such that the fits of a whole block
+        are performed together.
+        The last block is padded with copies of its first toy if needed.
+
+        If ``executor`` is set the toys are split into chunks that are
+        evaluated by the workers of the executor.
+        """
+        tensorlib, _ = get_backend()
+        ntoys = tensorlib.shape(samples)[0]
+
+        if self.executor is not None:
+            return self._distributed_toy_teststatistics(
+                poi_test, samples, tqdm_options, desc
+            )
+
+        if not self.batch_size:
+            return [
                 teststat_func(
                     poi_test,
                     sample,
@@ -797,24 +1054,78 @@ def distributions(self, poi_test, track_progress=None):
                     self.par_bounds,
                     self.fixed_params,
                 )
-            )
+                for sample in tqdm.tqdm(samples, **tqdm_options, desc=desc)
+            ]
 
-        bkg_teststat = []
-        for sample in tqdm.tqdm(bkg_sample, **tqdm_options, desc='Background-like'):
-            bkg_teststat.append(
-                teststat_func(
+        batch_size = min(self.batch_size, ntoys)
+        if self._batched_pdf is None or self._batched_pdf.batch_size != batch_size:
+            self._batched_pdf = _batched_model(self.pdf, batch_size)
+
+        teststats = []
+        with tqdm.tqdm(**tqdm_options, desc=desc) as progress:
+            for start in range(0, ntoys, batch_size):
+                block = samples[start : start + batch_size]
+                n_block = tensorlib.shape(block)[0]
+                if n_block < batch_size:
+                    padding = tensorlib.tile(block[:1], (batch_size - n_block, 1))
+                    block = tensorlib.concatenate([block, padding])
+                teststat = teststat_func(
                     poi_test,
-                    sample,
-                    self.pdf,
+                    block,
+                    self._batched_pdf,
                     self.init_pars,
                     self.par_bounds,
                     self.fixed_params,
                 )
-            )
+                teststats.append(teststat[:n_block])
+                progress.update(n_block)
+        return tensorlib.concatenate(teststats)
 
-        s_plus_b = EmpiricalDistribution(tensorlib.astensor(signal_teststat))
-        b_only = EmpiricalDistribution(tensorlib.astensor(bkg_teststat))
-        return s_plus_b, b_only
+    def _distributed_toy_teststatistics(self, poi_test, samples, tqdm_options, desc):
+        """
+        Evaluate the test statistic for each of the sampled toys with the executor.
+
+        The toys are split into chunks of ``batch_size`` toys, or, if no
+        ``batch_size`` is set, into about two chunks per available CPU.
+        """
+        tensorlib, optimizer = get_backend()
+        ntoys = tensorlib.shape(samples)[0]
+        chunk_size = self.batch_size or math.ceil(ntoys / (2 * (os.cpu_count() or 1)))
+
+        # the workers of a _toy_executor already have the model
+        worker_has_pdf = _toy_executor_models.get(self.executor) is self.pdf
+        calculator_kwargs = dict(
+            data=self.data,
+            pdf=None if worker_has_pdf else self.pdf,
+            init_pars=self.init_pars,
+            par_bounds=self.par_bounds,
+            fixed_params=self.fixed_params,
+            test_stat=self.test_stat,
+            batch_size=self.batch_size,
+        )
+        futures = {
+            self.executor.submit(
+                _toy_teststatistics_task,
+                (tensorlib, optimizer),
+                calculator_kwargs,
+                poi_test,
+                tensorlib.tolist(samples[start : start + chunk_size]),
+            ): start
+            for start in range(0, ntoys, chunk_size)
+        }
+
+        chunk_teststats = {}
+        with tqdm.tqdm(**tqdm_options, desc=desc) as progress:
+            for future in as_completed(futures):
+                chunk_teststats[futures[future]] = future.result()
+                progress.update(len(chunk_teststats[futures[future]]))
+        return tensorlib.astensor(
+            [
+                teststat
+                for start in sorted(chunk_teststats)
+                for teststat in chunk_teststats[start]
+            ]
+        )
 
     def pvalues(self, teststat, sig_plus_bkg_distribution, bkg_only_distribution):
         r"""
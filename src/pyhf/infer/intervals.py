@@ -1,9 +1,11 @@
 """Interval estimation"""
-from pyhf.infer import hypotest
-from pyhf import get_backend
+from pyhf.infer import _hypotest_results, hypotest
+from pyhf.infer.mle import fit_cache
+from pyhf import get_backend, set_backend
 import numpy as np
+from scipy.optimize import toms748
 
-__all__ = ["upperlimit"]
+__all__ = ["toms748_scan", "upperlimit"]
 
 
 def __dir__():
@@ -15,10 +17,224 @@ def _interp(x, xp, fp):
     return tb.astensor(np.interp(x, xp.tolist(), fp.tolist()))
 
 
-def upperlimit(data, model, scan, level=0.05, return_results=False, **hypotest_kwargs):
+def _hypotest_task(backend, poi_test, data, model, hypotest_kwargs):
+    """
+    Run :func:`~pyhf.infer.hypotest` for a single scan point in a worker of an executor.
+    """
+    if get_backend() != backend:
+        set_backend(*backend)
+    tb, _ = get_backend()
+    obs, exp = hypotest(
+        poi_test, tb.astensor(data), model, return_expected_set=True, **hypotest_kwargs
+    )
+    return tb.tolist(obs), [tb.tolist(value) for value in exp]
+
+
+def _hypotest_function(data, model, hypotest_kwargs, warm_start=False):
+    """
+    Build a function computing the :func:`~pyhf.infer.hypotest` results for a POI value.
+
+    For asymptotic calculations a single calculator is shared between the POI
+    values, so the Asimov dataset and the fits that do not depend on the tested
+    value are only computed once. With ``warm_start`` its fixed-POI fits start
+    from those of the previously tested POI value.
+    """
+    if hypotest_kwargs.get("calctype", "asymptotics") != "asymptotics":
+        return lambda poi_test: hypotest(
+            poi_test, data, model, return_expected_set=True, **hypotest_kwargs
+        )
+
+    is_q0 = hypotest_kwargs.get("test_stat", "qtilde") == "q0"
+    calc = None
+
+    def _hypotest(poi_test):
+        nonlocal calc
+        if calc is None:
+            *results, calc = hypotest(
+                poi_test,
+                data,
+                model,
+                return_expected_set=True,
+                return_calculator=True,
+                **hypotest_kwargs,
+            )
+            calc._warm_start = warm_start
+            return tuple(results)
+        return _hypotest_results(poi_test, calc, is_q0, return_expected_set=True)
+
+    return _hypotest
+
+
+def _scan(data, model, scan, executor, warm_start, hypotest_kwargs):
+    tb, optimizer = get_backend()
+    if executor is not None:
+        futures = [
+            executor.submit(
+                _hypotest_task,
+                (tb, optimizer),
+                float(mu),
+                tb.tolist(data),
+                model,
+                hypotest_kwargs,
+            )
+            for mu in scan
+        ]
+        results = [future.result() for future in futures]
+        return [
+            (tb.astensor(obs), [tb.astensor(value) for value in exp])
+            for obs, exp in results
+        ]
+
+    return list(map(_hypotest_function(data, model, hypotest_kwargs, warm_start), scan))
+
+
+def toms748_scan(
+    data,
+    model,
+    bounds_low,
+    bounds_up,
+    level=0.05,
+    atol=2e-12,
+    rtol=1e-4,
+    return_results=False,
+    **hypotest_kwargs,
+):
+    r"""
+    Calculate an upper limit interval ``(0, poi_up)`` for a single
+    Parameter of Interest (POI) by solving :math:`\mathrm{CL}_{s}(\mu) = \mathrm{level}`
+    for the observed and each of the expected :math:`\mathrm{CL}_{s}` values with
+    :func:`scipy.optimize.toms748`.
+
+    The :class:`~pyhf.infer.hypotest` results are cached and shared between the
+    six root searches, which start from the closest bracket already evaluated.
+
+    Example:
+        >>> import numpy as np
+        >>> import pyhf
+        >>> pyhf.set_backend("numpy")
+        >>> model = pyhf.simplemodels.uncorrelated_background(
+        ...     signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+        ... )
+        >>> observations = [51, 48]
+        >>> data = pyhf.tensorlib.astensor(observations + model.config.auxdata)
+        >>> obs_limit, exp_limits = pyhf.infer.intervals.toms748_scan(
+        ...     data, model, 0.0, 5.0, rtol=0.01
+        ... )
+        >>> obs_limit
+        array(1.01156939)
+        >>> exp_limits
+        [array(0.55987984), array(0.75702336), array(1.06234684), array(1.50116475), array(2.05078594)]
+
+    Args:
+        data (:obj:`tensor`): The observed data.
+        model (~pyhf.pdf.Model): The statistical model adhering to the schema ``model.json``.
+        bounds_low (:obj:`float`): Lower boundary of the search interval. It is
+         halved until the interval brackets all of the limits.
+        bounds_up (:obj:`float`): Upper boundary of the search interval. It is
+         doubled, up to the upper bound of the POI, until the interval brackets
+         all of the limits.
+        level (:obj:`float`): The threshold value of :math:`\mathrm{CL}_{s}`.
+        atol (:obj:`float`): Absolute tolerance of the root finding.
+        rtol (:obj:`float`): Relative tolerance of the root finding.
+        return_results (:obj:`bool`): Whether to return the per-point results.
+        hypotest_kwargs (:obj:`string`): Kwargs for the calls to
+         :class:`~pyhf.infer.hypotest` to configure the fits.
+
+    Returns:
+        Tuple of Tensors:
+
+            - Tensor: The observed upper limit on the POI.
+            - Tensor: The expected upper limits on the POI.
+            - Tuple of Tensors: The evaluated POI values along with the
+              :class:`~pyhf.infer.hypotest` results at each of them.
+              Only returned when ``return_results`` is ``True``.
+    """
+    tb, _ = get_backend()
+    cache = {}
+    _hypotest = _hypotest_function(data, model, hypotest_kwargs)
+
+    def f_cached(poi):
+        if poi not in cache:
+            cache[poi] = _hypotest(poi)
+        return cache[poi]
+
+    def f(poi, limit):
+        # limit == 0 is the observed limit, 1 to 5 the expected limits
+        obs, exp = f_cached(poi)
+        cls = float(obs if limit == 0 else exp[limit - 1])
+        # CLs falls off roughly like a Gaussian tail, so its logarithm is much
+        # closer to linear in the POI and the root finding converges faster
+        return np.log(max(cls, np.finfo(float).tiny)) - np.log(level)
+
+    def all_cls(poi):
+        obs, exp = f_cached(poi)
+        return np.asarray([float(value) for value in [obs, *exp]])
+
+    def best_bracket(limit):
+        pois = np.asarray(list(cache))
+        values = np.asarray([f(poi, limit) for poi in pois])
+        above, below = values >= 0, values < 0
+        return (
+            pois[above][np.argmin(values[above])],
+            pois[below][np.argmax(values[below])],
+        )
+
+    # the fits that do not depend on the tested POI value are shared
+    with fit_cache():
+        # extend the boundaries until they bracket all of the limits
+        bounds_low, bounds_up = float(bounds_low), float(bounds_up)
+        while np.any(all_cls(bounds_low) < level):
+            if bounds_low == 0.0:
+                raise ValueError(
+                    f"CLs is below {level} at the lowest POI value {bounds_low}"
+                )
+            bounds_low /= 2
+        par_bounds = (
+            hypotest_kwargs.get('par_bounds') or model.config.suggested_bounds()
+        )
+        poi_max = float(par_bounds[model.config.poi_index][1])
+        while np.any(all_cls(bounds_up) > level):
+            if bounds_up >= poi_max:
+                raise ValueError(
+                    f"CLs is above {level} at the upper bound of the POI {poi_max}"
+                )
+            bounds_up = min(bounds_up * 2, poi_max)
+
+        limits = [
+            tb.astensor(
+                toms748(f, *best_bracket(idx), args=(idx,), xtol=atol, rtol=rtol)
+            )
+            for idx in range(6)
+        ]
+    obs_limit, exp_limits = limits[0], limits[1:]
+
+    if return_results:
+        scan = sorted(cache)
+        return obs_limit, exp_limits, (tb.astensor(scan), [cache[poi] for poi in scan])
+    return obs_limit, exp_limits
+
+
+def upperlimit(
+    data,
+    model,
+    scan=None,
+    level=0.05,
+    return_results=False,
+    executor=None,
+    warm_start=False,
+    **hypotest_kwargs,
+):
     """
     Calculate an upper limit interval ``(0, poi_up)`` for a single
-    Parameter of Interest (POI) using a fixed scan through POI-space.
+    Parameter of Interest (POI) using a fixed scan through POI-space or, if
+    no ``scan`` is given, using root finding with :func:`toms748_scan` within the
+    bounds of the POI.
+
+    The scan points can either be evaluated concurrently by passing a
+    :class:`concurrent.futures.Executor` as ``executor``, or sequentially with
+    ``warm_start=True`` in which case the fixed-POI fits at each scan point are
+    started from the conditional best-fit parameters found at the previous scan
+    point.
 
     Example:
         >>> import numpy as np
@@ -41,9 +257,18 @@ def upperlimit(data, model, scan, level=0.05, return_results=False, **hypotest_k
     Args:
         data (:obj:`tensor`): The observed data.
         model (~pyhf.pdf.Model): The statistical model adhering to the schema ``model.json``.
-        scan (:obj:`iterable`): Iterable of POI values.
+        scan (:obj:`iterable` or ``None``): Iterable of POI values or ``None``
+         to use :func:`toms748_scan`.
         level (:obj:`float`): The threshold value to evaluate the interpolated results at.
         return_results (:obj:`bool`): Whether to return the per-point results.
+        executor (:class:`concurrent.futures.Executor`): An optional executor used
+         to run the :class:`~pyhf.infer.hypotest` calls of the scan points
+         concurrently.
+        warm_start (:obj:`bool`): Whether to start the fixed-POI fits of each scan
+         point from those of the previous scan point.
+         Only supported when no ``executor`` is given and only used for
+         asymptotic calculations.
+         ``executor`` and ``warm_start`` are only used together with a ``scan``.
         hypotest_kwargs (:obj:`string`): Kwargs for the calls to
          :class:`~pyhf.infer.hypotest` to configure the fits.
 
@@ -52,15 +277,34 @@ def upperlimit(data, model, scan, level=0.05, return_results=False, **hypotest_k
 
             - Tensor: The observed upper limit on the POI.
             - Tensor: The expected upper limits on the POI.
-            - Tuple of Tensors: The given ``scan`` along with the
-              :class:`~pyhf.infer.hypotest` results at each test POI.
+            - Tuple of Tensors: The given ``scan`` (or the POI values evaluated
+              by the root finding) along with the :class:`~pyhf.infer.hypotest`
+              results at each test POI.
               Only returned when ``return_results`` is ``True``.
     """
+    if scan is None:
+        if executor is not None or warm_start:
+            raise ValueError("executor and warm_start require a scan")
+        par_bounds = (
+            hypotest_kwargs.get('par_bounds') or model.config.suggested_bounds()
+        )
+        bounds = par_bounds[model.config.poi_index]
+        return toms748_scan(
+            data,
+            model,
+            bounds[0],
+            bounds[1],
+            level=level,
+            return_results=return_results,
+            **hypotest_kwargs,
+        )
+
+    if executor is not None and warm_start:
+        raise ValueError("warm_start is not supported together with an executor")
+
     tb, _ = get_backend()
-    results = [
-        hypotest(mu, data, model, return_expected_set=True, **hypotest_kwargs)
-        for mu in scan
-    ]
+    with fit_cache():
+        results = _scan(data, model, scan, executor, warm_start, hypotest_kwargs)
     obs = tb.astensor([[r[0]] for r in results])
     exp = tb.astensor([[r[1][idx] for idx in range(5)] for r in results])
 
@@ -1,14 +1,46 @@
 """Module for Maximum Likelihood Estimation."""
-from pyhf import get_backend
+import copy
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+import numpy as np
+
+from pyhf import get_backend, set_backend
+from pyhf import exceptions
 from pyhf.exceptions import UnspecifiedPOI
 
-__all__ = ["fit", "fixed_poi_fit", "twice_nll"]
+__all__ = ["fit", "fit_cache", "fixed_poi_fit", "profile_scan", "twice_nll"]
+
+_fit_results_cache = ContextVar('fit_results_cache', default=None)
 
 
 def __dir__():
     return __all__
 
 
+class _LRUFitResults(OrderedDict):
+    """
+    A :obj:`dict` of fit results for :func:`fit_cache` that keeps at most
+    ``maxsize`` entries, evicting the least recently used one.
+    """
+
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
 def twice_nll(pars, data, pdf):
     r"""
     Two times the negative log-likelihood of the model parameters, :math:`\left(\mu, \boldsymbol{\theta}\right)`, given the observed data.
@@ -53,7 +85,175 @@ def twice_nll(pars, data, pdf):
     return -2 * pdf.logpdf(pars, data)
 
 
+def _batched_twice_nll(pars, data, pdf):
+    """
+    :func:`twice_nll` of the elements of a batched model.
+
+    The parameters of all batch elements are concatenated into a single
+    flat tensor such that the independent fits of the batch can be handed to
+    the optimizer as one minimization of the sum of the returned values.
+    """
+    tensorlib, _ = get_backend()
+    pars = tensorlib.reshape(
+        tensorlib.astensor(pars), (pdf.batch_size, pdf.config.npars)
+    )
+    return twice_nll(pars, data, pdf)
+
+
+def _batched_fit(data, pdf, init_pars, par_bounds, fixed_params, **kwargs):
+    """
+    Fit every element of a batched model to its own dataset.
+
+    The batch elements share ``par_bounds`` and ``fixed_params``, and ``data``
+    has shape ``(batch_size, n_data)``. ``init_pars`` is either shared as well
+    or given per batch element with shape ``(batch_size, n_pars)``.
+    As the batch elements are independent, the sum of their objectives is
+    minimized over the concatenated parameters, which requires a single
+    (batched) likelihood evaluation per optimizer step. The
+    :class:`~pyhf.optimize.opt_newton.newton_optimizer` minimizes the batch
+    elements as independent problems, each converging on its own.
+    """
+    tensorlib, opt = get_backend()
+    batch_size, npars = pdf.batch_size, pdf.config.npars
+
+    return_fitted_val = kwargs.pop('return_fitted_val', False)
+    return_result_obj = kwargs.pop('return_result_obj', False)
+    return_uncertainties = kwargs.pop('return_uncertainties', False)
+    if kwargs.pop('return_correlations', False):
+        raise exceptions.Unsupported(
+            'Correlations are not supported for fits of batched models.'
+        )
+    if kwargs.get('hessian') == 'exact':
+        raise exceptions.Unsupported(
+            'Exact Hessians are not supported for fits of batched models.'
+        )
+
+    init_pars = tensorlib.tolist(tensorlib.astensor(init_pars))
+    if not isinstance(init_pars[0], list):
+        init_pars = [init_pars] * batch_size
+
+    fixed_vals = [
+        (batch_idx * npars + index, init)
+        for batch_idx, batch_init_pars in enumerate(init_pars)
+        for index, (init, is_fixed) in enumerate(zip(batch_init_pars, fixed_params))
+        if is_fixed
+    ]
+
+    kwargs.setdefault('do_stitch', True)
+    if opt.name == 'scipy':
+        kwargs.setdefault('method', 'L-BFGS-B')
+
+    _, result = opt.minimize(
+        _batched_twice_nll,
+        data,
+        pdf,
+        [init for batch_init_pars in init_pars for init in batch_init_pars],
+        [*par_bounds] * batch_size,
+        fixed_vals,
+        return_result_obj=True,
+        return_uncertainties=return_uncertainties,
+        **kwargs,
+    )
+
+    fitted_pars = tensorlib.reshape(
+        result.x, (batch_size, npars) + tuple(tensorlib.shape(result.x)[1:])
+    )
+    _returns = [fitted_pars]
+    if return_fitted_val:
+        bestfit_pars = fitted_pars[..., 0] if return_uncertainties else fitted_pars
+        _returns.append(twice_nll(bestfit_pars, data, pdf))
+    if return_result_obj:
+        _returns.append(result)
+    return tuple(_returns) if len(_returns) > 1 else _returns[0]
+
+
+@contextmanager
+def fit_cache(cache=None):
+    r"""
+    Context manager that caches the results of :func:`~pyhf.infer.mle.fit` and
+    :func:`~pyhf.infer.mle.fixed_poi_fit` while it is active.
+
+    Fits are keyed on the model, the data, the starting values, bounds and fixed
+    parameters, the keyword arguments, and the active backend and optimizer, so
+    a repeated fit returns the stored result instead of being rerun.
+    This allows a series of :func:`~pyhf.infer.hypotest` calls, as in a limit scan,
+    to share the fits that do not depend on the tested POI value, such as the
+    unconditional fit and the fit used to build the Asimov dataset.
+    Nested uses share the cache of the outermost one, which is cleared on exit.
+    A ``cache`` dictionary can be passed to keep the fit results beyond the
+    context when no other cache is active.
+
+    The cache is held in a :class:`~contextvars.ContextVar`, such that it is
+    only active in the thread (and :mod:`contextvars` context) that entered it.
+    Fits run in other threads or processes, e.g. through an ``executor``, do
+    not use it. Cached fit results are returned as copies, such that callers
+    can modify them.
+
+    Example:
+        >>> import pyhf
+        >>> pyhf.set_backend("numpy")
+        >>> model = pyhf.simplemodels.uncorrelated_background(
+        ...     signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+        ... )
+        >>> observations = [51, 48]
+        >>> data = pyhf.tensorlib.astensor(observations + model.config.auxdata)
+        >>> with pyhf.infer.mle.fit_cache() as cache:
+        ...     CLs_obs = [pyhf.infer.hypotest(mu, data, model) for mu in [0.5, 1.0]]
+        ...     len(cache)
+        ...
+        7
+
+    Args:
+        cache (:obj:`dict`): An optional dictionary to store the fit results in
+         if no other cache is active.
+
+    Yields:
+        :obj:`dict`: The cache of fit results.
+    """
+    active_cache = _fit_results_cache.get()
+    if active_cache is not None:
+        yield active_cache
+        return
+
+    token = _fit_results_cache.set({} if cache is None else cache)
+    try:
+        yield _fit_results_cache.get()
+    finally:
+        _fit_results_cache.reset(token)
+
+
+def _fit_cache_key(data, pdf, init_pars, par_bounds, fixed_params, kwargs):
+    tensorlib, optimizer = get_backend()
+
+    def _as_key(values):
+        if isinstance(values, list):
+            return tuple(_as_key(value) for value in values)
+        return values
+
+    key = (
+        pdf,
+        tensorlib,
+        optimizer,
+        _as_key(tensorlib.tolist(tensorlib.astensor(data))),
+        _as_key(tensorlib.tolist(tensorlib.astensor(init_pars))),
+        _as_key(tensorlib.tolist(tensorlib.astensor(par_bounds))),
+        tuple(bool(is_fixed) for is_fixed in fixed_params),
+        tuple(sorted(kwargs.items())),
+    )
+    try:
+        hash(key)
+    except TypeError:
+        # unhashable keyword arguments are not cached
+        return None
+    return key
+
+
 def _validate_fit_inputs(init_pars, par_bounds, fixed_params):
+    # batched models can be given starting values per batch element
+    if isinstance(init_pars[0], (list, tuple)):
+        for batch_init_pars in init_pars:
+            _validate_fit_inputs(batch_init_pars, par_bounds, fixed_params)
+        return
     for par_idx, (value, bound) in enumerate(zip(init_pars, par_bounds)):
         if not (bound[0] <= value <= bound[1]):
             raise ValueError(
@@ -83,6 +283,25 @@ def fit(data, pdf, init_pars=None, par_bounds=None, fixed_params=None, **kwargs)
         is returned evaluated at the best fit model parameters when the optional
         kwarg ``return_fitted_val`` is ``True``.
 
+    .. note::
+
+        For a batched model (``pdf.batch_size`` is not ``None``) ``data`` is
+        expected to have shape ``(batch_size, n_data)`` and every batch element
+        is fit to its own dataset, starting from the same ``init_pars``.
+        The fitted parameters are then returned with shape ``(batch_size, n)``
+        and the objective value with shape ``(batch_size,)``.
+
+    .. note::
+
+        With ``hessian='exact'`` the uncertainties (``return_uncertainties``)
+        and correlations (``return_correlations``) of the fitted parameters are
+        computed from the exact Hessian of :func:`twice_nll` at the best fit
+        instead of the estimate of the optimizer, which for large models is
+        considerably faster than ``HESSE`` of
+        :class:`~pyhf.optimize.opt_minuit.minuit_optimizer`.
+        The Hessian is evaluated by automatic differentiation, or analytically
+        for the numpy backend.
+
     Example:
         >>> import pyhf
         >>> pyhf.set_backend("numpy")
@@ -121,16 +340,31 @@ def fit(data, pdf, init_pars=None, par_bounds=None, fixed_params=None, **kwargs)
 
     _validate_fit_inputs(init_pars, par_bounds, fixed_params)
 
-    # get fixed vals from the model
-    fixed_vals = [
-        (index, init)
-        for index, (init, is_fixed) in enumerate(zip(init_pars, fixed_params))
-        if is_fixed
-    ]
+    cache, cache_key = _fit_results_cache.get(), None
+    if cache is not None:
+        cache_key = _fit_cache_key(
+            data, pdf, init_pars, par_bounds, fixed_params, kwargs
+        )
+        if cache_key in cache:
+            return copy.deepcopy(cache[cache_key])
+
+    if getattr(pdf, 'batch_size', None):
+        result = _batched_fit(data, pdf, init_pars, par_bounds, fixed_params, **kwargs)
+    else:
+        # get fixed vals from the model
+        fixed_vals = [
+            (index, init)
+            for index, (init, is_fixed) in enumerate(zip(init_pars, fixed_params))
+            if is_fixed
+        ]
+
+        result = opt.minimize(
+            twice_nll, data, pdf, init_pars, par_bounds, fixed_vals, **kwargs
+        )
 
-    return opt.minimize(
-        twice_nll, data, pdf, init_pars, par_bounds, fixed_vals, **kwargs
-    )
+    if cache_key is not None:
+        cache[cache_key] = copy.deepcopy(result)
+    return result
 
 
 def fixed_poi_fit(
@@ -200,3 +434,214 @@ def fixed_poi_fit(
     fixed_params[pdf.config.poi_index] = True
 
     return fit(data, pdf, init_pars, par_bounds, fixed_params, **kwargs)
+
+
+def _scan_index(pdf, par):
+    """The index of a scalar model parameter given by its index or name."""
+    if isinstance(par, int):
+        return par
+    par_names = pdf.config.par_names()
+    if par not in par_names:
+        raise ValueError(
+            f"{par} is not a scalar parameter of the model, use one of {par_names}"
+        )
+    return par_names.index(par)
+
+
+def _profile_task(
+    backend,
+    points,
+    data,
+    pdf,
+    scan_idx,
+    init_pars,
+    par_bounds,
+    fixed_params,
+    warm_start,
+    kwargs,
+):
+    """
+    Run the fits of consecutive scan points, in a worker of an executor.
+
+    Returns:
+        :obj:`list`: The pairs of the objective value and the fitted parameters.
+    """
+    if get_backend() != backend:
+        set_backend(*backend)
+    tensorlib, _ = get_backend()
+    data = tensorlib.astensor(data)
+
+    fixed_params = [*fixed_params]
+    for index in scan_idx:
+        fixed_params[index] = True
+
+    results = []
+    start_pars = init_pars
+    for point in points:
+        start_pars = [*start_pars]
+        for index, value in zip(scan_idx, point):
+            start_pars[index] = value
+        fitted_pars, fitted_val = fit(
+            data,
+            pdf,
+            start_pars,
+            par_bounds,
+            fixed_params,
+            return_fitted_val=True,
+            **kwargs,
+        )
+        results.append((tensorlib.tolist(fitted_val), tensorlib.tolist(fitted_pars)))
+        # start the fit of the next scan point from the best fit of this one
+        start_pars = tensorlib.tolist(fitted_pars) if warm_start else init_pars
+    return results
+
+
+def profile_scan(
+    pars,
+    values,
+    data,
+    pdf,
+    init_pars=None,
+    par_bounds=None,
+    fixed_params=None,
+    executor=None,
+    warm_start=True,
+    return_fitted_pars=False,
+    **kwargs,
+):
+    r"""
+    Scan the profile likelihood of one or two model parameters.
+
+    At each scan point the scanned parameters are fixed to the point and all
+    other parameters are fitted, minimizing :func:`twice_nll`.
+    With ``warm_start`` the fit of a scan point starts from the best fit of
+    a neighbouring point. The points of a 2D scan are traversed in rows of
+    alternating direction, such that consecutive points are always neighbours.
+
+    The scan can be run concurrently by passing a
+    :class:`concurrent.futures.Executor` as ``executor``, in which case the
+    rows of a 2D scan are run concurrently (each warm started along the row),
+    and the points of a 1D scan are run concurrently without warm starts.
+
+    Example:
+        >>> import pyhf
+        >>> pyhf.set_backend("numpy")
+        >>> model = pyhf.simplemodels.uncorrelated_background(
+        ...     signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+        ... )
+        >>> observations = [51, 48]
+        >>> data = pyhf.tensorlib.astensor(observations + model.config.auxdata)
+        >>> twice_nll = pyhf.infer.mle.profile_scan("mu", [0.0, 0.5, 1.0], data, model)
+        >>> twice_nll
+        array([24.98393534, 26.12582745, 28.92218013])
+        >>> twice_nll = pyhf.infer.mle.profile_scan(
+        ...     ["mu", "uncorr_bkguncrt[0]"], [[0.0, 1.0], [0.9, 1.0, 1.1]], data, model
+        ... )
+        >>> twice_nll.shape
+        (2, 3)
+
+    Args:
+        pars (:obj:`str`, :obj:`int` or :obj:`list`): The scanned parameter,
+         or a list of two scanned parameters for a 2D scan, given by their
+         names (as in :meth:`~pyhf.pdf._ModelConfig.par_names`) or indices.
+        values (:obj:`list` of :obj:`float` or :obj:`list`): The values of the
+         scanned parameter, or a list of the values of each parameter of a 2D
+         scan, which spans a grid of the scan points.
+        data: The data
+        pdf (~pyhf.pdf.Model): The statistical model adhering to the schema model.json
+        init_pars (:obj:`list` of :obj:`float`): The starting values of the model parameters for minimization.
+        par_bounds (:obj:`list` of :obj:`list`/:obj:`tuple`): The extrema of values the model parameters
+            are allowed to reach in the fit.
+            The shape should be ``(n, 2)`` for ``n`` model parameters.
+        fixed_params (:obj:`list` of :obj:`bool`): The flag to set a parameter constant to its starting
+            value during minimization.
+        executor (:class:`concurrent.futures.Executor`): An optional executor used
+         to run the fits of the scan concurrently.
+        warm_start (:obj:`bool`): Whether to start the fit of each scan point from
+         the best fit of a neighbouring point. Default is ``True``.
+        return_fitted_pars (:obj:`bool`): Return the fitted parameters at each
+         scan point. Default is off (``False``).
+        kwargs: Keyword arguments passed through to the optimizer API
+
+    Returns:
+        Tensor or Tuple of Tensors:
+
+            - Tensor: The value of :func:`twice_nll` at the scan points, with
+              the shape of the scan grid.
+            - Tensor: The fitted parameters at the scan points, with the shape
+              of the scan grid followed by the number of model parameters.
+              Only returned when ``return_fitted_pars`` is ``True``.
+    """
+    tensorlib, optimizer = get_backend()
+
+    if isinstance(pars, (str, int)):
+        pars, values = [pars], [values]
+    if len(pars) not in [1, 2] or len(values) != len(pars):
+        raise ValueError(
+            "A profile scan needs one or two parameters and their scan values"
+        )
+    scan_idx = [_scan_index(pdf, par) for par in pars]
+    values = [
+        [float(value) for value in tensorlib.tolist(tensorlib.astensor(axis))]
+        for axis in values
+    ]
+    shape = tuple(len(axis) for axis in values)
+
+    init_pars = [*(init_pars or pdf.config.suggested_init())]
+    par_bounds = [*(par_bounds or pdf.config.suggested_bounds())]
+    fixed_params = [*(fixed_params or pdf.config.suggested_fixed())]
+
+    # lines of neighbouring grid points, each run in order with warm starts
+    rows = [
+        [(*row, column) for column in range(shape[-1])]
+        for row in np.ndindex(shape[:-1])
+    ]
+    if executor is None:
+        lines = [
+            [
+                index
+                for row, line in enumerate(rows)
+                for index in line[:: 1 - 2 * (row % 2)]
+            ]
+        ]
+    elif len(shape) == 1:
+        lines = [[index] for index in rows[0]]
+    else:
+        lines = rows
+
+    task_args = (
+        tensorlib.tolist(tensorlib.astensor(data)),
+        pdf,
+        scan_idx,
+        init_pars,
+        par_bounds,
+        fixed_params,
+        warm_start,
+        kwargs,
+    )
+    line_points = [
+        [[axis[position] for axis, position in zip(values, index)] for index in line]
+        for line in lines
+    ]
+    if executor is None:
+        results = [
+            _profile_task((tensorlib, optimizer), points, *task_args)
+            for points in line_points
+        ]
+    else:
+        futures = [
+            executor.submit(_profile_task, (tensorlib, optimizer), points, *task_args)
+            for points in line_points
+        ]
+        results = [future.result() for future in futures]
+
+    twice_nll_values = np.zeros(shape)
+    fitted_pars = np.zeros(shape + (len(init_pars),))
+    for line, line_results in zip(lines, results):
+        for index, (fitted_val, pars) in zip(line, line_results):
+            twice_nll_values[index] = fitted_val
+            fitted_pars[index] = pars
+
+    if return_fitted_pars:
+        return tensorlib.astensor(twice_nll_values), tensorlib.astensor(fitted_pars)
+    return tensorlib.astensor(twice_nll_values)
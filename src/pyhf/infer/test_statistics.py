@@ -28,7 +28,9 @@ def _qmu_like(
         mu, data, pdf, init_pars, par_bounds, fixed_params, return_fitted_pars=True
     )
     qmu_like_stat = tensorlib.where(
-        muhatbhat[pdf.config.poi_index] > mu, tensorlib.astensor(0.0), tmu_like_stat
+        muhatbhat[..., pdf.config.poi_index] > mu,
+        tensorlib.astensor(0.0),
+        tmu_like_stat,
     )
     if return_fitted_pars:
         return qmu_like_stat, (mubhathat, muhatbhat)
@@ -489,7 +491,7 @@ def q0(mu, data, pdf, init_pars, par_bounds, fixed_params, return_fitted_pars=Fa
         mu, data, pdf, init_pars, par_bounds, fixed_params, return_fitted_pars=True
     )
     q0_stat = tensorlib.where(
-        muhatbhat[pdf.config.poi_index] < 0, tensorlib.astensor(0.0), tmu_like_stat
+        muhatbhat[..., pdf.config.poi_index] < 0, tensorlib.astensor(0.0), tmu_like_stat
     )
     if return_fitted_pars:
         return q0_stat, (mubhathat, muhatbhat)
@@ -1,4 +1,24 @@
 """Histogram Interpolation."""
+from contextlib import nullcontext
+
+from pyhf.tensor.manager import get_backend
+
+
+def _precompute_context():
+    """
+    The context in which the interpolators precompute the tensors for the shape
+    of the alphasets.
+
+    The precomputed tensors are kept for later calls, such that they are
+    evaluated eagerly also while a call is traced by jax (e.g. under
+    :func:`jax.jit`), rather than leaking traced values out of the trace.
+    """
+    tensorlib, _ = get_backend()
+    if tensorlib.name == 'jax':
+        import jax
+
+        return jax.ensure_compile_time_eval()
+    return nullcontext()
 
 
 def _slow_interpolator_looper(histogramssets, alphasets, func):
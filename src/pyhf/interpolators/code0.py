@@ -3,7 +3,7 @@
 import pyhf
 from pyhf.tensor.manager import get_backend
 from pyhf import events
-from pyhf.interpolators import _slow_interpolator_looper
+from pyhf.interpolators import _precompute_context, _slow_interpolator_looper
 
 log = logging.getLogger(__name__)
 
@@ -54,8 +54,9 @@ def _precompute_alphasets(self, alphasets_shape):
             return
         tensorlib, _ = get_backend()
         self.alphasets_shape = alphasets_shape
-        self.mask_on = tensorlib.ones(self.alphasets_shape)
-        self.mask_off = tensorlib.zeros(self.alphasets_shape)
+        with _precompute_context():
+            self.mask_on = tensorlib.ones(self.alphasets_shape)
+            self.mask_off = tensorlib.zeros(self.alphasets_shape)
 
     def __call__(self, alphasets):
         """Compute Interpolated Values."""
@@ -85,6 +86,32 @@ def __call__(self, alphasets):
 
         return tensorlib.where(masks, alphas_times_deltas_up, alphas_times_deltas_dn)
 
+    def derivative(self, alphasets):
+        """Compute the Derivatives of the Interpolated Values w.r.t. the alphas."""
+        tensorlib, _ = get_backend()
+        self._precompute_alphasets(tensorlib.shape(alphasets))
+        where_alphasets_positive = tensorlib.where(
+            alphasets > 0, self.mask_on, self.mask_off
+        )
+
+        slopes_up = tensorlib.einsum('sa,shb->shab', self.mask_on, self.deltas_up)
+        slopes_dn = tensorlib.einsum('sa,shb->shab', self.mask_on, self.deltas_dn)
+
+        masks = tensorlib.astensor(
+            tensorlib.einsum(
+                'sa,shb->shab', where_alphasets_positive, self.broadcast_helper
+            ),
+            dtype="bool",
+        )
+
+        return tensorlib.where(masks, slopes_up, slopes_dn)
+
+    def second_derivative(self, alphasets):
+        """Compute the Second Derivatives of the Interpolated Values w.r.t. the alphas."""
+        tensorlib, _ = get_backend()
+        self._precompute_alphasets(tensorlib.shape(alphasets))
+        return tensorlib.einsum('sa,shb->shab', self.mask_off, self.broadcast_helper)
+
 
 class _slow_code0:
     def summand(self, down, nom, up, alpha):
@@ -4,7 +4,7 @@
 import pyhf
 from pyhf.tensor.manager import get_backend
 from pyhf import events
-from pyhf.interpolators import _slow_interpolator_looper
+from pyhf.interpolators import _precompute_context, _slow_interpolator_looper
 
 log = logging.getLogger(__name__)
 
@@ -66,15 +66,15 @@ def _precompute_alphasets(self, alphasets_shape):
             return
         tensorlib, _ = get_backend()
         self.alphasets_shape = alphasets_shape
-        self.bases_up = tensorlib.einsum(
-            'sa,shb->shab', tensorlib.ones(self.alphasets_shape), self.deltas_up
-        )
-        self.bases_dn = tensorlib.einsum(
-            'sa,shb->shab', tensorlib.ones(self.alphasets_shape), self.deltas_dn
-        )
-        self.mask_on = tensorlib.ones(self.alphasets_shape)
-        self.mask_off = tensorlib.zeros(self.alphasets_shape)
-        return
+        with _precompute_context():
+            self.bases_up = tensorlib.einsum(
+                'sa,shb->shab', tensorlib.ones(self.alphasets_shape), self.deltas_up
+            )
+            self.bases_dn = tensorlib.einsum(
+                'sa,shb->shab', tensorlib.ones(self.alphasets_shape), self.deltas_dn
+            )
+            self.mask_on = tensorlib.ones(self.alphasets_shape)
+            self.mask_off = tensorlib.zeros(self.alphasets_shape)
 
     def __call__(self, alphasets):
         """Compute Interpolated Values."""
@@ -101,6 +101,56 @@ def __call__(self, alphasets):
         bases = tensorlib.where(masks, self.bases_up, self.bases_dn)
         return tensorlib.power(bases, exponents)
 
+    def derivative(self, alphasets):
+        """Compute the Derivatives of the Interpolated Values w.r.t. the alphas."""
+        tensorlib, _ = get_backend()
+        self._precompute_alphasets(tensorlib.shape(alphasets))
+        where_alphasets_positive = tensorlib.where(
+            alphasets > 0, self.mask_on, self.mask_off
+        )
+
+        exponents = tensorlib.einsum(
+            'sa,shb->shab', tensorlib.abs(alphasets), self.broadcast_helper
+        )
+        # d/dalpha base^|alpha| = sign(alpha) * log(base) * base^|alpha|
+        signs = tensorlib.einsum(
+            'sa,shb->shab',
+            2 * where_alphasets_positive - self.mask_on,
+            self.broadcast_helper,
+        )
+        masks = tensorlib.astensor(
+            tensorlib.einsum(
+                'sa,shb->shab', where_alphasets_positive, self.broadcast_helper
+            ),
+            dtype="bool",
+        )
+
+        bases = tensorlib.where(masks, self.bases_up, self.bases_dn)
+        return signs * tensorlib.log(bases) * tensorlib.power(bases, exponents)
+
+    def second_derivative(self, alphasets):
+        """Compute the Second Derivatives of the Interpolated Values w.r.t. the alphas."""
+        tensorlib, _ = get_backend()
+        self._precompute_alphasets(tensorlib.shape(alphasets))
+        where_alphasets_positive = tensorlib.where(
+            alphasets > 0, self.mask_on, self.mask_off
+        )
+
+        exponents = tensorlib.einsum(
+            'sa,shb->shab', tensorlib.abs(alphasets), self.broadcast_helper
+        )
+        masks = tensorlib.astensor(
+            tensorlib.einsum(
+                'sa,shb->shab', where_alphasets_positive, self.broadcast_helper
+            ),
+            dtype="bool",
+        )
+
+        bases = tensorlib.where(masks, self.bases_up, self.bases_dn)
+        return tensorlib.power(tensorlib.log(bases), 2) * tensorlib.power(
+            bases, exponents
+        )
+
 
 class _slow_code1:
     def product(self, down, nom, up, alpha):
@@ -3,7 +3,7 @@
 import pyhf
 from pyhf.tensor.manager import get_backend
 from pyhf import events
-from pyhf.interpolators import _slow_interpolator_looper
+from pyhf.interpolators import _precompute_context, _slow_interpolator_looper
 
 log = logging.getLogger(__name__)
 
@@ -64,8 +64,9 @@ def _precompute_alphasets(self, alphasets_shape):
             return
         tensorlib, _ = get_backend()
         self.alphasets_shape = alphasets_shape
-        self.mask_on = tensorlib.ones(self.alphasets_shape)
-        self.mask_off = tensorlib.zeros(self.alphasets_shape)
+        with _precompute_context():
+            self.mask_on = tensorlib.ones(self.alphasets_shape)
+            self.mask_off = tensorlib.zeros(self.alphasets_shape)
 
     def __call__(self, alphasets):
         """Compute Interpolated Values."""
@@ -118,6 +119,51 @@ def __call__(self, alphasets):
         #   not(alpha >= -1): fill with (b-2a)(alpha + 1)
         return tensorlib.where(masks_not_lt1, results_gt1_btwn, value_lt1)
 
+    def derivative(self, alphasets):
+        """Compute the Derivatives of the Interpolated Values w.r.t. the alphas."""
+        tensorlib, _ = get_backend()
+        self._precompute_alphasets(tensorlib.shape(alphasets))
+
+        where_alphasets_gt1 = tensorlib.where(
+            alphasets > 1, self.mask_on, self.mask_off
+        )
+        where_alphasets_not_lt1 = tensorlib.where(
+            alphasets >= -1, self.mask_on, self.mask_off
+        )
+
+        slope_gt1 = tensorlib.einsum('sa,shb->shab', self.mask_on, self.b_plus_2a)
+        slope_btwn = 2 * tensorlib.einsum(
+            'sa,shb->shab', alphasets, self.a
+        ) + tensorlib.einsum('sa,shb->shab', self.mask_on, self.b)
+        slope_lt1 = tensorlib.einsum('sa,shb->shab', self.mask_on, self.b_minus_2a)
+
+        masks_gt1 = tensorlib.astensor(
+            tensorlib.einsum(
+                'sa,shb->shab', where_alphasets_gt1, self.broadcast_helper
+            ),
+            dtype="bool",
+        )
+        masks_not_lt1 = tensorlib.astensor(
+            tensorlib.einsum(
+                'sa,shb->shab', where_alphasets_not_lt1, self.broadcast_helper
+            ),
+            dtype="bool",
+        )
+
+        results_gt1_btwn = tensorlib.where(masks_gt1, slope_gt1, slope_btwn)
+        return tensorlib.where(masks_not_lt1, results_gt1_btwn, slope_lt1)
+
+    def second_derivative(self, alphasets):
+        """Compute the Second Derivatives of the Interpolated Values w.r.t. the alphas."""
+        tensorlib, _ = get_backend()
+        self._precompute_alphasets(tensorlib.shape(alphasets))
+
+        # only the quadratic interpolation for |alpha| <= 1 is curved
+        where_alphasets_btwn = tensorlib.where(
+            tensorlib.abs(alphasets) <= 1, self.mask_on, self.mask_off
+        )
+        return 2 * tensorlib.einsum('sa,shb->shab', where_alphasets_btwn, self.a)
+
 
 class _slow_code2:
     def summand(self, down, nom, up, alpha):
@@ -4,7 +4,7 @@
 import pyhf
 from pyhf.tensor.manager import get_backend
 from pyhf import events
-from pyhf.interpolators import _slow_interpolator_looper
+from pyhf.interpolators import _precompute_context, _slow_interpolator_looper
 
 log = logging.getLogger(__name__)
 
@@ -154,18 +154,18 @@ def _precompute_alphasets(self, alphasets_shape):
             return
         tensorlib, _ = get_backend()
         self.alphasets_shape = alphasets_shape
-        self.bases_up = tensorlib.einsum(
-            'sa,shb->shab', tensorlib.ones(self.alphasets_shape), self.deltas_up
-        )
-        self.bases_dn = tensorlib.einsum(
-            'sa,shb->shab', tensorlib.ones(self.alphasets_shape), self.deltas_dn
-        )
-        self.mask_on = tensorlib.ones(self.alphasets_shape)
-        self.mask_off = tensorlib.zeros(self.alphasets_shape)
-        self.ones = tensorlib.einsum(
-            'sa,shb->shab', self.mask_on, self.broadcast_helper
-        )
-        return
+        with _precompute_context():
+            self.bases_up = tensorlib.einsum(
+                'sa,shb->shab', tensorlib.ones(self.alphasets_shape), self.deltas_up
+            )
+            self.bases_dn = tensorlib.einsum(
+                'sa,shb->shab', tensorlib.ones(self.alphasets_shape), self.deltas_dn
+            )
+            self.mask_on = tensorlib.ones(self.alphasets_shape)
+            self.mask_off = tensorlib.zeros(self.alphasets_shape)
+            self.ones = tensorlib.einsum(
+                'sa,shb->shab', self.mask_on, self.broadcast_helper
+            )
 
     def __call__(self, alphasets):
         """Compute Interpolated Values."""
@@ -236,6 +236,114 @@ def __call__(self, alphasets):
         )
         return tensorlib.power(bases, masked_exponents)
 
+    def derivative(self, alphasets):
+        """Compute the Derivatives of the Interpolated Values w.r.t. the alphas."""
+        tensorlib, _ = get_backend()
+        self._precompute_alphasets(tensorlib.shape(alphasets))
+
+        where_alphasets_gtalpha0 = tensorlib.where(
+            alphasets >= self.__alpha0, self.mask_on, self.mask_off
+        )
+        masks_gtalpha0 = tensorlib.astensor(
+            tensorlib.einsum(
+                'sa,shb->shab', where_alphasets_gtalpha0, self.broadcast_helper
+            ),
+            dtype="bool",
+        )
+
+        where_alphasets_not_ltalpha0 = tensorlib.where(
+            alphasets > -self.__alpha0, self.mask_on, self.mask_off
+        )
+        masks_not_ltalpha0 = tensorlib.astensor(
+            tensorlib.einsum(
+                'sa,shb->shab', where_alphasets_not_ltalpha0, self.broadcast_helper
+            ),
+            dtype="bool",
+        )
+
+        exponents = tensorlib.einsum(
+            'sa,shb->shab', tensorlib.abs(alphasets), self.broadcast_helper
+        )
+        # d/dalpha delta_up^alpha = log(delta_up) * delta_up^alpha
+        # d/dalpha delta_dn^(-alpha) = -log(delta_dn) * delta_dn^(-alpha)
+        slopes_up = tensorlib.log(self.bases_up) * tensorlib.power(
+            self.bases_up, exponents
+        )
+        slopes_dn = -tensorlib.log(self.bases_dn) * tensorlib.power(
+            self.bases_dn, exponents
+        )
+        # this is d/dalpha (1 + sum_i a_i alpha^i)
+        alphasets_powers = tensorlib.stack(
+            [
+                self.mask_on,
+                2 * alphasets,
+                3 * tensorlib.power(alphasets, 2),
+                4 * tensorlib.power(alphasets, 3),
+                5 * tensorlib.power(alphasets, 4),
+                6 * tensorlib.power(alphasets, 5),
+            ]
+        )
+        slopes_btwn = tensorlib.einsum(
+            'rshb,rsa->shab', self.coefficients, alphasets_powers
+        )
+
+        results_gtalpha0_btwn = tensorlib.where(masks_gtalpha0, slopes_up, slopes_btwn)
+        return tensorlib.where(masks_not_ltalpha0, results_gtalpha0_btwn, slopes_dn)
+
+    def second_derivative(self, alphasets):
+        """Compute the Second Derivatives of the Interpolated Values w.r.t. the alphas."""
+        tensorlib, _ = get_backend()
+        self._precompute_alphasets(tensorlib.shape(alphasets))
+
+        where_alphasets_gtalpha0 = tensorlib.where(
+            alphasets >= self.__alpha0, self.mask_on, self.mask_off
+        )
+        masks_gtalpha0 = tensorlib.astensor(
+            tensorlib.einsum(
+                'sa,shb->shab', where_alphasets_gtalpha0, self.broadcast_helper
+            ),
+            dtype="bool",
+        )
+
+        where_alphasets_not_ltalpha0 = tensorlib.where(
+            alphasets > -self.__alpha0, self.mask_on, self.mask_off
+        )
+        masks_not_ltalpha0 = tensorlib.astensor(
+            tensorlib.einsum(
+                'sa,shb->shab', where_alphasets_not_ltalpha0, self.broadcast_helper
+            ),
+            dtype="bool",
+        )
+
+        exponents = tensorlib.einsum(
+            'sa,shb->shab', tensorlib.abs(alphasets), self.broadcast_helper
+        )
+        curvatures_up = tensorlib.power(
+            tensorlib.log(self.bases_up), 2
+        ) * tensorlib.power(self.bases_up, exponents)
+        curvatures_dn = tensorlib.power(
+            tensorlib.log(self.bases_dn), 2
+        ) * tensorlib.power(self.bases_dn, exponents)
+        # this is d^2/dalpha^2 (1 + sum_i a_i alpha^i)
+        alphasets_powers = tensorlib.stack(
+            [
+                self.mask_off,
+                2 * self.mask_on,
+                6 * alphasets,
+                12 * tensorlib.power(alphasets, 2),
+                20 * tensorlib.power(alphasets, 3),
+                30 * tensorlib.power(alphasets, 4),
+            ]
+        )
+        curvatures_btwn = tensorlib.einsum(
+            'rshb,rsa->shab', self.coefficients, alphasets_powers
+        )
+
+        results_gtalpha0_btwn = tensorlib.where(
+            masks_gtalpha0, curvatures_up, curvatures_btwn
+        )
+        return tensorlib.where(masks_not_ltalpha0, results_gtalpha0_btwn, curvatures_dn)
+
 
 class _slow_code4:
     """
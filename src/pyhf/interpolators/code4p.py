@@ -3,7 +3,7 @@
 import pyhf
 from pyhf.tensor.manager import get_backend
 from pyhf import events
-from pyhf.interpolators import _slow_interpolator_looper
+from pyhf.interpolators import _precompute_context, _slow_interpolator_looper
 
 log = logging.getLogger(__name__)
 
@@ -51,8 +51,9 @@ def _precompute_alphasets(self, alphasets_shape):
             return
         tensorlib, _ = get_backend()
         self.alphasets_shape = alphasets_shape
-        self.mask_on = tensorlib.ones(self.alphasets_shape)
-        self.mask_off = tensorlib.zeros(self.alphasets_shape)
+        with _precompute_context():
+            self.mask_on = tensorlib.ones(self.alphasets_shape)
+            self.mask_off = tensorlib.zeros(self.alphasets_shape)
 
     def __call__(self, alphasets):
         """Compute Interpolated Values."""
@@ -114,6 +115,72 @@ def __call__(self, alphasets):
             tensorlib.where(masks_p1, alphas_times_deltas_up, deltas),
         )
 
+    def derivative(self, alphasets):
+        """Compute the Derivatives of the Interpolated Values w.r.t. the alphas."""
+        tensorlib, _ = get_backend()
+        self._precompute_alphasets(tensorlib.shape(alphasets))
+        where_alphasets_greater_p1 = tensorlib.where(
+            alphasets > 1, self.mask_on, self.mask_off
+        )
+
+        where_alphasets_smaller_m1 = tensorlib.where(
+            alphasets < -1, self.mask_on, self.mask_off
+        )
+
+        # for a > 1
+        slopes_up = tensorlib.einsum('sa,shb->shab', self.mask_on, self.deltas_up)
+
+        # for a < -1
+        slopes_dn = tensorlib.einsum('sa,shb->shab', self.mask_on, self.deltas_dn)
+
+        # for |a| < 1, the derivative of a^2 * (3a^4 - 10a^2 + 15)
+        asquare = tensorlib.power(alphasets, 2)
+        tmp1 = asquare * 18.0 - 40.0
+        tmp2 = asquare * tmp1 + 30.0
+        tmp3 = alphasets * tmp2
+
+        tmp3_times_A = tensorlib.einsum('sa,shb->shab', tmp3, self.A)
+
+        slopes = tmp3_times_A + tensorlib.einsum('sa,shb->shab', self.mask_on, self.S)
+        # end |a| < 1
+
+        masks_p1 = tensorlib.astensor(
+            tensorlib.einsum(
+                'sa,shb->shab', where_alphasets_greater_p1, self.broadcast_helper
+            ),
+            dtype='bool',
+        )
+
+        masks_m1 = tensorlib.astensor(
+            tensorlib.einsum(
+                'sa,shb->shab', where_alphasets_smaller_m1, self.broadcast_helper
+            ),
+            dtype='bool',
+        )
+
+        return tensorlib.where(
+            masks_m1,
+            slopes_dn,
+            tensorlib.where(masks_p1, slopes_up, slopes),
+        )
+
+    def second_derivative(self, alphasets):
+        """Compute the Second Derivatives of the Interpolated Values w.r.t. the alphas."""
+        tensorlib, _ = get_backend()
+        self._precompute_alphasets(tensorlib.shape(alphasets))
+
+        # only the polynomial interpolation for |alpha| <= 1 is curved
+        where_alphasets_btwn = tensorlib.where(
+            tensorlib.abs(alphasets) <= 1, self.mask_on, self.mask_off
+        )
+
+        # for |a| < 1, the second derivative of a^2 * (3a^4 - 10a^2 + 15)
+        asquare = tensorlib.power(alphasets, 2)
+        tmp1 = asquare * 90.0 - 120.0
+        tmp2 = (asquare * tmp1 + 30.0) * where_alphasets_btwn
+
+        return tensorlib.einsum('sa,shb->shab', tmp2, self.A)
+
 
 class _slow_code4p:
     def summand(self, down, nom, up, alpha):
@@ -1,3 +1,146 @@
+from itertools import accumulate
+
+import pyhf
+
+
+def _sparse_modifier_data(keys, samples, builder_data, fields):
+    """
+    Collect the (modifier, sample, bin) entries that a set of modifiers affect.
+
+    The combined modifiers act on every (modifier, sample, bin) entry of the
+    mega-channel, but most of these entries are no-ops. Only the entries set
+    in the ``mask`` of the builder data are kept, so that storage and
+    evaluation scale with the number of affected bins.
+
+    Args:
+        keys (:obj:`list`): The ``type/name`` keys of the modifiers.
+        samples (:obj:`list`): The names of the samples.
+        builder_data (:obj:`dict`): The finalized builder data of the modifiers.
+        fields (:obj:`list`): The data fields to collect for each entry.
+
+    Returns:
+        Tuple of (:obj:`dict`, Tensor, Tensor, Tensor, Tensor):
+
+            - The values of each field for the affected entries.
+            - The index of the modifier of each entry.
+            - The position of each entry among the affected bins of its
+              modifier and sample.
+            - The index of the (sample, bin) each entry modifies in the
+              flattened ``(n_samples * n_bins)`` expected data.
+            - The indices of the entries affecting each (sample, bin), shape
+              ``(n_samples, n_bins, n_overlaps)`` with ``n_overlaps`` the
+              largest number of modifiers affecting a single bin. Unused
+              slots point one past the last entry.
+    """
+    default_backend = pyhf.default_backend
+
+    n_bins = len(builder_data[keys[0]][samples[0]]['data']['mask']) if keys else 0
+    bin_indices = default_backend.astensor(range(n_bins), dtype='int')
+
+    values = {field: [] for field in fields}
+    modifier_indices = []
+    positions = []
+    # the number of entries affecting each (sample, bin) so far
+    overlaps = default_backend.zeros((len(samples) * n_bins,), dtype='int')
+    target_indices = []
+    slots = []
+    for modifier_index, key in enumerate(keys):
+        for sample_index, sample in enumerate(samples):
+            data = builder_data[key][sample]['data']
+            mask = default_backend.astensor(data['mask'], dtype='bool')
+            affected_bins = default_backend.boolean_mask(bin_indices, mask)
+            n_affected = len(affected_bins)
+            if not n_affected:
+                continue
+            for field in fields:
+                values[field].append(
+                    default_backend.boolean_mask(
+                        default_backend.astensor(data[field]), mask
+                    )
+                )
+            modifier_indices.append([modifier_index] * n_affected)
+            positions.append(range(n_affected))
+            targets = affected_bins + sample_index * n_bins
+            target_indices.append(targets)
+            slots.append(default_backend.gather(overlaps, targets))
+            overlaps[targets] += 1
+
+    def _concatenate(pieces, dtype='float'):
+        return default_backend.astensor(
+            default_backend.concatenate(pieces) if pieces else [], dtype=dtype
+        )
+
+    values = {field: _concatenate(values[field]) for field in fields}
+    modifier_indices = _concatenate(modifier_indices, dtype='int')
+    positions = _concatenate(positions, dtype='int')
+    target_indices = _concatenate(target_indices, dtype='int')
+    slots = _concatenate(slots, dtype='int')
+
+    n_entries = len(target_indices)
+    n_overlaps = max(default_backend.tolist(overlaps), default=0)
+    reduce_indices = n_entries * default_backend.ones(
+        (len(samples) * n_bins * n_overlaps,), dtype='int'
+    )
+    reduce_indices[target_indices * n_overlaps + slots] = default_backend.astensor(
+        range(n_entries), dtype='int'
+    )
+    reduce_indices = default_backend.reshape(
+        reduce_indices, (len(samples), n_bins, n_overlaps)
+    )
+    return (
+        values,
+        modifier_indices,
+        positions,
+        target_indices,
+        reduce_indices,
+    )
+
+
+def _stitch_indices(modifier_indices, target_indices, shape):
+    """
+    The index of the entry for each (modifier, sample, bin) to scatter the
+    affected entries back into the full layout of the modifiers.
+
+    Args:
+        modifier_indices (Tensor): The index of the modifier of each entry.
+        target_indices (Tensor): The index of the (sample, bin) each entry
+          modifies in the flattened ``(n_samples * n_bins)`` expected data.
+        shape (:obj:`tuple`): The ``(n_modifiers, n_samples, n_bins)`` layout.
+
+    Returns:
+        Tensor: The index of the entry for each (modifier, sample, bin), shape
+        ``(n_modifiers, n_samples, n_bins)``. Bins that are not affected point
+        one past the last entry.
+    """
+    default_backend = pyhf.default_backend
+
+    n_entries = len(target_indices)
+    n_bins = shape[-1]
+    stitch_indices = n_entries * default_backend.ones(shape, dtype='int')
+    stitch_indices[
+        modifier_indices, target_indices // n_bins, target_indices % n_bins
+    ] = default_backend.astensor(range(n_entries), dtype='int')
+    return stitch_indices
+
+
+def _entry_offsets(modifier_indices, n_modifiers):
+    """
+    The offset of the entries of each modifier, which are stored one modifier
+    after the other, followed by the number of entries.
+
+    Args:
+        modifier_indices (Tensor): The index of the modifier of each entry.
+        n_modifiers (:obj:`int`): The number of modifiers.
+
+    Returns:
+        :obj:`list`: The ``n_modifiers + 1`` offsets.
+    """
+    counts = [0] * n_modifiers
+    for modifier_index in pyhf.default_backend.tolist(modifier_indices):
+        counts[modifier_index] += 1
+    return [0, *accumulate(counts)]
+
+
 from pyhf.modifiers.histosys import histosys_builder, histosys_combined
 from pyhf.modifiers.lumi import lumi_builder, lumi_combined
 from pyhf.modifiers.normfactor import normfactor_builder, normfactor_combined
@@ -3,6 +3,7 @@
 import pyhf
 from pyhf import events, interpolators
 from pyhf.exceptions import InvalidModifier
+from pyhf.modifiers import _entry_offsets, _sparse_modifier_data, _stitch_indices
 from pyhf.parameters import ParamViewer
 from pyhf.tensor.manager import get_backend
 
@@ -29,6 +30,7 @@ def __init__(self, config):
         self.builder_data = {}
         self.config = config
         self.required_parsets = {}
+        self.nominal_rates = {}
 
     def collect(self, thismod, nom):
         lo_data = thismod['data']['lo_data'] if thismod else nom
@@ -38,19 +40,75 @@ def collect(self, thismod, nom):
         return {'lo_data': lo_data, 'hi_data': hi_data, 'mask': mask, 'nom_data': nom}
 
     def append(self, key, channel, sample, thismod, defined_samp):
-        self.builder_data.setdefault(key, {}).setdefault(sample, {}).setdefault(
-            'data', {'hi_data': [], 'lo_data': [], 'nom_data': [], 'mask': []}
-        )
+        """
+        Collect the data of a histosys modifier for a single channel and sample.
+
+        :meth:`append_all` collects the data of all channels and samples a
+        modifier affects at once.
+
+        Args:
+            key (:obj:`str`): The ``type/name`` key of the modifier.
+            channel (:obj:`str`): The name of the channel.
+            sample (:obj:`str`): The name of the sample.
+            thismod (:obj:`dict`): The modifier spec, ``None`` if the modifier
+             does not affect the sample in the channel.
+            defined_samp (:obj:`dict`): The sample spec, ``None`` if the channel
+             does not have the sample.
+        """
         nom = (
             defined_samp['data']
             if defined_samp
             else [0.0] * self.config.channel_nbins[channel]
         )
+        n_bins = sum(self.config.channel_nbins.values())
+        self.nominal_rates.setdefault(sample, [0.0] * n_bins)[
+            self.config.channel_slices[channel]
+        ] = nom
+        self._append(key, channel, sample, thismod, defined_samp, nom)
+
+    def append_all(self, modifiers, nominal_rates):
+        """
+        Collect the data of all histosys modifiers in a single pass.
+
+        Args:
+            modifiers (:obj:`list`): The ``(key, channel, sample, modifier, sample_spec)``
+             tuples of the channels and samples affected by a histosys modifier.
+            nominal_rates (:obj:`dict`): The nominal rates of each sample across all bins.
+        """
+        self.nominal_rates = nominal_rates
+        for key, channel, sample, thismod, defined_samp in modifiers:
+            self._append(
+                key, channel, sample, thismod, defined_samp, defined_samp['data']
+            )
+
+    def _append(self, key, channel, sample, thismod, defined_samp, nom):
+        modifier = self.builder_data.setdefault(key, {})
+        if sample not in modifier:
+            nominal = self.nominal_rates[sample]
+            modifier[sample] = {
+                'data': {
+                    'lo_data': list(nominal),
+                    'hi_data': list(nominal),
+                    'mask': [False] * len(nominal),
+                }
+            }
+        data = modifier[sample]['data']
+
         moddata = self.collect(thismod, nom)
-        self.builder_data[key][sample]['data']['lo_data'].append(moddata['lo_data'])
-        self.builder_data[key][sample]['data']['hi_data'].append(moddata['hi_data'])
-        self.builder_data[key][sample]['data']['nom_data'].append(moddata['nom_data'])
-        self.builder_data[key][sample]['data']['mask'].append(moddata['mask'])
+        n_bins = self.config.channel_nbins[channel]
+        lo_data = moddata['lo_data']
+        hi_data = moddata['hi_data']
+        if not n_bins == len(lo_data) == len(hi_data):
+            raise InvalidModifier(
+                f"The '{sample}' sample {thismod['type']} modifier"
+                + f" '{thismod['name']}' has data shape inconsistent with the sample.\n"
+                + f"{sample} has 'data' of length {n_bins} but {thismod['name']}"
+                + f" has 'lo_data' of length {len(lo_data)} and 'hi_data' of length {len(hi_data)}."
+            )
+        bins = self.config.channel_slices[channel]
+        data['lo_data'][bins] = lo_data
+        data['hi_data'][bins] = hi_data
+        data['mask'][bins] = moddata['mask']
 
         if thismod:
             self.required_parsets.setdefault(
@@ -61,35 +119,40 @@ def append(self, key, channel, sample, thismod, defined_samp):
     def finalize(self):
         default_backend = pyhf.default_backend
 
-        for modifier_name, modifier in self.builder_data.items():
-            for sample_name, sample in modifier.items():
-                sample["data"]["mask"] = default_backend.concatenate(
-                    sample["data"]["mask"]
-                )
-                sample["data"]["lo_data"] = default_backend.concatenate(
-                    sample["data"]["lo_data"]
-                )
-                sample["data"]["hi_data"] = default_backend.concatenate(
-                    sample["data"]["hi_data"]
-                )
-                sample["data"]["nom_data"] = default_backend.concatenate(
-                    sample["data"]["nom_data"]
-                )
-                if (
-                    not len(sample["data"]["nom_data"])
-                    == len(sample["data"]["lo_data"])
-                    == len(sample["data"]["hi_data"])
-                ):
-                    _modifier_type, _modifier_name = modifier_name.split("/")
-                    _sample_data_len = len(sample["data"]["nom_data"])
-                    _lo_data_len = len(sample["data"]["lo_data"])
-                    _hi_data_len = len(sample["data"]["hi_data"])
-                    raise InvalidModifier(
-                        f"The '{sample_name}' sample {_modifier_type} modifier"
-                        + f" '{_modifier_name}' has data shape inconsistent with the sample.\n"
-                        + f"{sample_name} has 'data' of length {_sample_data_len} but {_modifier_name}"
-                        + f" has 'lo_data' of length {_lo_data_len} and 'hi_data' of length {_hi_data_len}."
-                    )
+        # samples a modifier does not affect all share the same no-op data
+        nominal = {
+            sample: default_backend.astensor(self.nominal_rates[sample])
+            for sample in self.config.samples
+        }
+        no_mask = default_backend.astensor(
+            [False] * sum(self.config.channel_nbins.values()), dtype='bool'
+        )
+
+        keys = [f'{mtype}/{m}' for m, mtype in self.config.modifiers]
+        builder_data = {}
+        for key in keys:
+            if key not in self.builder_data:
+                continue
+            modifier = self.builder_data[key]
+            builder_data[key] = {}
+            for sample in self.config.samples:
+                if sample not in modifier:
+                    data = {
+                        'lo_data': nominal[sample],
+                        'hi_data': nominal[sample],
+                        'nom_data': nominal[sample],
+                        'mask': no_mask,
+                    }
+                else:
+                    data = modifier[sample]['data']
+                    data = {
+                        'lo_data': default_backend.astensor(data['lo_data']),
+                        'hi_data': default_backend.astensor(data['hi_data']),
+                        'nom_data': nominal[sample],
+                        'mask': default_backend.astensor(data['mask'], dtype='bool'),
+                    }
+                builder_data[key][sample] = {'data': data}
+        self.builder_data = builder_data
         return self.builder_data
 
 
@@ -100,6 +163,8 @@ class histosys_combined:
     def __init__(
         self, modifiers, pdfconfig, builder_data, interpcode='code0', batch_size=None
     ):
+        default_backend = pyhf.default_backend
+
         self.batch_size = batch_size
         self.interpcode = interpcode
         assert self.interpcode in ['code0', 'code2', 'code4p']
@@ -116,21 +181,32 @@ def __init__(
             parfield_shape, pdfconfig.par_map, histosys_mods
         )
 
-        self._histosys_histoset = [
-            [
+        # only the bins a modifier affects are stored and interpolated, each
+        # as its own single-bin histogram set
+        (
+            histosys_data,
+            self._modifier_indices,
+            _,
+            self._target_indices,
+            self._reduce_indices,
+        ) = _sparse_modifier_data(
+            keys, pdfconfig.samples, builder_data, ['lo_data', 'nom_data', 'hi_data']
+        )
+        self._stitch_shape = (len(keys),) + tuple(
+            default_backend.shape(self._reduce_indices)[:2]
+        )
+        self._entry_offsets = _entry_offsets(self._modifier_indices, len(keys))
+        self._histosys_histoset = default_backend.reshape(
+            default_backend.stack(
                 [
-                    builder_data[m][s]['data']['lo_data'],
-                    builder_data[m][s]['data']['nom_data'],
-                    builder_data[m][s]['data']['hi_data'],
-                ]
-                for s in pdfconfig.samples
-            ]
-            for m in keys
-        ]
-        self._histosys_mask = [
-            [[builder_data[m][s]['data']['mask']] for s in pdfconfig.samples]
-            for m in keys
-        ]
+                    histosys_data['lo_data'],
+                    histosys_data['nom_data'],
+                    histosys_data['hi_data'],
+                ],
+                axis=1,
+            ),
+            (-1, 1, 3, 1),
+        )
 
         if histosys_mods:
             self.interpolator = getattr(interpolators, self.interpcode)(
@@ -144,12 +220,68 @@ def _precompute(self):
         if not self.param_viewer.index_selection:
             return
         tensorlib, _ = get_backend()
-        self.histosys_mask = tensorlib.astensor(self._histosys_mask, dtype="bool")
-        self.histosys_default = tensorlib.zeros(self.histosys_mask.shape)
+        self.modifier_indices = tensorlib.astensor(self._modifier_indices, dtype='int')
+        # built on the first call of apply, see _stitch_indices
+        self.stitch_indices = None
+        # the interpolators of the bins of single modifiers, see _entry_modifications
+        self._modifier_interpolators = {}
+        self.reduce_indices = tensorlib.astensor(self._reduce_indices, dtype='int')
+        self.histosys_default = tensorlib.zeros((1, self.batch_size or 1))
         if self.batch_size is None:
             self.indices = tensorlib.reshape(
                 self.param_viewer.indices_concatenated, (-1, 1)
             )
+        self.target_indices = tensorlib.astensor(self._target_indices, dtype='int')
+        # the index of the parameter of each affected bin in the flattened
+        # parameters, shape (n_entries, n_alphas)
+        self.parameter_indices = tensorlib.gather(
+            self.indices
+            if self.batch_size is None
+            else self.param_viewer.indices_concatenated,
+            self.modifier_indices,
+        )
+
+    def _entry_alphaset(self, pars):
+        """
+        Returns:
+            alphaset tensor: Shape (n_entries, n_alphas), the parameter values
+            of the affected bins
+        """
+        tensorlib, _ = get_backend()
+        if self.batch_size is None:
+            histosys_alphaset = self.param_viewer.get(pars, self.indices)
+        else:
+            histosys_alphaset = self.param_viewer.get(pars)
+        return tensorlib.gather(histosys_alphaset, self.modifier_indices)
+
+    def _entry_modifications(self, pars, modifier_index=None):
+        """
+        Returns:
+            modification tensor: Shape (n_entries + 1, n_alphas), the
+            modifications of the affected bins followed by the no-op, or if
+            ``modifier_index`` is given, shape (n_modifier_entries, n_alphas),
+            the modifications of the bins affected by that modifier only
+        """
+        tensorlib, _ = get_backend()
+        # interpolate only the affected bins
+        entry_alphaset = self._entry_alphaset(pars)
+        if modifier_index is not None:
+            start, stop = self._entry_offsets[modifier_index : modifier_index + 2]
+            entry_alphaset = entry_alphaset[start:stop]
+            if start == stop:
+                return entry_alphaset
+            if modifier_index not in self._modifier_interpolators:
+                self._modifier_interpolators[modifier_index] = getattr(
+                    interpolators, self.interpcode
+                )(self._histosys_histoset[start:stop], subscribe=False)
+            return tensorlib.reshape(
+                self._modifier_interpolators[modifier_index](entry_alphaset),
+                tensorlib.shape(entry_alphaset),
+            )
+        results_histo = tensorlib.reshape(
+            self.interpolator(entry_alphaset), tensorlib.shape(entry_alphaset)
+        )
+        return tensorlib.concatenate([results_histo, self.histosys_default])
 
     def apply(self, pars):
         """
@@ -160,14 +292,83 @@ def apply(self, pars):
             return
 
         tensorlib, _ = get_backend()
-        if self.batch_size is None:
-            histosys_alphaset = self.param_viewer.get(pars, self.indices)
-        else:
-            histosys_alphaset = self.param_viewer.get(pars)
+        # scatter the affected bins back into the full (modifier, sample, bin)
+        # layout with the no-op elsewhere
+        if self.stitch_indices is None:
+            self.stitch_indices = tensorlib.astensor(
+                _stitch_indices(
+                    self._modifier_indices, self._target_indices, self._stitch_shape
+                ),
+                dtype='int',
+            )
+        results_histo = tensorlib.gather(
+            self._entry_modifications(pars), self.stitch_indices
+        )
+        return tensorlib.einsum('msba->msab', results_histo)
+
+    def apply_reduced(self, pars):
+        """
+        Returns:
+            modification tensor: Shape (n_global_samples, n_alphas, n_global_bin),
+            the modifications of all histosys modifiers summed
+        """
+        if not self.param_viewer.index_selection:
+            return
+
+        return self._reduce_entries(self._entry_modifications(pars))
+
+    def _reduce_entries(self, entry_modifications):
+        """
+        Args:
+            entry_modifications (:obj:`tensor`): Shape (n_entries + 1, n_alphas),
+             the modifications of the affected bins followed by the no-op
+
+        Returns:
+            modification tensor: Shape (n_global_samples, n_alphas, n_global_bin),
+            the modifications of all histosys modifiers summed
+        """
+        tensorlib, _ = get_backend()
+        results_histo = tensorlib.gather(entry_modifications, self.reduce_indices)
+        return tensorlib.einsum('sbka->sab', results_histo)
 
-        results_histo = self.interpolator(histosys_alphaset)
-        # either rely on numerical no-op or force with line below
-        results_histo = tensorlib.where(
-            self.histosys_mask, results_histo, self.histosys_default
+    def gradient_entries(self, pars):
+        """
+        The modifications of the affected bins and their derivatives w.r.t.
+        the parameter of each bin, see ``target_indices`` and
+        ``parameter_indices`` for the bins and parameters.
+
+        Returns:
+            Tuple of modification tensors: Shapes (n_entries, n_alphas)
+        """
+        if not self.param_viewer.index_selection:
+            return
+
+        tensorlib, _ = get_backend()
+        entry_alphaset = self._entry_alphaset(pars)
+        shape = tensorlib.shape(entry_alphaset)
+        return (
+            tensorlib.reshape(self.interpolator(entry_alphaset), shape),
+            tensorlib.reshape(self.interpolator.derivative(entry_alphaset), shape),
+        )
+
+    def hessian_entries(self, pars):
+        """
+        The modifications of the affected bins and their first and second
+        derivatives w.r.t. the parameter of each bin, see ``gradient_entries``.
+
+        Returns:
+            Tuple of modification tensors: Shapes (n_entries, n_alphas)
+        """
+        if not self.param_viewer.index_selection:
+            return
+
+        tensorlib, _ = get_backend()
+        entry_alphaset = self._entry_alphaset(pars)
+        shape = tensorlib.shape(entry_alphaset)
+        return (
+            tensorlib.reshape(self.interpolator(entry_alphaset), shape),
+            tensorlib.reshape(self.interpolator.derivative(entry_alphaset), shape),
+            tensorlib.reshape(
+                self.interpolator.second_derivative(entry_alphaset), shape
+            ),
         )
-        return results_histo
@@ -1,6 +1,8 @@
 import logging
 
+import pyhf
 from pyhf import get_backend, events
+from pyhf.modifiers import _sparse_modifier_data
 from pyhf.parameters import ParamViewer
 
 log = logging.getLogger(__name__)
@@ -32,16 +34,52 @@ def collect(self, thismod, nom):
         return {'mask': mask}
 
     def append(self, key, channel, sample, thismod, defined_samp):
-        self.builder_data.setdefault(key, {}).setdefault(sample, {}).setdefault(
-            'data', {'mask': []}
-        )
+        """
+        Collect the data of a normfactor modifier for a single channel and sample.
+
+        :meth:`append_all` collects the data of all channels and samples a
+        modifier affects at once.
+
+        Args:
+            key (:obj:`str`): The ``type/name`` key of the modifier.
+            channel (:obj:`str`): The name of the channel.
+            sample (:obj:`str`): The name of the sample.
+            thismod (:obj:`dict`): The modifier spec, ``None`` if the modifier
+             does not affect the sample in the channel.
+            defined_samp (:obj:`dict`): The sample spec, ``None`` if the channel
+             does not have the sample.
+        """
         nom = (
             defined_samp['data']
             if defined_samp
             else [0.0] * self.config.channel_nbins[channel]
         )
+        self._append(key, channel, sample, thismod, defined_samp, nom)
+
+    def append_all(self, modifiers, nominal_rates):
+        """
+        Collect the data of all normfactor modifiers in a single pass.
+
+        Args:
+            modifiers (:obj:`list`): The ``(key, channel, sample, modifier, sample_spec)``
+             tuples of the channels and samples affected by a normfactor modifier.
+            nominal_rates (:obj:`dict`): The nominal rates of each sample across all bins.
+        """
+        for key, channel, sample, thismod, defined_samp in modifiers:
+            self._append(
+                key, channel, sample, thismod, defined_samp, defined_samp['data']
+            )
+
+    def _append(self, key, channel, sample, thismod, defined_samp, nom):
+        modifier = self.builder_data.setdefault(key, {})
+        if sample not in modifier:
+            n_bins = sum(self.config.channel_nbins.values())
+            modifier[sample] = {'data': {'mask': [False] * n_bins}}
         moddata = self.collect(thismod, nom)
-        self.builder_data[key][sample]['data']['mask'] += moddata['mask']
+        modifier[sample]['data']['mask'][self.config.channel_slices[channel]] = moddata[
+            'mask'
+        ]
+
         if thismod:
             self.required_parsets.setdefault(
                 thismod['name'],
@@ -49,6 +87,32 @@ def append(self, key, channel, sample, thismod, defined_samp):
             )
 
     def finalize(self):
+        default_backend = pyhf.default_backend
+
+        # samples a modifier does not affect all share the same no-op mask
+        no_mask = default_backend.astensor(
+            [False] * sum(self.config.channel_nbins.values()), dtype='bool'
+        )
+
+        keys = [f'{mtype}/{m}' for m, mtype in self.config.modifiers]
+        builder_data = {}
+        for key in keys:
+            if key not in self.builder_data:
+                continue
+            modifier = self.builder_data[key]
+            builder_data[key] = {
+                sample: {
+                    'data': {
+                        'mask': default_backend.astensor(
+                            modifier[sample]['data']['mask'], dtype='bool'
+                        )
+                        if sample in modifier
+                        else no_mask
+                    }
+                }
+                for sample in self.config.samples
+            }
+        self.builder_data = builder_data
         return self.builder_data
 
 
@@ -75,6 +139,14 @@ def __init__(self, modifiers, pdfconfig, builder_data, batch_size=None):
             [[builder_data[m][s]['data']['mask']] for s in pdfconfig.samples]
             for m in keys
         ]
+        # the (modifier, sample, bin) entries the modifiers affect
+        (
+            _,
+            self._modifier_indices,
+            _,
+            self._target_indices,
+            _,
+        ) = _sparse_modifier_data(keys, pdfconfig.samples, builder_data, [])
         self._precompute()
         events.subscribe('tensorlib_changed')(self._precompute)
 
@@ -89,6 +161,15 @@ def _precompute(self):
             self.normfactor_mask, dtype="bool"
         )
         self.normfactor_default = tensorlib.ones(self.normfactor_mask.shape)
+        self.target_indices = tensorlib.astensor(self._target_indices, dtype='int')
+        # the index of the parameter of each affected bin in the flattened
+        # parameters, shape (n_entries, n_alphas)
+        self.parameter_indices = tensorlib.gather(
+            tensorlib.reshape(self.param_viewer.indices_concatenated, (-1, 1))
+            if self.batch_size is None
+            else self.param_viewer.indices_concatenated,
+            tensorlib.astensor(self._modifier_indices, dtype='int'),
+        )
 
     def apply(self, pars):
         """
@@ -113,3 +194,38 @@ def apply(self, pars):
             self.normfactor_mask_bool, results_normfactor, self.normfactor_default
         )
         return results_normfactor
+
+    def gradient_entries(self, pars):
+        """
+        The modifications of the affected bins and their derivatives w.r.t.
+        the parameter of each bin, see ``target_indices`` and
+        ``parameter_indices`` for the bins and parameters.
+
+        Returns:
+            Tuple of modification tensors: Shapes (n_entries, n_alphas)
+        """
+        if not self.param_viewer.index_selection:
+            return
+
+        tensorlib, _ = get_backend()
+        if self.batch_size is None:
+            flat_pars = pars
+        else:
+            flat_pars = tensorlib.reshape(pars, (-1,))
+        results_normfactor = tensorlib.gather(flat_pars, self.parameter_indices)
+        return results_normfactor, tensorlib.ones(tensorlib.shape(results_normfactor))
+
+    def hessian_entries(self, pars):
+        """
+        The modifications of the affected bins and their first and second
+        derivatives w.r.t. the parameter of each bin, see ``gradient_entries``.
+
+        Returns:
+            Tuple of modification tensors: Shapes (n_entries, n_alphas)
+        """
+        if not self.param_viewer.index_selection:
+            return
+
+        tensorlib, _ = get_backend()
+        values, derivatives = self.gradient_entries(pars)
+        return values, derivatives, tensorlib.zeros(tensorlib.shape(values))
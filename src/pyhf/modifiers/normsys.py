@@ -1,7 +1,9 @@
 import logging
 
+import pyhf
 from pyhf import get_backend, events
 from pyhf import interpolators
+from pyhf.modifiers import _entry_offsets, _sparse_modifier_data, _stitch_indices
 from pyhf.parameters import ParamViewer
 
 log = logging.getLogger(__name__)
@@ -39,20 +41,60 @@ def collect(self, thismod, nom):
         return {'lo': lo, 'hi': hi, 'mask': mask, 'nom_data': nom_data}
 
     def append(self, key, channel, sample, thismod, defined_samp):
-        self.builder_data.setdefault(key, {}).setdefault(sample, {}).setdefault(
-            'data', {'hi': [], 'lo': [], 'nom_data': [], 'mask': []}
-        )
+        """
+        Collect the data of a normsys modifier for a single channel and sample.
+
+        :meth:`append_all` collects the data of all channels and samples a
+        modifier affects at once.
 
+        Args:
+            key (:obj:`str`): The ``type/name`` key of the modifier.
+            channel (:obj:`str`): The name of the channel.
+            sample (:obj:`str`): The name of the sample.
+            thismod (:obj:`dict`): The modifier spec, ``None`` if the modifier
+             does not affect the sample in the channel.
+            defined_samp (:obj:`dict`): The sample spec, ``None`` if the channel
+             does not have the sample.
+        """
         nom = (
             defined_samp['data']
             if defined_samp
             else [0.0] * self.config.channel_nbins[channel]
         )
+        self._append(key, channel, sample, thismod, defined_samp, nom)
+
+    def append_all(self, modifiers, nominal_rates):
+        """
+        Collect the data of all normsys modifiers in a single pass.
+
+        Args:
+            modifiers (:obj:`list`): The ``(key, channel, sample, modifier, sample_spec)``
+             tuples of the channels and samples affected by a normsys modifier.
+            nominal_rates (:obj:`dict`): The nominal rates of each sample across all bins.
+        """
+        for key, channel, sample, thismod, defined_samp in modifiers:
+            self._append(
+                key, channel, sample, thismod, defined_samp, defined_samp['data']
+            )
+
+    def _append(self, key, channel, sample, thismod, defined_samp, nom):
+        modifier = self.builder_data.setdefault(key, {})
+        if sample not in modifier:
+            n_bins = sum(self.config.channel_nbins.values())
+            modifier[sample] = {
+                'data': {
+                    'hi': [1.0] * n_bins,
+                    'lo': [1.0] * n_bins,
+                    'mask': [False] * n_bins,
+                }
+            }
+        data = modifier[sample]['data']
+
         moddata = self.collect(thismod, nom)
-        self.builder_data[key][sample]['data']['nom_data'] += moddata['nom_data']
-        self.builder_data[key][sample]['data']['lo'] += moddata['lo']
-        self.builder_data[key][sample]['data']['hi'] += moddata['hi']
-        self.builder_data[key][sample]['data']['mask'] += moddata['mask']
+        bins = self.config.channel_slices[channel]
+        data['lo'][bins] = moddata['lo']
+        data['hi'][bins] = moddata['hi']
+        data['mask'][bins] = moddata['mask']
 
         if thismod:
             self.required_parsets.setdefault(
@@ -61,6 +103,33 @@ def append(self, key, channel, sample, thismod, defined_samp):
             )
 
     def finalize(self):
+        default_backend = pyhf.default_backend
+
+        # samples a modifier does not affect all share the same no-op data
+        n_bins = sum(self.config.channel_nbins.values())
+        ones = default_backend.ones((n_bins,))
+        no_mask = default_backend.astensor([False] * n_bins, dtype='bool')
+
+        keys = [f'{mtype}/{m}' for m, mtype in self.config.modifiers]
+        builder_data = {}
+        for key in keys:
+            if key not in self.builder_data:
+                continue
+            modifier = self.builder_data[key]
+            builder_data[key] = {}
+            for sample in self.config.samples:
+                if sample not in modifier:
+                    data = {'hi': ones, 'lo': ones, 'nom_data': ones, 'mask': no_mask}
+                else:
+                    data = modifier[sample]['data']
+                    data = {
+                        'hi': default_backend.astensor(data['hi']),
+                        'lo': default_backend.astensor(data['lo']),
+                        'nom_data': ones,
+                        'mask': default_backend.astensor(data['mask'], dtype='bool'),
+                    }
+                builder_data[key][sample] = {'data': data}
+        self.builder_data = builder_data
         return self.builder_data
 
 
@@ -71,6 +140,7 @@ class normsys_combined:
     def __init__(
         self, modifiers, pdfconfig, builder_data, interpcode='code1', batch_size=None
     ):
+        default_backend = pyhf.default_backend
 
         self.interpcode = interpcode
         assert self.interpcode in ['code1', 'code4']
@@ -86,21 +156,29 @@ def __init__(
             else (pdfconfig.npars,)
         )
         self.param_viewer = ParamViewer(parfield_shape, pdfconfig.par_map, normsys_mods)
-        self._normsys_histoset = [
-            [
-                [
-                    builder_data[m][s]['data']['lo'],
-                    builder_data[m][s]['data']['nom_data'],
-                    builder_data[m][s]['data']['hi'],
-                ]
-                for s in pdfconfig.samples
-            ]
-            for m in keys
-        ]
-        self._normsys_mask = [
-            [[builder_data[m][s]['data']['mask']] for s in pdfconfig.samples]
-            for m in keys
-        ]
+
+        # only the bins a modifier affects are stored and interpolated, each
+        # as its own single-bin histogram set
+        (
+            normsys_data,
+            self._modifier_indices,
+            _,
+            self._target_indices,
+            self._reduce_indices,
+        ) = _sparse_modifier_data(
+            keys, pdfconfig.samples, builder_data, ['lo', 'nom_data', 'hi']
+        )
+        self._stitch_shape = (len(keys),) + tuple(
+            default_backend.shape(self._reduce_indices)[:2]
+        )
+        self._entry_offsets = _entry_offsets(self._modifier_indices, len(keys))
+        self._normsys_histoset = default_backend.reshape(
+            default_backend.stack(
+                [normsys_data['lo'], normsys_data['nom_data'], normsys_data['hi']],
+                axis=1,
+            ),
+            (-1, 1, 3, 1),
+        )
 
         if normsys_mods:
             self.interpolator = getattr(interpolators, self.interpcode)(
@@ -114,15 +192,68 @@ def _precompute(self):
         if not self.param_viewer.index_selection:
             return
         tensorlib, _ = get_backend()
-        self.normsys_mask = tensorlib.tile(
-            tensorlib.astensor(self._normsys_mask, dtype="bool"),
-            (1, 1, self.batch_size or 1, 1),
-        )
-        self.normsys_default = tensorlib.ones(self.normsys_mask.shape)
+        self.modifier_indices = tensorlib.astensor(self._modifier_indices, dtype='int')
+        # built on the first call of apply, see _stitch_indices
+        self.stitch_indices = None
+        # the interpolators of the bins of single modifiers, see _entry_modifications
+        self._modifier_interpolators = {}
+        self.reduce_indices = tensorlib.astensor(self._reduce_indices, dtype='int')
+        self.normsys_default = tensorlib.ones((1, self.batch_size or 1))
         if self.batch_size is None:
             self.indices = tensorlib.reshape(
                 self.param_viewer.indices_concatenated, (-1, 1)
             )
+        self.target_indices = tensorlib.astensor(self._target_indices, dtype='int')
+        # the index of the parameter of each affected bin in the flattened
+        # parameters, shape (n_entries, n_alphas)
+        self.parameter_indices = tensorlib.gather(
+            self.indices
+            if self.batch_size is None
+            else self.param_viewer.indices_concatenated,
+            self.modifier_indices,
+        )
+
+    def _entry_alphaset(self, pars):
+        """
+        Returns:
+            alphaset tensor: Shape (n_entries, n_alphas), the parameter values
+            of the affected bins
+        """
+        tensorlib, _ = get_backend()
+        if self.batch_size is None:
+            normsys_alphaset = self.param_viewer.get(pars, self.indices)
+        else:
+            normsys_alphaset = self.param_viewer.get(pars)
+        return tensorlib.gather(normsys_alphaset, self.modifier_indices)
+
+    def _entry_modifications(self, pars, modifier_index=None):
+        """
+        Returns:
+            modification tensor: Shape (n_entries + 1, n_alphas), the
+            modifications of the affected bins followed by the no-op, or if
+            ``modifier_index`` is given, shape (n_modifier_entries, n_alphas),
+            the modifications of the bins affected by that modifier only
+        """
+        tensorlib, _ = get_backend()
+        # interpolate only the affected bins
+        entry_alphaset = self._entry_alphaset(pars)
+        if modifier_index is not None:
+            start, stop = self._entry_offsets[modifier_index : modifier_index + 2]
+            entry_alphaset = entry_alphaset[start:stop]
+            if start == stop:
+                return entry_alphaset
+            if modifier_index not in self._modifier_interpolators:
+                self._modifier_interpolators[modifier_index] = getattr(
+                    interpolators, self.interpcode
+                )(self._normsys_histoset[start:stop], subscribe=False)
+            return tensorlib.reshape(
+                self._modifier_interpolators[modifier_index](entry_alphaset),
+                tensorlib.shape(entry_alphaset),
+            )
+        results_norm = tensorlib.reshape(
+            self.interpolator(entry_alphaset), tensorlib.shape(entry_alphaset)
+        )
+        return tensorlib.concatenate([results_norm, self.normsys_default])
 
     def apply(self, pars):
         """
@@ -133,14 +264,83 @@ def apply(self, pars):
             return
 
         tensorlib, _ = get_backend()
-        if self.batch_size is None:
-            normsys_alphaset = self.param_viewer.get(pars, self.indices)
-        else:
-            normsys_alphaset = self.param_viewer.get(pars)
-        results_norm = self.interpolator(normsys_alphaset)
+        # scatter the affected bins back into the full (modifier, sample, bin)
+        # layout with the no-op elsewhere
+        if self.stitch_indices is None:
+            self.stitch_indices = tensorlib.astensor(
+                _stitch_indices(
+                    self._modifier_indices, self._target_indices, self._stitch_shape
+                ),
+                dtype='int',
+            )
+        results_norm = tensorlib.gather(
+            self._entry_modifications(pars), self.stitch_indices
+        )
+        return tensorlib.einsum('msba->msab', results_norm)
+
+    def apply_reduced(self, pars):
+        """
+        Returns:
+            modification tensor: Shape (n_global_samples, n_alphas, n_global_bin),
+            the modifications of all normsys modifiers multiplied
+        """
+        if not self.param_viewer.index_selection:
+            return
+
+        return self._reduce_entries(self._entry_modifications(pars))
+
+    def _reduce_entries(self, entry_modifications):
+        """
+        Args:
+            entry_modifications (:obj:`tensor`): Shape (n_entries + 1, n_alphas),
+             the modifications of the affected bins followed by the no-op
+
+        Returns:
+            modification tensor: Shape (n_global_samples, n_alphas, n_global_bin),
+            the modifications of all normsys modifiers multiplied
+        """
+        tensorlib, _ = get_backend()
+        results_norm = tensorlib.gather(entry_modifications, self.reduce_indices)
+        return tensorlib.einsum('sba->sab', tensorlib.product(results_norm, axis=2))
 
-        # either rely on numerical no-op or force with line below
-        results_norm = tensorlib.where(
-            self.normsys_mask, results_norm, self.normsys_default
+    def gradient_entries(self, pars):
+        """
+        The modifications of the affected bins and their derivatives w.r.t.
+        the parameter of each bin, see ``target_indices`` and
+        ``parameter_indices`` for the bins and parameters.
+
+        Returns:
+            Tuple of modification tensors: Shapes (n_entries, n_alphas)
+        """
+        if not self.param_viewer.index_selection:
+            return
+
+        tensorlib, _ = get_backend()
+        entry_alphaset = self._entry_alphaset(pars)
+        shape = tensorlib.shape(entry_alphaset)
+        return (
+            tensorlib.reshape(self.interpolator(entry_alphaset), shape),
+            tensorlib.reshape(self.interpolator.derivative(entry_alphaset), shape),
+        )
+
+    def hessian_entries(self, pars):
+        """
+        The modifications of the affected bins and their first and second
+        derivatives w.r.t. the parameter of each bin, see ``gradient_entries``.
+
+        Returns:
+            Tuple of modification tensors: Shapes (n_entries, n_alphas)
+        """
+        if not self.param_viewer.index_selection:
+            return
+
+        tensorlib, _ = get_backend()
+        entry_alphaset = self._entry_alphaset(pars)
+        shape = tensorlib.shape(entry_alphaset)
+        return (
+            tensorlib.reshape(self.interpolator(entry_alphaset), shape),
+            tensorlib.reshape(self.interpolator.derivative(entry_alphaset), shape),
+            tensorlib.reshape(
+                self.interpolator.second_derivative(entry_alphaset), shape
+            ),
         )
-        return results_norm
@@ -3,6 +3,7 @@
 import pyhf
 from pyhf import events
 from pyhf.exceptions import InvalidModifier
+from pyhf.modifiers import _sparse_modifier_data
 from pyhf.parameters import ParamViewer
 from pyhf.tensor.manager import get_backend
 
@@ -42,6 +43,7 @@ def __init__(self, config):
         self.builder_data = {}
         self.config = config
         self.required_parsets = {}
+        self.nominal_rates = {}
 
     def collect(self, thismod, nom):
         uncrt = thismod['data'] if thismod else [0.0] * len(nom)
@@ -49,18 +51,68 @@ def collect(self, thismod, nom):
         return {'mask': mask, 'nom_data': nom, 'uncrt': uncrt}
 
     def append(self, key, channel, sample, thismod, defined_samp):
-        self.builder_data.setdefault(key, {}).setdefault(sample, {}).setdefault(
-            'data', {'uncrt': [], 'nom_data': [], 'mask': []}
-        )
+        """
+        Collect the data of a shapesys modifier for a single channel and sample.
+
+        :meth:`append_all` collects the data of all channels and samples a
+        modifier affects at once.
+
+        Args:
+            key (:obj:`str`): The ``type/name`` key of the modifier.
+            channel (:obj:`str`): The name of the channel.
+            sample (:obj:`str`): The name of the sample.
+            thismod (:obj:`dict`): The modifier spec, ``None`` if the modifier
+             does not affect the sample in the channel.
+            defined_samp (:obj:`dict`): The sample spec, ``None`` if the channel
+             does not have the sample.
+        """
         nom = (
             defined_samp['data']
             if defined_samp
             else [0.0] * self.config.channel_nbins[channel]
         )
+        n_bins = sum(self.config.channel_nbins.values())
+        self.nominal_rates.setdefault(sample, [0.0] * n_bins)[
+            self.config.channel_slices[channel]
+        ] = nom
+        self._append(key, channel, sample, thismod, defined_samp, nom)
+
+    def append_all(self, modifiers, nominal_rates):
+        """
+        Collect the data of all shapesys modifiers in a single pass.
+
+        Args:
+            modifiers (:obj:`list`): The ``(key, channel, sample, modifier, sample_spec)``
+             tuples of the channels and samples affected by a shapesys modifier.
+            nominal_rates (:obj:`dict`): The nominal rates of each sample across all bins.
+        """
+        self.nominal_rates = nominal_rates
+        for key, channel, sample, thismod, defined_samp in modifiers:
+            self._append(
+                key, channel, sample, thismod, defined_samp, defined_samp['data']
+            )
+
+    def _append(self, key, channel, sample, thismod, defined_samp, nom):
+        modifier = self.builder_data.setdefault(key, {})
+        if sample not in modifier:
+            n_bins = sum(self.config.channel_nbins.values())
+            modifier[sample] = {
+                'data': {'uncrt': [0.0] * n_bins, 'mask': [False] * n_bins}
+            }
+        data = modifier[sample]['data']
+
         moddata = self.collect(thismod, nom)
-        self.builder_data[key][sample]['data']['mask'].append(moddata['mask'])
-        self.builder_data[key][sample]['data']['uncrt'].append(moddata['uncrt'])
-        self.builder_data[key][sample]['data']['nom_data'].append(moddata['nom_data'])
+        channel_bins = self.config.channel_nbins[channel]
+        if len(moddata['uncrt']) != channel_bins:
+            raise InvalidModifier(
+                f"The '{sample}' sample {thismod['type']} modifier"
+                + f" '{thismod['name']}' has data shape inconsistent with the sample.\n"
+                + f"{sample} has 'data' of length {channel_bins} but {thismod['name']}"
+                + f" has 'data' of length {len(moddata['uncrt'])}."
+            )
+        bins = self.config.channel_slices[channel]
+        data['uncrt'][bins] = moddata['uncrt']
+        data['mask'][bins] = moddata['mask']
 
         if thismod:
             self.required_parsets.setdefault(
@@ -71,27 +123,38 @@ def append(self, key, channel, sample, thismod, defined_samp):
     def finalize(self):
         default_backend = pyhf.default_backend
 
-        for modifier_name, modifier in self.builder_data.items():
-            for sample_name, sample in modifier.items():
-                sample["data"]["mask"] = default_backend.concatenate(
-                    sample["data"]["mask"]
-                )
-                sample["data"]["uncrt"] = default_backend.concatenate(
-                    sample["data"]["uncrt"]
-                )
-                sample["data"]["nom_data"] = default_backend.concatenate(
-                    sample["data"]["nom_data"]
-                )
-                if len(sample["data"]["nom_data"]) != len(sample["data"]["uncrt"]):
-                    _modifier_type, _modifier_name = modifier_name.split("/")
-                    _sample_data_len = len(sample["data"]["nom_data"])
-                    _uncrt_len = len(sample["data"]["uncrt"])
-                    raise InvalidModifier(
-                        f"The '{sample_name}' sample {_modifier_type} modifier"
-                        + f" '{_modifier_name}' has data shape inconsistent with the sample.\n"
-                        + f"{sample_name} has 'data' of length {_sample_data_len} but {_modifier_name}"
-                        + f" has 'data' of length {_uncrt_len}."
-                    )
+        # samples a modifier does not affect all share the same no-op data
+        n_bins = sum(self.config.channel_nbins.values())
+        nominal = {
+            sample: default_backend.astensor(self.nominal_rates[sample])
+            for sample in self.config.samples
+        }
+        zeros = default_backend.zeros((n_bins,))
+        no_mask = default_backend.astensor([False] * n_bins, dtype='bool')
+
+        keys = [f'{mtype}/{m}' for m, mtype in self.config.modifiers]
+        builder_data = {}
+        for key in keys:
+            if key not in self.builder_data:
+                continue
+            modifier = self.builder_data[key]
+            builder_data[key] = {}
+            for sample in self.config.samples:
+                if sample not in modifier:
+                    data = {
+                        'uncrt': zeros,
+                        'nom_data': nominal[sample],
+                        'mask': no_mask,
+                    }
+                else:
+                    data = modifier[sample]['data']
+                    data = {
+                        'uncrt': default_backend.astensor(data['uncrt']),
+                        'nom_data': nominal[sample],
+                        'mask': default_backend.astensor(data['mask'], dtype='bool'),
+                    }
+                builder_data[key][sample] = {'data': data}
+        self.builder_data = builder_data
         return self.builder_data
 
 
@@ -141,6 +204,24 @@ def __init__(self, modifiers, pdfconfig, builder_data, batch_size=None):
         # reindex it based on current masking
         self._reindex_access_field(pdfconfig)
 
+        # the (modifier, sample, bin) entries the modifiers affect and the
+        # index of their parameter in the flattened parameters
+        (
+            _,
+            modifier_indices,
+            _,
+            self._target_indices,
+            _,
+        ) = _sparse_modifier_data(keys, pdfconfig.samples, builder_data, [])
+        n_bins = default_backend.shape(self._access_field)[-1]
+        self._parameter_indices = default_backend.gather(
+            default_backend.reshape(
+                default_backend.einsum('mab->mba', self._access_field),
+                (-1, self.batch_size or 1),
+            ),
+            modifier_indices * n_bins + self._target_indices % n_bins,
+        )
+
         self._precompute()
         events.subscribe('tensorlib_changed')(self._precompute)
 
@@ -177,6 +258,10 @@ def _precompute(self):
             self.shapesys_mask, (1, 1, self.batch_size or 1, 1)
         )
         self.access_field = tensorlib.astensor(self._access_field, dtype='int')
+        self.target_indices = tensorlib.astensor(self._target_indices, dtype='int')
+        self.parameter_indices = tensorlib.astensor(
+            self._parameter_indices, dtype='int'
+        )
         self.sample_ones = tensorlib.ones(tensorlib.shape(self.shapesys_mask)[1])
         self.shapesys_default = tensorlib.ones(tensorlib.shape(self.shapesys_mask))
 
@@ -202,3 +287,38 @@ def apply(self, pars):
             self.shapesys_mask, results_shapesys, self.shapesys_default
         )
         return results_shapesys
+
+    def gradient_entries(self, pars):
+        """
+        The modifications of the affected bins and their derivatives w.r.t.
+        the parameter of each bin, see ``target_indices`` and
+        ``parameter_indices`` for the bins and parameters.
+
+        Returns:
+            Tuple of modification tensors: Shapes (n_entries, n_alphas)
+        """
+        if not self.param_viewer.index_selection:
+            return
+
+        tensorlib, _ = get_backend()
+        if self.batch_size is None:
+            flat_pars = pars
+        else:
+            flat_pars = tensorlib.reshape(pars, (-1,))
+        results_shapesys = tensorlib.gather(flat_pars, self.parameter_indices)
+        return results_shapesys, tensorlib.ones(tensorlib.shape(results_shapesys))
+
+    def hessian_entries(self, pars):
+        """
+        The modifications of the affected bins and their first and second
+        derivatives w.r.t. the parameter of each bin, see ``gradient_entries``.
+
+        Returns:
+            Tuple of modification tensors: Shapes (n_entries, n_alphas)
+        """
+        if not self.param_viewer.index_selection:
+            return
+
+        tensorlib, _ = get_backend()
+        values, derivatives = self.gradient_entries(pars)
+        return values, derivatives, tensorlib.zeros(tensorlib.shape(values))
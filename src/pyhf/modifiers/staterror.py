@@ -4,6 +4,7 @@
 import pyhf
 from pyhf import events
 from pyhf.exceptions import InvalidModifier
+from pyhf.modifiers import _entry_offsets, _sparse_modifier_data, _stitch_indices
 from pyhf.parameters import ParamViewer
 from pyhf.tensor.manager import get_backend
 
@@ -32,6 +33,7 @@ def __init__(self, config):
         self.builder_data = {}
         self.config = config
         self.required_parsets = {}
+        self.nominal_rates = {}
 
     def collect(self, thismod, nom):
         uncrt = thismod['data'] if thismod else [0.0] * len(nom)
@@ -39,44 +41,104 @@ def collect(self, thismod, nom):
         return {'mask': mask, 'nom_data': nom, 'uncrt': uncrt}
 
     def append(self, key, channel, sample, thismod, defined_samp):
-        self.builder_data.setdefault(key, {}).setdefault(sample, {}).setdefault(
-            'data', {'uncrt': [], 'nom_data': [], 'mask': []}
-        )
+        """
+        Collect the data of a staterror modifier for a single channel and sample.
+
+        :meth:`append_all` collects the data of all channels and samples a
+        modifier affects at once.
+
+        Args:
+            key (:obj:`str`): The ``type/name`` key of the modifier.
+            channel (:obj:`str`): The name of the channel.
+            sample (:obj:`str`): The name of the sample.
+            thismod (:obj:`dict`): The modifier spec, ``None`` if the modifier
+             does not affect the sample in the channel.
+            defined_samp (:obj:`dict`): The sample spec, ``None`` if the channel
+             does not have the sample.
+        """
         nom = (
             defined_samp['data']
             if defined_samp
             else [0.0] * self.config.channel_nbins[channel]
         )
+        n_bins = sum(self.config.channel_nbins.values())
+        self.nominal_rates.setdefault(sample, [0.0] * n_bins)[
+            self.config.channel_slices[channel]
+        ] = nom
+        self._append(key, channel, sample, thismod, defined_samp, nom)
+
+    def append_all(self, modifiers, nominal_rates):
+        """
+        Collect the data of all staterror modifiers in a single pass.
+
+        Args:
+            modifiers (:obj:`list`): The ``(key, channel, sample, modifier, sample_spec)``
+             tuples of the channels and samples affected by a staterror modifier.
+            nominal_rates (:obj:`dict`): The nominal rates of each sample across all bins.
+        """
+        self.nominal_rates = nominal_rates
+        for key, channel, sample, thismod, defined_samp in modifiers:
+            self._append(
+                key, channel, sample, thismod, defined_samp, defined_samp['data']
+            )
+
+    def _append(self, key, channel, sample, thismod, defined_samp, nom):
+        modifier = self.builder_data.setdefault(key, {})
+        if sample not in modifier:
+            n_bins = sum(self.config.channel_nbins.values())
+            modifier[sample] = {
+                'data': {'uncrt': [0.0] * n_bins, 'mask': [False] * n_bins}
+            }
+        data = modifier[sample]['data']
+
         moddata = self.collect(thismod, nom)
-        self.builder_data[key][sample]['data']['mask'].append(moddata['mask'])
-        self.builder_data[key][sample]['data']['uncrt'].append(moddata['uncrt'])
-        self.builder_data[key][sample]['data']['nom_data'].append(moddata['nom_data'])
+        channel_bins = self.config.channel_nbins[channel]
+        if len(moddata['uncrt']) != channel_bins:
+            raise InvalidModifier(
+                f"The '{sample}' sample {thismod['type']} modifier"
+                + f" '{thismod['name']}' has data shape inconsistent with the sample.\n"
+                + f"{sample} has 'data' of length {channel_bins} but {thismod['name']}"
+                + f" has 'data' of length {len(moddata['uncrt'])}."
+            )
+        bins = self.config.channel_slices[channel]
+        data['uncrt'][bins] = moddata['uncrt']
+        data['mask'][bins] = moddata['mask']
 
     def finalize(self):
         default_backend = pyhf.default_backend
 
-        for modifier_name, modifier in self.builder_data.items():
-            for sample_name, sample in modifier.items():
-                sample["data"]["mask"] = default_backend.concatenate(
-                    sample["data"]["mask"]
-                )
-                sample["data"]["uncrt"] = default_backend.concatenate(
-                    sample["data"]["uncrt"]
-                )
-                sample["data"]["nom_data"] = default_backend.concatenate(
-                    sample["data"]["nom_data"]
-                )
-                if len(sample["data"]["nom_data"]) != len(sample["data"]["uncrt"]):
-                    _modifier_type, _modifier_name = modifier_name.split("/")
-                    _sample_data_len = len(sample["data"]["nom_data"])
-                    _uncrt_len = len(sample["data"]["uncrt"])
-                    raise InvalidModifier(
-                        f"The '{sample_name}' sample {_modifier_type} modifier"
-                        + f" '{_modifier_name}' has data shape inconsistent with the sample.\n"
-                        + f"{sample_name} has 'data' of length {_sample_data_len} but {_modifier_name}"
-                        + f" has 'data' of length {_uncrt_len}."
-                    )
+        # samples a modifier does not affect all share the same no-op data
+        n_bins = sum(self.config.channel_nbins.values())
+        nominal = {
+            sample: default_backend.astensor(self.nominal_rates[sample])
+            for sample in self.config.samples
+        }
+        zeros = default_backend.zeros((n_bins,))
+        no_mask = default_backend.astensor([False] * n_bins, dtype='bool')
 
+        keys = [f'{mtype}/{m}' for m, mtype in self.config.modifiers]
+        builder_data = {}
+        for key in keys:
+            if key not in self.builder_data:
+                continue
+            modifier = self.builder_data[key]
+            builder_data[key] = {}
+            for sample in self.config.samples:
+                if sample not in modifier:
+                    data = {
+                        'uncrt': zeros,
+                        'nom_data': nominal[sample],
+                        'mask': no_mask,
+                    }
+                else:
+                    data = modifier[sample]['data']
+                    data = {
+                        'uncrt': default_backend.astensor(data['uncrt']),
+                        'nom_data': nominal[sample],
+                        'mask': default_backend.astensor(data['mask'], dtype='bool'),
+                    }
+                builder_data[key][sample] = {'data': data}
+        self.builder_data = builder_data
         for modname in self.builder_data.keys():
             parname = modname.split('/')[1]
 
@@ -88,14 +150,19 @@ def finalize(self):
                 ],
                 axis=0,
             )
+            # bins without any yield get no relative error
+            has_yield = nomsall > 0
+            n_bins = default_backend.shape(nomsall)
+            denominator = default_backend.where(
+                has_yield, nomsall, default_backend.ones(n_bins)
+            )
             relerrs = default_backend.sum(
                 [
-                    [
-                        (modifier_data['data']['uncrt'][binnr] / nomsall[binnr]) ** 2
-                        if nomsall[binnr] > 0
-                        else 0.0
-                        for binnr in range(len(modifier_data['data']['nom_data']))
-                    ]
+                    default_backend.where(
+                        has_yield,
+                        (modifier_data['data']['uncrt'] / denominator) ** 2,
+                        default_backend.zeros(n_bins),
+                    )
                     for modifier_data in self.builder_data[modname].values()
                 ],
                 axis=0,
@@ -141,83 +208,141 @@ def __init__(self, modifiers, pdfconfig, builder_data, batch_size=None):
             parfield_shape, pdfconfig.par_map, self._staterr_mods
         )
 
-        self._staterror_mask = [
-            [[builder_data[m][s]['data']['mask']] for s in pdfconfig.samples]
-            for m in keys
-        ]
-        self.__staterror_uncrt = default_backend.astensor(
-            [
-                [
-                    [
-                        builder_data[m][s]['data']['uncrt'],
-                        builder_data[m][s]['data']['nom_data'],
-                    ]
-                    for s in pdfconfig.samples
-                ]
-                for m in keys
-            ]
+        # only the bins a modifier affects are stored, all samples share the
+        # mask of a staterror modifier so the n-th affected bin of each sample
+        # is scaled by the n-th parameter of the modifier
+        (
+            _,
+            self._modifier_indices,
+            positions,
+            self._target_indices,
+            self._reduce_indices,
+        ) = _sparse_modifier_data(keys, pdfconfig.samples, builder_data, [])
+        self._stitch_shape = (len(keys),) + tuple(
+            default_backend.shape(self._reduce_indices)[:2]
         )
-        global_concatenated_bin_indices = [
-            [[j for c in pdfconfig.channels for j in range(pdfconfig.channel_nbins[c])]]
+        self._entry_offsets = _entry_offsets(self._modifier_indices, len(keys))
+        n_parameters = [
+            pdfconfig.par_map[m]['slice'].stop - pdfconfig.par_map[m]['slice'].start
+            for m in self._staterr_mods
         ]
-
-        self._access_field = default_backend.tile(
-            global_concatenated_bin_indices,
-            (len(self._staterr_mods), self.batch_size or 1, 1),
+        parameter_offsets = default_backend.astensor(
+            [sum(n_parameters[:idx]) for idx in range(len(n_parameters))],
+            dtype='int',
+        )
+        self._parameter_positions = (
+            default_backend.gather(parameter_offsets, self._modifier_indices)
+            + positions
         )
-
-        self._reindex_access_field(pdfconfig)
 
         self._precompute()
         events.subscribe('tensorlib_changed')(self._precompute)
 
-    def _reindex_access_field(self, pdfconfig):
-        default_backend = pyhf.default_backend
-        for syst_index, syst_access in enumerate(self._access_field):
-            singular_sample_index = [
-                idx
-                for idx, syst in enumerate(
-                    default_backend.astensor(self._staterror_mask)[syst_index, :, 0]
-                )
-                if any(syst)
-            ][-1]
-
-            for batch_index, batch_access in enumerate(syst_access):
-                selection = self.param_viewer.index_selection[syst_index][batch_index]
-                access_field_for_syst_and_batch = default_backend.zeros(
-                    len(batch_access)
-                )
-
-                sample_mask = self._staterror_mask[syst_index][singular_sample_index][0]
-                access_field_for_syst_and_batch[sample_mask] = selection
-                self._access_field[
-                    syst_index, batch_index
-                ] = access_field_for_syst_and_batch
-
     def _precompute(self):
         if not self.param_viewer.index_selection:
             return
         tensorlib, _ = get_backend()
-        self.staterror_mask = tensorlib.astensor(self._staterror_mask, dtype="bool")
-        self.staterror_mask = tensorlib.tile(
-            self.staterror_mask, (1, 1, self.batch_size or 1, 1)
+        # the indices of the parameters of each affected bin in the
+        # flattened parameters, shape (n_entries, n_alphas)
+        self.access_field = tensorlib.gather(
+            self.param_viewer.indices_concatenated,
+            tensorlib.astensor(self._parameter_positions, dtype='int'),
         )
-        self.access_field = tensorlib.astensor(self._access_field, dtype='int')
-        self.sample_ones = tensorlib.ones(tensorlib.shape(self.staterror_mask)[1])
-        self.staterror_default = tensorlib.ones(tensorlib.shape(self.staterror_mask))
-
-    def apply(self, pars):
-        if not self.param_viewer.index_selection:
-            return
+        # built on the first call of apply, see _stitch_indices
+        self.stitch_indices = None
+        self.reduce_indices = tensorlib.astensor(self._reduce_indices, dtype='int')
+        self.staterror_default = tensorlib.ones((1, self.batch_size or 1))
+        self.target_indices = tensorlib.astensor(self._target_indices, dtype='int')
+        self.parameter_indices = self.access_field
 
+    def _entry_modifications(self, pars, modifier_index=None):
+        """
+        Returns:
+            modification tensor: Shape (n_entries + 1, n_alphas), the
+            modifications of the affected bins followed by the no-op, or if
+            ``modifier_index`` is given, shape (n_modifier_entries, n_alphas),
+            the modifications of the bins affected by that modifier only
+        """
         tensorlib, _ = get_backend()
         if self.batch_size is None:
             flat_pars = pars
         else:
             flat_pars = tensorlib.reshape(pars, (-1,))
-        statfactors = tensorlib.gather(flat_pars, self.access_field)
-        results_staterr = tensorlib.einsum('mab,s->msab', statfactors, self.sample_ones)
-        results_staterr = tensorlib.where(
-            self.staterror_mask, results_staterr, self.staterror_default
+        if modifier_index is not None:
+            start, stop = self._entry_offsets[modifier_index : modifier_index + 2]
+            return tensorlib.gather(flat_pars, self.access_field[start:stop])
+        results_staterr = tensorlib.gather(flat_pars, self.access_field)
+        return tensorlib.concatenate([results_staterr, self.staterror_default])
+
+    def apply(self, pars):
+        if not self.param_viewer.index_selection:
+            return
+
+        tensorlib, _ = get_backend()
+        if self.stitch_indices is None:
+            self.stitch_indices = tensorlib.astensor(
+                _stitch_indices(
+                    self._modifier_indices, self._target_indices, self._stitch_shape
+                ),
+                dtype='int',
+            )
+        results_staterr = tensorlib.gather(
+            self._entry_modifications(pars), self.stitch_indices
         )
-        return results_staterr
+        return tensorlib.einsum('msba->msab', results_staterr)
+
+    def apply_reduced(self, pars):
+        """
+        Returns:
+            modification tensor: Shape (n_global_samples, n_alphas, n_global_bin),
+            the modifications of all staterror modifiers multiplied
+        """
+        if not self.param_viewer.index_selection:
+            return
+
+        return self._reduce_entries(self._entry_modifications(pars))
+
+    def _reduce_entries(self, entry_modifications):
+        """
+        Args:
+            entry_modifications (:obj:`tensor`): Shape (n_entries + 1, n_alphas),
+             the modifications of the affected bins followed by the no-op
+
+        Returns:
+            modification tensor: Shape (n_global_samples, n_alphas, n_global_bin),
+            the modifications of all staterror modifiers multiplied
+        """
+        tensorlib, _ = get_backend()
+        results_staterr = tensorlib.gather(entry_modifications, self.reduce_indices)
+        return tensorlib.einsum('sba->sab', tensorlib.product(results_staterr, axis=2))
+
+    def gradient_entries(self, pars):
+        """
+        The modifications of the affected bins and their derivatives w.r.t.
+        the parameter of each bin, see ``target_indices`` and
+        ``parameter_indices`` for the bins and parameters.
+
+        Returns:
+            Tuple of modification tensors: Shapes (n_entries, n_alphas)
+        """
+        if not self.param_viewer.index_selection:
+            return
+
+        tensorlib, _ = get_backend()
+        results_staterr = self._entry_modifications(pars)[:-1]
+        return results_staterr, tensorlib.ones(tensorlib.shape(results_staterr))
+
+    def hessian_entries(self, pars):
+        """
+        The modifications of the affected bins and their first and second
+        derivatives w.r.t. the parameter of each bin, see ``gradient_entries``.
+
+        Returns:
+            Tuple of modification tensors: Shapes (n_entries, n_alphas)
+        """
+        if not self.param_viewer.index_selection:
+            return
+
+        tensorlib, _ = get_backend()
+        values, derivatives = self.gradient_entries(pars)
+        return values, derivatives, tensorlib.zeros(tensorlib.shape(values))
@@ -31,9 +31,27 @@ def __getattr__(self, name):
                     "There was a problem importing Minuit. The minuit optimizer cannot be used.",
                     e,
                 )
+        elif name == 'newton_optimizer':
+            from pyhf.optimize.opt_newton import newton_optimizer
+
+            assert newton_optimizer
+            # hide away one level of the module name
+            # pyhf.optimize.newton_optimizer.newton_optimizer->pyhf.optimize.newton_optimizer
+            newton_optimizer.__module__ = __name__
+            # for autocomplete and dir() calls
+            self.newton_optimizer = newton_optimizer
+            return newton_optimizer
         elif name == '__wrapped__':  # doctest
             pass
 
 
 OptimizerRetriever = _OptimizerRetriever()
 __all__ = ['OptimizerRetriever']
+
+
+def __getattr__(name):
+    # the optimizers report this module as their __module__, so resolve them
+    # through the retriever to allow e.g. pickle to look them up by name
+    if name in ['scipy_optimizer', 'minuit_optimizer', 'newton_optimizer']:
+        return getattr(OptimizerRetriever, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 """Common Backend Shim to prepare minimization for optimizer."""
 from pyhf.tensor.manager import get_backend
 from pyhf.tensor.common import _TensorViewer
+from pyhf import exceptions
 
 
 def _make_stitch_pars(tv=None, fixed_values=None):
@@ -28,33 +29,105 @@ def stitch_pars(pars, stitch_with=fixed_values):
     return stitch_pars
 
 
-def _get_tensor_shim():
+def _block_indices(indices, batch_size, npars):
+    """
+    The indices within the parameters of a single batch element of the
+    flattened parameter ``indices`` of all batch elements.
+
+    Args:
+        indices (:obj:`list`): flattened parameter indices of all batch elements
+        batch_size (:obj:`int`): number of batch elements
+        npars (:obj:`int`): number of parameters of a batch element
+
+    Returns:
+        indices (:obj:`list`): parameter indices of a batch element
+    """
+    block_indices = sorted({index % npars for index in indices})
+    if len(block_indices) * batch_size != len(indices):
+        raise exceptions.Unsupported(
+            "The elements of a batched model need to fix the same parameters."
+        )
+    return block_indices
+
+
+def _block_tangents(batch_size, size):
+    """
+    The tangents that probe the Hessians of the independent objectives of the
+    batch elements, with shape ``(size, batch_size * size)``.
+
+    The ``j``-th tangent is the ``j``-th unit vector in the parameters of every
+    batch element. As the Hessian of the summed objective has no entries
+    between batch elements, its product with the ``j``-th tangent holds the
+    ``j``-th columns of the Hessians of all batch elements. ``size``
+    Hessian-vector products thus yield all Hessians of the batch elements,
+    without the full Hessian w.r.t. the concatenated parameters.
+
+    Args:
+        batch_size (:obj:`int`): number of batch elements
+        size (:obj:`int`): number of parameters of a batch element
+
+    Returns:
+        tangents (:obj:`tensor`): the tangents along the rows
+    """
+    tensorlib, _ = get_backend()
+    identity = tensorlib.astensor(
+        [[float(row == column) for column in range(size)] for row in range(size)]
+    )
+    return tensorlib.reshape(
+        tensorlib.einsum('ij,a->iaj', identity, tensorlib.ones((batch_size,))),
+        (size, batch_size * size),
+    )
+
+
+def _hessian_blocks(columns, batch_size):
+    """
+    The Hessians of the batch elements with shape ``(batch_size, n, n)``.
+
+    Args:
+        columns (:obj:`tensor`): products of the Hessian of the summed objective
+          with the tangents of :func:`_block_tangents`, with shape ``(n, batch_size * n)``
+        batch_size (:obj:`int`): number of batch elements
+
+    Returns:
+        hessians (:obj:`tensor`): Hessians of the batch elements
+    """
+    tensorlib, _ = get_backend()
+    size = tensorlib.shape(columns)[0]
+    return tensorlib.einsum(
+        'jai->aij', tensorlib.reshape(columns, (size, batch_size, size))
+    )
+
+
+def _get_tensor_shim(wrapper='wrap_objective'):
     """
     A shim-retriever to lazy-retrieve the necessary shims as needed.
 
     Because pyhf.tensor is a lazy-retriever for the backends, we can be sure
     that tensorlib is imported correctly.
+
+    Args:
+        wrapper (:obj:`str`): The wrapper to retrieve, ``wrap_objective``, ``wrap_hessian`` or ``wrap_values``.
     """
     tensorlib, _ = get_backend()
     if tensorlib.name == 'numpy':
-        from pyhf.optimize.opt_numpy import wrap_objective as numpy_shim
+        from pyhf.optimize import opt_numpy as numpy_shim
 
-        return numpy_shim
+        return getattr(numpy_shim, wrapper)
 
     if tensorlib.name == 'tensorflow':
-        from pyhf.optimize.opt_tflow import wrap_objective as tflow_shim
+        from pyhf.optimize import opt_tflow as tflow_shim
 
-        return tflow_shim
+        return getattr(tflow_shim, wrapper)
 
     if tensorlib.name == 'pytorch':
-        from pyhf.optimize.opt_pytorch import wrap_objective as pytorch_shim
+        from pyhf.optimize import opt_pytorch as pytorch_shim
 
-        return pytorch_shim
+        return getattr(pytorch_shim, wrapper)
 
     if tensorlib.name == 'jax':
-        from pyhf.optimize.opt_jax import wrap_objective as jax_shim
+        from pyhf.optimize import opt_jax as jax_shim
 
-        return jax_shim
+        return getattr(jax_shim, wrapper)
     raise ValueError(f'No optimizer shim for {tensorlib.name}.')
 
 
@@ -67,6 +140,7 @@ def shim(
     fixed_vals=None,
     do_grad=False,
     do_stitch=False,
+    do_hessian=False,
 ):
     """
     Prepare Minimization for Optimizer.
@@ -102,16 +176,32 @@ def shim(
 
         ``do_stitch`` will modify the ``init_pars``, ``par_bounds``, and ``fixed_vals`` by stripping away the entries associated with fixed parameters. The parameters can be stitched back in via ``stitch_pars``.
 
+    .. note::
+
+        The ``objective`` returns a tensor of values whose sum is minimized,
+        e.g. the values of the independent elements of a batched model.
+
+    .. note::
+
+        ``do_hessian`` additionally returns ``hessian(pars)``, a callable that
+        evaluates the exact Hessian of the ``objective`` w.r.t. the parameters
+        handed to the minimizer. For batched models the objective is a sum over
+        independent batch elements, and ``hessian`` returns the Hessians of the
+        batch elements with shape ``(batch_size, n, n)`` instead. The
+        ``minimizer_kwargs`` of batched models then also hold ``values``, the
+        backend-wrapped values of the batch elements.
+
     Returns:
         minimizer_kwargs (:obj:`dict`): arguments to pass to a minimizer following the :func:`scipy.optimize.minimize` API (see notes)
         stitch_pars (:obj:`func`): callable that stitches fixed parameters into the unfixed parameters
+        hessian (:obj:`func`): if ``do_hessian`` flagged, the backend-wrapped Hessian of the ``objective`` (see notes)
     """
     tensorlib, _ = get_backend()
 
     fixed_vals = fixed_vals or []
     fixed_idx = [x[0] for x in fixed_vals]
     fixed_values = [x[1] for x in fixed_vals]
-    variable_idx = [x for x in range(pdf.config.npars) if x not in fixed_idx]
+    variable_idx = [x for x in range(len(init_pars)) if x not in fixed_idx]
 
     if do_stitch:
         all_init = tensorlib.astensor(init_pars)
@@ -132,18 +222,19 @@ def shim(
         minimizer_fixed_vals = fixed_vals
         stitch_pars = _make_stitch_pars()
 
+    jit_pieces = {
+        'fixed_idx': fixed_idx,
+        'variable_idx': variable_idx,
+        'fixed_values': fixed_values,
+        'do_stitch': do_stitch,
+    }
     objective_and_grad = _get_tensor_shim()(
         objective,
         tensorlib.astensor(data),
         pdf,
         stitch_pars,
         do_grad=do_grad,
-        jit_pieces={
-            'fixed_idx': fixed_idx,
-            'variable_idx': variable_idx,
-            'fixed_values': fixed_values,
-            'do_stitch': do_stitch,
-        },
+        jit_pieces=jit_pieces,
     )
 
     minimizer_kwargs = dict(
@@ -154,4 +245,22 @@ def shim(
         fixed_vals=minimizer_fixed_vals,
     )
 
+    if do_hessian:
+        hessian = _get_tensor_shim('wrap_hessian')(
+            objective,
+            tensorlib.astensor(data),
+            pdf,
+            stitch_pars,
+            jit_pieces=jit_pieces,
+        )
+        if getattr(pdf, 'batch_size', None):
+            minimizer_kwargs['values'] = _get_tensor_shim('wrap_values')(
+                objective,
+                tensorlib.astensor(data),
+                pdf,
+                stitch_pars,
+                jit_pieces=jit_pieces,
+            )
+        return minimizer_kwargs, stitch_pars, hessian
+
     return minimizer_kwargs, stitch_pars
@@ -4,6 +4,7 @@
 from pyhf.optimize.common import shim
 
 import logging
+import numpy as np
 
 log = logging.getLogger(__name__)
 
@@ -13,6 +14,11 @@ class OptimizerMixin:
 
     __slots__ = ['maxiter', 'verbose']
 
+    # optimizers that minimize with the exact gradient and Hessian of the
+    # objective, which are passed to ``_minimize`` as ``hess`` (and the values
+    # of the batch elements of batched models as ``values``)
+    _requires_derivatives = False
+
     def __init__(self, **kwargs):
         """
         Create an optimizer.
@@ -38,6 +44,8 @@ def _internal_minimize(
         fixed_vals=None,
         options={},
         par_names=None,
+        hess=None,
+        values=None,
     ):
 
         minimizer = self._get_minimizer(
@@ -56,6 +64,7 @@ def _internal_minimize(
             bounds=bounds,
             fixed_vals=fixed_vals,
             options=options,
+            **({'hess': hess, 'values': values} if self._requires_derivatives else {}),
         )
 
         try:
@@ -77,11 +86,12 @@ def _internal_postprocess(self, fitresult, stitch_pars, return_uncertainties=Fal
         # stitch in missing parameters (e.g. fixed parameters)
         fitted_pars = stitch_pars(tensorlib.astensor(fitresult.x))
 
+        # extract number of fixed parameters
+        num_fixed_pars = len(fitted_pars) - len(fitresult.x)
+
         # check if uncertainties were provided (and stitch just in case)
         uncertainties = getattr(fitresult, 'unc', None)
         if uncertainties is not None:
-            # extract number of fixed parameters
-            num_fixed_pars = len(fitted_pars) - len(fitresult.x)
             # stitch in zero-uncertainty for fixed values
             uncertainties = stitch_pars(
                 tensorlib.astensor(uncertainties),
@@ -92,17 +102,21 @@ def _internal_postprocess(self, fitresult, stitch_pars, return_uncertainties=Fal
 
         correlations = getattr(fitresult, 'corr', None)
         if correlations is not None:
-            _zeros = tensorlib.zeros(num_fixed_pars)
-            # possibly a more elegant way to do this
-            stitched_columns = [
-                stitch_pars(tensorlib.astensor(column), stitch_with=_zeros)
-                for column in zip(*correlations)
-            ]
-            stitched_rows = [
-                stitch_pars(tensorlib.astensor(row), stitch_with=_zeros)
-                for row in zip(*stitched_columns)
-            ]
-            correlations = tensorlib.stack(stitched_rows, axis=1)
+            # stitch in zero-correlation for fixed values, the columns of the
+            # matrix first and then its rows
+            correlations = stitch_pars(
+                tensorlib.astensor(correlations),
+                stitch_with=tensorlib.zeros((len(fitresult.x), num_fixed_pars)),
+            )
+            correlations = tensorlib.einsum(
+                'ij->ji',
+                stitch_pars(
+                    tensorlib.einsum('ij->ji', correlations),
+                    stitch_with=tensorlib.zeros(
+                        (len(fitresult.x) + num_fixed_pars, num_fixed_pars)
+                    ),
+                ),
+            )
 
         fitresult.x = fitted_pars
         fitresult.fun = tensorlib.astensor(fitresult.fun)
@@ -111,6 +125,45 @@ def _internal_postprocess(self, fitresult, stitch_pars, return_uncertainties=Fal
 
         return fitresult
 
+    def _exact_hessian_options(self, options):
+        """
+        The minimizer options for a fit whose uncertainties are computed from
+        the exact Hessian, such that the minimizer can skip its own estimate.
+        """
+        return options
+
+    def _internal_exact_uncertainties(self, fitresult, hessian, fixed_vals=None):
+        """
+        Replace the uncertainties and correlations estimated by the minimizer
+        with those of the exact Hessian of the objective at the best fit.
+
+        Returns:
+            fitresult (scipy.optimize.OptimizeResult): A modified version of the fit result.
+        """
+        tensorlib, _ = get_backend()
+
+        n_pars = len(fitresult.x)
+        fixed_idx = [index for index, _ in fixed_vals or []]
+        free_idx = [index for index in range(n_pars) if index not in fixed_idx]
+
+        hess = np.asarray(tensorlib.tolist(hessian(fitresult.x)), dtype=float)
+        # the objective is twice the NLL, see errordef of the minuit optimizer
+        errordef = getattr(self, 'errordef', 1.0)
+        covariance = np.zeros((n_pars, n_pars))
+        covariance[np.ix_(free_idx, free_idx)] = (
+            2.0 * errordef * np.linalg.inv(hess[np.ix_(free_idx, free_idx)])
+        )
+        uncertainties = np.sqrt(np.diag(covariance))
+        scales = np.outer(uncertainties, uncertainties)
+        correlations = np.divide(
+            covariance, scales, out=np.zeros_like(covariance), where=scales > 0
+        )
+
+        fitresult.hess_inv = covariance
+        fitresult.unc = uncertainties
+        fitresult.corr = correlations
+        return fitresult
+
     def minimize(
         self,
         objective,
@@ -125,6 +178,7 @@ def minimize(
         return_correlations=False,
         do_grad=None,
         do_stitch=False,
+        hessian=None,
         **kwargs,
     ):
         """
@@ -146,6 +200,12 @@ def minimize(
             return_correlations (:obj:`bool`): Return correlations of the fitted parameters. Default is off (``False``).
             do_grad (:obj:`bool`): enable autodifferentiation mode. Default depends on backend (:attr:`pyhf.tensorlib.default_do_grad`).
             do_stitch (:obj:`bool`): enable splicing/stitching fixed parameter.
+            hessian (:obj:`str`): How the uncertainties and correlations are computed.
+                Either ``None`` for the estimate of the minimizer (e.g. ``HESSE``
+                for :class:`~pyhf.optimize.opt_minuit.minuit_optimizer`) or
+                ``'exact'`` for the inverse of the exact Hessian of the objective
+                at the best fit, evaluated by automatic differentiation or
+                analytically for the numpy backend. Default is ``None``.
             kwargs: other options to pass through to underlying minimizer
 
         Returns:
@@ -157,9 +217,23 @@ def minimize(
         """
         # Configure do_grad based on backend "automagically" if not set by user
         tensorlib, _ = get_backend()
-        do_grad = tensorlib.default_do_grad if do_grad is None else do_grad
+        if self._requires_derivatives and do_grad is False:
+            raise exceptions.Unsupported(
+                f"The {self.name} optimizer requires gradients, do_grad cannot be False."
+            )
+        do_grad = (
+            (self._requires_derivatives or tensorlib.default_do_grad)
+            if do_grad is None
+            else do_grad
+        )
 
-        minimizer_kwargs, stitch_pars = shim(
+        if hessian not in [None, 'exact']:
+            raise exceptions.Unsupported(
+                f"Unsupported hessian was passed in: {hessian}. Use None or 'exact'."
+            )
+        exact_hessian = hessian == 'exact'
+
+        minimizer_kwargs, stitch_pars, *wrapped_hessian = shim(
             objective,
             data,
             pdf,
@@ -168,6 +242,7 @@ def minimize(
             fixed_vals,
             do_grad=do_grad,
             do_stitch=do_stitch,
+            do_hessian=exact_hessian or self._requires_derivatives,
         )
 
         # handle non-pyhf ModelConfigs
@@ -176,15 +251,30 @@ def minimize(
         except AttributeError:
             par_names = None
 
+        # batched models are minimized over the concatenated parameters of all
+        # batch elements, for which the model parameter names do not apply
+        if getattr(pdf, 'batch_size', None):
+            par_names = None
+
         # need to remove parameters that are fixed in the fit
         if par_names and do_stitch and fixed_vals:
             for index, _ in fixed_vals:
                 par_names[index] = None
             par_names = [name for name in par_names if name]
 
+        if exact_hessian:
+            kwargs = self._exact_hessian_options(kwargs)
+
         result = self._internal_minimize(
-            **minimizer_kwargs, options=kwargs, par_names=par_names
+            **minimizer_kwargs,
+            options=kwargs,
+            par_names=par_names,
+            hess=wrapped_hessian[0] if wrapped_hessian else None,
         )
+        if exact_hessian:
+            result = self._internal_exact_uncertainties(
+                result, wrapped_hessian[0], fixed_vals=minimizer_kwargs['fixed_vals']
+            )
         result = self._internal_postprocess(
             result, stitch_pars, return_uncertainties=return_uncertainties
         )
@@ -1,6 +1,7 @@
 """JAX Backend Function Shim."""
 
 from pyhf import get_backend
+from pyhf.optimize.common import _block_tangents, _hessian_blocks
 from pyhf.tensor.common import _TensorViewer
 import jax
 import logging
@@ -8,7 +9,7 @@
 log = logging.getLogger(__name__)
 
 
-def _final_objective(
+def _final_values(
     pars, data, fixed_values, fixed_idx, variable_idx, do_stitch, objective, pdf
 ):
     log.debug('jitting function')
@@ -21,7 +22,18 @@ def _final_objective(
         )
     else:
         constrained_pars = pars
-    return objective(constrained_pars, data, pdf)[0]
+    return objective(constrained_pars, data, pdf)
+
+
+def _final_objective(
+    pars, data, fixed_values, fixed_idx, variable_idx, do_stitch, objective, pdf
+):
+    tensorlib, _ = get_backend()
+    return tensorlib.sum(
+        _final_values(
+            pars, data, fixed_values, fixed_idx, variable_idx, do_stitch, objective, pdf
+        )
+    )
 
 
 _jitted_objective_and_grad = jax.jit(
@@ -30,6 +42,38 @@ def _final_objective(
 
 _jitted_objective = jax.jit(_final_objective, static_argnums=(3, 4, 5, 6, 7))
 
+_jitted_values = jax.jit(_final_values, static_argnums=(3, 4, 5, 6, 7))
+
+_jitted_hessian = jax.jit(
+    jax.hessian(_final_objective, argnums=0), static_argnums=(3, 4, 5, 6, 7)
+)
+
+
+def _final_hessian_columns(
+    pars,
+    tangents,
+    data,
+    fixed_values,
+    fixed_idx,
+    variable_idx,
+    do_stitch,
+    objective,
+    pdf,
+):
+    """The products of the Hessian of the final objective with the ``tangents``."""
+
+    def gradient(pars):
+        return jax.grad(_final_objective)(
+            pars, data, fixed_values, fixed_idx, variable_idx, do_stitch, objective, pdf
+        )
+
+    return jax.vmap(lambda tangent: jax.jvp(gradient, (pars,), (tangent,))[1])(tangents)
+
+
+_jitted_hessian_columns = jax.jit(
+    _final_hessian_columns, static_argnums=(4, 5, 6, 7, 8)
+)
+
 
 def wrap_objective(objective, data, pdf, stitch_pars, do_grad=False, jit_pieces=None):
     """
@@ -78,3 +122,87 @@ def func(pars):
             )
 
     return func
+
+
+def wrap_hessian(objective, data, pdf, stitch_pars, jit_pieces=None):
+    """
+    Wrap the Hessian of the objective function w.r.t. the minimized parameters.
+
+    Args:
+        objective (:obj:`func`): objective function
+        data (:obj:`list`): observed data
+        pdf (~pyhf.pdf.Model): The statistical model adhering to the schema model.json
+        stitch_pars (:obj:`func`): callable that stitches parameters, see :func:`pyhf.optimize.common.shim`.
+
+    Returns:
+        hessian (:obj:`func`): tensor backend wrapped Hessian of the objective
+    """
+    tensorlib, _ = get_backend()
+    batch_size = getattr(pdf, 'batch_size', None)
+
+    if batch_size:
+
+        def func(pars):
+            # the Hessians of the independent batch elements from forward-mode
+            # derivatives of the gradient, see pyhf.optimize.common._block_tangents
+            pars = tensorlib.astensor(pars)
+            columns = _jitted_hessian_columns(
+                pars,
+                _block_tangents(batch_size, tensorlib.shape(pars)[0] // batch_size),
+                data,
+                jit_pieces['fixed_values'],
+                tuple(jit_pieces['fixed_idx']),
+                tuple(jit_pieces['variable_idx']),
+                jit_pieces['do_stitch'],
+                objective,
+                pdf,
+            )
+            return _hessian_blocks(columns, batch_size)
+
+        return func
+
+    def func(pars):
+        # need to convert to tuple to make args hashable
+        return _jitted_hessian(
+            tensorlib.astensor(pars),
+            data,
+            jit_pieces['fixed_values'],
+            tuple(jit_pieces['fixed_idx']),
+            tuple(jit_pieces['variable_idx']),
+            jit_pieces['do_stitch'],
+            objective,
+            pdf,
+        )
+
+    return func
+
+
+def wrap_values(objective, data, pdf, stitch_pars, jit_pieces=None):
+    """
+    Wrap the values of the objective function, e.g. of the batch elements.
+
+    Args:
+        objective (:obj:`func`): objective function
+        data (:obj:`list`): observed data
+        pdf (~pyhf.pdf.Model): The statistical model adhering to the schema model.json
+        stitch_pars (:obj:`func`): callable that stitches parameters, see :func:`pyhf.optimize.common.shim`.
+
+    Returns:
+        values (:obj:`func`): tensor backend wrapped values of the objective
+    """
+    tensorlib, _ = get_backend()
+
+    def func(pars):
+        # need to convert to tuple to make args hashable
+        return _jitted_values(
+            tensorlib.astensor(pars),
+            data,
+            jit_pieces['fixed_values'],
+            tuple(jit_pieces['fixed_idx']),
+            tuple(jit_pieces['variable_idx']),
+            jit_pieces['do_stitch'],
+            objective,
+            pdf,
+        )
+
+    return func
@@ -74,6 +74,9 @@ def _get_minimizer(
         minuit.errordef = self.errordef
         return minuit
 
+    def _exact_hessian_options(self, options):
+        return {'hesse': False, **options}
+
     def _minimize(
         self,
         minimizer,
@@ -98,6 +101,9 @@ def _minimize(
           * tolerance (:obj:`float`): Tolerance for termination.
             See specific optimizer for detailed meaning.
             Default is ``0.1``.
+          * hesse (:obj:`bool`): Estimate the uncertainties and correlations
+            with :meth:`iminuit.Minuit.hesse` after the minimization.
+            Default is ``True``.
 
         Returns:
             fitresult (scipy.optimize.OptimizeResult): the fit result
@@ -109,6 +115,7 @@ def _minimize(
             'strategy', self.strategy if self.strategy else not do_grad
         )
         tolerance = options.pop('tolerance', self.tolerance)
+        hesse = options.pop('hesse', True)
         if options:
             raise exceptions.Unsupported(
                 f"Unsupported options were passed in: {list(options.keys())}."
@@ -131,7 +138,7 @@ def _minimize(
         hess_inv = None
         corr = None
         unc = None
-        if minimizer.valid:
+        if minimizer.valid and hesse:
             # Extra call to hesse() after migrad() is always needed for good error estimates. If you pass a user-provided gradient to MINUIT, convergence is faster.
             minimizer.hesse()
             hess_inv = minimizer.covariance
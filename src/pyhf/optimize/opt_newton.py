@@ -0,0 +1,370 @@
+"""Newton Optimizer Class."""
+from pyhf import exceptions
+from pyhf.optimize.mixins import OptimizerMixin
+from pyhf.tensor.manager import get_backend
+import logging
+import scipy
+
+log = logging.getLogger(__name__)
+
+
+def _trust_region_newton(
+    func,
+    hess,
+    x0,
+    bounds,
+    fixed_vals=None,
+    maxiter=100,
+    tolerance=1e-6,
+    verbose=0,
+    values=None,
+):
+    r"""
+    Minimize with Newton steps on the active tensor backend.
+
+    The Newton step of the free parameters is damped in a Levenberg-Marquardt
+    fashion, which restricts it to a trust region, until the objective
+    decreases. Steps are projected onto the bounds, and parameters at a bound
+    whose gradient points outside of it are held for the step.
+    The minimization converges once the estimated distance to the minimum
+    :math:`\frac{1}{2} g^{T} H^{-1} g` of the free parameters is below
+    ``tolerance``.
+
+    If ``hess`` returns the Hessians of independent batch elements with shape
+    ``(batch_size, n, n)``, see :func:`pyhf.optimize.common.shim`, ``x0`` holds
+    the concatenated parameters of the batch elements, which are minimized as
+    independent problems in a single loop. Each element is damped on its own,
+    its steps are accepted on the change of its own objective value, and an
+    element no longer moves once it has converged, or once no step decreasing
+    its objective value is found, which fails the minimization without
+    stopping the other elements.
+
+    Args:
+        func (:obj:`func`): The objective function returning the objective value and gradient
+        hess (:obj:`func`): The Hessian of the objective function
+        x0 (:obj:`list`): The starting values of the parameters
+        bounds (:obj:`list` of :obj:`list`/:obj:`tuple`): The bounds of the parameters
+        fixed_vals (:obj:`list` of :obj:`list`/:obj:`tuple`): The pairs of index and constant value of fixed parameters
+        maxiter (:obj:`int`): Maximum number of Newton iterations
+        tolerance (:obj:`float`): Tolerance on the estimated distance to the minimum
+        verbose (:obj:`int`): Log the progress of each iteration at the info
+          instead of the debug level
+        values (:obj:`func`): The objective values of the batch elements, required for batched problems
+
+    Returns:
+        fitresult (scipy.optimize.OptimizeResult): the fit result
+    """
+    tensorlib, _ = get_backend()
+
+    x0 = list(x0)
+    is_fixed = [0.0] * len(x0)
+    for index, value in fixed_vals or []:
+        x0[index] = value
+        is_fixed[index] = 1.0
+    lower = tensorlib.astensor([bound[0] for bound in bounds])
+    upper = tensorlib.astensor([bound[1] for bound in bounds])
+    x = tensorlib.clip(tensorlib.astensor(x0), lower, upper)
+
+    hessian = tensorlib.astensor(hess(x))
+    batched = len(tensorlib.shape(hessian)) == 3
+    # the parameters of the batch elements along the rows, a single row if the
+    # problem is not batched
+    batch_size = tensorlib.shape(hessian)[0] if batched else 1
+    shape = (batch_size, len(x0) // batch_size)
+    n_pars = shape[1]
+    hessian = tensorlib.reshape(hessian, (batch_size, n_pars, n_pars))
+
+    fixed = tensorlib.reshape(tensorlib.astensor(is_fixed), shape)
+    free = 1.0 - fixed
+    lower = tensorlib.reshape(lower, shape)
+    upper = tensorlib.reshape(upper, shape)
+    ones = tensorlib.ones(shape)
+    identity = tensorlib.astensor(
+        [[float(row == column) for column in range(n_pars)] for row in range(n_pars)]
+    )
+
+    value, grad = func(x)
+    element_values = tensorlib.astensor(
+        values(x) if batched else tensorlib.reshape(tensorlib.astensor(value), (1,))
+    )
+    value = float(value)
+    grad = tensorlib.reshape(tensorlib.astensor(grad), shape)
+    x = tensorlib.reshape(x, shape)
+    nfev = nhev = 1
+    damping = tensorlib.zeros((batch_size,))
+    converged = tensorlib.zeros((batch_size,))
+    stalled = tensorlib.zeros((batch_size,))
+
+    def count(mask):
+        return float(
+            tensorlib.sum(
+                tensorlib.where(
+                    mask, tensorlib.ones((batch_size,)), tensorlib.zeros((batch_size,))
+                )
+            )
+        )
+
+    def increased(damping):
+        return tensorlib.where(
+            4.0 * damping > 1e-4 * scale, 4.0 * damping, 1e-4 * scale
+        )
+
+    def solve(matrices, vectors):
+        return tensorlib.reshape(
+            tensorlib.solve(
+                matrices, tensorlib.reshape(vectors, (batch_size, n_pars, 1))
+            ),
+            shape,
+        )
+
+    success = False
+    message = "Maximum number of iterations reached."
+    nit = 0
+    for nit in range(maxiter):
+        if nit:
+            hessian = tensorlib.reshape(
+                tensorlib.astensor(hess(tensorlib.reshape(x, (-1,)))),
+                (batch_size, n_pars, n_pars),
+            )
+            nhev += 1
+
+        # the parameters that do not move in this step
+        held = tensorlib.where(
+            ((x <= lower) & (grad > 0)) | ((x >= upper) & (grad < 0)), ones, fixed
+        )
+        moving = tensorlib.einsum('ij,aj->aij', identity, 1.0 - held)
+        free_grad = grad * (1.0 - held)
+        free_hessian = hessian * tensorlib.einsum(
+            'ai,aj->aij', 1.0 - held, 1.0 - held
+        ) + tensorlib.einsum('ij,aj->aij', identity, held)
+
+        newton_step = -solve(free_hessian, free_grad)
+        edm = -0.5 * tensorlib.sum(free_grad * newton_step, axis=1)
+        converged = tensorlib.where(
+            (edm >= 0) & (edm < tolerance), tensorlib.ones((batch_size,)), converged
+        )
+        level = logging.INFO if verbose else logging.DEBUG
+        if log.isEnabledFor(level):
+            log.log(
+                level,
+                "iteration %d: fun = %s, edm = %s, damping = %s",
+                nit,
+                value,
+                tensorlib.tolist(edm),
+                tensorlib.tolist(damping),
+            )
+        if count(converged > 0) == batch_size:
+            success = True
+            message = "Optimization terminated successfully."
+            break
+
+        scale = tensorlib.einsum('aij->a', tensorlib.abs(hessian * moving))
+        scale = tensorlib.where(scale > 1.0, scale, tensorlib.ones((batch_size,)))
+        while True:
+            # converged batch elements do not move anymore, nor do the
+            # elements for which no step decreasing the objective was found
+            stalled = tensorlib.where(
+                damping > 1e10 * scale, tensorlib.ones((batch_size,)), stalled
+            )
+            active = (1.0 - converged) * (1.0 - stalled)
+            if count(active > 0) == 0:
+                break
+
+            step = -solve(
+                free_hessian + tensorlib.einsum('a,aij->aij', damping, moving),
+                free_grad,
+            )
+            step = tensorlib.clip(x + step, lower, upper) - x
+            predicted = -(
+                tensorlib.sum(grad * step, axis=1)
+                + 0.5 * tensorlib.einsum('ai,aij,aj->a', step, hessian, step)
+            )
+            # an element whose step does not decrease the quadratic model is
+            # damped further without moving
+            improving = tensorlib.where(
+                predicted > 0, active, tensorlib.zeros((batch_size,))
+            )
+            damping = tensorlib.where(
+                (active > 0) & (improving == 0), increased(damping), damping
+            )
+            if count(improving > 0) == 0:
+                continue
+
+            step = tensorlib.einsum('a,ai->ai', improving, step)
+            # the gradient is only needed once a step is accepted, which for
+            # batched problems is evaluated at the accepted steps of all elements
+            if batched:
+                trial_values = tensorlib.astensor(
+                    values(tensorlib.reshape(x + step, (-1,)))
+                )
+            else:
+                trial_value, trial_grad = func(tensorlib.reshape(x + step, (-1,)))
+                trial_values = tensorlib.reshape(tensorlib.astensor(trial_value), (1,))
+            nfev += 1
+            ratios = (element_values - trial_values) / tensorlib.where(
+                improving > 0, predicted, ones[:, 0]
+            )
+            accepted = tensorlib.where(
+                ratios > 1e-4, improving, tensorlib.zeros((batch_size,))
+            )
+            damping = tensorlib.where(
+                (accepted > 0) & (ratios > 0.75),
+                tensorlib.where(damping > 1e-8 * scale, damping / 4.0, 0.0 * damping),
+                damping,
+            )
+            damping = tensorlib.where(
+                (improving > 0) & (accepted == 0), increased(damping), damping
+            )
+            if count(accepted > 0) == 0:
+                continue
+
+            x = x + tensorlib.einsum('a,ai->ai', accepted, step)
+            if batched:
+                _, trial_grad = func(tensorlib.reshape(x, (-1,)))
+                nfev += 1
+            grad = tensorlib.reshape(tensorlib.astensor(trial_grad), shape)
+            element_values = tensorlib.where(accepted > 0, trial_values, element_values)
+            value = float(tensorlib.sum(element_values))
+            break
+
+        if count(active > 0) == 0:
+            message = "Optimization failed. No step decreasing the objective was found."
+            break
+
+    # the covariance of the free parameters from the inverse Hessian of twice the NLL
+    free_outer = tensorlib.einsum('ai,aj->aij', free, free)
+    hessian = hessian * free_outer + tensorlib.einsum('ij,aj->aij', identity, fixed)
+    hess_inv = unc = corr = None
+    if success:
+        hess_inv = (
+            2.0
+            * tensorlib.solve(
+                hessian,
+                tensorlib.einsum('ij,a->aij', identity, tensorlib.ones((batch_size,))),
+            )
+            * free_outer
+        )
+        unc = tensorlib.sqrt(tensorlib.einsum('aii->ai', hess_inv))
+        # fixed parameters have no uncertainty and are uncorrelated
+        corr = hess_inv / tensorlib.einsum('ai,aj->aij', unc + fixed, unc + fixed)
+        unc = tensorlib.reshape(unc, (-1,))
+        # correlations are only defined within a batch element
+        if batched:
+            corr = None
+        else:
+            hess_inv, corr = hess_inv[0], corr[0]
+
+    return scipy.optimize.OptimizeResult(
+        x=tensorlib.reshape(x, (-1,)),
+        unc=unc,
+        corr=corr,
+        success=success,
+        fun=value,
+        hess_inv=hess_inv,
+        message=message,
+        nfev=nfev,
+        njev=nfev,
+        nhev=nhev,
+        nit=nit,
+    )
+
+
+class newton_optimizer(OptimizerMixin):
+    """
+    Optimizer that minimizes with Newton steps on the active tensor backend.
+
+    The exact gradient and Hessian of the objective are evaluated on the
+    backend (by automatic differentiation, or analytically for the numpy
+    backend), such that the smooth and nearly quadratic likelihoods converge
+    within few iterations.
+
+    Fits of batched models, e.g. of many toy datasets, are minimized as
+    independent problems of the batch elements in a single vectorized loop,
+    with the Hessians of the elements and a convergence mask that stops the
+    elements that have converged.
+
+    Example:
+        >>> import pyhf
+        >>> pyhf.set_backend("numpy", "newton")
+        >>> model = pyhf.simplemodels.uncorrelated_background(
+        ...     signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0], batch_size=2
+        ... )
+        >>> data = [[51, 48] + model.config.auxdata, [60, 55] + model.config.auxdata]
+        >>> pyhf.infer.mle.fit(pyhf.tensorlib.astensor(data), model)
+        array([[0.        , 1.00304187, 0.96267296],
+               [0.63675495, 1.00636968, 0.96510689]])
+    """
+
+    __slots__ = ['name', 'tolerance']
+
+    _requires_derivatives = True
+
+    def __init__(self, *args, **kwargs):
+        """
+        Create a Newton optimizer.
+
+        See :class:`pyhf.optimize.mixins.OptimizerMixin` for other configuration options.
+
+        Args:
+            tolerance (:obj:`float`): Tolerance for termination on the estimated
+              distance to the minimum. Default is ``1e-6``.
+        """
+        self.name = 'newton'
+        self.tolerance = kwargs.pop('tolerance', 1e-6)
+        super().__init__(*args, **kwargs)
+
+    def _get_minimizer(
+        self,
+        objective_and_grad,
+        init_pars,
+        init_bounds,
+        fixed_vals=None,
+        do_grad=False,
+        par_names=None,
+    ):
+        return _trust_region_newton
+
+    def _minimize(
+        self,
+        minimizer,
+        func,
+        x0,
+        do_grad=False,
+        bounds=None,
+        fixed_vals=None,
+        options={},
+        hess=None,
+        values=None,
+    ):
+        """
+        Same signature as :func:`scipy.optimize.minimize`.
+
+        Minimizer Options:
+          * maxiter (:obj:`int`): Maximum number of iterations. Default is ``100000``.
+          * verbose (:obj:`bool`): Log the progress of each iteration at the
+            info level during minimization. Default is ``False``.
+          * tolerance (:obj:`float`): Tolerance for termination on the estimated
+            distance to the minimum. Default is ``1e-6``.
+
+        Returns:
+            fitresult (scipy.optimize.OptimizeResult): the fit result
+        """
+        maxiter = options.pop('maxiter', self.maxiter)
+        verbose = options.pop('verbose', self.verbose)
+        tolerance = options.pop('tolerance', self.tolerance)
+        if options:
+            raise exceptions.Unsupported(
+                f"Unsupported options were passed in: {list(options.keys())}."
+            )
+
+        return minimizer(
+            func,
+            hess,
+            x0,
+            bounds,
+            fixed_vals=fixed_vals,
+            maxiter=maxiter,
+            tolerance=tolerance,
+            verbose=verbose,
+            values=values,
+        )
@@ -1,32 +1,521 @@
 """Numpy Backend Function Shim."""
 
+import numpy as np
+
 from pyhf import get_backend
 from pyhf import exceptions
+from pyhf.optimize.common import _block_indices
+
+
+def _scatter_add(indices, values, size):
+    """Sum the ``values`` into a flat tensor of length ``size`` at ``indices``."""
+    return np.bincount(np.ravel(indices), weights=np.ravel(values), minlength=size)
+
+
+def _exclusive_products(slotted):
+    """
+    The product of all factors but the one in each slot along the second axis,
+    built from prefix and suffix products to not divide by factors of zero.
+    """
+    prefix = np.cumprod(slotted, axis=1)
+    suffix = np.cumprod(slotted[:, ::-1], axis=1)[:, ::-1]
+    others = np.ones_like(slotted)
+    others[:, 1:] *= prefix[:, :-1]
+    others[:, :-1] *= suffix[:, 1:]
+    return others
+
+
+class _LogpdfGradient:
+    r"""
+    The analytic gradient of :meth:`~pyhf.pdf.Model.logpdf` w.r.t. the parameters.
+
+    The expected rate of each sample :math:`s` in each bin :math:`b` is
+
+    .. math::
+
+        \lambda_{sb} = \left(\nu_{sb}^0 + \sum_{e \in \text{deltas}} \Delta_e\right) \prod_{e \in \text{factors}} f_e
+
+    where each delta :math:`\Delta_e` and factor :math:`f_e` of a modifier
+    entry depends on a single parameter. The ``gradient_entries`` of the
+    modifier appliers provide these modifications and their derivatives, so
+    that the gradient of the main term follows from the chain rule with
+
+    .. math::
+
+        \frac{\partial \ln L}{\partial \lambda_{sb}} = \frac{n_b}{\sum_s \lambda_{sb}} - 1\,.
+
+    The product of all other factors of a (sample, bin) is built from prefix
+    and suffix products, such that factors of zero (e.g. a POI of zero) are
+    handled without dividing by them.
+    """
+
+    _entries = 'gradient_entries'
+    _derivatives = 'gradients'
+
+    def __init__(self, pdf):
+        main_model = pdf.main_model
+        self.batch_size = pdf.batch_size
+        self.n_alphas = pdf.batch_size or 1
+        self.npars = pdf.config.npars
+        self.nmaindata = pdf.config.nmaindata
+        self.constraints_gaussian = pdf.constraint_model.constraints_gaussian
+        self.constraints_poisson = pdf.constraint_model.constraints_poisson
+
+        nominal_rates = np.asarray(main_model.nominal_rates)[0]
+        self.n_bins = nominal_rates.shape[-1]
+        # (sample, bin) flattened, shape (n_samples * n_bins, n_alphas)
+        self.nominal_rates = np.reshape(
+            np.einsum('sab->sba', nominal_rates), (-1, nominal_rates.shape[1])
+        )
+
+        for name in main_model._delta_mods + main_model._factor_mods:
+            if not hasattr(main_model.modifiers_appliers[name], self._entries):
+                raise exceptions.Unsupported(
+                    f'The {name} modifier does not provide analytic {self._derivatives}.'
+                )
+        self.delta_appliers = [
+            main_model.modifiers_appliers[name]
+            for name in main_model._delta_mods
+            if main_model.modifiers_appliers[name].param_viewer.index_selection
+        ]
+        self.factor_appliers = [
+            main_model.modifiers_appliers[name]
+            for name in main_model._factor_mods
+            if main_model.modifiers_appliers[name].param_viewer.index_selection
+        ]
+
+        # place the factors affecting a (sample, bin) next to each other in
+        # a (n_samples * n_bins, n_overlaps) layout padded with ones
+        factor_targets = np.concatenate(
+            [np.asarray(applier.target_indices) for applier in self.factor_appliers]
+            + [np.zeros(0, dtype=int)]
+        )
+        counts = np.bincount(factor_targets, minlength=len(self.nominal_rates))
+        self.n_overlaps = int(counts.max(initial=0))
+        order = np.argsort(factor_targets, kind='stable')
+        starts = np.cumsum(counts) - counts
+        slots = np.empty_like(factor_targets)
+        slots[order] = np.arange(len(factor_targets)) - starts[factor_targets[order]]
+        self.factor_positions = factor_targets * self.n_overlaps + slots
+
+    def _rate_components(self, deltas, factors):
+        """
+        The nominal rates with all deltas added, the factors in their slots,
+        the product of all factors but the one in each slot, and the product
+        of all factors of each (sample, bin).
+        """
+        n_rates, n_alphas = len(self.nominal_rates), self.n_alphas
+        # the nominal rates with all deltas added, shape (n_rates, n_alphas)
+        alpha_offsets = np.arange(n_alphas)
+        summed = self.nominal_rates * np.ones(n_alphas)
+        for applier, (values, *_) in zip(self.delta_appliers, deltas):
+            targets = np.asarray(applier.target_indices)[:, None] * n_alphas
+            summed = summed + np.reshape(
+                _scatter_add(targets + alpha_offsets, values, n_rates * n_alphas),
+                (n_rates, n_alphas),
+            )
+
+        slotted = np.ones((n_rates * self.n_overlaps, n_alphas))
+        if factors:
+            slotted[self.factor_positions] = np.concatenate(
+                [values for values, *_ in factors]
+            )
+        slotted = np.reshape(slotted, (n_rates, self.n_overlaps, n_alphas))
+        others = _exclusive_products(slotted)
+        product = (
+            others[:, 0] * slotted[:, 0] if self.n_overlaps else np.ones_like(summed)
+        )
+        return summed, slotted, others, product
+
+    def _weights(self, expected, maindata):
+        """d ln L / d lambda_sb, shape (n_rates, n_alphas)"""
+        weights = np.divide(
+            maindata, expected, out=np.zeros_like(expected), where=maindata != 0
+        )
+        return np.tile(weights - 1.0, (len(self.nominal_rates) // self.n_bins, 1))
+
+    def _expected(self, summed, product):
+        """The expected event rates of the bins, shape (n_bins, n_alphas)"""
+        return np.sum(
+            np.reshape(summed * product, (-1, self.n_bins, self.n_alphas)), axis=0
+        )
+
+    def _main_gradient(self, pars, maindata):
+        n_alphas = self.n_alphas
+        grad = np.zeros(n_alphas * self.npars)
+
+        deltas = [applier.gradient_entries(pars) for applier in self.delta_appliers]
+        factors = [applier.gradient_entries(pars) for applier in self.factor_appliers]
+        summed, _, others, product = self._rate_components(deltas, factors)
+        weights = self._weights(self._expected(summed, product), maindata)
+
+        delta_weights = weights * product
+        for applier, (_, derivatives) in zip(self.delta_appliers, deltas):
+            grad += _scatter_add(
+                applier.parameter_indices,
+                delta_weights[np.asarray(applier.target_indices)] * derivatives,
+                len(grad),
+            )
+
+        factor_weights = weights * summed
+        others = np.reshape(others, (-1, n_alphas))
+        offset = 0
+        for applier, (_, derivatives) in zip(self.factor_appliers, factors):
+            positions = self.factor_positions[offset : offset + len(derivatives)]
+            offset += len(derivatives)
+            grad += _scatter_add(
+                applier.parameter_indices,
+                factor_weights[np.asarray(applier.target_indices)]
+                * others[positions]
+                * derivatives,
+                len(grad),
+            )
+        return grad
+
+    def _constraint_gradient(self, flat_pars, auxdata):
+        grad = np.zeros(len(flat_pars))
+        if self.constraints_gaussian.has_pdf():
+            indices = np.asarray(self.constraints_gaussian.access_field)
+            normal_data = auxdata[:, np.asarray(self.constraints_gaussian.normal_data)]
+            sigmas = np.asarray(self.constraints_gaussian.sigmas)
+            grad += _scatter_add(
+                indices,
+                (normal_data - flat_pars[indices]) / sigmas**2,
+                len(grad),
+            )
+        if self.constraints_poisson.has_pdf():
+            indices = np.asarray(self.constraints_poisson.access_field)
+            poisson_data = auxdata[:, np.asarray(self.constraints_poisson.poisson_data)]
+            factors = np.asarray(self.constraints_poisson.batched_factors)
+            rates = flat_pars[indices] * factors
+            ratios = np.divide(
+                poisson_data, rates, out=np.zeros_like(rates), where=poisson_data != 0
+            )
+            grad += _scatter_add(indices, factors * (ratios - 1.0), len(grad))
+        return grad
+
+    def _split(self, pars, data):
+        """The flattened and the (batched) parameters, the main and the auxiliary data."""
+        pars = np.asarray(pars, dtype=float)
+        flat_pars = np.reshape(pars, (-1,))
+        if self.batch_size:
+            pars = np.reshape(pars, (self.batch_size, self.npars))
+        data = np.asarray(data, dtype=float)
+        data = np.broadcast_to(
+            np.reshape(data, (-1, data.shape[-1])), (self.n_alphas, data.shape[-1])
+        )
+        return (
+            flat_pars,
+            pars,
+            np.transpose(data[:, : self.nmaindata]),
+            data[:, self.nmaindata :],
+        )
+
+    def __call__(self, pars, data):
+        """
+        Args:
+            pars (:obj:`tensor`): The parameter values
+            data (:obj:`tensor`): The measurement data
+
+        Returns:
+            Tensor: The gradient of the log density w.r.t. the flattened parameters
+        """
+        flat_pars, pars, maindata, auxdata = self._split(pars, data)
+        return self._main_gradient(pars, maindata) + self._constraint_gradient(
+            flat_pars, auxdata
+        )
+
+
+class _LogpdfHessian(_LogpdfGradient):
+    r"""
+    The analytic Hessian of :meth:`~pyhf.pdf.Model.logpdf` w.r.t. the parameters.
+
+    Differentiating the gradient of :class:`_LogpdfGradient` once more gives
+    for the main term
+
+    .. math::
+
+        \frac{\partial^2 \ln L}{\partial \theta_i \partial \theta_j} = \sum_b \left(\frac{n_b}{\nu_b} - 1\right) \frac{\partial^2 \nu_b}{\partial \theta_i \partial \theta_j} - \sum_b \frac{n_b}{\nu_b^2} \frac{\partial \nu_b}{\partial \theta_i} \frac{\partial \nu_b}{\partial \theta_j}
+
+    with :math:`\nu_b = \sum_s \lambda_{sb}`. The ``hessian_entries`` of the
+    modifier appliers provide the second derivatives of the modifications,
+    the mixed second derivatives of a rate :math:`\lambda_{sb}` follow from
+    the first derivatives of each pair of modifications of the same
+    (sample, bin).
+    """
+
+    _entries = 'hessian_entries'
+    _derivatives = 'Hessians'
+
+    def _main_hessian(self, pars, maindata):
+        n_rates, n_alphas = len(self.nominal_rates), self.n_alphas
+        n_overlaps = self.n_overlaps
+        npars = self.npars
+
+        deltas = [applier.hessian_entries(pars) for applier in self.delta_appliers]
+        factors = [applier.hessian_entries(pars) for applier in self.factor_appliers]
+        summed, slotted, others, product = self._rate_components(deltas, factors)
+        expected = self._expected(summed, product)
+        weights = self._weights(expected, maindata)
+
+        # the parameters and derivatives of the factors in their slots, the
+        # padding slots have vanishing derivatives
+        slot_shape = (n_rates, n_overlaps, n_alphas)
+        slot_pars = np.zeros((n_rates * n_overlaps, n_alphas), dtype=int)
+        slot_derivatives = np.zeros((n_rates * n_overlaps, n_alphas))
+        slot_curvatures = np.zeros((n_rates * n_overlaps, n_alphas))
+        if factors:
+            slot_pars[self.factor_positions] = np.concatenate(
+                [
+                    np.reshape(applier.parameter_indices, (-1, n_alphas))
+                    for applier in self.factor_appliers
+                ]
+            )
+            slot_derivatives[self.factor_positions] = np.concatenate(
+                [derivatives for _, derivatives, _ in factors]
+            )
+            slot_curvatures[self.factor_positions] = np.concatenate(
+                [curvatures for *_, curvatures in factors]
+            )
+        slot_pars = np.reshape(slot_pars, slot_shape)
+        slot_derivatives = np.reshape(slot_derivatives, slot_shape)
+        slot_curvatures = np.reshape(slot_curvatures, slot_shape)
+        factor_slopes = others * slot_derivatives
+
+        # the batch elements are independent, such that only the blocks of
+        # parameters of the same element are computed, a flattened parameter p
+        # enters its block as p % npars
+        # d nu_b / d theta_p with the rows (alpha, bin) flattened
+        rate_rows = (np.arange(n_rates) % self.n_bins)[:, None]
+        rate_rows = rate_rows + np.arange(n_alphas) * self.n_bins
+        jacobian = np.zeros(self.n_bins * n_alphas * npars)
+        hessian = np.zeros(n_alphas * npars * npars)
+        mixed = np.zeros(n_alphas * npars * npars)
+
+        for applier, (_, derivatives, curvatures) in zip(self.delta_appliers, deltas):
+            targets = np.asarray(applier.target_indices)
+            parameters = np.reshape(applier.parameter_indices, (-1, n_alphas))
+            jacobian += _scatter_add(
+                rate_rows[targets] * npars + parameters % npars,
+                product[targets] * derivatives,
+                len(jacobian),
+            )
+            hessian += _scatter_add(
+                parameters * npars + parameters % npars,
+                weights[targets] * product[targets] * curvatures,
+                len(hessian),
+            )
+            # with the factors of the same (sample, bin)
+            mixed += _scatter_add(
+                parameters[:, None] * npars + slot_pars[targets] % npars,
+                (weights[targets] * derivatives)[:, None] * factor_slopes[targets],
+                len(mixed),
+            )
+
+        factor_weights = weights * summed
+        jacobian += _scatter_add(
+            rate_rows[:, None] * npars + slot_pars % npars,
+            summed[:, None] * factor_slopes,
+            len(jacobian),
+        )
+        hessian += _scatter_add(
+            slot_pars * npars + slot_pars % npars,
+            factor_weights[:, None] * others * slot_curvatures,
+            len(hessian),
+        )
+        # pairs of distinct factors of the same (sample, bin)
+        for slot in range(n_overlaps):
+            excluded = slotted.copy()
+            excluded[:, slot] = 1.0
+            pair_slopes = _exclusive_products(excluded) * slot_derivatives
+            pair_slopes[:, slot] = 0.0
+            hessian += _scatter_add(
+                slot_pars[:, slot, None] * npars + slot_pars % npars,
+                (factor_weights * slot_derivatives[:, slot])[:, None] * pair_slopes,
+                len(hessian),
+            )
+
+        block_shape = (n_alphas, npars, npars)
+        hessian = np.reshape(hessian, block_shape)
+        mixed = np.reshape(mixed, block_shape)
+        jacobian = np.reshape(jacobian, (n_alphas, self.n_bins, npars))
+        curvature = np.divide(
+            maindata,
+            expected**2,
+            out=np.zeros_like(expected),
+            where=maindata != 0,
+        )
+        return (
+            hessian
+            + mixed
+            + np.transpose(mixed, (0, 2, 1))
+            - np.einsum('abi,ba,abj->aij', jacobian, curvature, jacobian)
+        )
+
+    def _constraint_hessian(self, flat_pars, auxdata):
+        npars = self.npars
+        hessian = np.zeros(len(flat_pars) * npars)
+        if self.constraints_gaussian.has_pdf():
+            indices = np.asarray(self.constraints_gaussian.access_field)
+            sigmas = np.asarray(self.constraints_gaussian.sigmas)
+            hessian += _scatter_add(
+                indices * npars + indices % npars,
+                np.broadcast_to(-1.0 / sigmas**2, indices.shape),
+                len(hessian),
+            )
+        if self.constraints_poisson.has_pdf():
+            indices = np.asarray(self.constraints_poisson.access_field)
+            poisson_data = auxdata[:, np.asarray(self.constraints_poisson.poisson_data)]
+            pars = flat_pars[indices]
+            hessian += _scatter_add(
+                indices * npars + indices % npars,
+                -np.divide(
+                    poisson_data,
+                    pars**2,
+                    out=np.zeros_like(pars),
+                    where=poisson_data != 0,
+                ),
+                len(hessian),
+            )
+        return np.reshape(hessian, (-1, npars, npars))
+
+    def __call__(self, pars, data):
+        """
+        Args:
+            pars (:obj:`tensor`): The parameter values
+            data (:obj:`tensor`): The measurement data
+
+        Returns:
+            Tensor: The Hessian of the log density w.r.t. the parameters of each
+            batch element, with shape ``(batch_size, npars, npars)`` (and a
+            batch size of one for non-batched models)
+        """
+        flat_pars, pars, maindata, auxdata = self._split(pars, data)
+        return self._main_hessian(pars, maindata) + self._constraint_hessian(
+            flat_pars, auxdata
+        )
 
 
 def wrap_objective(objective, data, pdf, stitch_pars, do_grad=False, jit_pieces=None):
     """
     Wrap the objective function for the minimization.
 
+    Numpy does not support autodifferentiation, the gradients of
+    :func:`~pyhf.infer.mle.twice_nll` are instead computed analytically.
+
     Args:
         objective (:obj:`func`): objective function
         data (:obj:`list`): observed data
         pdf (~pyhf.pdf.Model): The statistical model adhering to the schema model.json
         stitch_pars (:obj:`func`): callable that stitches parameters, see :func:`pyhf.optimize.common.shim`.
-        do_grad (:obj:`bool`): enable autodifferentiation mode. Default is off.
+        do_grad (:obj:`bool`): enable gradient mode. Default is off.
 
     Returns:
         objective_and_grad (:obj:`func`): tensor backend wrapped objective,gradient pair
     """
+    from pyhf.infer.mle import twice_nll, _batched_twice_nll
 
     tensorlib, _ = get_backend()
 
     if do_grad:
-        raise exceptions.Unsupported("Numpy does not support autodifferentiation.")
+        batch_size = getattr(pdf, 'batch_size', None)
+        if not (
+            (objective is twice_nll and not batch_size)
+            or (objective is _batched_twice_nll and batch_size)
+        ) or not hasattr(pdf, 'main_model'):
+            raise exceptions.Unsupported(
+                "Numpy only supports gradients of the negative log-likelihood of HistFactory models."
+            )
+        logpdf_gradient = _LogpdfGradient(pdf)
+        variable_idx = (
+            jit_pieces['variable_idx']
+            if jit_pieces and jit_pieces['do_stitch']
+            else None
+        )
+
+        def func(pars):
+            pars = tensorlib.astensor(pars)
+            constrained_pars = stitch_pars(pars)
+            value = tensorlib.sum(objective(constrained_pars, data, pdf))
+            grad = -2 * logpdf_gradient(constrained_pars, data)
+            if variable_idx is not None:
+                grad = grad[variable_idx]
+            return value, grad
+
+        return func
 
     def func(pars):
         pars = tensorlib.astensor(pars)
         constrained_pars = stitch_pars(pars)
-        return objective(constrained_pars, data, pdf)[0]
+        return tensorlib.sum(objective(constrained_pars, data, pdf))
+
+    return func
+
+
+def wrap_hessian(objective, data, pdf, stitch_pars, jit_pieces=None):
+    """
+    Wrap the Hessian of the objective function w.r.t. the minimized parameters.
+
+    Numpy does not support autodifferentiation, the Hessian of
+    :func:`~pyhf.infer.mle.twice_nll` is instead computed analytically.
+    For batched models the Hessian is block diagonal, and the blocks of the
+    batch elements are returned, see :func:`pyhf.optimize.common.shim`.
+
+    Args:
+        objective (:obj:`func`): objective function
+        data (:obj:`list`): observed data
+        pdf (~pyhf.pdf.Model): The statistical model adhering to the schema model.json
+        stitch_pars (:obj:`func`): callable that stitches parameters, see :func:`pyhf.optimize.common.shim`.
+
+    Returns:
+        hessian (:obj:`func`): tensor backend wrapped Hessian of the objective
+    """
+    from pyhf.infer.mle import twice_nll, _batched_twice_nll
+
+    tensorlib, _ = get_backend()
+
+    batch_size = getattr(pdf, 'batch_size', None)
+    if not (
+        (objective is twice_nll and not batch_size)
+        or (objective is _batched_twice_nll and batch_size)
+    ) or not hasattr(pdf, 'main_model'):
+        raise exceptions.Unsupported(
+            "Numpy only supports Hessians of the negative log-likelihood of HistFactory models."
+        )
+    logpdf_hessian = _LogpdfHessian(pdf)
+    variable_idx = (
+        jit_pieces['variable_idx'] if jit_pieces and jit_pieces['do_stitch'] else None
+    )
+    if variable_idx is not None:
+        # the parameters of a block that are minimized
+        variable_idx = _block_indices(variable_idx, batch_size or 1, pdf.config.npars)
+
+    def func(pars):
+        pars = tensorlib.astensor(pars)
+        hessian = -2 * logpdf_hessian(stitch_pars(pars), data)
+        if variable_idx is not None:
+            hessian = hessian[:, variable_idx][:, :, variable_idx]
+        return hessian if batch_size else hessian[0]
+
+    return func
+
+
+def wrap_values(objective, data, pdf, stitch_pars, jit_pieces=None):
+    """
+    Wrap the values of the objective function, e.g. of the batch elements.
+
+    Args:
+        objective (:obj:`func`): objective function
+        data (:obj:`list`): observed data
+        pdf (~pyhf.pdf.Model): The statistical model adhering to the schema model.json
+        stitch_pars (:obj:`func`): callable that stitches parameters, see :func:`pyhf.optimize.common.shim`.
+
+    Returns:
+        values (:obj:`func`): tensor backend wrapped values of the objective
+    """
+    tensorlib, _ = get_backend()
+
+    def func(pars):
+        return objective(stitch_pars(tensorlib.astensor(pars)), data, pdf)
 
     return func
@@ -1,6 +1,7 @@
 """PyTorch Backend Function Shim."""
 
 from pyhf import get_backend
+from pyhf.optimize.common import _block_tangents, _hessian_blocks
 import torch
 
 
@@ -24,19 +25,89 @@ def wrap_objective(objective, data, pdf, stitch_pars, do_grad=False, jit_pieces=
     if do_grad:
 
         def func(pars):
-            pars = tensorlib.astensor(pars)
+            # differentiate w.r.t. a leaf tensor that leaves the input untouched
+            pars = tensorlib.astensor(pars).detach()
             pars.requires_grad = True
             constrained_pars = stitch_pars(pars)
-            constr_nll = objective(constrained_pars, data, pdf)
+            constr_nll = tensorlib.sum(objective(constrained_pars, data, pdf))
             grad = torch.autograd.grad(constr_nll, pars)[0]
-            return constr_nll.detach().numpy()[0], grad
+            return constr_nll.detach().numpy(), grad
 
     else:
 
         def func(pars):
             pars = tensorlib.astensor(pars)
             constrained_pars = stitch_pars(pars)
-            constr_nll = objective(constrained_pars, data, pdf)
-            return constr_nll[0]
+            return tensorlib.sum(objective(constrained_pars, data, pdf))
+
+    return func
+
+
+def wrap_hessian(objective, data, pdf, stitch_pars, jit_pieces=None):
+    """
+    Wrap the Hessian of the objective function w.r.t. the minimized parameters.
+
+    Args:
+        objective (:obj:`func`): objective function
+        data (:obj:`list`): observed data
+        pdf (~pyhf.pdf.Model): The statistical model adhering to the schema model.json
+        stitch_pars (:obj:`func`): callable that stitches parameters, see :func:`pyhf.optimize.common.shim`.
+
+    Returns:
+        hessian (:obj:`func`): tensor backend wrapped Hessian of the objective
+    """
+    tensorlib, _ = get_backend()
+    batch_size = getattr(pdf, 'batch_size', None)
+
+    def constrained_objective(pars):
+        return tensorlib.sum(objective(stitch_pars(pars), data, pdf))
+
+    if batch_size:
+
+        def func(pars):
+            # the Hessians of the independent batch elements from
+            # Hessian-vector products, see pyhf.optimize.common._block_tangents
+            pars = tensorlib.astensor(pars).detach()
+            pars.requires_grad = True
+            grad = torch.autograd.grad(
+                constrained_objective(pars), pars, create_graph=True
+            )[0]
+            columns = torch.stack(
+                [
+                    torch.autograd.grad(
+                        grad, pars, grad_outputs=tangent, retain_graph=True
+                    )[0]
+                    for tangent in _block_tangents(batch_size, len(pars) // batch_size)
+                ]
+            )
+            return _hessian_blocks(columns.detach(), batch_size)
+
+        return func
+
+    def func(pars):
+        pars = tensorlib.astensor(pars)
+        return torch.autograd.functional.hessian(constrained_objective, pars)
+
+    return func
+
+
+def wrap_values(objective, data, pdf, stitch_pars, jit_pieces=None):
+    """
+    Wrap the values of the objective function, e.g. of the batch elements.
+
+    Args:
+        objective (:obj:`func`): objective function
+        data (:obj:`list`): observed data
+        pdf (~pyhf.pdf.Model): The statistical model adhering to the schema model.json
+        stitch_pars (:obj:`func`): callable that stitches parameters, see :func:`pyhf.optimize.common.shim`.
+
+    Returns:
+        values (:obj:`func`): tensor backend wrapped values of the objective
+    """
+    tensorlib, _ = get_backend()
+
+    def func(pars):
+        with torch.no_grad():
+            return objective(stitch_pars(tensorlib.astensor(pars)), data, pdf)
 
     return func
@@ -1,5 +1,6 @@
 """Tensorflow Backend Function Shim."""
 from pyhf import get_backend
+from pyhf.optimize.common import _block_tangents, _hessian_blocks
 import tensorflow as tf
 
 
@@ -26,18 +27,82 @@ def func(pars):
             with tf.GradientTape() as tape:
                 tape.watch(pars)
                 constrained_pars = stitch_pars(pars)
-                constr_nll = objective(constrained_pars, data, pdf)
+                constr_nll = tensorlib.sum(objective(constrained_pars, data, pdf))
             # NB: tape.gradient can return a sparse gradient (tf.IndexedSlices)
             # when tf.gather is used and this needs to be converted back to a
             # tensor to be usable as a value
             grad = tape.gradient(constr_nll, pars)
-            return constr_nll.numpy()[0], tf.convert_to_tensor(grad)
+            return constr_nll.numpy(), tf.convert_to_tensor(grad)
 
     else:
 
         def func(pars):
             pars = tensorlib.astensor(pars)
             constrained_pars = stitch_pars(pars)
-            return objective(constrained_pars, data, pdf)[0]
+            return tensorlib.sum(objective(constrained_pars, data, pdf))
+
+    return func
+
+
+def wrap_hessian(objective, data, pdf, stitch_pars, jit_pieces=None):
+    """
+    Wrap the Hessian of the objective function w.r.t. the minimized parameters.
+
+    Args:
+        objective (:obj:`func`): objective function
+        data (:obj:`list`): observed data
+        pdf (~pyhf.pdf.Model): The statistical model adhering to the schema model.json
+        stitch_pars (:obj:`func`): callable that stitches parameters, see :func:`pyhf.optimize.common.shim`.
+
+    Returns:
+        hessian (:obj:`func`): tensor backend wrapped Hessian of the objective
+    """
+    tensorlib, _ = get_backend()
+    batch_size = getattr(pdf, 'batch_size', None)
+
+    def func(pars):
+        pars = tensorlib.astensor(pars)
+        with tf.GradientTape(persistent=True) as outer_tape:
+            outer_tape.watch(pars)
+            with tf.GradientTape() as tape:
+                tape.watch(pars)
+                constr_nll = tensorlib.sum(objective(stitch_pars(pars), data, pdf))
+            grad = tf.convert_to_tensor(tape.gradient(constr_nll, pars))
+        if batch_size:
+            # the Hessians of the independent batch elements from
+            # Hessian-vector products, see pyhf.optimize.common._block_tangents
+            columns = tf.stack(
+                [
+                    tf.convert_to_tensor(
+                        outer_tape.gradient(grad, pars, output_gradients=tangent)
+                    )
+                    for tangent in _block_tangents(
+                        batch_size, pars.shape[0] // batch_size
+                    )
+                ]
+            )
+            return _hessian_blocks(columns, batch_size)
+        return outer_tape.jacobian(grad, pars, experimental_use_pfor=False)
+
+    return func
+
+
+def wrap_values(objective, data, pdf, stitch_pars, jit_pieces=None):
+    """
+    Wrap the values of the objective function, e.g. of the batch elements.
+
+    Args:
+        objective (:obj:`func`): objective function
+        data (:obj:`list`): observed data
+        pdf (~pyhf.pdf.Model): The statistical model adhering to the schema model.json
+        stitch_pars (:obj:`func`): callable that stitches parameters, see :func:`pyhf.optimize.common.shim`.
+
+    Returns:
+        values (:obj:`func`): tensor backend wrapped values of the objective
+    """
+    tensorlib, _ = get_backend()
+
+    def func(pars):
+        return objective(stitch_pars(tensorlib.astensor(pars)), data, pdf)
 
     return func
@@ -5,7 +5,7 @@
 import jsonpatch
 from pyhf import exceptions
 from pyhf import utils
-from pyhf.workspace import Workspace
+from pyhf.workspace import Workspace, _apply_patch
 
 log = logging.getLogger(__name__)
 
@@ -314,4 +314,5 @@ def apply(self, spec, key):
             workspace (:class:`~pyhf.workspace.Workspace`): The background-only workspace with the patch applied.
         """
         self.verify(spec)
-        return Workspace(self[key].apply(spec))
+        # the patch is applied to a copy of the specification
+        return Workspace(_apply_patch(spec, self[key]), copy=False)
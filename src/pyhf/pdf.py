@@ -1,7 +1,13 @@
 """The main module of pyhf."""
 
-import copy
 import logging
+from concurrent.futures import ThreadPoolExecutor
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
 from typing import List
 
 import pyhf.parameters
@@ -19,7 +25,7 @@
 
 log = logging.getLogger(__name__)
 
-__all__ = ["Model", "_ModelConfig"]
+__all__ = ["Model", "ModelCache", "_ModelConfig"]
 
 
 def __dir__():
@@ -58,30 +64,27 @@ def _create_parameters_from_spec(_reqs):
 
 class _nominal_builder:
     def __init__(self, config):
-        self.mega_samples = {}
         self.config = config
+        # preallocate the nominal rates of each mega-sample across all bins
+        # of the mega-channel, samples missing from a channel stay at zero
+        n_bins = sum(self.config.channel_nbins.values())
+        self.nominal_rates = {sample: [0.0] * n_bins for sample in self.config.samples}
 
     def append(self, channel, sample, defined_samp):
-        self.mega_samples.setdefault(sample, {'name': f'mega_{sample}', 'nom': []})
-        nom = (
-            defined_samp['data']
-            if defined_samp
-            else [0.0] * self.config.channel_nbins[channel]
-        )
+        if not defined_samp:
+            return
+        nom = defined_samp['data']
         if not len(nom) == self.config.channel_nbins[channel]:
             raise exceptions.InvalidModel(
                 f'expected {self.config.channel_nbins[channel]} size sample data but got {len(nom)}'
             )
-        self.mega_samples[sample]['nom'].append(nom)
+        self.nominal_rates[sample][self.config.channel_slices[channel]] = nom
 
     def finalize(self):
         default_backend = pyhf.default_backend
 
         nominal_rates = default_backend.astensor(
-            [
-                default_backend.concatenate(self.mega_samples[sample]['nom'])
-                for sample in self.config.samples
-            ]
+            [self.nominal_rates[sample] for sample in self.config.samples]
         )
         _nominal_rates = default_backend.reshape(
             nominal_rates,
@@ -95,7 +98,24 @@ def finalize(self):
         return _nominal_rates
 
 
-def _nominal_and_modifiers_from_spec(modifier_set, config, spec, batch_size):
+def _collects_all(builder):
+    """
+    Whether a modifier builder collects the data of all affected channels and
+    samples at once with ``append_all``.
+
+    Builders without ``append_all``, and subclasses of the built-in builders
+    that customize ``append``, are handed every channel and sample through
+    ``append`` instead.
+    """
+    for cls in type(builder).__mro__:
+        if 'append' in vars(cls) or 'append_all' in vars(cls):
+            return 'append_all' in vars(cls)
+    return False
+
+
+def _nominal_and_modifiers_from_spec(
+    modifier_set, config, spec, batch_size, par_config=None, build_appliers=True
+):
     # the mega-channel will consist of mega-samples that subscribe to
     # mega-modifiers. i.e. while in normal histfactory, each sample might
     # be affected by some modifiers and some not, here we change it so that
@@ -127,19 +147,42 @@ def _nominal_and_modifiers_from_spec(modifier_set, config, spec, batch_size):
     for k, (builder, applier) in modifier_set.items():
         modifiers_builders[k] = builder(config)
 
-    # 2. walk spec and call builders
+    # 2. walk spec once, filling the nominal rates and recording only the
+    # channel/sample slots each modifier actually affects. Builders that
+    # support it fill in the no-op data for all other slots themselves.
+    defined_modifiers = {k: [] for k in modifier_set}
     for c in config.channels:
         for s in config.samples:
             helper_data = helper.get(c, {}).get(s)
-            defined_samp, defined_mods = (
-                (None, None) if not helper_data else helper_data
-            )
+            if not helper_data:
+                continue
+            defined_samp, defined_mods = helper_data
             nominal.append(c, s, defined_samp)
-            for m, mtype in config.modifiers:
-                key = f'{mtype}/{m}'
-                # this is None if modifier doesn't affect channel/sample.
-                thismod = defined_mods.get(key) if defined_mods else None
-                modifiers_builders[mtype].append(key, c, s, thismod, defined_samp)
+            # same order as config.modifiers, i.e. sorted by (name, type)
+            for key, thismod in sorted(
+                defined_mods.items(), key=lambda x: (x[1]['name'], x[1]['type'])
+            ):
+                defined_modifiers[thismod['type']].append(
+                    (key, c, s, thismod, defined_samp)
+                )
+
+    for k, builder in modifiers_builders.items():
+        if _collects_all(builder):
+            builder.append_all(defined_modifiers[k], nominal.nominal_rates)
+            continue
+        for c in config.channels:
+            for s in config.samples:
+                helper_data = helper.get(c, {}).get(s)
+                defined_samp, defined_mods = (
+                    (None, None) if not helper_data else helper_data
+                )
+                for m, mtype in config.modifiers:
+                    if mtype != k:
+                        continue
+                    key = f'{mtype}/{m}'
+                    # this is None if modifier doesn't affect channel/sample.
+                    thismod = defined_mods.get(key) if defined_mods else None
+                    builder.append(key, c, s, thismod, defined_samp)
 
     # 3. finalize nominal & modifier builders
     nominal_rates = nominal.finalize()
@@ -149,6 +192,19 @@ def _nominal_and_modifiers_from_spec(modifier_set, config, spec, batch_size):
 
     # 4. collect parameters from spec and from user.
     # At this point we know all constraints and so forth
+    if par_config is not None:
+        # a part of a model shares the parameters of the full model
+        config.set_parameters(
+            {name: par_config.param_set(name) for name in par_config.par_order}
+        )
+        config.set_auxinfo(par_config.auxdata, par_config.auxdata_order)
+        return (
+            _appliers_from_builder_data(
+                modifier_set, config, finalizd_builder_data, batch_size
+            ),
+            nominal_rates,
+        )
+
     _required_paramsets = {}
     for v in list(modifiers_builders.values()):
         for pname, req_list in v.required_parsets.items():
@@ -170,8 +226,18 @@ def _nominal_and_modifiers_from_spec(modifier_set, config, spec, batch_size):
 
     config.set_parameters(_prameter_objects)
     config.set_auxinfo(_auxdata, _auxdata_order)
+    if not build_appliers:
+        return None, nominal_rates
 
     # 6. use finalized modifier data to build reparametrization function for main likelihood part
+    the_modifiers = _appliers_from_builder_data(
+        modifier_set, config, finalizd_builder_data, batch_size
+    )
+
+    return the_modifiers, nominal_rates
+
+
+def _appliers_from_builder_data(modifier_set, config, builder_data, batch_size):
     the_modifiers = {}
     for k, (builder, applier) in modifier_set.items():
         the_modifiers[k] = applier(
@@ -179,12 +245,90 @@ def _nominal_and_modifiers_from_spec(modifier_set, config, spec, batch_size):
                 x for x in config.modifiers if x[1] == k
             ],  # filter modifier names for that mtype (x[1])
             pdfconfig=config,
-            builder_data=finalizd_builder_data.get(k),
+            builder_data=builder_data.get(k),
             batch_size=batch_size,
             **config.modifier_settings.get(k, {}),
         )
+    return the_modifiers
 
-    return the_modifiers, nominal_rates
+
+_group_executor = None
+_group_executor_pid = None
+_group_executor_lock = threading.Lock()
+
+
+def _shared_group_executor():
+    """
+    The thread pool shared by all models to evaluate their groups of channels.
+
+    It is created on first use, and again in a forked child process, whose
+    copy of the parent's pool has no worker threads.
+    """
+    global _group_executor, _group_executor_pid
+    with _group_executor_lock:
+        if _group_executor is None or _group_executor_pid != os.getpid():
+            _group_executor = ThreadPoolExecutor(
+                thread_name_prefix='pyhf-channel-groups'
+            )
+            _group_executor_pid = os.getpid()
+        return _group_executor
+
+
+def _main_model_of_channels(
+    config, spec, modifier_set, channels, batch_size=None, incremental=False
+):
+    """
+    The :class:`_MainModel` of a subset of the channels of a model, sharing
+    the parameters of the model configuration ``config``.
+    """
+    channels_spec = {
+        'channels': [
+            channel for channel in spec['channels'] if channel['name'] in channels
+        ]
+    }
+    channels_config = _ModelConfig(
+        channels_spec, modifier_settings=config.modifier_settings
+    )
+    modifiers, nominal_rates = _nominal_and_modifiers_from_spec(
+        modifier_set, channels_config, channels_spec, batch_size, par_config=config
+    )
+    return _MainModel(
+        channels_config,
+        modifiers=modifiers,
+        nominal_rates=nominal_rates,
+        batch_size=batch_size,
+        incremental=incremental,
+    )
+
+
+def _partition_channels(config, channel_groups):
+    """
+    The groups of channels from either a number of groups, filled with
+    channels such that the groups have about the same number of bins, or
+    from the lists of channel names of every group.
+    """
+    if isinstance(channel_groups, int):
+        if channel_groups < 1:
+            raise exceptions.InvalidModel(
+                f"The number of channel groups must be positive, got {channel_groups}."
+            )
+        groups = [[] for _ in range(min(channel_groups, len(config.channels)))]
+        nbins = [0] * len(groups)
+        for channel in sorted(
+            config.channels, key=lambda channel: -config.channel_nbins[channel]
+        ):
+            smallest = nbins.index(min(nbins))
+            groups[smallest].append(channel)
+            nbins[smallest] += config.channel_nbins[channel]
+    else:
+        groups = [list(group) for group in channel_groups]
+        if sorted(channel for group in groups for channel in group) != sorted(
+            config.channels
+        ):
+            raise exceptions.InvalidModel(
+                f"The channel groups {groups} must contain every channel of the model {config.channels} exactly once."
+            )
+    return [sorted(group) for group in groups if group]
 
 
 class _ModelConfig(_ChannelSummaryMixin):
@@ -506,10 +650,13 @@ def logpdf(self, auxdata, pars):
 class _MainModel:
     """Factory class to create pdfs for the main measurement."""
 
-    def __init__(self, config, modifiers, nominal_rates, batch_size=None):
+    def __init__(
+        self, config, modifiers, nominal_rates, batch_size=None, incremental=False
+    ):
         default_backend = pyhf.default_backend
 
         self.config = config
+        self.incremental = incremental
 
         self._factor_mods = []
         self._delta_mods = []
@@ -533,6 +680,8 @@ def __init__(self, config, modifiers, nominal_rates, batch_size=None):
     def _precompute(self):
         tensorlib, _ = get_backend()
         self.nominal_rates = tensorlib.astensor(self._nominal_rates)
+        # the cached modifications are tensors of the previous backend
+        self._modification_cache = {}
 
     def has_pdf(self):
         """
@@ -578,6 +727,106 @@ def _modifications(self, pars):
 
         return deltas, factors
 
+    def _combined_modification(self, name, pars):
+        """
+        The modification of all modifiers of a type combined.
+
+        Appliers that can combine their modifiers directly provide an
+        ``apply_reduced`` method, for all others the result of ``apply`` is
+        summed or multiplied over the modifiers.
+
+        Returns:
+            modification tensor: Shape (n_global_samples, n_alphas, n_global_bin)
+        """
+        tensorlib, _ = get_backend()
+        modifier_applier = self.modifiers_appliers[name]
+        if hasattr(modifier_applier, 'apply_reduced'):
+            return modifier_applier.apply_reduced(pars)
+
+        modification = modifier_applier.apply(pars)
+        if modification is None:
+            return None
+        if modifier_applier.op_code == "addition":
+            return tensorlib.sum(modification, axis=0)
+        return tensorlib.product(modification, axis=0)
+
+    def _cached_modification(self, name, pars):
+        """
+        The combined modification of a modifier type, reused from the
+        previous evaluation if none of the parameters of the modifier type
+        changed since.
+
+        The parameters of the modifier type are looked up with the
+        :class:`~pyhf.parameters.ParamViewer` of its applier, appliers
+        without one are always evaluated. Appliers that store the bins
+        affected by each modifier (see ``_reduce_entries``) keep the
+        modifications of these bins per modifier, and only those of the
+        modifiers whose parameters changed are evaluated again before they
+        are combined.
+
+        Returns:
+            modification tensor: Shape (n_global_samples, n_alphas, n_global_bin)
+        """
+        tensorlib, _ = get_backend()
+        modifier_applier = self.modifiers_appliers[name]
+        param_viewer = getattr(modifier_applier, 'param_viewer', None)
+        if param_viewer is None:
+            return self._combined_modification(name, pars)
+
+        selected = param_viewer.get(pars)
+        if selected is None:
+            # no modifiers of this type
+            return None
+        if not hasattr(modifier_applier, '_reduce_entries'):
+            key = tensorlib.tolist(selected)
+            cached = self._modification_cache.get(name)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+            modification = self._combined_modification(name, pars)
+            # store key and value together so that concurrent evaluations
+            # never see a key with the modification of other parameters
+            self._modification_cache[name] = (key, modification)
+            return modification
+
+        # the values of the selected parameters, for each batch entry, split
+        # into those of each modifier
+        values = tensorlib.tolist(selected)
+        offsets = [0]
+        for indices in param_viewer.selected_viewer.partition_indices:
+            offsets.append(offsets[-1] + len(indices))
+        keys = [values[start:stop] for start, stop in zip(offsets[:-1], offsets[1:])]
+
+        cached = self._modification_cache.get(name)
+        if cached is None:
+            entry_modifications = modifier_applier._entry_modifications(pars)
+            entry_offsets = modifier_applier._entry_offsets
+            modifier_entries = [
+                entry_modifications[start:stop]
+                for start, stop in zip(entry_offsets[:-1], entry_offsets[1:])
+            ]
+            no_op = entry_modifications[entry_offsets[-1] :]
+            modification = modifier_applier._reduce_entries(entry_modifications)
+        else:
+            cached_keys, modifier_entries, no_op, modification = cached
+            changed = [
+                modifier_index
+                for modifier_index, (key, cached_key) in enumerate(
+                    zip(keys, cached_keys)
+                )
+                if key != cached_key
+            ]
+            if changed:
+                modifier_entries = list(modifier_entries)
+                for modifier_index in changed:
+                    modifier_entries[
+                        modifier_index
+                    ] = modifier_applier._entry_modifications(pars, modifier_index)
+                modification = modifier_applier._reduce_entries(
+                    tensorlib.concatenate([*modifier_entries, no_op])
+                )
+        self._modification_cache[name] = (keys, modifier_entries, no_op, modification)
+        return modification
+
     def expected_data(self, pars, return_by_sample=False):
         """
         Compute the expected rates for given values of parameters.
@@ -604,21 +853,30 @@ def expected_data(self, pars, return_by_sample=False):
             2. All Gaussian constraint as one call
             3. All Poisson constraints as one call
 
+        In incremental mode only the modifiers whose parameters changed since
+        the previous call are evaluated again.
+
         """
         tensorlib, _ = get_backend()
         pars = tensorlib.astensor(pars)
-        deltas, factors = self._modifications(pars)
-
-        allsum = tensorlib.concatenate(deltas + [self.nominal_rates])
-
-        nom_plus_delta = tensorlib.sum(allsum, axis=0)
-        nom_plus_delta = tensorlib.reshape(
-            nom_plus_delta, (1,) + tensorlib.shape(nom_plus_delta)
+        modification = (
+            self._cached_modification
+            if self.incremental
+            else self._combined_modification
         )
 
-        allfac = tensorlib.concatenate(factors + [nom_plus_delta])
+        # accumulate the modifications of each modifier type right away
+        # rather than stacking the modifications of all modifiers
+        newbysample = self.nominal_rates[0]
+        for k in self._delta_mods:
+            delta = modification(k, pars)
+            if delta is not None:
+                newbysample = newbysample + delta
+        for k in self._factor_mods:
+            factor = modification(k, pars)
+            if factor is not None:
+                newbysample = newbysample * factor
 
-        newbysample = tensorlib.product(allfac, axis=0)
         if return_by_sample:
             batch_first = tensorlib.einsum('ij...->ji...', newbysample)
             if self.batch_size is None:
@@ -631,6 +889,109 @@ def expected_data(self, pars, return_by_sample=False):
         return newresults
 
 
+class _ChannelGroupsModel:
+    """
+    The main model evaluated as independent groups of channels.
+
+    Every group of channels has its own :class:`_MainModel` sharing the
+    parameters of the full model and the log-likelihoods of the groups are
+    summed. On the numpy backend the groups are evaluated concurrently on a
+    thread pool shared by all models, as numpy releases the GIL in large
+    tensor operations.
+    """
+
+    def __init__(
+        self,
+        config,
+        spec,
+        modifier_set,
+        channel_groups,
+        batch_size=None,
+        incremental=False,
+    ):
+        self.batch_size = batch_size
+        self.groups = _partition_channels(config, channel_groups)
+
+        self.main_models = [
+            _main_model_of_channels(
+                config, spec, modifier_set, group, batch_size, incremental
+            )
+            for group in self.groups
+        ]
+        # the bins of every group in the main data of the full model
+        self.groups_tv = _TensorViewer(
+            [
+                [
+                    index
+                    for channel in main_model.config.channels
+                    for index in range(
+                        config.channel_slices[channel].start,
+                        config.channel_slices[channel].stop,
+                    )
+                ]
+                for main_model in self.main_models
+            ],
+            self.batch_size,
+        )
+
+    def has_pdf(self):
+        """
+        Indicate whether the main model exists.
+
+        Returns:
+            Bool: Whether the model has a Main Model component (yes it does)
+
+        """
+        return True
+
+    def expected_data(self, pars):
+        """
+        The expected data of the main model, stitched from the groups.
+
+        Args:
+            pars (:obj:`tensor`): The model parameters
+
+        Returns:
+            Tensor: The expected data of the main model
+        """
+        return self.groups_tv.stitch(
+            [main_model.expected_data(pars) for main_model in self.main_models]
+        )
+
+    def make_pdf(self, pars):
+        lambdas_data = self.expected_data(pars)
+        return prob.Independent(prob.Poisson(lambdas_data))
+
+    def logpdf(self, maindata, pars):
+        """
+        Compute the logarithm of the value of the probability density.
+
+        Args:
+            maindata (:obj:`tensor`): The main channel data (a subset of the full data in a HistFactory model)
+            pars (:obj:`tensor`): The model parameters
+
+        Returns:
+            Tensor: The log of the pdf value
+
+        """
+        tensorlib, _ = get_backend()
+        groups_data = self.groups_tv.split(maindata)
+        if tensorlib.name == 'numpy' and len(self.main_models) > 1:
+            results = list(
+                _shared_group_executor().map(
+                    lambda main_model, data: main_model.logpdf(data, pars),
+                    self.main_models,
+                    groups_data,
+                )
+            )
+        else:
+            results = [
+                main_model.logpdf(data, pars)
+                for main_model, data in zip(self.main_models, groups_data)
+            ]
+        return tensorlib.sum(tensorlib.stack(results), axis=0)
+
+
 class Model:
     """The main pyhf model class."""
 
@@ -640,6 +1001,8 @@ def __init__(
         modifier_set=None,
         batch_size=None,
         validate: bool = True,
+        incremental: bool = False,
+        channel_groups=None,
         **config_kwargs,
     ):
         """
@@ -650,6 +1013,21 @@ def __init__(
             batch_size (:obj:`None` or :obj:`int`): Number of simultaneous (batched)
              Models to compute.
             validate (:obj:`bool`): Whether to validate against a JSON schema
+            incremental (:obj:`bool`): Whether to reuse the modifications of
+             modifier types whose parameters did not change since the previous
+             evaluation. This speeds up evaluations that change only a few
+             parameters at a time, like scans or fits with numerical
+             derivatives, but must not be used with automatic differentiation
+             or just-in-time compilation.
+            channel_groups (:obj:`None`, :obj:`int` or :obj:`list` of :obj:`list`):
+             The number of groups of channels, or the channel names of every
+             group, whose log-likelihoods are evaluated separately, and on the
+             numpy backend concurrently, by :meth:`logpdf`. The concurrent
+             evaluations run on a single thread pool of the process that is
+             shared by all models. By default all channels are evaluated
+             together. With groups of channels, the main model of all
+             channels together is only built when it is accessed as
+             ``main_model``.
             config_kwargs: Possible keyword arguments for the model configuration
 
         Returns:
@@ -659,32 +1037,56 @@ def __init__(
         modifier_set = modifier_set or histfactory_set
 
         self.batch_size = batch_size
-        # deep-copy "spec" as it may be modified by config
-        self.spec = copy.deepcopy(spec)
+        self.modifier_set = modifier_set
+        # copy "spec" as it may be modified by config, but share its read-only
+        # arrays, such as the memory-mapped columns of a workspace loaded with
+        # Workspace.from_npz, which the builders turn into tensors
+        self._spec = utils._copy_spec(spec)
+        self._json_spec = None
         self.schema = config_kwargs.pop('schema', 'model.json')
         self.version = config_kwargs.pop('version', None)
         # run jsonschema validation of input specification against the (provided) schema
         if validate:
             log.info(f"Validating spec against schema: {self.schema:s}")
-            utils.validate(self.spec, self.schema, version=self.version)
+            utils.validate(self._spec, self.schema, version=self.version)
         # build up our representation of the specification
         poi_name = config_kwargs.pop('poi_name', 'mu')
-        self.config = _ModelConfig(self.spec, **config_kwargs)
+        self.config = _ModelConfig(self._spec, **config_kwargs)
 
+        self._incremental = incremental
         modifiers, _nominal_rates = _nominal_and_modifiers_from_spec(
-            modifier_set, self.config, self.spec, self.batch_size
+            modifier_set,
+            self.config,
+            self._spec,
+            self.batch_size,
+            build_appliers=channel_groups is None,
         )
 
         poi_name = None if poi_name == "" else poi_name
         if poi_name is not None:
             self.config.set_poi(poi_name)
 
-        self.main_model = _MainModel(
-            self.config,
-            modifiers=modifiers,
-            nominal_rates=_nominal_rates,
-            batch_size=self.batch_size,
-        )
+        if channel_groups is None:
+            self._main_model = _MainModel(
+                self.config,
+                modifiers=modifiers,
+                nominal_rates=_nominal_rates,
+                batch_size=self.batch_size,
+                incremental=incremental,
+            )
+            self.channel_groups_model = None
+        else:
+            # the groups replace the main model of all channels, which is
+            # only built if it is accessed
+            self._main_model = None
+            self.channel_groups_model = _ChannelGroupsModel(
+                self.config,
+                self._spec,
+                modifier_set,
+                channel_groups,
+                batch_size=self.batch_size,
+                incremental=incremental,
+            )
 
         # the below call needs auxdata order for example
         self.constraint_model = _ConstraintModel(
@@ -692,7 +1094,7 @@ def __init__(
         )
 
         sizes = []
-        if self.main_model.has_pdf():
+        if self._main_pdf_model().has_pdf():
             sizes.append(self.config.nmaindata)
         if self.constraint_model.has_pdf():
             sizes.append(self.config.nauxdata)
@@ -700,6 +1102,38 @@ def __init__(
             sizes, ['main', 'aux'], self.batch_size
         )
 
+    @property
+    def spec(self):
+        """
+        The HistFactory JSON specification of the model.
+
+        The numpy arrays of a specification loaded with
+        :meth:`~pyhf.workspace.Workspace.from_npz` are only converted to lists
+        when it is first accessed.
+        """
+        if self._json_spec is None:
+            self._json_spec = utils._arrays_to_lists(self._spec)
+        return self._json_spec
+
+    @property
+    def main_model(self):
+        """The model of the main measurement of all channels."""
+        if self._main_model is None:
+            self._main_model = _main_model_of_channels(
+                self.config,
+                self._spec,
+                self.modifier_set,
+                self.config.channels,
+                self.batch_size,
+                self._incremental,
+            )
+        return self._main_model
+
+    def _main_pdf_model(self):
+        if self.channel_groups_model is not None:
+            return self.channel_groups_model
+        return self.main_model
+
     def expected_auxdata(self, pars):
         """
         Compute the expected value of the auxiliary measurements.
@@ -797,7 +1231,7 @@ def make_pdf(self, pars):
         tensorlib, _ = get_backend()
 
         pdfobjs = []
-        mainpdf = self.main_model.make_pdf(pars)
+        mainpdf = self._main_pdf_model().make_pdf(pars)
         if mainpdf:
             pdfobjs.append(mainpdf)
         constraintpdf = self.constraint_model.make_pdf(pars)
@@ -828,14 +1262,15 @@ def logpdf(self, pars, data):
                     f'eval failed as pars has len {pars.shape[-1]} but {self.config.npars} was expected'
                 )
 
-            if data.shape[-1] != self.nominal_rates.shape[-1] + len(
-                self.config.auxdata
-            ):
+            if data.shape[-1] != self.config.nmaindata + len(self.config.auxdata):
                 raise exceptions.InvalidPdfData(
                     f'eval failed as data has len {data.shape[-1]} but {self.config.nmaindata + self.config.nauxdata} was expected'
                 )
 
-            result = self.make_pdf(pars).log_prob(data)
+            if self.channel_groups_model is not None:
+                result = self._grouped_logpdf(pars, data)
+            else:
+                result = self.make_pdf(pars).log_prob(data)
 
             if (
                 not self.batch_size
@@ -849,6 +1284,13 @@ def logpdf(self, pars, data):
             )
             raise
 
+    def _grouped_logpdf(self, pars, data):
+        datasets = self.fullpdf_tv.split(data)
+        result = self.channel_groups_model.logpdf(datasets[0], pars)
+        if self.constraint_model.has_pdf():
+            result = result + self.constraint_model.logpdf(datasets[1], pars)
+        return result
+
     def pdf(self, pars, data):
         """
         Compute the density at a given observed point in data space of the full model.
@@ -863,3 +1305,181 @@ def pdf(self, pars, data):
         """
         tensorlib, _ = get_backend()
         return tensorlib.exp(self.logpdf(pars, data))
+
+
+def _reattach(obj, seen=None):
+    """
+    Restore the ``tensorlib_changed`` subscriptions of an unpickled model.
+
+    Every pyhf object in the model with a ``_precompute`` method is
+    subscribed again and precomputed for the current backend, children first
+    as during the construction of the model.
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return
+    seen.add(id(obj))
+
+    if isinstance(obj, dict):
+        children = list(obj.values())
+    elif isinstance(obj, (list, tuple)):
+        children = list(obj)
+    elif type(obj).__module__.startswith('pyhf.') and hasattr(obj, '__dict__'):
+        children = list(vars(obj).values())
+    else:
+        return
+
+    for child in children:
+        _reattach(child, seen)
+
+    if not isinstance(obj, (dict, list, tuple)) and hasattr(obj, '_precompute'):
+        obj._precompute()
+        events.subscribe('tensorlib_changed')(obj._precompute)
+
+
+class ModelCache:
+    """
+    A cache of :class:`~pyhf.pdf.Model` objects keyed on the digest of the
+    specification and the configuration of the model.
+
+    The most recently used models are kept in memory and, if a ``cache_dir`` is
+    given, every built model is also pickled to that directory so that other
+    processes can load it instead of building it again.
+
+    Example:
+        >>> import pyhf
+        >>> pyhf.set_backend("numpy")
+        >>> spec = pyhf.simplemodels.uncorrelated_background(
+        ...     signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+        ... ).spec
+        >>> cache = pyhf.pdf.ModelCache(maxsize=4)
+        >>> model = cache.model(spec, poi_name="mu")
+        >>> cache.model(spec, poi_name="mu") is model
+        True
+        >>> len(cache)
+        1
+
+    """
+
+    def __init__(self, maxsize=8, cache_dir=None):
+        """
+        Args:
+            maxsize (:obj:`int`): The maximal number of models kept in memory.
+            cache_dir (:obj:`str` or :class:`pathlib.Path`): An optional directory to
+             store the built models in.
+
+        Returns:
+            ~pyhf.pdf.ModelCache: The cache of models.
+
+        """
+        self.maxsize = maxsize
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._models)
+
+    def key(self, spec, modifier_set=None, batch_size=None, validate=True, **kwargs):
+        """
+        The key of the model built from ``spec`` with the given configuration.
+
+        Args:
+            spec (:obj:`jsonable`): The HistFactory JSON specification
+            modifier_set, batch_size, validate, kwargs: The arguments for
+             :class:`~pyhf.pdf.Model`.
+
+        Returns:
+            :obj:`str`: The digest of the specification and the configuration.
+        """
+        modifier_set = {
+            name: [f'{impl.__module__}.{impl.__qualname__}' for impl in modifier]
+            for name, modifier in (modifier_set or histfactory_set).items()
+        }
+        return utils.digest(
+            {
+                'spec': spec,
+                'modifier_set': modifier_set,
+                'batch_size': batch_size,
+                'validate': validate,
+                'config': kwargs,
+                'version': pyhf.__version__,
+            }
+        )
+
+    def model(self, spec, **kwargs):
+        """
+        Return the model for ``spec``, building it only if it is not cached.
+
+        Args:
+            spec (:obj:`jsonable`): The HistFactory JSON specification
+            kwargs: Keyword arguments for :class:`~pyhf.pdf.Model`.
+
+        Returns:
+            ~pyhf.pdf.Model: The Model instance.
+        """
+        key = self.key(spec, **kwargs)
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                self._models.move_to_end(key)
+                return model
+
+        model = self._load(key)
+        if model is None:
+            model = Model(spec, **kwargs)
+            self._dump(key, model)
+
+        with self._lock:
+            self._models[key] = model
+            self._models.move_to_end(key)
+            while len(self._models) > self.maxsize:
+                self._models.popitem(last=False)
+        return model
+
+    def clear(self):
+        """
+        Remove all models from the in-memory cache.
+        """
+        with self._lock:
+            self._models.clear()
+
+    def _path(self, key):
+        return self.cache_dir.joinpath(f'{key}.pkl')
+
+    def _load(self, key):
+        if self.cache_dir is None or not self._path(key).exists():
+            return None
+        try:
+            with open(self._path(key), 'rb') as cache_file:
+                model = pickle.load(cache_file)
+        except (OSError, pickle.UnpicklingError, EOFError) as err:
+            log.warning(f"Could not load cached model {key}: {err}")
+            return None
+        _reattach(model)
+        return model
+
+    def _dump(self, key, model):
+        if self.cache_dir is None:
+            return
+        temp_name = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first so that concurrent readers never
+            # see a partially written model
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_dir, suffix='.tmp', delete=False
+            ) as cache_file:
+                temp_name = cache_file.name
+                pickle.dump(model, cache_file)
+            os.replace(temp_name, self._path(key))
+            temp_name = None
+        except (OSError, pickle.PicklingError, TypeError) as err:
+            log.warning(f"Could not store model {key} in the cache: {err}")
+        finally:
+            # do not leave the partially written model behind
+            if temp_name is not None:
+                try:
+                    os.remove(temp_name)
+                except OSError:
+                    pass
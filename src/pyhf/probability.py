@@ -22,6 +22,8 @@ def log_prob(self, value):
             Tensor: The value of :math:`\log(f\left(x\middle|\theta\right))` for :math:`x=`:code:`value`
 
         """
+        tensorlib, _ = get_backend()
+        (value,) = tensorlib._accumulate(value)
         return self._pdf.log_prob(value)
 
     def expected_data(self):
@@ -67,7 +69,7 @@ def __init__(self, rate):
         """
         tensorlib, _ = get_backend()
         self.rate = rate
-        self._pdf = tensorlib.poisson_dist(rate)
+        self._pdf = tensorlib.poisson_dist(*tensorlib._accumulate(rate))
 
     def expected_data(self):
         r"""
@@ -109,7 +111,7 @@ def __init__(self, loc, scale):
         tensorlib, _ = get_backend()
         self.loc = loc
         self.scale = scale
-        self._pdf = tensorlib.normal_dist(loc, scale)
+        self._pdf = tensorlib.normal_dist(*tensorlib._accumulate(loc, scale))
 
     def expected_data(self):
         r"""
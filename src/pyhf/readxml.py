@@ -2,7 +2,10 @@
 from pyhf import compat
 
 import logging
+import threading
 
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
 import xml.etree.ElementTree as ET
 import numpy as np
@@ -11,9 +14,8 @@
 
 log = logging.getLogger(__name__)
 
-__FILECACHE__ = {}
-
 __all__ = [
+    "FileCache",
     "clear_filecache",
     "dedupe_parameters",
     "extract_error",
@@ -30,6 +32,142 @@ def __dir__():
     return __all__
 
 
+class _CachedFile:
+    __slots__ = ['file', 'keys', 'users', 'evicted']
+
+    def __init__(self, rootfile):
+        self.file = rootfile
+        self.keys = set(rootfile.keys(cycle=False))
+        self.users = 0
+        self.evicted = False
+
+
+class FileCache:
+    """
+    A thread-safe cache of the most recently used opened ROOT files and their
+    keys.
+
+    At most ``maxsize`` files are kept open, the least recently used file is
+    closed when another file is opened. A file evicted while it is still read
+    from is closed once the reading is done. A pickled cache, e.g. one passed
+    to the workers of a :class:`~concurrent.futures.ProcessPoolExecutor`, is
+    restored empty.
+
+    Example:
+        >>> import pyhf.readxml
+        >>> filecache = pyhf.readxml.FileCache(maxsize=4)
+        >>> with filecache.open("validation/xmlimport_input/data/example.root") as (
+        ...     rootfile,
+        ...     keys,
+        ... ):
+        ...     "signal" in keys
+        True
+        >>> len(filecache)
+        1
+        >>> filecache.clear()
+
+    """
+
+    def __init__(self, maxsize=32):
+        """
+        Args:
+            maxsize (:obj:`int` or :obj:`None`): The maximal number of open
+             files, :obj:`None` for no limit.
+
+        Returns:
+            ~pyhf.readxml.FileCache: The cache of files.
+
+        """
+        self.maxsize = maxsize
+        self._files = OrderedDict()
+        self._lock = threading.Lock()
+        # the locks of the files being opened, such that different files are
+        # opened concurrently and the same file only once
+        self._opening = {}
+
+    def __getstate__(self):
+        # the opened files and the lock are not shared between processes
+        return {'maxsize': self.maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def __len__(self):
+        return len(self._files)
+
+    def __contains__(self, fullpath):
+        return fullpath in self._files
+
+    @contextmanager
+    def open(self, fullpath):
+        """
+        Open the ROOT file at ``fullpath``, or reuse it if it is cached, for
+        the duration of the context.
+
+        Args:
+            fullpath (:obj:`str`): The path of the ROOT file.
+
+        Returns:
+            :obj:`tuple`: The opened file and the :obj:`set` of its keys.
+        """
+        with self._lock:
+            cached = self._use(fullpath)
+            if cached is None:
+                opening = self._opening.setdefault(fullpath, threading.Lock())
+        if cached is None:
+            with opening:
+                with self._lock:
+                    cached = self._use(fullpath)
+                if cached is None:
+                    opened = _CachedFile(uproot.open(fullpath))
+                    with self._lock:
+                        cached = self._use(fullpath)
+                        if cached is None:
+                            cached = self._files[fullpath] = opened
+                            cached.users += 1
+                            self._evict()
+                        else:
+                            opened.file.close()
+                with self._lock:
+                    if self._opening.get(fullpath) is opening:
+                        del self._opening[fullpath]
+        try:
+            yield cached.file, cached.keys
+        finally:
+            with self._lock:
+                cached.users -= 1
+                if cached.evicted and not cached.users:
+                    cached.file.close()
+
+    def clear(self):
+        """
+        Close and remove all files from the cache.
+        """
+        with self._lock:
+            while self._files:
+                self._close_oldest()
+
+    def _use(self, fullpath):
+        cached = self._files.get(fullpath)
+        if cached is not None:
+            self._files.move_to_end(fullpath)
+            cached.users += 1
+        return cached
+
+    def _evict(self):
+        while self.maxsize is not None and len(self._files) > self.maxsize:
+            self._close_oldest()
+
+    def _close_oldest(self):
+        _, cached = self._files.popitem(last=False)
+        cached.evicted = True
+        if not cached.users:
+            cached.file.close()
+
+
+__FILECACHE__ = FileCache()
+
+
 def extract_error(hist):
     """
     Determine the bin uncertainties for a histogram.
@@ -49,36 +187,51 @@ def extract_error(hist):
     return np.sqrt(variance).tolist()
 
 
+@contextmanager
+def _open_cached(filecache, fullpath):
+    """
+    Open the ROOT file at ``fullpath`` from a :class:`FileCache`, or from a
+    mapping of the paths of the opened files to the files and their keys.
+    """
+    if isinstance(filecache, FileCache):
+        with filecache.open(fullpath) as opened:
+            yield opened
+        return
+    if fullpath not in filecache:
+        rootfile = uproot.open(fullpath)
+        filecache[fullpath] = (rootfile, set(rootfile.keys(cycle=False)))
+    yield filecache[fullpath]
+
+
 def import_root_histogram(rootdir, filename, path, name, filecache=None):
-    global __FILECACHE__
-    filecache = filecache or __FILECACHE__
+    filecache = filecache if filecache is not None else __FILECACHE__
 
     # strip leading slashes as uproot doesn't use "/" for top-level
     path = path or ''
     path = path.strip('/')
     fullpath = str(Path(rootdir).joinpath(filename))
-    if fullpath not in filecache:
-        f = uproot.open(fullpath)
-        keys = set(f.keys(cycle=False))
-        filecache[fullpath] = (f, keys)
-    else:
-        f, keys = filecache[fullpath]
-
     fullname = "/".join([path, name])
 
-    if name in keys:
-        hist = f[name]
-    elif fullname in keys:
-        hist = f[fullname]
-    else:
-        raise KeyError(
-            f'Both {name} and {fullname} were tried and not found in {fullpath}'
-        )
-    return hist.to_numpy()[0].tolist(), extract_error(hist)
+    with _open_cached(filecache, fullpath) as (f, keys):
+        if name in keys:
+            hist = f[name]
+        elif fullname in keys:
+            hist = f[fullname]
+        else:
+            raise KeyError(
+                f'Both {name} and {fullname} were tried and not found in {fullpath}'
+            )
+        return hist.to_numpy()[0].tolist(), extract_error(hist)
 
 
 def process_sample(
-    sample, rootdir, inputfile, histopath, channelname, track_progress=False
+    sample,
+    rootdir,
+    inputfile,
+    histopath,
+    channelname,
+    track_progress=False,
+    filecache=None,
 ):
     if 'InputFile' in sample.attrib:
         inputfile = sample.attrib.get('InputFile')
@@ -86,7 +239,9 @@ def process_sample(
         histopath = sample.attrib.get('HistoPath')
     histoname = sample.attrib['HistoName']
 
-    data, err = import_root_histogram(rootdir, inputfile, histopath, histoname)
+    data, err = import_root_histogram(
+        rootdir, inputfile, histopath, histoname, filecache=filecache
+    )
 
     parameter_configs = []
     modifiers = []
@@ -134,12 +289,14 @@ def process_sample(
                 modtag.attrib.get('HistoFileLow', inputfile),
                 modtag.attrib.get('HistoPathLow', ''),
                 modtag.attrib['HistoNameLow'],
+                filecache=filecache,
             )
             hi, _ = import_root_histogram(
                 rootdir,
                 modtag.attrib.get('HistoFileHigh', inputfile),
                 modtag.attrib.get('HistoPathHigh', ''),
                 modtag.attrib['HistoNameHigh'],
+                filecache=filecache,
             )
             modifiers.append(
                 {
@@ -157,6 +314,7 @@ def process_sample(
                     modtag.attrib.get('HistoFile', inputfile),
                     modtag.attrib.get('HistoPath', ''),
                     modtag.attrib['HistoName'],
+                    filecache=filecache,
                 )
                 staterr = np.multiply(extstat, data).tolist()
             if not staterr:
@@ -180,6 +338,7 @@ def process_sample(
                 modtag.attrib.get('InputFile', inputfile),
                 modtag.attrib.get('HistoPath', ''),
                 modtag.attrib['HistoName'],
+                filecache=filecache,
             )
             # NB: we convert relative uncertainty to absolute uncertainty
             modifiers.append(
@@ -204,18 +363,20 @@ def process_sample(
     }
 
 
-def process_data(sample, rootdir, inputfile, histopath):
+def process_data(sample, rootdir, inputfile, histopath, filecache=None):
     if 'InputFile' in sample.attrib:
         inputfile = sample.attrib.get('InputFile')
     if 'HistoPath' in sample.attrib:
         histopath = sample.attrib.get('HistoPath')
     histoname = sample.attrib['HistoName']
 
-    data, _ = import_root_histogram(rootdir, inputfile, histopath, histoname)
+    data, _ = import_root_histogram(
+        rootdir, inputfile, histopath, histoname, filecache=filecache
+    )
     return data
 
 
-def process_channel(channelxml, rootdir, track_progress=False):
+def process_channel(channelxml, rootdir, track_progress=False, filecache=None):
     channel = channelxml.getroot()
 
     inputfile = channel.attrib.get('InputFile')
@@ -227,7 +388,9 @@ def process_channel(channelxml, rootdir, track_progress=False):
 
     data = channel.findall('Data')
     if data:
-        parsed_data = process_data(data[0], rootdir, inputfile, histopath)
+        parsed_data = process_data(
+            data[0], rootdir, inputfile, histopath, filecache=filecache
+        )
     else:
         parsed_data = None
     channelname = channel.attrib['Name']
@@ -237,7 +400,13 @@ def process_channel(channelxml, rootdir, track_progress=False):
     for sample in samples:
         samples.set_description(f"  - sample {sample.attrib.get('Name')}")
         result = process_sample(
-            sample, rootdir, inputfile, histopath, channelname, track_progress
+            sample,
+            rootdir,
+            inputfile,
+            histopath,
+            channelname,
+            track_progress,
+            filecache=filecache,
         )
         channel_parameter_configs.extend(result.pop('parameter_configs'))
         results.append(result)
@@ -333,7 +502,27 @@ def dedupe_parameters(parameters):
     return list({v['name']: v for v in parameters}.values())
 
 
-def parse(configfile, rootdir, track_progress=False):
+def parse(configfile, rootdir, track_progress=False, executor=None, filecache=None):
+    """
+    Parse the HistFactory XML configuration and the ROOT histograms it refers
+    to into a workspace specification.
+
+    Args:
+        configfile (:obj:`str` or :class:`pathlib.Path`): The top-level XML file.
+        rootdir (:obj:`str` or :class:`pathlib.Path`): The directory the paths
+         in the XML files are relative to.
+        track_progress (:obj:`bool`): Whether to show progress bars.
+        executor (:class:`concurrent.futures.Executor`): An optional executor
+         the channels are processed on concurrently. With a
+         :class:`~concurrent.futures.ThreadPoolExecutor` the channels share the
+         opened ROOT files, so that every file is opened only once.
+        filecache (:class:`~pyhf.readxml.FileCache` or :obj:`dict`): The cache
+         of the opened ROOT files, by default a cache shared by all imports.
+         A :obj:`dict` keeps every file it opens, keyed by its path, open.
+
+    Returns:
+        :obj:`dict`: The workspace specification.
+    """
     toplvl = ET.parse(configfile)
     inputs = tqdm.tqdm(
         [x.text for x in toplvl.findall('Input')],
@@ -341,13 +530,31 @@ def parse(configfile, rootdir, track_progress=False):
         disable=not (track_progress),
     )
 
+    if executor is not None:
+        futures = {
+            inp: executor.submit(
+                process_channel,
+                ET.parse(Path(rootdir).joinpath(inp)),
+                rootdir,
+                filecache=filecache,
+            )
+            for inp in inputs.iterable
+        }
+
     channels = {}
     parameter_configs = []
     for inp in inputs:
         inputs.set_description(f'Processing {inp}')
-        channel, data, samples, channel_parameter_configs = process_channel(
-            ET.parse(Path(rootdir).joinpath(inp)), rootdir, track_progress
-        )
+        if executor is None:
+            processed = process_channel(
+                ET.parse(Path(rootdir).joinpath(inp)),
+                rootdir,
+                track_progress,
+                filecache=filecache,
+            )
+        else:
+            processed = futures[inp].result()
+        channel, data, samples, channel_parameter_configs = processed
         channels[channel] = {'data': data, 'samples': samples}
         parameter_configs.extend(channel_parameter_configs)
 
@@ -372,5 +579,7 @@ def parse(configfile, rootdir, track_progress=False):
 
 
 def clear_filecache():
-    global __FILECACHE__
-    __FILECACHE__ = {}
+    """
+    Close and remove all files from the file cache shared by all imports.
+    """
+    __FILECACHE__.clear()
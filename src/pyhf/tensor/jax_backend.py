@@ -9,9 +9,20 @@
 import numpy as np
 import scipy.stats as osp_stats
 import logging
+import os
 
 log = logging.getLogger(__name__)
 
+# the values of the jax config options that enabling the persistent
+# compilation cache overrides, as they were before it was first enabled
+_compilation_cache_config_defaults = {}
+
+_compilation_cache_config = {
+    # every compiled objective is cached, however fast it compiled or small it is
+    'jax_persistent_cache_min_compile_time_secs': 0,
+    'jax_persistent_cache_min_entry_size_bytes': 0,
+}
+
 
 class _BasicPoisson:
     def __init__(self, rate):
@@ -49,13 +60,40 @@ def log_prob(self, value):
 
 
 class jax_backend:
-    """JAX backend for pyhf"""
-
-    __slots__ = ['name', 'precision', 'dtypemap', 'default_do_grad']
+    """
+    JAX backend for pyhf
+
+    Passing a ``compilation_cache_dir`` enables the persistent compilation cache
+    of JAX in that directory, such that the compiled objectives of the
+    optimizers are reused across processes instead of being recompiled in each
+    of them. The cache entries are keyed by JAX on the compiled computation,
+    which covers the model, the precision, the fixed parameters, and the
+    device the computation runs on. If no ``compilation_cache_dir`` is passed,
+    the directory is taken from the ``PYHF_JAX_COMPILATION_CACHE_DIR``
+    environment variable, which also applies to the backends created by
+    :func:`pyhf.set_backend` and the command line interface.
+
+    While the cache is enabled every compiled computation is written to it,
+    independent of its compile time and size. The cache is a setting of the
+    JAX config and as such global to the process: setting a JAX backend
+    without a cache directory restores the config values in place before the
+    cache was first enabled.
+    """
+
+    __slots__ = [
+        'name',
+        'precision',
+        'dtypemap',
+        'default_do_grad',
+        'compilation_cache_dir',
+    ]
 
     def __init__(self, **kwargs):
         self.name = 'jax'
         self.precision = kwargs.get('precision', '64b')
+        self.compilation_cache_dir = kwargs.get(
+            'compilation_cache_dir', os.environ.get('PYHF_JAX_COMPILATION_CACHE_DIR')
+        )
         self.dtypemap = {
             'float': jnp.float64 if self.precision == '64b' else jnp.float32,
             'int': jnp.int64 if self.precision == '64b' else jnp.int32,
@@ -67,6 +105,39 @@ def _setup(self):
         """
         Run any global setups for the jax lib.
         """
+        if self.compilation_cache_dir is not None:
+            cache_config = {
+                'jax_compilation_cache_dir': str(self.compilation_cache_dir),
+                **_compilation_cache_config,
+            }
+            for name in cache_config:
+                if hasattr(config, name):
+                    _compilation_cache_config_defaults.setdefault(
+                        name, getattr(config, name)
+                    )
+            self._update_compilation_cache_config(cache_config)
+        elif _compilation_cache_config_defaults:
+            self._update_compilation_cache_config(_compilation_cache_config_defaults)
+            _compilation_cache_config_defaults.clear()
+
+    @staticmethod
+    def _update_compilation_cache_config(cache_config):
+        from jax.experimental.compilation_cache import compilation_cache
+
+        cache_dir = cache_config.get('jax_compilation_cache_dir')
+        if not hasattr(config, 'jax_compilation_cache_dir'):
+            # versions of jax before the cache was configurable through the config
+            if cache_dir is not None:
+                compilation_cache.initialize_cache(cache_dir)
+            return
+
+        for name, value in cache_config.items():
+            if hasattr(config, name) and getattr(config, name) != value:
+                config.update(name, value)
+                if name == 'jax_compilation_cache_dir':
+                    # the cache is bound to the directory configured at its
+                    # first use, so it is reset to use the new directory
+                    compilation_cache.reset_cache()
 
     def clip(self, tensor_in, min_value, max_value):
         """
@@ -188,6 +259,28 @@ def tolist(self, tensor_in):
     def outer(self, tensor_in_1, tensor_in_2):
         return jnp.outer(tensor_in_1, tensor_in_2)
 
+    def solve(self, tensor_in_1, tensor_in_2):
+        """
+        Solve the linear system :math:`A x = b` for :math:`x`.
+
+        Example:
+
+            >>> import pyhf
+            >>> pyhf.set_backend("jax")
+            >>> a = pyhf.tensorlib.astensor([[2.0, 1.0], [1.0, 3.0]])
+            >>> b = pyhf.tensorlib.astensor([3.0, 5.0])
+            >>> pyhf.tensorlib.solve(a, b)
+            Array([0.8, 1.4], dtype=float64)
+
+        Args:
+            tensor_in_1 (:obj:`tensor`): The square matrix :math:`A`.
+            tensor_in_2 (:obj:`tensor`): The right-hand side :math:`b`.
+
+        Returns:
+            JAX ndarray: The solution :math:`x`.
+        """
+        return jnp.linalg.solve(tensor_in_1, tensor_in_2)
+
     def gather(self, tensor, indices):
         return tensor[indices]
 
@@ -229,6 +322,15 @@ def astensor(self, tensor_in, dtype="float"):
 
         return jnp.asarray(tensor_in, dtype=dtype)
 
+    def _accumulate(self, *tensors):
+        """
+        The tensors in the precision the log-likelihoods are accumulated in,
+        which is float64 for the ``mixed`` precision.
+        """
+        if self.precision != 'mixed':
+            return tensors
+        return tuple(jnp.asarray(tensor, dtype=jnp.float64) for tensor in tensors)
+
     def sum(self, tensor_in, axis=None):
         return jnp.sum(tensor_in, axis=axis)
 
@@ -405,8 +507,7 @@ def einsum(self, subscripts, *operands):
         return jnp.einsum(subscripts, *operands)
 
     def poisson_logpdf(self, n, lam):
-        n = jnp.asarray(n)
-        lam = jnp.asarray(lam)
+        n, lam = self._accumulate(jnp.asarray(n), jnp.asarray(lam))
         return xlogy(n, lam) - lam - gammaln(n + 1.0)
 
     def poisson(self, n, lam):
@@ -457,6 +558,7 @@ def normal_logpdf(self, x, mu, sigma):
         # this is much faster than
         # norm.logpdf(x, loc=mu, scale=sigma)
         # https://codereview.stackexchange.com/questions/69718/fastest-computation-of-n-likelihoods-on-normal-distributions
+        x, mu, sigma = self._accumulate(x, mu, sigma)
         root2 = jnp.sqrt(2)
         root2pi = jnp.sqrt(2 * jnp.pi)
         prefactor = -jnp.log(sigma * root2pi)
@@ -67,13 +67,14 @@ def set_backend(backend, custom_optimizer=None, precision=None, default=False):
     Args:
         backend (:obj:`str` or `pyhf.tensor` backend): One of the supported pyhf backends: NumPy, TensorFlow, PyTorch, and JAX
         custom_optimizer (`pyhf.optimize` optimizer): Optional custom optimizer defined by the user
-        precision (:obj:`str`): Floating point precision to use in the backend: ``64b`` or ``32b``. Default is backend dependent.
+        precision (:obj:`str`): Floating point precision to use in the backend: ``64b``, ``32b`` or ``mixed``.
+         The ``mixed`` precision stores and computes tensors in ``32b`` but accumulates the log-likelihoods in ``64b``. Default is backend dependent.
         default (:obj:`bool`): Set the backend as the default backend additionally
 
     Returns:
         None
     """
-    _supported_precisions = ["32b", "64b"]
+    _supported_precisions = ["32b", "64b", "mixed"]
     backend_kwargs = {}
 
     if isinstance(precision, (str, bytes)):
@@ -127,7 +128,7 @@ def set_backend(backend, custom_optimizer=None, precision=None, default=False):
                 )()
             except TypeError:
                 raise exceptions.InvalidOptimizer(
-                    f"The optimizer provided is not supported: {custom_optimizer}. Select from one of the supported optimizers: scipy, minuit"
+                    f"The optimizer provided is not supported: {custom_optimizer}. Select from one of the supported optimizers: scipy, minuit, newton"
                 )
         else:
             _name_supported = getattr(
@@ -47,7 +47,8 @@ def __init__(self, **kwargs):
             'int': np.int64 if self.precision == '64b' else np.int32,
             'bool': np.bool_,
         }
-        self.default_do_grad = False
+        # finite differences cannot resolve steps in float32 parameters
+        self.default_do_grad = self.precision == 'mixed'
 
     def _setup(self):
         """
@@ -173,6 +174,28 @@ def tolist(self, tensor_in):
     def outer(self, tensor_in_1, tensor_in_2):
         return np.outer(tensor_in_1, tensor_in_2)
 
+    def solve(self, tensor_in_1, tensor_in_2):
+        """
+        Solve the linear system :math:`A x = b` for :math:`x`.
+
+        Example:
+
+            >>> import pyhf
+            >>> pyhf.set_backend("numpy")
+            >>> a = pyhf.tensorlib.astensor([[2.0, 1.0], [1.0, 3.0]])
+            >>> b = pyhf.tensorlib.astensor([3.0, 5.0])
+            >>> pyhf.tensorlib.solve(a, b)
+            array([0.8, 1.4])
+
+        Args:
+            tensor_in_1 (:obj:`tensor`): The square matrix :math:`A`.
+            tensor_in_2 (:obj:`tensor`): The right-hand side :math:`b`.
+
+        Returns:
+            NumPy ndarray: The solution :math:`x`.
+        """
+        return np.linalg.solve(tensor_in_1, tensor_in_2)
+
     def gather(self, tensor, indices):
         return tensor[indices]
 
@@ -213,6 +236,15 @@ def astensor(self, tensor_in, dtype='float'):
 
         return np.asarray(tensor_in, dtype=dtype)
 
+    def _accumulate(self, *tensors):
+        """
+        The tensors in the precision the log-likelihoods are accumulated in,
+        which is float64 for the ``mixed`` precision.
+        """
+        if self.precision != 'mixed':
+            return tensors
+        return tuple(np.asarray(tensor, dtype=np.float64) for tensor in tensors)
+
     def sum(self, tensor_in, axis=None):
         return np.sum(tensor_in, axis=axis)
 
@@ -387,6 +419,7 @@ def einsum(self, subscripts, *operands):
         return np.einsum(subscripts, *operands)
 
     def poisson_logpdf(self, n, lam):
+        n, lam = self._accumulate(n, lam)
         return xlogy(n, lam) - lam - gammaln(n + 1.0)
 
     def poisson(self, n, lam):
@@ -437,6 +470,7 @@ def normal_logpdf(self, x, mu, sigma):
         # this is much faster than
         # norm.logpdf(x, loc=mu, scale=sigma)
         # https://codereview.stackexchange.com/questions/69718/fastest-computation-of-n-likelihoods-on-normal-distributions
+        x, mu, sigma = self._accumulate(x, mu, sigma)
         root2 = np.sqrt(2)
         root2pi = np.sqrt(2 * np.pi)
         prefactor = -np.log(sigma * root2pi)
@@ -200,6 +200,28 @@ def astensor(self, tensor_in, dtype='float'):
 
         return torch.as_tensor(tensor_in, dtype=dtype)
 
+    def solve(self, tensor_in_1, tensor_in_2):
+        """
+        Solve the linear system :math:`A x = b` for :math:`x`.
+
+        Example:
+
+            >>> import pyhf
+            >>> pyhf.set_backend("pytorch")
+            >>> a = pyhf.tensorlib.astensor([[2.0, 1.0], [1.0, 3.0]])
+            >>> b = pyhf.tensorlib.astensor([3.0, 5.0])
+            >>> pyhf.tensorlib.solve(a, b)
+            tensor([0.8000, 1.4000])
+
+        Args:
+            tensor_in_1 (:obj:`tensor`): The square matrix :math:`A`.
+            tensor_in_2 (:obj:`tensor`): The right-hand side :math:`b`.
+
+        Returns:
+            PyTorch tensor: The solution :math:`x`.
+        """
+        return torch.linalg.solve(tensor_in_1, tensor_in_2)
+
     def gather(self, tensor, indices):
         return tensor[indices.type(torch.LongTensor)]
 
@@ -232,6 +254,15 @@ def ravel(self, tensor):
         """
         return torch.ravel(tensor)
 
+    def _accumulate(self, *tensors):
+        """
+        The tensors in the precision the log-likelihoods are accumulated in,
+        which is float64 for the ``mixed`` precision.
+        """
+        if self.precision != 'mixed':
+            return tensors
+        return tuple(torch.as_tensor(tensor, dtype=torch.float64) for tensor in tensors)
+
     def sum(self, tensor_in, axis=None):
         return (
             torch.sum(tensor_in)
@@ -399,6 +430,7 @@ def einsum(self, subscripts, *operands):
         return torch.einsum(subscripts, operands)
 
     def poisson_logpdf(self, n, lam):
+        n, lam = self._accumulate(n, lam)
         # validate_args=True disallows continuous approximation
         return torch.distributions.Poisson(lam, validate_args=False).log_prob(n)
 
@@ -451,6 +483,7 @@ def normal_logpdf(self, x, mu, sigma):
         x = self.astensor(x)
         mu = self.astensor(mu)
         sigma = self.astensor(sigma)
+        x, mu, sigma = self._accumulate(x, mu, sigma)
 
         normal = torch.distributions.Normal(mu, sigma)
         return normal.log_prob(x)
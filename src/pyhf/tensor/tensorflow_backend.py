@@ -169,6 +169,35 @@ def outer(self, tensor_in_1, tensor_in_2):
         )
         return tf.einsum('i,j->ij', tensor_in_1, tensor_in_2)
 
+    def solve(self, tensor_in_1, tensor_in_2):
+        """
+        Solve the linear system :math:`A x = b` for :math:`x`.
+
+        Example:
+
+            >>> import pyhf
+            >>> pyhf.set_backend("tensorflow")
+            >>> a = pyhf.tensorlib.astensor([[2.0, 1.0], [1.0, 3.0]])
+            >>> b = pyhf.tensorlib.astensor([3.0, 5.0])
+            >>> t = pyhf.tensorlib.solve(a, b)
+            >>> print(t)
+            tf.Tensor([0.8 1.4], shape=(2,), dtype=float64)
+
+        Args:
+            tensor_in_1 (:obj:`tensor`): The square matrix :math:`A`.
+            tensor_in_2 (:obj:`tensor`): The right-hand side :math:`b`.
+
+        Returns:
+            TensorFlow Tensor: The solution :math:`x`.
+        """
+        # tf.linalg.solve requires the right-hand side to be a matrix
+        tensor_in_2 = tf.convert_to_tensor(tensor_in_2)
+        if len(tensor_in_2.shape) == 1:
+            return tf.reshape(
+                tf.linalg.solve(tensor_in_1, tf.reshape(tensor_in_2, (-1, 1))), (-1,)
+            )
+        return tf.linalg.solve(tensor_in_1, tensor_in_2)
+
     def gather(self, tensor, indices):
         return tf.compat.v2.gather(tensor, indices)
 
@@ -220,6 +249,15 @@ def astensor(self, tensor_in, dtype='float'):
             tensor = tf.cast(tensor, dtype)
         return tensor
 
+    def _accumulate(self, *tensors):
+        """
+        The tensors in the precision the log-likelihoods are accumulated in,
+        which is float64 for the ``mixed`` precision.
+        """
+        if self.precision != 'mixed':
+            return tensors
+        return tuple(tf.cast(tensor, tf.float64) for tensor in tensors)
+
     def sum(self, tensor_in, axis=None):
         return (
             tf.reduce_sum(tensor_in)
@@ -468,6 +506,7 @@ def poisson_logpdf(self, n, lam):
             TensorFlow Tensor: Value of the continuous approximation to log(Poisson(n|lam))
         """
         lam = self.astensor(lam)
+        n, lam = self._accumulate(n, lam)
         return tfp.distributions.Poisson(lam).log_prob(n)
 
     def poisson(self, n, lam):
@@ -543,6 +582,7 @@ def normal_logpdf(self, x, mu, sigma):
         """
         mu = self.astensor(mu)
         sigma = self.astensor(sigma)
+        x, mu, sigma = self._accumulate(x, mu, sigma)
 
         return tfp.distributions.Normal(mu, sigma).log_prob(x)
 
@@ -627,7 +667,7 @@ def poisson_dist(self, rate):
             TensorFlow Probability Poisson distribution: The Poisson distribution class
 
         """
-        rate = self.astensor(rate)
+        (rate,) = self._accumulate(self.astensor(rate))
 
         return tfp.distributions.Poisson(rate)
 
@@ -654,8 +694,7 @@ def normal_dist(self, mu, sigma):
             TensorFlow Probability Normal distribution: The Normal distribution class
 
         """
-        mu = self.astensor(mu)
-        sigma = self.astensor(sigma)
+        mu, sigma = self._accumulate(self.astensor(mu), self.astensor(sigma))
 
         return tfp.distributions.Normal(mu, sigma)
 
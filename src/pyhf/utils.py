@@ -1,5 +1,7 @@
+import copy
 import json
 import jsonschema
+import numpy as np
 import pkg_resources
 from pathlib import Path
 import yaml
@@ -48,6 +50,72 @@ def load_schema(schema_id, version=None):
 load_schema('defs.json')
 
 
+def _is_array(checker, instance):
+    return isinstance(instance, (list, np.ndarray))
+
+
+def _items(validator, items, instance, schema):
+    # validate numeric arrays (e.g. the memory-mapped columns of a workspace
+    # loaded with Workspace.from_npz) as a whole instead of item by item
+    if isinstance(instance, np.ndarray) and items == {"type": "number"}:
+        if instance.ndim != 1 or instance.dtype.kind not in 'iuf':
+            yield jsonschema.ValidationError(
+                f"array of shape {instance.shape} and dtype {instance.dtype} is not an array of numbers"
+            )
+        return
+    yield from jsonschema.Draft6Validator.VALIDATORS['items'](
+        validator, items, instance, schema
+    )
+
+
+_Validator = jsonschema.validators.extend(
+    jsonschema.Draft6Validator,
+    validators={'items': _items},
+    type_checker=jsonschema.Draft6Validator.TYPE_CHECKER.redefine('array', _is_array),
+)
+
+
+def _to_jsonable(obj):
+    """Serialize the numpy arrays of a specification as lists, for use as ``default`` of :func:`json.dump`."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _copy_spec(spec):
+    """
+    Deep copy a specification, sharing instead of copying its read-only numpy
+    arrays, such as the memory-mapped columns of a workspace loaded with
+    :meth:`~pyhf.workspace.Workspace.from_npz`.
+    """
+    if isinstance(spec, dict):
+        return {key: _copy_spec(value) for key, value in spec.items()}
+    if isinstance(spec, list):
+        # the numbers and strings of a specification are immutable and shared
+        return [
+            item
+            if isinstance(item, (str, int, float, type(None)))
+            else _copy_spec(item)
+            for item in spec
+        ]
+    if isinstance(spec, (str, int, float, type(None))):
+        return spec
+    if isinstance(spec, np.ndarray) and not spec.flags.writeable:
+        return spec
+    return copy.deepcopy(spec)
+
+
+def _arrays_to_lists(spec):
+    """Convert the numpy arrays of a specification to lists."""
+    if isinstance(spec, np.ndarray):
+        return spec.tolist()
+    if isinstance(spec, dict):
+        return {key: _arrays_to_lists(value) for key, value in spec.items()}
+    if isinstance(spec, list):
+        return [_arrays_to_lists(item) for item in spec]
+    return spec
+
+
 def validate(spec, schema_name, version=None):
     schema = load_schema(schema_name, version=version)
     try:
@@ -56,9 +124,7 @@ def validate(spec, schema_name, version=None):
             referrer=schema_name,
             store=SCHEMA_CACHE,
         )
-        validator = jsonschema.Draft6Validator(
-            schema, resolver=resolver, format_checker=None
-        )
+        validator = _Validator(schema, resolver=resolver, format_checker=None)
         return validator.validate(spec)
     except jsonschema.ValidationError as err:
         raise InvalidSpecification(err, schema_name)
@@ -110,7 +176,9 @@ def digest(obj, algorithm='sha256'):
     """
 
     try:
-        stringified = json.dumps(obj, sort_keys=True, ensure_ascii=False).encode('utf8')
+        stringified = json.dumps(
+            obj, sort_keys=True, ensure_ascii=False, default=_to_jsonable
+        ).encode('utf8')
     except TypeError:
         raise ValueError(
             "The supplied object is not JSON-serializable for calculating a hash."
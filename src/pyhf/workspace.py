@@ -7,10 +7,16 @@
 """
 import logging
 import jsonpatch
-import copy
 import collections
+import json
+import struct
+import zipfile
+
+import numpy as np
+
 from pyhf import exceptions
 from pyhf import utils
+from pyhf.utils import _arrays_to_lists, _copy_spec
 from pyhf.pdf import Model
 from pyhf.mixins import _ChannelSummaryMixin
 
@@ -23,6 +29,118 @@ def __dir__():
     return __all__
 
 
+# the keys of the histogram contents stored as columns by Workspace.to_npz
+_COLUMN_KEYS = ('data', 'lo_data', 'hi_data')
+_COLUMN_DTYPES = ('float64', 'int64')
+
+
+def _spec_equal(left, right):
+    """Compare two specifications whose lists of numbers may be numpy arrays."""
+    if isinstance(left, np.ndarray) or isinstance(right, np.ndarray):
+        return np.array_equal(left, right)
+    if isinstance(left, dict) and isinstance(right, dict):
+        return left.keys() == right.keys() and all(
+            _spec_equal(value, right[key]) for key, value in left.items()
+        )
+    if isinstance(left, list) and isinstance(right, list):
+        return len(left) == len(right) and all(map(_spec_equal, left, right))
+    return left == right
+
+
+def _same_items(items, other_items):
+    """Whether two lists hold the same objects."""
+    return len(items) == len(other_items) and all(
+        item is other_item for item, other_item in zip(items, other_items)
+    )
+
+
+def _apply_patch(spec, patch):
+    """
+    Apply a JSON patch to a copy of a specification whose lists of numbers may
+    be numpy arrays, such as the specification of a workspace loaded with
+    :meth:`~pyhf.workspace.Workspace.from_npz`.
+
+    :mod:`jsonpatch` supports neither operations on the items of arrays nor
+    comparisons of arrays, so the arrays that an operation of the patch points
+    into or at, or that it tests, are converted to lists first. All other
+    read-only arrays are shared with ``spec``.
+    """
+    patch = (
+        patch if isinstance(patch, jsonpatch.JsonPatch) else jsonpatch.JsonPatch(patch)
+    )
+    spec = _copy_spec(spec)
+    for operation in patch:
+        for key in ('path', 'from'):
+            if key not in operation:
+                continue
+            parts = patch.pointer_cls(operation[key]).parts
+            if not parts:
+                spec = _arrays_to_lists(spec)
+                continue
+            parent = spec
+            for depth, part in enumerate(parts):
+                if isinstance(parent, list) and part.isdigit():
+                    part = int(part)
+                    if part >= len(parent):
+                        break
+                elif not isinstance(parent, dict) or part not in parent:
+                    break
+                if depth == len(parts) - 1:
+                    parent[part] = _arrays_to_lists(parent[part])
+                    break
+                if isinstance(parent[part], np.ndarray):
+                    parent[part] = parent[part].tolist()
+                parent = parent[part]
+    # the specification is a copy, whose arrays are not modified by the patch
+    return patch.apply(spec, in_place=True)
+
+
+def _column_dtype(values):
+    """The dtype of the column a list or array of numbers is stored in, or ``None`` if it is not stored as a column."""
+    if isinstance(values, np.ndarray):
+        return {'f': 'float64', 'i': 'int64', 'u': 'int64'}.get(values.dtype.kind)
+    if all(isinstance(value, float) for value in values):
+        return 'float64'
+    if all(
+        isinstance(value, (int, np.integer)) and not isinstance(value, bool)
+        for value in values
+    ):
+        return 'int64'
+    return None
+
+
+def _memmap_npz_array(file, name):
+    """Memory-map an array stored uncompressed in a numpy ``.npz`` archive."""
+    with zipfile.ZipFile(file) as archive:
+        info = archive.getinfo(f'{name}.npy')
+    read_array_header = None
+    if info.compress_type == zipfile.ZIP_STORED:
+        with open(file, 'rb') as fp:
+            # skip the local file header of the archive member: 30 bytes
+            # followed by the file name and the extra field
+            fp.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack('<HH', fp.read(4))
+            fp.seek(name_length + extra_length, 1)
+            read_array_header = {
+                (1, 0): np.lib.format.read_array_header_1_0,
+                (2, 0): np.lib.format.read_array_header_2_0,
+            }.get(np.lib.format.read_magic(fp))
+            if read_array_header is not None:
+                shape, fortran_order, dtype = read_array_header(fp)
+                offset = fp.tell()
+    if read_array_header is None or dtype.hasobject or 0 in shape:
+        with np.load(file) as archive:
+            return archive[name]
+    return np.memmap(
+        file,
+        dtype=dtype,
+        mode='r',
+        offset=offset,
+        shape=shape,
+        order='F' if fortran_order else 'C',
+    ).view(np.ndarray)
+
+
 def _join_items(join, left_items, right_items, key='name', deep_merge_key=None):
     """
     Join two lists of dictionaries along the given key.
@@ -43,17 +161,23 @@ def _join_items(join, left_items, right_items, key='name', deep_merge_key=None):
         primary_items, secondary_items = right_items, left_items
     else:
         primary_items, secondary_items = left_items, right_items
-    joined_items = copy.deepcopy(primary_items)
+    # the items are shared with the joined lists, and only the merged items
+    # are replaced by new ones
+    joined_items = list(primary_items)
     keys = [item[key] for item in joined_items]
     for secondary_item in secondary_items:
         # first, check for deep merging
         if secondary_item[key] in keys and deep_merge_key is not None:
-            _deep_left_items = joined_items[keys.index(secondary_item[key])][
-                deep_merge_key
-            ]
+            index = keys.index(secondary_item[key])
+            _deep_left_items = joined_items[index][deep_merge_key]
             _deep_right_items = secondary_item[deep_merge_key]
-            joined_items[keys.index(secondary_item[key])][deep_merge_key] = _join_items(
-                'left outer', _deep_left_items, _deep_right_items
+            joined_items[index] = dict(
+                joined_items[index],
+                **{
+                    deep_merge_key: _join_items(
+                        'left outer', _deep_left_items, _deep_right_items
+                    )
+                },
             )
         # next, move over whole items where possible:
         #   - if no join logic
@@ -63,13 +187,16 @@ def _join_items(join, left_items, right_items, key='name', deep_merge_key=None):
         # NB: this will be slow for large numbers of items
         elif (
             join == 'none'
-            or (join in ['outer'] and secondary_item not in primary_items)
+            or (
+                join in ['outer']
+                and not any(_spec_equal(secondary_item, item) for item in primary_items)
+            )
             or (
                 join in ['left outer', 'right outer']
                 and secondary_item[key] not in keys
             )
         ):
-            joined_items.append(copy.deepcopy(secondary_item))
+            joined_items.append(secondary_item)
     return joined_items
 
 
@@ -282,24 +409,32 @@ def _join_measurements(join, left_measurements, right_measurements):
 class Workspace(_ChannelSummaryMixin, dict):
     """
     A JSON-serializable object that is built from an object that follows the :obj:`workspace.json` `schema <https://scikit-hep.org/pyhf/likelihood.html#workspace>`__.
+
+    The workspaces returned by :meth:`prune`, :meth:`rename` and :meth:`combine`
+    share the channels and samples they do not change with the workspaces they
+    are built from, so these are to be treated as immutable.
     """
 
     valid_joins = ['none', 'outer', 'left outer', 'right outer']
 
-    def __init__(self, spec, validate: bool = True, **config_kwargs):
+    def __init__(self, spec, validate: bool = True, copy: bool = True, **config_kwargs):
         """
         Workspaces hold the model, data and measurements.
 
         Args:
             spec (:obj:`jsonable`): The HistFactory JSON specification
             validate (:obj:`bool`): Whether to validate against a JSON schema
+            copy (:obj:`bool`): Whether to copy the specification. If ``False``,
+             the workspace takes ownership of the specification, which must
+             then not be modified by the caller.
             config_kwargs: Possible keyword arguments for the workspace configuration
 
         Returns:
             model (:class:`~pyhf.workspace.Workspace`): The Workspace instance
 
         """
-        spec = copy.deepcopy(spec)
+        if copy:
+            spec = _copy_spec(spec)
         super().__init__(spec, channels=spec['channels'])
         self.schema = config_kwargs.pop('schema', 'workspace.json')
         self.version = config_kwargs.pop('version', spec.get('version', None))
@@ -308,6 +443,10 @@ def __init__(self, spec, validate: bool = True, **config_kwargs):
         if validate:
             log.info(f"Validating spec against schema: {self.schema}")
             utils.validate(self, self.schema, version=self.version)
+        # operations that keep a valid workspace valid skip the validation of
+        # the workspaces they build from a validated (or otherwise known to be
+        # valid) workspace
+        self._validated = validate and self.schema == 'workspace.json'
 
         self.measurement_names = []
         for measurement in self.get('measurements', []):
@@ -326,7 +465,7 @@ def __eq__(self, other):
         """Equality is defined as equal dict representations."""
         if not isinstance(other, Workspace):
             return False
-        return dict(self) == dict(other)
+        return _spec_equal(dict(self), dict(other))
 
     def __ne__(self, other):
         """Negation of equality."""
@@ -394,6 +533,7 @@ def model(
         measurement_name=None,
         measurement_index=None,
         patches=None,
+        model_cache=None,
         **config_kwargs,
     ):
         """
@@ -408,6 +548,8 @@ def model(
              in :func:`~pyhf.workspace.Workspace.get_measurement`.
             patches (:obj:`list` of :class:`jsonpatch.JsonPatch` or :class:`pyhf.patchset.Patch`):
              A list of patches to apply to the model specification.
+            model_cache (~pyhf.pdf.ModelCache): An optional cache to take the model
+             from instead of building it if an identical model was built before.
             config_kwargs: Possible keyword arguments for the model
              configuration.
              See :class:`~pyhf.pdf.Model` for more details.
@@ -437,8 +579,10 @@ def model(
 
         patches = patches or []
         for patch in patches:
-            modelspec = jsonpatch.JsonPatch(patch).apply(modelspec)
+            modelspec = _apply_patch(modelspec, patch)
 
+        if model_cache is not None:
+            return model_cache.model(modelspec, **config_kwargs)
         return Model(modelspec, **config_kwargs)
 
     def data(self, model, include_auxdata=True):
@@ -460,7 +604,13 @@ def data(self, model, include_auxdata=True):
         """
         try:
             observed_data = sum(
-                (self.observations[c] for c in model.config.channels), []
+                (
+                    self.observations[c].tolist()
+                    if isinstance(self.observations[c], np.ndarray)
+                    else self.observations[c]
+                    for c in model.config.channels
+                ),
+                [],
             )
         except KeyError:
             log.error(
@@ -562,33 +712,46 @@ def _prune_and_rename(
                     f"{measurement_name} is not one of the measurements in this workspace."
                 )
 
+        # the channels, samples and modifiers that are neither pruned nor
+        # renamed are shared with this workspace
+        channels = []
+        for channel in self['channels']:
+            if channel['name'] in prune_channels:
+                continue
+            samples = []
+            for sample in channel['samples']:
+                if sample['name'] in prune_samples:
+                    continue
+                modifiers = [
+                    dict(modifier, name=rename_modifiers[modifier['name']])
+                    if modifier['name'] in rename_modifiers
+                    else modifier
+                    for modifier in sample['modifiers']
+                    if modifier['name'] not in prune_modifiers
+                    and modifier['type'] not in prune_modifier_types
+                ]
+                if sample['name'] in rename_samples or not _same_items(
+                    modifiers, sample['modifiers']
+                ):
+                    sample = dict(
+                        sample,
+                        name=rename_samples.get(sample['name'], sample['name']),
+                        modifiers=modifiers,
+                    )
+                samples.append(sample)
+            if channel['name'] in rename_channels or not _same_items(
+                samples, channel['samples']
+            ):
+                channel = dict(
+                    channel,
+                    name=rename_channels.get(channel['name'], channel['name']),
+                    samples=samples,
+                )
+            channels.append(channel)
+
         newspec = {
-            'channels': [
-                {
-                    'name': rename_channels.get(channel['name'], channel['name']),
-                    'samples': [
-                        {
-                            'name': rename_samples.get(sample['name'], sample['name']),
-                            'data': sample['data'],
-                            'modifiers': [
-                                dict(
-                                    modifier,
-                                    name=rename_modifiers.get(
-                                        modifier['name'], modifier['name']
-                                    ),
-                                )
-                                for modifier in sample['modifiers']
-                                if modifier['name'] not in prune_modifiers
-                                and modifier['type'] not in prune_modifier_types
-                            ],
-                        }
-                        for sample in channel['samples']
-                        if sample['name'] not in prune_samples
-                    ],
-                }
-                for channel in self['channels']
-                if channel['name'] not in prune_channels
-            ],
+            'channels': channels,
+            # the measurements and observations are small and copied
             'measurements': [
                 {
                     'name': rename_measurements.get(
@@ -597,7 +760,7 @@ def _prune_and_rename(
                     'config': {
                         'parameters': [
                             dict(
-                                parameter,
+                                _copy_spec(parameter),
                                 name=rename_modifiers.get(
                                     parameter['name'], parameter['name']
                                 ),
@@ -615,7 +778,7 @@ def _prune_and_rename(
             ],
             'observations': [
                 dict(
-                    copy.deepcopy(observation),
+                    _copy_spec(observation),
                     name=rename_channels.get(observation['name'], observation['name']),
                 )
                 for observation in self['observations']
@@ -623,7 +786,28 @@ def _prune_and_rename(
             ],
             'version': self['version'],
         }
-        return Workspace(newspec)
+        # pruning and renaming only make a valid workspace invalid by emptying
+        # a list that must not be empty or by renaming to a non-string
+        valid = (
+            self._validated
+            and newspec['channels']
+            and newspec['measurements']
+            and newspec['observations']
+            and all(channel['samples'] for channel in newspec['channels'])
+            and all(
+                isinstance(name, str)
+                for renames in (
+                    rename_modifiers,
+                    rename_samples,
+                    rename_channels,
+                    rename_measurements,
+                )
+                for name in renames.values()
+            )
+        )
+        workspace = Workspace(newspec, validate=not valid, copy=False)
+        workspace._validated = True
+        return workspace
 
     def prune(
         self,
@@ -761,11 +945,20 @@ def combine(cls, left, right, join='none', merge_channels=False):
 
         newspec = {
             'channels': new_channels,
-            'measurements': new_measurements,
-            'observations': new_observations,
+            # the measurements and observations are small and copied
+            'measurements': _copy_spec(new_measurements),
+            'observations': _copy_spec(new_observations),
             'version': new_version,
         }
-        return cls(newspec)
+        # the channels and samples are shared with the joined workspaces, and
+        # joining valid workspaces gives a valid workspace
+        workspace = cls(
+            newspec,
+            validate=not (left._validated and right._validated),
+            copy=False,
+        )
+        workspace._validated = True
+        return workspace
 
     @classmethod
     def sorted(cls, workspace):
@@ -779,7 +972,7 @@ def sorted(cls, workspace):
             ~pyhf.workspace.Workspace: A new sorted workspace object
 
         """
-        newspec = copy.deepcopy(dict(workspace))
+        newspec = _copy_spec(dict(workspace))
 
         newspec['channels'].sort(key=lambda e: e['name'])
         for channel in newspec['channels']:
@@ -793,7 +986,10 @@ def sorted(cls, workspace):
 
         newspec['observations'].sort(key=lambda e: e['name'])
 
-        return cls(newspec)
+        # sorting keeps a valid workspace valid
+        sorted_workspace = cls(newspec, validate=not workspace._validated, copy=False)
+        sorted_workspace._validated = True
+        return sorted_workspace
 
     @classmethod
     def build(cls, model, data, name='measurement', validate: bool = True):
@@ -810,7 +1006,7 @@ def build(cls, model, data, name='measurement', validate: bool = True):
             ~pyhf.workspace.Workspace: A new workspace object
 
         """
-        workspace = copy.deepcopy(dict(channels=model.spec['channels']))
+        workspace = _copy_spec(dict(channels=model._spec['channels']))
         workspace['version'] = utils.SCHEMA_VERSION
         workspace['measurements'] = [
             {
@@ -836,4 +1032,97 @@ def build(cls, model, data, name='measurement', validate: bool = True):
             {'name': k, 'data': list(data[model.config.channel_slices[k]])}
             for k in model.config.channels
         ]
-        return cls(workspace, validate=validate)
+        return cls(workspace, validate=validate, copy=False)
+
+    def to_npz(self, file):
+        """
+        Write the workspace to a binary columnar file.
+
+        The histogram contents of the workspace (the ``data``, ``lo_data`` and
+        ``hi_data`` lists of numbers) are stored as contiguous ``float64`` and
+        ``int64`` arrays of an uncompressed :func:`numpy.savez` archive, next to
+        the JSON specification in which they are replaced by references to
+        these arrays. The file is read back with :meth:`from_npz`.
+
+        Args:
+            file (:obj:`str` or :class:`pathlib.Path`): The file to write to.
+
+        """
+        columns = {dtype: [] for dtype in _COLUMN_DTYPES}
+        sizes = dict.fromkeys(_COLUMN_DTYPES, 0)
+
+        def _to_columns(spec, key=None):
+            if key in _COLUMN_KEYS and isinstance(spec, (list, np.ndarray)):
+                dtype = _column_dtype(spec)
+                if dtype is not None:
+                    column = np.asarray(spec, dtype=dtype)
+                    columns[dtype].append(column)
+                    start, sizes[dtype] = sizes[dtype], sizes[dtype] + column.size
+                    return {'$column': [dtype, start, sizes[dtype]]}
+            if isinstance(spec, dict):
+                return {key: _to_columns(value, key) for key, value in spec.items()}
+            if isinstance(spec, list):
+                return [_to_columns(item) for item in spec]
+            return spec
+
+        metadata = json.dumps(_to_columns(dict(self))).encode('utf-8')
+        with open(file, 'wb') as fp:
+            np.savez(
+                fp,
+                spec=np.frombuffer(metadata, dtype=np.uint8),
+                **{
+                    dtype: np.concatenate(columns[dtype] or [np.empty(0, dtype=dtype)])
+                    for dtype in _COLUMN_DTYPES
+                },
+            )
+
+    @classmethod
+    def from_npz(cls, file, mmap: bool = True, validate: bool = True, **config_kwargs):
+        """
+        Load a workspace from a binary columnar file written by :meth:`to_npz`.
+
+        The histogram contents of the returned workspace are read-only numpy
+        arrays instead of lists. Unless ``mmap`` is ``False``, they are views
+        of the memory-mapped file, so that no histogram is parsed or read before
+        it is used, e.g. when building a model with :meth:`model`.
+
+        Raises:
+          ~pyhf.exceptions.InvalidWorkspaceOperation: The file is not a columnar workspace.
+
+        Args:
+            file (:obj:`str` or :class:`pathlib.Path`): The file to read from.
+            mmap (:obj:`bool`): Whether to memory-map the histogram contents
+             instead of reading them into memory.
+            validate (:obj:`bool`): Whether to validate against a JSON schema
+            config_kwargs: Possible keyword arguments for the workspace configuration
+
+        Returns:
+            ~pyhf.workspace.Workspace: A new workspace object
+
+        """
+        with np.load(file) as archive:
+            if sorted(archive.files) != sorted(['spec', *_COLUMN_DTYPES]):
+                raise exceptions.InvalidWorkspaceOperation(
+                    f"{file} is not a columnar workspace written by Workspace.to_npz."
+                )
+            metadata = json.loads(archive['spec'].tobytes().decode('utf-8'))
+            columns = {
+                dtype: _memmap_npz_array(file, dtype) if mmap else archive[dtype]
+                for dtype in _COLUMN_DTYPES
+            }
+        for column in columns.values():
+            column.flags.writeable = False
+
+        def _from_columns(spec):
+            if isinstance(spec, dict):
+                if spec.keys() == {'$column'}:
+                    dtype, start, stop = spec['$column']
+                    return columns[dtype][start:stop]
+                return {key: _from_columns(value) for key, value in spec.items()}
+            if isinstance(spec, list):
+                return [_from_columns(item) for item in spec]
+            return spec
+
+        return cls(
+            _from_columns(metadata), validate=validate, copy=False, **config_kwargs
+        )
@@ -272,7 +272,43 @@ def build_channel(spec, channelspec, obsspec):
     return channel
 
 
-def writexml(spec, specdir, data_rootdir, resultprefix):
+class _HistogramCollection(dict):
+    """
+    The histograms of an export, collected so that they can be written to the
+    ROOT file at ``file_path`` in a single update.
+    """
+
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+
+
+def _write_channel(channelfilename, channel):
+    indent(channel)
+    with open(channelfilename, 'w') as channelfile:
+        channelfile.write("<!DOCTYPE Channel SYSTEM '../HistFactorySchema.dtd'>\n\n")
+        channelfile.write(ET.tostring(channel, encoding='utf-8').decode('utf-8'))
+
+
+def writexml(spec, specdir, data_rootdir, resultprefix, executor=None):
+    """
+    Write the XML and ROOT files of a HistFactory workspace.
+
+    All histograms are collected first and then written to the ROOT file in a
+    single bulk update.
+
+    Args:
+        spec (:obj:`dict`): The workspace specification.
+        specdir (:obj:`str`): The directory the channel XML files are written to.
+        data_rootdir (:obj:`str`): The directory the ``data.root`` file is written to.
+        resultprefix (:obj:`str`): The prefix of the output file names.
+        executor (:obj:`concurrent.futures.Executor`): An executor used to write
+          the channel XML files concurrently. If ``None``, they are written
+          sequentially.
+
+    Returns:
+        :obj:`bytes`: The top-level (``Combination``) XML.
+    """
     global _ROOT_DATA_FILE
 
     shutil.copyfile(
@@ -283,24 +319,32 @@ def writexml(spec, specdir, data_rootdir, resultprefix):
         "Combination", OutputFilePrefix=str(Path(specdir).joinpath(resultprefix))
     )
 
-    with uproot.recreate(Path(data_rootdir).joinpath('data.root')) as _ROOT_DATA_FILE:
-        for channelspec in spec['channels']:
-            channelfilename = str(
-                Path(specdir).joinpath(f'{resultprefix}_{channelspec["name"]}.xml')
-            )
-            with open(channelfilename, 'w') as channelfile:
-                channel = build_channel(spec, channelspec, spec.get('observations'))
-                indent(channel)
-                channelfile.write(
-                    "<!DOCTYPE Channel SYSTEM '../HistFactorySchema.dtd'>\n\n"
-                )
-                channelfile.write(
-                    ET.tostring(channel, encoding='utf-8').decode('utf-8')
+    channels = []
+    with uproot.recreate(Path(data_rootdir).joinpath('data.root')) as rootfile:
+        _ROOT_DATA_FILE = _HistogramCollection(rootfile.file_path)
+        try:
+            for channelspec in spec['channels']:
+                channelfilename = str(
+                    Path(specdir).joinpath(f'{resultprefix}_{channelspec["name"]}.xml')
                 )
+                channel = build_channel(spec, channelspec, spec.get('observations'))
+                channels.append((channelfilename, channel))
+
+                inp = ET.Element("Input")
+                inp.text = channelfilename
+                combination.append(inp)
 
-            inp = ET.Element("Input")
-            inp.text = channelfilename
-            combination.append(inp)
+            rootfile.update(_ROOT_DATA_FILE)
+        finally:
+            _ROOT_DATA_FILE = None
+
+    if executor is None:
+        for channelfilename, channel in channels:
+            _write_channel(channelfilename, channel)
+    else:
+        futures = [executor.submit(_write_channel, *args) for args in channels]
+        for future in futures:
+            future.result()
 
     # need information about modifier types to get the right prefix in measurement
     mixin = _ChannelSummaryMixin(channels=spec['channels'])
@@ -89,3 +89,101 @@ def test_hypotest(benchmark, backend, n_bins):
     )
     data = source['bindata']['data'] + pdf.config.auxdata
     assert benchmark(hypotest, pdf, data)
+
+
+def generate_spec(n_channels, n_samples, n_bins, n_histosys):
+    """
+    Create a workspace specification with per-channel shape uncertainties.
+
+    Each channel has a histosys modifier on one of its samples for every one of
+    the ``n_histosys`` uncertainties, a staterror and shapesys per channel and
+    a set of normsys modifiers shared across all channels.
+
+    Args:
+        n_channels: `int` number of channels
+        n_samples: `int` number of samples per channel
+        n_bins: `int` number of bins per channel
+        n_histosys: `int` number of histosys modifiers per channel
+
+    Returns:
+        spec
+    """
+    channels = []
+    for channel in range(n_channels):
+        samples = []
+        for sample in range(n_samples):
+            nominal = [50.0 + 10.0 * sample + _bin for _bin in range(n_bins)]
+            modifiers = [
+                {'name': 'lumi', 'type': 'lumi', 'data': None},
+                {
+                    'name': f'staterror_{channel}',
+                    'type': 'staterror',
+                    'data': [1.0] * n_bins,
+                },
+            ]
+            modifiers += [
+                {
+                    'name': f'normsys_{idx}',
+                    'type': 'normsys',
+                    'data': {'hi': 1.05, 'lo': 0.95},
+                }
+                for idx in range(sample, 20, n_samples)
+            ]
+            modifiers += [
+                {
+                    'name': f'histosys_{channel}_{idx}',
+                    'type': 'histosys',
+                    'data': {
+                        'hi_data': [1.1 * rate for rate in nominal],
+                        'lo_data': [0.9 * rate for rate in nominal],
+                    },
+                }
+                for idx in range(sample, n_histosys, n_samples)
+            ]
+            if sample == 0:
+                modifiers.append({'name': 'mu', 'type': 'normfactor', 'data': None})
+            else:
+                modifiers.append(
+                    {
+                        'name': f'shapesys_{channel}',
+                        'type': 'shapesys',
+                        'data': [2.0] * n_bins,
+                    }
+                )
+            samples.append(
+                {'name': f'sample_{sample}', 'data': nominal, 'modifiers': modifiers}
+            )
+        channels.append({'name': f'channel_{channel}', 'samples': samples})
+
+    parameters = [
+        {
+            'name': 'lumi',
+            'auxdata': [1.0],
+            'sigmas': [0.02],
+            'bounds': [[0.5, 1.5]],
+            'inits': [1.0],
+        }
+    ]
+    return {'channels': channels, 'parameters': parameters}
+
+
+channels = [10, 100]
+channel_ids = [f'{n_channels}_channels' for n_channels in channels]
+
+
+@pytest.mark.parametrize('n_channels', channels, ids=channel_ids)
+def test_model_construction(benchmark, n_channels):
+    """
+    Benchmark the construction of a pyhf.Model for workspaces with many
+    channels and modifiers (5k+ modifiers for 100 channels)
+
+    Args:
+        benchmark: pytest benchmark
+        n_channels: `int` number of channels given by pytest parameterization
+
+    Returns:
+        None
+    """
+    spec = generate_spec(n_channels, n_samples=4, n_bins=4, n_histosys=50)
+    model = benchmark(pyhf.Model, spec, poi_name='mu', validate=False)
+    assert len(model.config.modifiers) > 50 * n_channels
@@ -87,3 +87,51 @@ def test_asymptotic_calculator_has_fitted_pars(test_stat):
         assert pytest.approx(
             [7.6470499e-05, 1.4997178], rel=rtol
         ) == pyhf.tensorlib.tolist(fitted_pars.free_fit_to_asimov)
+
+
+# q0 tests the background-only hypothesis for every POI value so all fits are shared
+@pytest.mark.parametrize('test_stat,n_fits', [('qtilde', 3 + 2 * 3), ('q0', 5)])
+def test_asymptotic_calculator_reuse(mocker, test_stat, n_fits):
+    model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+    )
+    data = [51, 48] + model.config.auxdata
+    poi_tests = [0.5, 1.0, 1.5]
+
+    expected = []
+    for poi_test in poi_tests:
+        calc = pyhf.infer.calculators.AsymptoticCalculator(
+            data, model, test_stat=test_stat
+        )
+        teststat = calc.teststatistic(poi_test)
+        expected.append(
+            (teststat, calc.pvalues(teststat, *calc.distributions(poi_test)))
+        )
+
+    _, optimizer = pyhf.get_backend()
+    minimize = mocker.spy(type(optimizer), "_minimize")
+    calc = pyhf.infer.calculators.AsymptoticCalculator(data, model, test_stat=test_stat)
+    for poi_test, (teststat, pvalues) in zip(poi_tests, expected):
+        assert calc.teststatistic(poi_test) == pytest.approx(teststat)
+        assert calc.pvalues(
+            calc.teststatistic(poi_test), *calc.distributions(poi_test)
+        ) == pytest.approx(pvalues)
+    # the Asimov dataset and the free fits are only computed once
+    assert minimize.call_count == n_fits
+
+
+def test_asymptotic_calculator_fit_cache_bounded(mocker):
+    model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+    )
+    data = [51, 48] + model.config.auxdata
+    calc = pyhf.infer.calculators.AsymptoticCalculator(data, model)
+
+    _, optimizer = pyhf.get_backend()
+    minimize = mocker.spy(type(optimizer), "_minimize")
+    poi_tests = [0.1 * step for step in range(1, 21)]
+    for poi_test in poi_tests:
+        calc.teststatistic(poi_test)
+    # the fixed-POI fits age out of the cache while the free fits are kept
+    assert len(calc._fit_cache) <= calc._fit_cache.maxsize
+    assert minimize.call_count == 3 + 2 * len(poi_tests)
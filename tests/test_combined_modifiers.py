@@ -125,10 +125,13 @@ def test_histosys(backend):
     hsc = histosys_combined(
         [('hello', 'histosys'), ('world', 'histosys')], mc, mega_mods
     )
+    # the dense stitch map is only built when the full layout is requested
+    assert hsc.stitch_indices is None
 
     mod = hsc.apply(pyhf.tensorlib.astensor([0.5, -1.0]))
     shape = pyhf.tensorlib.shape(mod)
     assert shape == (2, 2, 1, 3)
+    assert pyhf.tensorlib.shape(hsc.stitch_indices) == (2, 2, 3)
     mod = np.asarray(pyhf.tensorlib.tolist(mod))
     assert np.allclose(mod[0, 0, 0], [0.5, 1.0, 1.5])
 
@@ -255,6 +258,100 @@ def test_normsys(backend):
     assert np.allclose(mod[0, 0, 3], [1.1, 1.1, 1.1])
 
 
+def test_histosys_partial_mask(backend):
+    mc = MockConfig(
+        par_map={
+            'hello': {
+                'paramset': constrained_by_normal(
+                    name='hello',
+                    is_scalar=True,
+                    n_parameters=1,
+                    inits=[0],
+                    bounds=[[-5, 5]],
+                    fixed=False,
+                    auxdata=[0.0],
+                ),
+                'slice': slice(0, 1),
+            },
+            'world': {
+                'paramset': constrained_by_normal(
+                    name='world',
+                    is_scalar=True,
+                    n_parameters=1,
+                    inits=[0],
+                    bounds=[[-5, 5]],
+                    fixed=False,
+                    auxdata=[0.0],
+                ),
+                'slice': slice(1, 2),
+            },
+        },
+        par_order=['hello', 'world'],
+        samples=['signal', 'background'],
+    )
+
+    mega_mods = {
+        'histosys/hello': {
+            'signal': {
+                'type': 'histosys',
+                'name': 'hello',
+                'data': {
+                    'hi_data': [11, 12, 10, 10],
+                    'lo_data': [9, 8, 10, 10],
+                    'nom_data': [10, 10, 10, 10],
+                    'mask': [True, True, False, False],
+                },
+            },
+            'background': {
+                'type': 'histosys',
+                'name': 'hello',
+                'data': {
+                    'hi_data': [20, 20, 20, 20],
+                    'lo_data': [20, 20, 20, 20],
+                    'nom_data': [20, 20, 20, 20],
+                    'mask': [False, False, False, False],
+                },
+            },
+        },
+        'histosys/world': {
+            'signal': {
+                'type': 'histosys',
+                'name': 'world',
+                'data': {
+                    'hi_data': [10, 10, 10, 10],
+                    'lo_data': [10, 10, 10, 10],
+                    'nom_data': [10, 10, 10, 10],
+                    'mask': [False, False, False, False],
+                },
+            },
+            'background': {
+                'type': 'histosys',
+                'name': 'world',
+                'data': {
+                    'hi_data': [20, 20, 22, 24],
+                    'lo_data': [20, 20, 19, 18],
+                    'nom_data': [20, 20, 20, 20],
+                    'mask': [False, False, True, True],
+                },
+            },
+        },
+    }
+
+    hsc = histosys_combined(
+        [('hello', 'histosys'), ('world', 'histosys')], mc, mega_mods, batch_size=2
+    )
+    # only the masked bins are stored
+    assert len(hsc._modifier_indices) == 4
+
+    mod = hsc.apply(pyhf.tensorlib.astensor([[1.0, -1.0], [-0.5, 2.0]]))
+    assert pyhf.tensorlib.shape(mod) == (2, 2, 2, 4)
+    mod = np.asarray(pyhf.tensorlib.tolist(mod))
+    assert np.allclose(mod[0, 0], [[1.0, 2.0, 0.0, 0.0], [-0.5, -1.0, 0.0, 0.0]])
+    assert np.allclose(mod[1, 1], [[0.0, 0.0, -1.0, -2.0], [0.0, 0.0, 4.0, 8.0]])
+    assert np.allclose(mod[0, 1], 0.0)
+    assert np.allclose(mod[1, 0], 0.0)
+
+
 def test_lumi(backend):
     mc = MockConfig(
         par_map={
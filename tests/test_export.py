@@ -430,3 +430,41 @@ def test_integer_data(datadir, mocker):
 
     channel = pyhf.writexml.build_channel(spec, channel_spec, {})
     assert channel
+
+
+@pytest.mark.parametrize("executor_type", [None, "thread"])
+def test_writexml_bulk_histograms(tmp_path, mocker, executor_type):
+    """
+    Test that pyhf.writexml.writexml writes all histograms to the ROOT file in
+    a single update and writes the same channel XML files when an executor is
+    used
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    spec = spec_staterror()
+    spec['measurements'] = [
+        {'name': 'measurement', 'config': {'poi': 'mu', 'parameters': []}}
+    ]
+    spec['observations'] = [{'name': 'firstchannel', 'data': [60.0, 80.0]}]
+    specdir = tmp_path.joinpath("config")
+    specdir.mkdir()
+
+    spy = mocker.spy(uproot.writing.WritableDirectory, "update")
+    if executor_type is None:
+        combination = pyhf.writexml.writexml(spec, specdir, tmp_path, "FitConfig")
+    else:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            combination = pyhf.writexml.writexml(
+                spec, specdir, tmp_path, "FitConfig", executor=executor
+            )
+
+    assert spy.call_count == 1
+    assert pyhf.writexml._ROOT_DATA_FILE is None
+    assert b"FitConfig_firstchannel.xml" in combination
+    channel = ET.parse(specdir.joinpath("FitConfig_firstchannel.xml")).getroot()
+    assert channel.attrib["Name"] == "firstchannel"
+    assert len(channel.findall("Sample")) == len(spec["channels"][0]["samples"])
+
+    with uproot.open(tmp_path.joinpath("data.root")) as file:
+        assert file["histfirstchannel_data"].values().tolist() == [60.0, 80.0]
+        assert file["histfirstchannel_bkg1"].values().tolist() == [50.0, 70.0]
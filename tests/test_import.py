@@ -1,11 +1,14 @@
 import pyhf
 import pyhf.readxml
 import numpy as np
+import concurrent.futures
 import uproot
 from pathlib import Path
 import pytest
 import xml.etree.ElementTree as ET
 import logging
+import pickle
+import threading
 
 
 def assert_equal_dictionary(d1, d2):
@@ -323,6 +326,133 @@ def test_import_filecache(mocker):
     assert_equal_dictionary(parsed_xml, parsed_xml2)
 
 
+def test_import_filecache_maxsize(mocker):
+    rootdirs = ['validation/xmlimport_input', 'validation/xmlimport_input2']
+    filecache = pyhf.readxml.FileCache(maxsize=1)
+    mocker.patch("pyhf.readxml.uproot.open", wraps=uproot.open)
+
+    for rootdir in rootdirs + rootdirs[:1]:
+        pyhf.readxml.parse(
+            f'{rootdir}/config/example.xml', rootdir, filecache=filecache
+        )
+        assert len(filecache) == 1
+    # the first file was closed and evicted before it was needed again
+    assert pyhf.readxml.uproot.open.call_count == 3
+    opened = [call.args[0] for call in pyhf.readxml.uproot.open.call_args_list]
+    assert opened[0] == opened[2]
+
+    filecache.clear()
+    assert len(filecache) == 0
+
+
+def test_import_filecache_evict_in_use(mocker):
+    filecache = pyhf.readxml.FileCache(maxsize=1)
+    first = str(Path('validation/xmlimport_input/data/example.root'))
+    second = str(Path('validation/xmlimport_input2/data/data.root'))
+    with filecache.open(first) as (rootfile, keys):
+        close = mocker.spy(rootfile, 'close')
+        with filecache.open(second):
+            assert first not in filecache
+            # still used, so not closed yet
+            assert close.call_count == 0
+            assert rootfile['signal'].values().tolist()
+        assert close.call_count == 0
+    assert close.call_count == 1
+    filecache.clear()
+
+
+def test_import_filecache_concurrent_open(mocker):
+    filecache = pyhf.readxml.FileCache()
+    first = str(Path('validation/xmlimport_input/data/example.root'))
+    second = str(Path('validation/xmlimport_input2/data/data.root'))
+    # the files can only be opened if they are opened at the same time
+    barrier = threading.Barrier(2, timeout=10)
+    uproot_open = uproot.open
+
+    def open_file(fullpath):
+        barrier.wait()
+        return uproot_open(fullpath)
+
+    mocker.patch("pyhf.readxml.uproot.open", side_effect=open_file)
+
+    def read(fullpath):
+        with filecache.open(fullpath) as (_, keys):
+            return len(keys)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        assert all(executor.map(read, [first, second]))
+        # the same file is only opened once
+        mocker.patch("pyhf.readxml.uproot.open", wraps=uproot_open)
+        filecache.clear()
+        assert all(executor.map(read, [first] * 4))
+    pyhf.readxml.uproot.open.assert_called_once_with(first)
+    assert len(filecache) == 1
+    filecache.clear()
+
+
+def test_import_filecache_dict():
+    rootdir = 'validation/xmlimport_input'
+    filecache = {}
+    data, err = pyhf.readxml.import_root_histogram(
+        rootdir, './data/example.root', '', 'signal', filecache=filecache
+    )
+    fullpath = str(Path(rootdir).joinpath('./data/example.root'))
+    rootfile, keys = filecache[fullpath]
+    assert 'signal' in keys
+    assert data == rootfile['signal'].values().tolist()
+
+    assert pyhf.readxml.parse(
+        f'{rootdir}/config/example.xml', rootdir, filecache=filecache
+    ) == pyhf.readxml.parse(f'{rootdir}/config/example.xml', rootdir)
+    assert list(filecache) == [fullpath]
+    rootfile.close()
+
+
+def test_import_filecache_pickle():
+    filecache = pyhf.readxml.FileCache(maxsize=4)
+    with filecache.open('validation/xmlimport_input/data/example.root'):
+        loaded = pickle.loads(pickle.dumps(filecache))
+    assert loaded.maxsize == 4
+    assert len(loaded) == 0 and len(filecache) == 1
+    with loaded.open('validation/xmlimport_input/data/example.root') as (_, keys):
+        assert 'signal' in keys
+    loaded.clear()
+    filecache.clear()
+
+
+@pytest.mark.parametrize(
+    'executor_type',
+    [concurrent.futures.ThreadPoolExecutor, concurrent.futures.ProcessPoolExecutor],
+    ids=['thread', 'process'],
+)
+def test_import_executor(executor_type, mocker):
+    configfile = 'validation/xmlimport_input2/config/example.xml'
+    rootdir = 'validation/xmlimport_input2'
+    parsed_xml = pyhf.readxml.parse(configfile, rootdir)
+
+    pyhf.readxml.clear_filecache()
+    mocker.patch("pyhf.readxml.uproot.open", wraps=uproot.open)
+    with executor_type(max_workers=2) as executor:
+        parsed_xml_executor = pyhf.readxml.parse(configfile, rootdir, executor=executor)
+
+    assert parsed_xml_executor == parsed_xml
+    if executor_type is concurrent.futures.ThreadPoolExecutor:
+        # the channels share the opened files
+        opened = [call.args[0] for call in pyhf.readxml.uproot.open.call_args_list]
+        assert len(opened) == len(set(opened))
+
+    # a cache passed to the workers of a process pool is pickled
+    filecache = pyhf.readxml.FileCache()
+    with executor_type(max_workers=2) as executor:
+        assert (
+            pyhf.readxml.parse(
+                configfile, rootdir, executor=executor, filecache=filecache
+            )
+            == parsed_xml
+        )
+    filecache.clear()
+
+
 def test_import_shapesys():
     parsed_xml = pyhf.readxml.parse(
         'validation/xmlimport_input3/config/examples/example_ShapeSys.xml',
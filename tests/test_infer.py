@@ -1,3 +1,5 @@
+import concurrent.futures
+import threading
 import pytest
 import pyhf
 import numpy as np
@@ -50,6 +52,296 @@ def test_upperlimit_with_kwargs(tmpdir, hypotest_args):
     )
 
 
+@pytest.mark.parametrize(
+    "executor_class",
+    [concurrent.futures.ThreadPoolExecutor, concurrent.futures.ProcessPoolExecutor],
+    ids=["thread", "process"],
+)
+def test_upperlimit_executor(hypotest_args, executor_class):
+    """
+    Check that running the scan points on an executor gives the sequential limits
+    """
+    _, data, model = hypotest_args
+    scan = np.linspace(0, 5, 11)
+    observed_limit, expected_limits = pyhf.infer.intervals.upperlimit(data, model, scan)
+    with executor_class(max_workers=2) as executor:
+        results = pyhf.infer.intervals.upperlimit(
+            data, model, scan, return_results=True, executor=executor
+        )
+    assert len(results) == 3
+    assert results[0] == pytest.approx(observed_limit)
+    assert results[1] == pytest.approx(expected_limits)
+    assert len(results[2][1]) == len(scan)
+
+
+def test_upperlimit_warm_start(mocker, hypotest_args):
+    """
+    Check that warm-starting the fits along the scan gives compatible limits
+    without running more fits than a cold scan
+    """
+    _, data, model = hypotest_args
+    _, optimizer = pyhf.get_backend()
+    minimize = mocker.spy(type(optimizer), "minimize")
+    pyhf.infer.intervals.upperlimit(data, model, scan=np.linspace(0, 5, 11))
+    n_cold_fits = minimize.call_count
+    minimize.reset_mock()
+
+    results = pyhf.infer.intervals.upperlimit(
+        data, model, scan=np.linspace(0, 5, 11), warm_start=True
+    )
+    assert minimize.call_count == n_cold_fits
+    assert len(results) == 2
+    observed_limit, expected_limits = results
+    assert observed_limit == pytest.approx(1.0262704738584554, rel=1e-4)
+    assert expected_limits == pytest.approx(
+        [0.65765653, 0.87999725, 1.12453992, 1.50243428, 2.09232927], rel=1e-4
+    )
+
+    with pytest.raises(ValueError):
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            pyhf.infer.intervals.upperlimit(
+                data,
+                model,
+                scan=np.linspace(0, 5, 11),
+                warm_start=True,
+                executor=executor,
+            )
+
+
+def test_upperlimit_reuses_calculator(mocker, hypotest_args):
+    """
+    Check that the scan points share a single asymptotic calculator
+    """
+    _, data, model = hypotest_args
+    create_calculator = mocker.spy(pyhf.infer.utils, "create_calculator")
+    pyhf.infer.intervals.upperlimit(data, model, scan=np.linspace(0, 5, 11))
+    assert create_calculator.call_count == 1
+
+
+def test_upperlimit_toms748_scan(hypotest_args):
+    """
+    Check that the root finding agrees with a dense grid scan
+    """
+    _, data, model = hypotest_args
+    grid_observed, grid_expected = pyhf.infer.intervals.upperlimit(
+        data, model, scan=np.linspace(0, 5, 201)
+    )
+    results = pyhf.infer.intervals.upperlimit(data, model, return_results=True)
+    assert len(results) == 3
+    observed_limit, expected_limits, (scan, scan_results) = results
+    assert observed_limit == pytest.approx(grid_observed, rel=1e-3)
+    assert np.asarray(expected_limits) == pytest.approx(
+        np.asarray(grid_expected), rel=1e-3
+    )
+    assert len(scan) == len(scan_results) < 50
+
+    # bounds that do not bracket the limits are extended
+    observed_limit, expected_limits = pyhf.infer.intervals.toms748_scan(
+        data, model, 1.0, 1.5
+    )
+    assert observed_limit == pytest.approx(grid_observed, rel=1e-3)
+    assert np.asarray(expected_limits) == pytest.approx(
+        np.asarray(grid_expected), rel=1e-3
+    )
+
+    # but not beyond the upper bound of the POI
+    par_bounds = model.config.suggested_bounds()
+    par_bounds[model.config.poi_index] = (0.0, 1.2)
+    with pytest.raises(ValueError, match="upper bound of the POI"):
+        pyhf.infer.intervals.toms748_scan(data, model, 0.5, 1.0, par_bounds=par_bounds)
+
+    # the initial bracket follows the given parameter bounds
+    par_bounds[model.config.poi_index] = (0.0, 3.0)
+    observed_limit, _, (scan, _) = pyhf.infer.intervals.upperlimit(
+        data, model, return_results=True, par_bounds=par_bounds
+    )
+    assert observed_limit == pytest.approx(grid_observed, rel=1e-3)
+    assert np.max(scan) == 3.0
+
+    with pytest.raises(ValueError):
+        pyhf.infer.intervals.upperlimit(data, model, warm_start=True)
+
+
+def test_mle_fit_cache(mocker, hypotest_args):
+    """
+    Check that fits are reused within pyhf.infer.mle.fit_cache
+    """
+    _, data, model = hypotest_args
+    _, optimizer = pyhf.get_backend()
+    minimize = mocker.spy(type(optimizer), "_minimize")
+
+    with pyhf.infer.mle.fit_cache() as cache:
+        fitted_pars = pyhf.infer.mle.fit(data, model)
+        assert minimize.call_count == 1
+        cached_pars = pyhf.infer.mle.fit(data, model)
+        assert minimize.call_count == 1
+        assert cached_pars is not fitted_pars
+        assert pyhf.tensorlib.tolist(cached_pars) == pyhf.tensorlib.tolist(fitted_pars)
+
+        pyhf.infer.mle.fit(data, model, return_fitted_val=True)
+        pyhf.infer.mle.fixed_poi_fit(1.0, data, model)
+        assert minimize.call_count == 3
+
+        with pyhf.infer.mle.fit_cache() as nested_cache:
+            assert nested_cache is cache
+            pyhf.infer.mle.fixed_poi_fit(1.0, data, model)
+            assert minimize.call_count == 3
+        assert len(cache) == 3
+
+        minimize.reset_mock()
+        pyhf.infer.hypotest(0.5, data, model)
+        pyhf.infer.hypotest(1.5, data, model)
+        # the free fit to data is already cached and the free fit to the Asimov
+        # data and the Asimov dataset are shared between the POI values
+        assert minimize.call_count == 4 + 2
+
+    minimize.reset_mock()
+    pyhf.infer.mle.fit(data, model)
+    assert minimize.call_count == 1
+
+
+def test_mle_fit_cache_copies():
+    """
+    Check that modifying a fit result does not modify the cached fit result
+    """
+    pyhf.set_backend("numpy")
+    model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+    )
+    data = pyhf.tensorlib.astensor([51, 48] + model.config.auxdata)
+
+    with pyhf.infer.mle.fit_cache():
+        fitted_pars = pyhf.infer.mle.fit(data, model)
+        expected = fitted_pars.tolist()
+        fitted_pars[0] = -1.0
+        pyhf.infer.mle.fit(data, model)[1] = -1.0
+        assert pyhf.infer.mle.fit(data, model).tolist() == expected
+
+
+def test_mle_fit_cache_threads(mocker):
+    """
+    Check that the fit cache is only active in the thread that entered it
+    """
+    pyhf.set_backend("numpy")
+    model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+    )
+    data = pyhf.tensorlib.astensor([51, 48] + model.config.auxdata)
+    entered, exited = threading.Event(), threading.Event()
+
+    def other_thread():
+        with pyhf.infer.mle.fit_cache() as cache:
+            pyhf.infer.mle.fit(data, model)
+            entered.set()
+            exited.wait()
+        return cache
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        with pyhf.infer.mle.fit_cache() as cache:
+            future = executor.submit(other_thread)
+            entered.wait()
+            pyhf.infer.mle.fit(data, model)
+            assert len(cache) == 1
+            # the other thread leaving its cache keeps this one active
+            exited.set()
+            other_cache = future.result()
+            assert other_cache is not cache
+            assert len(other_cache) == 1
+
+            minimize = mocker.spy(type(pyhf.optimizer), "_minimize")
+            pyhf.infer.mle.fit(data, model)
+            assert minimize.call_count == 0
+
+            # fits in other threads do not use the cache
+            executor.submit(pyhf.infer.mle.fit, data, model).result()
+            assert minimize.call_count == 1
+
+
+def test_mle_profile_scan(hypotest_args):
+    """
+    Check that a 1D profile scan matches the fits with a fixed POI
+    """
+    _, data, model = hypotest_args
+    scan = [0.0, 0.5, 1.0, 1.5]
+    twice_nll, fitted_pars = pyhf.infer.mle.profile_scan(
+        "mu", scan, data, model, return_fitted_pars=True
+    )
+    assert pyhf.tensorlib.shape(twice_nll) == (4,)
+    assert pyhf.tensorlib.shape(fitted_pars) == (4, 3)
+    for mu, value, pars in zip(scan, twice_nll, fitted_pars):
+        expected_pars, expected_value = pyhf.infer.mle.fixed_poi_fit(
+            mu, data, model, return_fitted_val=True
+        )
+        assert value == pytest.approx(expected_value, rel=1e-6)
+        assert pars == pytest.approx(expected_pars, rel=1e-3, abs=1e-4)
+
+    # the index of a parameter can be used instead of its name
+    assert pyhf.infer.mle.profile_scan(
+        model.config.poi_index, scan, data, model, warm_start=False
+    ) == pytest.approx(twice_nll, rel=1e-6)
+
+
+def test_mle_profile_scan_2d(hypotest_args):
+    """
+    Check that a 2D profile scan fixes both parameters at the grid points
+    """
+    _, data, model = hypotest_args
+    pars = ["mu", "uncorr_bkguncrt[1]"]
+    values = [[0.5, 1.0, 1.5], [0.8, 1.0]]
+    twice_nll, fitted_pars = pyhf.infer.mle.profile_scan(
+        pars, values, data, model, return_fitted_pars=True
+    )
+    assert pyhf.tensorlib.shape(twice_nll) == (3, 2)
+    for i, mu in enumerate(values[0]):
+        for j, gamma in enumerate(values[1]):
+            expected_pars, expected_value = pyhf.infer.mle.fit(
+                data,
+                model,
+                init_pars=[mu, 1.0, gamma],
+                fixed_params=[True, False, True],
+                return_fitted_val=True,
+            )
+            assert fitted_pars[i, j, 0] == mu
+            assert fitted_pars[i, j, 2] == gamma
+            assert twice_nll[i, j] == pytest.approx(expected_value, rel=1e-6)
+
+
+@pytest.mark.parametrize(
+    "executor_class",
+    [concurrent.futures.ThreadPoolExecutor, concurrent.futures.ProcessPoolExecutor],
+    ids=["thread", "process"],
+)
+@pytest.mark.parametrize("ndim", [1, 2], ids=["1d", "2d"])
+def test_mle_profile_scan_executor(hypotest_args, executor_class, ndim):
+    """
+    Check that running a profile scan on an executor gives the sequential scan
+    """
+    _, data, model = hypotest_args
+    pars = ["mu", "uncorr_bkguncrt[0]"][:ndim]
+    values = [[0.5, 1.0, 1.5], [0.9, 1.0, 1.1]][:ndim]
+    expected = pyhf.infer.mle.profile_scan(pars, values, data, model)
+    with executor_class(max_workers=2) as executor:
+        twice_nll = pyhf.infer.mle.profile_scan(
+            pars, values, data, model, executor=executor
+        )
+    assert twice_nll == pytest.approx(expected, rel=1e-6)
+
+
+def test_mle_profile_scan_invalid(hypotest_args):
+    _, data, model = hypotest_args
+    with pytest.raises(ValueError):
+        pyhf.infer.mle.profile_scan("uncorr_bkguncrt", [0.9, 1.0], data, model)
+    with pytest.raises(ValueError):
+        pyhf.infer.mle.profile_scan(
+            ["mu", "uncorr_bkguncrt[0]", "uncorr_bkguncrt[1]"],
+            [[1.0], [1.0], [1.0]],
+            data,
+            model,
+        )
+    with pytest.raises(ValueError):
+        pyhf.infer.mle.profile_scan(["mu"], [[1.0], [1.0]], data, model)
+
+
 def test_mle_fit_default(tmpdir, hypotest_args):
     """
     Check that the default return structure of pyhf.infer.mle.fit is as expected
@@ -80,6 +372,38 @@ def test_mle_fit_return_fitted_val(tmpdir, hypotest_args):
     assert pyhf.tensorlib.shape(result[1]) == ()
 
 
+def test_mle_fit_batched(hypotest_args):
+    """
+    Check that each element of a batched model is fit to its own dataset
+    """
+    _, data, model = hypotest_args
+    batched_model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0], batch_size=3
+    )
+    batched_data = [
+        data,
+        [60, 65] + model.config.auxdata,
+        [40, 45] + model.config.auxdata,
+    ]
+
+    bestfit_pars, twice_nll = pyhf.infer.mle.fit(
+        batched_data, batched_model, return_fitted_val=True
+    )
+    assert pyhf.tensorlib.shape(bestfit_pars) == (3, model.config.npars)
+    assert pyhf.tensorlib.shape(twice_nll) == (3,)
+
+    for idx, element_data in enumerate(batched_data):
+        expected_pars, expected_twice_nll = pyhf.infer.mle.fit(
+            element_data, model, return_fitted_val=True
+        )
+        assert pyhf.tensorlib.tolist(bestfit_pars[idx]) == pytest.approx(
+            pyhf.tensorlib.tolist(expected_pars), rel=1e-3, abs=1e-3
+        )
+        assert pyhf.tensorlib.tolist(twice_nll[idx]) == pytest.approx(
+            pyhf.tensorlib.tolist(expected_twice_nll), rel=1e-6
+        )
+
+
 def test_hypotest_default(tmpdir, hypotest_args):
     """
     Check that the default return structure of pyhf.infer.hypotest is as expected
@@ -242,6 +566,50 @@ def test_hypotest_backends(backend, kwargs):
     assert pyhf.infer.hypotest(1.0, data, pdf, **kwargs) is not None
 
 
+@pytest.mark.parametrize("test_stat", ["qtilde", "q", "q0"])
+def test_hypotest_poi_vector(backend, test_stat):
+    """
+    Check that testing a vector of POI values reproduces the results of
+    testing each value on its own.
+    """
+    tb = pyhf.tensorlib
+    pdf = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+    )
+    data = [51, 48] + pdf.config.auxdata
+    poi_tests = [0.5, 1.0, 2.0]
+
+    CLs_obs, tail_probs, CLs_exp_band = pyhf.infer.hypotest(
+        tb.astensor(poi_tests),
+        data,
+        pdf,
+        test_stat=test_stat,
+        return_tail_probs=True,
+        return_expected_set=True,
+    )
+    assert tb.shape(CLs_obs) == (len(poi_tests),)
+    assert len(CLs_exp_band) == 5
+
+    for idx, poi_test in enumerate(poi_tests):
+        expected_obs, expected_tail_probs, expected_band = pyhf.infer.hypotest(
+            poi_test,
+            data,
+            pdf,
+            test_stat=test_stat,
+            return_tail_probs=True,
+            return_expected_set=True,
+        )
+        assert tb.tolist(CLs_obs)[idx] == pytest.approx(
+            tb.tolist(expected_obs), rel=1e-5
+        )
+        assert [tb.tolist(tail_prob)[idx] for tail_prob in tail_probs] == pytest.approx(
+            tb.tolist(tb.astensor(expected_tail_probs)), rel=1e-5
+        )
+        assert [tb.tolist(band)[idx] for band in CLs_exp_band] == pytest.approx(
+            tb.tolist(tb.astensor(expected_band)), rel=1e-5
+        )
+
+
 def test_inferapi_pyhf_independence():
     """
     pyhf.infer should eventually be factored out so it should be
@@ -466,6 +834,88 @@ def test_toy_calculator(tmpdir, hypotest_args):
     )
 
 
+@pytest.mark.parametrize("batch_size", [4, 10, 20])
+def test_toy_calculator_batched(hypotest_args, batch_size):
+    """
+    Check that evaluating the toys in batches reproduces the unbatched results
+    """
+    mu_test, data, model = hypotest_args
+    distributions = []
+    for toy_batch_size in [None, batch_size]:
+        np.random.seed(0)
+        toy_calculator = pyhf.infer.calculators.ToyCalculator(
+            data, model, ntoys=10, track_progress=False, batch_size=toy_batch_size
+        )
+        distributions.append(toy_calculator.distributions(mu_test))
+
+    (sig, bkg), (batched_sig, batched_bkg) = distributions
+    assert batched_sig.samples.tolist() == pytest.approx(
+        sig.samples.tolist(), rel=1e-4, abs=1e-4
+    )
+    assert batched_bkg.samples.tolist() == pytest.approx(
+        bkg.samples.tolist(), rel=1e-4, abs=1e-4
+    )
+
+
+@pytest.mark.parametrize(
+    "executor_type",
+    [concurrent.futures.ThreadPoolExecutor, concurrent.futures.ProcessPoolExecutor],
+)
+@pytest.mark.parametrize("batch_size", [None, 3])
+def test_toy_calculator_executor(hypotest_args, executor_type, batch_size):
+    """
+    Check that evaluating the toys with an executor reproduces the serial results
+    """
+    mu_test, data, model = hypotest_args
+    distributions = []
+    with executor_type(max_workers=2) as executor:
+        for toy_executor in [None, executor]:
+            np.random.seed(0)
+            toy_calculator = pyhf.infer.calculators.ToyCalculator(
+                data,
+                model,
+                ntoys=10,
+                track_progress=False,
+                batch_size=batch_size,
+                executor=toy_executor,
+            )
+            distributions.append(toy_calculator.distributions(mu_test))
+
+    (sig, bkg), (distributed_sig, distributed_bkg) = distributions
+    assert distributed_sig.samples.tolist() == pytest.approx(sig.samples.tolist())
+    assert distributed_bkg.samples.tolist() == pytest.approx(bkg.samples.tolist())
+
+
+def test_toy_worker_reuses_batched_model(mocker, hypotest_args):
+    """
+    Check that a worker of a toy executor builds the batched model only once
+    for all of its chunks of toys
+    """
+    mu_test, data, model = hypotest_args
+    batched_model = mocker.spy(pyhf.infer.calculators, "_batched_model")
+    pyhf.infer.calculators._init_toy_worker(model)
+    tensorlib, optimizer = pyhf.get_backend()
+    calculator_kwargs = dict(
+        data=data,
+        pdf=None,
+        init_pars=model.config.suggested_init(),
+        par_bounds=model.config.suggested_bounds(),
+        fixed_params=model.config.suggested_fixed(),
+        test_stat="qtilde",
+        batch_size=2,
+    )
+    samples = tensorlib.tolist(tensorlib.tile(tensorlib.astensor([data]), (2, 1)))
+    results = [
+        pyhf.infer.calculators._toy_teststatistics_task(
+            (tensorlib, optimizer), calculator_kwargs, mu_test, samples
+        )
+        for _ in range(3)
+    ]
+    assert batched_model.call_count == 1
+    assert results[0] == results[1] == results[2]
+    pyhf.infer.calculators._init_toy_worker(None)
+
+
 def test_fixed_poi(tmpdir, hypotest_args):
     """
     Check that the return structure of pyhf.infer.hypotest with the
@@ -148,6 +148,60 @@ def test_validate_implementation(backend, interpcode, random_histosets_alphasets
     )
 
 
+@pytest.mark.parametrize('interpcode', [0, 1, 2, 4, '4p'])
+def test_interpolator_derivative(backend, interpcode):
+    histogramssets = [
+        [[[0.8, 0.6, 0.9], [1.0, 1.0, 1.0], [1.3, 1.1, 1.2]]],
+        [[[4.0, 2.5, 9.0], [5.0, 3.0, 10.0], [5.5, 3.2, 12.0]]],
+    ]
+    # stay clear of the boundaries of the pieces, where the derivative jumps
+    alphasets = np.asarray([[-2.3, -0.6, 0.2, 0.7, 1.9], [-1.4, -0.3, 0.4, 0.9, 2.6]])
+    step = 1e-3
+
+    def interpolate(alphas):
+        result = interpolator(pyhf.tensorlib.astensor(alphas.tolist()))
+        return np.asarray(pyhf.tensorlib.tolist(result))
+
+    interpolator = pyhf.interpolators.get(interpcode)(histogramssets, subscribe=False)
+    derivative = interpolator.derivative(pyhf.tensorlib.astensor(alphasets.tolist()))
+    numerical = (interpolate(alphasets + step) - interpolate(alphasets - step)) / (
+        2 * step
+    )
+
+    assert pyhf.tensorlib.shape(derivative) == numerical.shape
+    assert np.asarray(pyhf.tensorlib.tolist(derivative)) == pytest.approx(
+        numerical, rel=1e-3, abs=1e-3
+    )
+
+
+@pytest.mark.parametrize('interpcode', [0, 1, 2, 4, '4p'])
+def test_interpolator_second_derivative(backend, interpcode):
+    histogramssets = [
+        [[[0.8, 0.6, 0.9], [1.0, 1.0, 1.0], [1.3, 1.1, 1.2]]],
+        [[[4.0, 2.5, 9.0], [5.0, 3.0, 10.0], [5.5, 3.2, 12.0]]],
+    ]
+    # stay clear of the boundaries of the pieces, where the curvature jumps
+    alphasets = np.asarray([[-2.3, -0.6, 0.2, 0.7, 1.9], [-1.4, -0.3, 0.4, 0.9, 2.6]])
+    step = 1e-3
+
+    def derivative(alphas):
+        result = interpolator.derivative(pyhf.tensorlib.astensor(alphas.tolist()))
+        return np.asarray(pyhf.tensorlib.tolist(result))
+
+    interpolator = pyhf.interpolators.get(interpcode)(histogramssets, subscribe=False)
+    second_derivative = interpolator.second_derivative(
+        pyhf.tensorlib.astensor(alphasets.tolist())
+    )
+    numerical = (derivative(alphasets + step) - derivative(alphasets - step)) / (
+        2 * step
+    )
+
+    assert pyhf.tensorlib.shape(second_derivative) == numerical.shape
+    assert np.asarray(pyhf.tensorlib.tolist(second_derivative)) == pytest.approx(
+        numerical, rel=1e-3, abs=1e-3
+    )
+
+
 @pytest.mark.parametrize("do_tensorized_calc", [False, True], ids=['slow', 'fast'])
 def test_code0_validation(backend, do_tensorized_calc):
     histogramssets = [[[[0.5], [1.0], [2.0]]]]
@@ -193,3 +193,116 @@ def test_invalid_bin_wise_modifier(datadir, patch_file):
 
     with pytest.raises(pyhf.exceptions.InvalidModifier):
         pyhf.Model(bad_spec)
+
+
+def test_builder_append_override():
+    spec = {
+        'channels': [
+            {
+                'name': 'first',
+                'samples': [
+                    {
+                        'name': 'signal',
+                        'data': [10.0, 12.0],
+                        'modifiers': [
+                            {'name': 'mu', 'type': 'normfactor', 'data': None},
+                            {'name': 'lumi', 'type': 'lumi', 'data': None},
+                            {
+                                'name': 'norm',
+                                'type': 'normsys',
+                                'data': {'hi': 1.1, 'lo': 0.9},
+                            },
+                        ],
+                    },
+                    {
+                        'name': 'background',
+                        'data': [50.0, 60.0],
+                        'modifiers': [
+                            {
+                                'name': 'shape',
+                                'type': 'histosys',
+                                'data': {
+                                    'hi_data': [55.0, 62.0],
+                                    'lo_data': [45.0, 58.0],
+                                },
+                            },
+                            {
+                                'name': 'stat',
+                                'type': 'staterror',
+                                'data': [3.0, 4.0],
+                            },
+                        ],
+                    },
+                ],
+            },
+            {
+                'name': 'second',
+                'samples': [
+                    {
+                        'name': 'background',
+                        'data': [20.0],
+                        'modifiers': [
+                            {
+                                'name': 'uncorr',
+                                'type': 'shapesys',
+                                'data': [2.0],
+                            },
+                            {
+                                'name': 'free',
+                                'type': 'shapefactor',
+                                'data': None,
+                            },
+                            {
+                                'name': 'stat',
+                                'type': 'staterror',
+                                'data': [1.0],
+                            },
+                        ],
+                    },
+                ],
+            },
+        ],
+        'parameters': [
+            {
+                'name': 'lumi',
+                'auxdata': [1.0],
+                'sigmas': [0.02],
+                'bounds': [[0.9, 1.1]],
+                'inits': [1.0],
+            }
+        ],
+    }
+
+    appended = []
+
+    def counting(builder):
+        class counting_builder(builder):
+            def append(self, key, channel, sample, thismod, defined_samp):
+                appended.append(key)
+                super().append(key, channel, sample, thismod, defined_samp)
+
+        return counting_builder
+
+    modifier_set = {
+        name: (counting(builder), combined)
+        for name, (builder, combined) in pyhf.modifiers.histfactory_set.items()
+    }
+    model = pyhf.Model(spec, modifier_set=modifier_set, poi_name='mu')
+    expected = pyhf.Model(spec, poi_name='mu')
+    assert not pyhf.pdf._collects_all(modifier_set['histosys'][0](model.config))
+    assert pyhf.pdf._collects_all(pyhf.modifiers.histosys_builder(model.config))
+
+    # every modifier is appended for every channel and sample
+    n_slots = len(model.config.channels) * len(model.config.samples)
+    assert len(appended) == len(model.config.modifiers) * n_slots
+
+    assert model.config.par_order == expected.config.par_order
+    assert model.config.suggested_init() == expected.config.suggested_init()
+    assert model.config.auxdata == expected.config.auxdata
+    pars = [
+        value + 0.1 * index
+        for index, value in enumerate(expected.config.suggested_init())
+    ]
+    assert numpy.asarray(model.expected_data(pars)) == pytest.approx(
+        numpy.asarray(expected.expected_data(pars))
+    )
@@ -1,11 +1,13 @@
 import pyhf
 from pyhf.optimize.mixins import OptimizerMixin
-from pyhf.optimize.common import _get_tensor_shim, _make_stitch_pars
+from pyhf.optimize.common import _get_tensor_shim, _make_stitch_pars, shim
+from pyhf.optimize.opt_newton import _trust_region_newton
 from pyhf.tensor.common import _TensorViewer
 import pytest
 from scipy.optimize import minimize, OptimizeResult
 import iminuit
 import itertools
+import logging
 import numpy as np
 
 
@@ -49,48 +51,40 @@ def test_minimize(tensorlib, optimizer, do_grad, do_stitch):
     pyhf.set_backend(tensorlib(precision="64b"), optimizer())
     m = pyhf.simplemodels.uncorrelated_background([50.0], [100.0], [10.0])
     data = pyhf.tensorlib.astensor([125.0] + m.config.auxdata)
-    # numpy does not support grad
-    if pyhf.tensorlib.name == 'numpy' and do_grad:
-        with pytest.raises(pyhf.exceptions.Unsupported):
-            pyhf.infer.mle.fit(data, m, do_grad=do_grad)
-    else:
-        identifier = f'{"do_grad" if do_grad else "no_grad"}-{pyhf.optimizer.name}-{pyhf.tensorlib.name}'
-        expected = {
-            # numpy does not do grad
-            'do_grad-scipy-numpy': None,
-            'do_grad-minuit-numpy': None,
-            # no grad, scipy, 64b
-            'no_grad-scipy-numpy': [0.49998815367220306, 0.9999696999038924],
-            'no_grad-scipy-pytorch': [0.49998815367220306, 0.9999696999038924],
-            'no_grad-scipy-tensorflow': [0.49998865164653106, 0.9999696533705097],
-            'no_grad-scipy-jax': [0.4999880886490433, 0.9999696971774877],
-            # do grad, scipy, 64b
-            'do_grad-scipy-pytorch': [0.49998837853531425, 0.9999696648069287],
-            'do_grad-scipy-tensorflow': [0.4999883785353142, 0.9999696648069278],
-            'do_grad-scipy-jax': [0.49998837853531414, 0.9999696648069285],
-            # no grad, minuit, 64b - quite consistent
-            'no_grad-minuit-numpy': [0.5000493563629738, 1.0000043833598724],
-            'no_grad-minuit-pytorch': [0.5000493563758468, 1.0000043833508256],
-            'no_grad-minuit-tensorflow': [0.5000493563645547, 1.0000043833598657],
-            'no_grad-minuit-jax': [0.5000493563528641, 1.0000043833614634],
-            # do grad, minuit, 64b
-            'do_grad-minuit-pytorch': [0.500049321728735, 1.00000441739846],
-            'do_grad-minuit-tensorflow': [0.5000492930412292, 1.0000044107437134],
-            'do_grad-minuit-jax': [0.500049321731032, 1.0000044174002167],
-        }[identifier]
-
-        result = pyhf.infer.mle.fit(data, m, do_grad=do_grad, do_stitch=do_stitch)
-
-        rel_tol = 1e-5 if "no_grad" in identifier else 1e-6
-        # Fluctuations beyond precision shouldn't matter
-        abs_tol = 1e-8
-
-        # check fitted parameters
-        assert pytest.approx(
-            expected, rel=rel_tol, abs=abs_tol
-        ) == pyhf.tensorlib.tolist(
-            result
-        ), f"{identifier} = {pyhf.tensorlib.tolist(result)}"
+    identifier = f'{"do_grad" if do_grad else "no_grad"}-{pyhf.optimizer.name}-{pyhf.tensorlib.name}'
+    expected = {
+        # no grad, scipy, 64b
+        'no_grad-scipy-numpy': [0.49998815367220306, 0.9999696999038924],
+        'no_grad-scipy-pytorch': [0.49998815367220306, 0.9999696999038924],
+        'no_grad-scipy-tensorflow': [0.49998865164653106, 0.9999696533705097],
+        'no_grad-scipy-jax': [0.4999880886490433, 0.9999696971774877],
+        # do grad, scipy, 64b
+        'do_grad-scipy-numpy': [0.49998837853531425, 0.9999696648069287],
+        'do_grad-scipy-pytorch': [0.49998837853531425, 0.9999696648069287],
+        'do_grad-scipy-tensorflow': [0.4999883785353142, 0.9999696648069278],
+        'do_grad-scipy-jax': [0.49998837853531414, 0.9999696648069285],
+        # no grad, minuit, 64b - quite consistent
+        'no_grad-minuit-numpy': [0.5000493563629738, 1.0000043833598724],
+        'no_grad-minuit-pytorch': [0.5000493563758468, 1.0000043833508256],
+        'no_grad-minuit-tensorflow': [0.5000493563645547, 1.0000043833598657],
+        'no_grad-minuit-jax': [0.5000493563528641, 1.0000043833614634],
+        # do grad, minuit, 64b
+        'do_grad-minuit-numpy': [0.5000493217170922, 1.0000044173977196],
+        'do_grad-minuit-pytorch': [0.500049321728735, 1.00000441739846],
+        'do_grad-minuit-tensorflow': [0.5000492930412292, 1.0000044107437134],
+        'do_grad-minuit-jax': [0.500049321731032, 1.0000044174002167],
+    }[identifier]
+
+    result = pyhf.infer.mle.fit(data, m, do_grad=do_grad, do_stitch=do_stitch)
+
+    rel_tol = 1e-5 if "no_grad" in identifier else 1e-6
+    # Fluctuations beyond precision shouldn't matter
+    abs_tol = 1e-8
+
+    # check fitted parameters
+    assert pytest.approx(expected, rel=rel_tol, abs=abs_tol) == pyhf.tensorlib.tolist(
+        result
+    ), f"{identifier} = {pyhf.tensorlib.tolist(result)}"
 
 
 @pytest.mark.parametrize(
@@ -221,6 +215,595 @@ def test_optimizer_unsupported_minimizer_options(optimizer):
     assert 'unsupported_minimizer_options' in str(excinfo.value)
 
 
+def _multi_modifier_model(interpcodes, batch_size=None):
+    """A model with all modifier types and its data and (off-nominal) parameters."""
+    spec = {
+        'channels': [
+            {
+                'name': 'signal_region',
+                'samples': [
+                    {
+                        'name': 'signal',
+                        'data': [5.0, 6.0, 3.0],
+                        'modifiers': [
+                            {'name': 'mu', 'type': 'normfactor', 'data': None},
+                            {'name': 'lumi', 'type': 'lumi', 'data': None},
+                            {
+                                'name': 'norm',
+                                'type': 'normsys',
+                                'data': {'hi': 1.1, 'lo': 0.85},
+                            },
+                        ],
+                    },
+                    {
+                        'name': 'background',
+                        'data': [50.0, 40.0, 30.0],
+                        'modifiers': [
+                            {
+                                'name': 'shape',
+                                'type': 'histosys',
+                                'data': {
+                                    'hi_data': [55.0, 42.0, 29.0],
+                                    'lo_data': [46.0, 37.0, 33.0],
+                                },
+                            },
+                            {
+                                'name': 'uncorr',
+                                'type': 'shapesys',
+                                'data': [5.0, 4.0, 6.0],
+                            },
+                            {
+                                'name': 'stat',
+                                'type': 'staterror',
+                                'data': [2.0, 2.0, 3.0],
+                            },
+                            {
+                                'name': 'norm',
+                                'type': 'normsys',
+                                'data': {'hi': 1.05, 'lo': 0.9},
+                            },
+                            {'name': 'free', 'type': 'shapefactor', 'data': None},
+                        ],
+                    },
+                ],
+            },
+            {
+                'name': 'control_region',
+                'samples': [
+                    {
+                        'name': 'background',
+                        'data': [100.0, 80.0],
+                        'modifiers': [
+                            {
+                                'name': 'shape',
+                                'type': 'histosys',
+                                'data': {
+                                    'hi_data': [103.0, 82.0],
+                                    'lo_data': [98.0, 79.0],
+                                },
+                            },
+                            {'name': 'mu_bkg', 'type': 'normfactor', 'data': None},
+                        ],
+                    }
+                ],
+            },
+        ],
+        'parameters': [
+            {
+                'name': 'lumi',
+                'auxdata': [1.0],
+                'sigmas': [0.02],
+                'bounds': [[0.5, 1.5]],
+                'inits': [1.0],
+            }
+        ],
+    }
+    histosys_code, normsys_code = interpcodes
+    model = pyhf.Model(
+        spec,
+        poi_name='mu',
+        batch_size=batch_size,
+        modifier_settings={
+            'histosys': {'interpcode': histosys_code},
+            'normsys': {'interpcode': normsys_code},
+        },
+    )
+    data = np.asarray([98.0, 85.0, 53.0, 47.0, 35.0] + model.config.auxdata)
+    pars = np.asarray(model.config.suggested_init())
+    # move away from the nominal parameters, including a POI of zero
+    pars = pars * np.linspace(0.8, 1.2, len(pars))
+    pars[model.config.par_slice('shape')] = -0.6
+    pars[model.config.par_slice('norm')] = 1.4
+    pars[model.config.poi_index] = 0.0
+    return model, data, pars
+
+
+@pytest.mark.parametrize('batch_size', [None, 3], ids=['unbatched', 'batched'])
+@pytest.mark.parametrize(
+    'interpcodes',
+    [('code0', 'code1'), ('code2', 'code1'), ('code4p', 'code4')],
+    ids=['code0-code1', 'code2-code1', 'code4p-code4'],
+)
+def test_numpy_twice_nll_gradient(batch_size, interpcodes):
+    pyhf.set_backend('numpy')
+    model, data, pars = _multi_modifier_model(interpcodes, batch_size=batch_size)
+    if batch_size:
+        data = np.tile(data, (batch_size, 1))
+        pars = np.concatenate([pars * scale for scale in [1.0, 0.9, 1.1]])
+        objective = pyhf.infer.mle._batched_twice_nll
+    else:
+        objective = pyhf.infer.mle.twice_nll
+
+    minimizer_kwargs, _ = shim(
+        objective,
+        data,
+        model,
+        pars.tolist(),
+        [(-10.0, 10.0)] * len(pars),
+        do_grad=True,
+    )
+    value, grad = minimizer_kwargs['func'](pars)
+    assert value == pytest.approx(np.sum(objective(pars, data, model)))
+
+    step = 1e-6
+    numerical = [
+        (
+            np.sum(objective(pars + step * direction, data, model))
+            - np.sum(objective(pars - step * direction, data, model))
+        )
+        / (2 * step)
+        for direction in np.eye(len(pars))
+    ]
+    assert grad == pytest.approx(numerical, rel=1e-5, abs=1e-5)
+
+
+@pytest.mark.parametrize(
+    'interpcodes',
+    [('code0', 'code1'), ('code2', 'code1'), ('code4p', 'code4')],
+    ids=['code0-code1', 'code2-code1', 'code4p-code4'],
+)
+@pytest.mark.parametrize('do_stitch', [False, True], ids=['no_stitch', 'stitch'])
+def test_numpy_twice_nll_hessian(interpcodes, do_stitch):
+    pyhf.set_backend('numpy')
+    model, data, pars = _multi_modifier_model(interpcodes)
+    fixed_vals = [(model.config.poi_index, 0.0)]
+    variable_idx = [idx for idx in range(len(pars)) if idx != model.config.poi_index]
+
+    minimizer_kwargs, _, hessian = shim(
+        pyhf.infer.mle.twice_nll,
+        data,
+        model,
+        pars.tolist(),
+        [(-10.0, 10.0)] * len(pars),
+        fixed_vals,
+        do_grad=True,
+        do_stitch=do_stitch,
+        do_hessian=True,
+    )
+    gradient = lambda pars: minimizer_kwargs['func'](pars)[1]  # noqa: E731
+    x = pars[variable_idx] if do_stitch else pars
+
+    step = 1e-6
+    numerical = [
+        (gradient(x + step * direction) - gradient(x - step * direction)) / (2 * step)
+        for direction in np.eye(len(x))
+    ]
+    assert hessian(x) == pytest.approx(np.asarray(numerical), rel=1e-5, abs=1e-5)
+
+
+@pytest.mark.parametrize(
+    'optimizer',
+    [pyhf.optimize.scipy_optimizer, pyhf.optimize.minuit_optimizer],
+    ids=['scipy', 'minuit'],
+)
+def test_exact_hessian_uncertainties(backend, optimizer, mocker):
+    pyhf.set_backend(pyhf.tensorlib, optimizer())
+    model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+    )
+    data = pyhf.tensorlib.astensor([62.0, 63.0] + model.config.auxdata)
+    hesse = mocker.spy(iminuit.Minuit, 'hesse')
+
+    result, correlations = pyhf.infer.mle.fit(
+        data,
+        model,
+        return_uncertainties=True,
+        return_correlations=True,
+        hessian='exact',
+    )
+    assert hesse.call_count == 0
+    assert pyhf.tensorlib.tolist(result[:, 1]) == pytest.approx(
+        [0.5671823881989548, 0.058663458397773885, 0.11379193488173728], rel=1e-3
+    )
+    assert np.asarray(pyhf.tensorlib.tolist(correlations)) == pytest.approx(
+        np.asarray(
+            [
+                [1.0, -0.2941375542368013, -0.461294900618443],
+                [-0.2941375542368013, 1.0, 0.13568415384981736],
+                [-0.461294900618443, 0.13568415384981736, 1.0],
+            ]
+        ),
+        rel=1e-3,
+        abs=1e-3,
+    )
+
+
+@pytest.mark.parametrize('do_stitch', [False, True], ids=['no_stitch', 'stitch'])
+def test_exact_hessian_fixed_parameters(do_stitch):
+    pyhf.set_backend('numpy', 'minuit')
+    model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+    )
+    data = pyhf.tensorlib.astensor([62.0, 63.0] + model.config.auxdata)
+
+    result, correlations = pyhf.infer.mle.fixed_poi_fit(
+        1.0,
+        data,
+        model,
+        return_uncertainties=True,
+        return_correlations=True,
+        hessian='exact',
+        do_stitch=do_stitch,
+    )
+    assert result[:, 1] == pytest.approx(
+        [0.0, 0.05606836878449906, 0.1009615389714481], rel=1e-3
+    )
+    assert correlations == pytest.approx(np.diag([0.0, 1.0, 1.0]), abs=1e-6)
+
+
+def test_exact_hessian_unsupported():
+    pyhf.set_backend('numpy')
+    model = pyhf.simplemodels.uncorrelated_background([5.0], [10.0], [3.5])
+    data = pyhf.tensorlib.astensor([10.0] + model.config.auxdata)
+    with pytest.raises(pyhf.exceptions.Unsupported):
+        pyhf.infer.mle.fit(data, model, hessian='numerical')
+
+    model = pyhf.simplemodels.uncorrelated_background(
+        [5.0], [10.0], [3.5], batch_size=2
+    )
+    data = pyhf.tensorlib.astensor([[10.0] + model.config.auxdata] * 2)
+    with pytest.raises(pyhf.exceptions.Unsupported):
+        pyhf.infer.mle.fit(data, model, return_uncertainties=True, hessian='exact')
+
+
+@pytest.mark.parametrize(
+    'observations, expected',
+    [
+        (
+            [70.0, 60.0],
+            [
+                [1.3235, 0.56988],
+                [1.00992, 0.0592238],
+                [0.946891, 0.110029],
+            ],
+        ),
+        (
+            [45.0, 48.0],
+            [
+                [0.0, 0.531508],
+                [0.984746, 0.0576245],
+                [0.962676, 0.108246],
+            ],
+        ),
+    ],
+    ids=['interior', 'at_bound'],
+)
+def test_newton_optimizer(backend, observations, expected):
+    pyhf.set_backend(pyhf.tensorlib, pyhf.optimize.newton_optimizer())
+    model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+    )
+    data = pyhf.tensorlib.astensor(observations + model.config.auxdata)
+
+    result, correlations, fitresult = pyhf.infer.mle.fit(
+        data,
+        model,
+        return_uncertainties=True,
+        return_correlations=True,
+        return_result_obj=True,
+    )
+    assert fitresult.success
+    assert fitresult.nit < 10
+    assert np.asarray(pyhf.tensorlib.tolist(result)) == pytest.approx(
+        np.asarray(expected), rel=1e-3, abs=1e-3
+    )
+    correlations = np.asarray(pyhf.tensorlib.tolist(correlations))
+    assert correlations == pytest.approx(correlations.T)
+    assert np.diag(correlations) == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize('do_stitch', [False, True], ids=['no_stitch', 'stitch'])
+def test_newton_optimizer_fixed_params(do_stitch):
+    pyhf.set_backend('numpy', 'newton')
+    model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+    )
+    data = pyhf.tensorlib.astensor([70.0, 60.0] + model.config.auxdata)
+
+    result, correlations = pyhf.infer.mle.fixed_poi_fit(
+        2.0,
+        data,
+        model,
+        return_uncertainties=True,
+        return_correlations=True,
+        do_stitch=do_stitch,
+    )
+    pyhf.set_backend('numpy', 'scipy')
+    expected = pyhf.infer.mle.fixed_poi_fit(2.0, data, model)
+    assert result[:, 0] == pytest.approx(expected, rel=1e-4)
+    assert result[0, 1] == 0.0
+    assert correlations[0] == pytest.approx([0.0, 0.0, 0.0])
+    assert correlations[:, 0] == pytest.approx([0.0, 0.0, 0.0])
+
+
+def test_newton_optimizer_unsupported():
+    pyhf.set_backend('numpy', 'newton')
+    model = pyhf.simplemodels.uncorrelated_background([5.0], [10.0], [3.5])
+    data = pyhf.tensorlib.astensor([10.0] + model.config.auxdata)
+    with pytest.raises(pyhf.exceptions.Unsupported):
+        pyhf.infer.mle.fit(data, model, do_grad=False)
+    with pytest.raises(pyhf.exceptions.Unsupported) as excinfo:
+        pyhf.infer.mle.fit(data, model, unsupported_minimizer_options=False)
+    assert 'unsupported_minimizer_options' in str(excinfo.value)
+    with pytest.raises(pyhf.exceptions.FailedMinimization):
+        pyhf.infer.mle.fit(
+            pyhf.tensorlib.astensor([20.0] + model.config.auxdata),
+            model,
+            maxiter=1,
+        )
+
+
+def test_newton_optimizer_verbose(caplog, capsys):
+    pyhf.set_backend('numpy', 'newton')
+    model = pyhf.simplemodels.uncorrelated_background([5.0], [10.0], [3.5])
+    data = pyhf.tensorlib.astensor([10.0] + model.config.auxdata)
+    with caplog.at_level(logging.INFO, 'pyhf.optimize.opt_newton'):
+        pyhf.infer.mle.fit(data, model)
+        assert not caplog.records
+        pyhf.infer.mle.fit(data, model, verbose=1)
+    assert caplog.records
+    assert all(record.message.startswith('iteration ') for record in caplog.records)
+    assert capsys.readouterr().out == ''
+
+
+@pytest.mark.parametrize('do_stitch', [False, True], ids=['no_stitch', 'stitch'])
+def test_batched_hessian_blocks(backend, do_stitch):
+    model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0], batch_size=2
+    )
+    single = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+    )
+    data = [[51.0, 48.0] + model.config.auxdata, [60.0, 55.0] + model.config.auxdata]
+    pars = [[0.5, 1.1, 0.9], [1.5, 0.8, 1.2]]
+    bounds = model.config.suggested_bounds()
+
+    _, _, hessian = shim(
+        pyhf.infer.mle._batched_twice_nll,
+        pyhf.tensorlib.astensor(data),
+        model,
+        pars[0] + pars[1],
+        bounds * 2,
+        [(0, 0.5), (3, 1.5)],
+        do_grad=True,
+        do_stitch=do_stitch,
+        do_hessian=True,
+    )
+    x = pars[0][1:] + pars[1][1:] if do_stitch else pars[0] + pars[1]
+    blocks = np.asarray(pyhf.tensorlib.tolist(hessian(pyhf.tensorlib.astensor(x))))
+    assert blocks.shape == ((2, 2, 2) if do_stitch else (2, 3, 3))
+
+    for batch_data, batch_pars, block in zip(data, pars, blocks):
+        _, _, expected = shim(
+            pyhf.infer.mle.twice_nll,
+            pyhf.tensorlib.astensor(batch_data),
+            single,
+            batch_pars,
+            bounds,
+            [(0, batch_pars[0])],
+            do_grad=True,
+            do_stitch=do_stitch,
+            do_hessian=True,
+        )
+        x = batch_pars[1:] if do_stitch else batch_pars
+        expected = expected(pyhf.tensorlib.astensor(x))
+        assert block == pytest.approx(
+            np.asarray(pyhf.tensorlib.tolist(expected)), rel=1e-4
+        )
+
+
+def test_newton_optimizer_batched(backend):
+    pyhf.set_backend(pyhf.tensorlib, 'newton')
+    model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0], batch_size=3
+    )
+    single = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+    )
+    # the last dataset has its best fit at the bound of the POI
+    data = [
+        [51.0, 48.0] + model.config.auxdata,
+        [70.0, 65.0] + model.config.auxdata,
+        [40.0, 42.0] + model.config.auxdata,
+    ]
+
+    result, twice_nll, fitresult = pyhf.infer.mle.fit(
+        pyhf.tensorlib.astensor(data),
+        model,
+        return_uncertainties=True,
+        return_fitted_val=True,
+        return_result_obj=True,
+    )
+    assert fitresult.success
+    assert fitresult.nit < 10
+    for batch_data, batch_result, batch_twice_nll in zip(data, result, twice_nll):
+        expected, expected_twice_nll = pyhf.infer.mle.fit(
+            pyhf.tensorlib.astensor(batch_data),
+            single,
+            return_uncertainties=True,
+            return_fitted_val=True,
+        )
+        assert np.asarray(pyhf.tensorlib.tolist(batch_result)) == pytest.approx(
+            np.asarray(pyhf.tensorlib.tolist(expected)), rel=1e-3, abs=1e-4
+        )
+        assert float(batch_twice_nll) == pytest.approx(
+            float(expected_twice_nll), rel=1e-6
+        )
+
+
+@pytest.mark.parametrize('backend_name', ['numpy', 'jax', 'pytorch', 'tensorflow'])
+def test_newton_optimizer_batched_interpolated_modifiers(backend_name):
+    spec = {
+        'channels': [
+            {
+                'name': 'channel',
+                'samples': [
+                    {
+                        'name': 'signal',
+                        'data': [5.0, 6.0],
+                        'modifiers': [
+                            {'name': 'mu', 'type': 'normfactor', 'data': None},
+                            {
+                                'name': 'norm',
+                                'type': 'normsys',
+                                'data': {'hi': 1.1, 'lo': 0.9},
+                            },
+                        ],
+                    },
+                    {
+                        'name': 'background',
+                        'data': [50.0, 52.0],
+                        'modifiers': [
+                            {
+                                'name': 'shape',
+                                'type': 'histosys',
+                                'data': {
+                                    'hi_data': [55.0, 54.0],
+                                    'lo_data': [45.0, 50.0],
+                                },
+                            }
+                        ],
+                    },
+                ],
+            }
+        ]
+    }
+    observations = [[51.0, 53.0], [60.0, 58.0], [45.0, 50.0]]
+
+    pyhf.set_backend('numpy', 'newton')
+    model = pyhf.Model(spec, poi_name='mu')
+    expected = [
+        pyhf.infer.mle.fit(np.asarray(obs + model.config.auxdata), model)
+        for obs in observations
+    ]
+
+    # the interpolators of a new model precompute their tensors for the batch
+    # shape within the first (traced) evaluation
+    pyhf.set_backend(backend_name, 'newton')
+    model = pyhf.Model(spec, poi_name='mu', batch_size=len(observations))
+    data = pyhf.tensorlib.astensor([obs + model.config.auxdata for obs in observations])
+    result = pyhf.infer.mle.fit(data, model)
+    assert np.asarray(pyhf.tensorlib.tolist(result)) == pytest.approx(
+        np.asarray(expected), rel=1e-3, abs=1e-4
+    )
+
+
+def test_newton_optimizer_batched_converged_elements():
+    pyhf.set_backend('numpy', 'newton')
+    model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0], batch_size=2
+    )
+    data = np.asarray(
+        [[51.0, 48.0] + model.config.auxdata, [70.0, 65.0] + model.config.auxdata]
+    )
+    bestfit = pyhf.infer.mle.fit(data, model)
+
+    # an element that starts at its minimum has converged and is not moved
+    init_pars = [bestfit[0].tolist(), model.config.suggested_init()]
+    result = pyhf.infer.mle.fit(data, model, init_pars=init_pars)
+    assert np.all(result[0] == bestfit[0])
+    assert result[1] == pytest.approx(bestfit[1])
+
+    with pytest.raises(pyhf.exceptions.Unsupported):
+        pyhf.optimizer.minimize(
+            pyhf.infer.mle._batched_twice_nll,
+            data,
+            model,
+            init_pars[0] + init_pars[1],
+            model.config.suggested_bounds() * 2,
+            fixed_vals=[(0, 1.0)],
+            do_stitch=True,
+        )
+
+
+def test_newton_optimizer_batched_stalled_element():
+    pyhf.set_backend('numpy', 'newton')
+
+    # the first element converges slowly towards zero, while the objective of
+    # the second one never decreases along its gradient
+    def values(x):
+        return np.asarray([x[0] ** 4, 0.0])
+
+    def func(x):
+        return float(np.sum(values(x))), np.asarray([4 * x[0] ** 3, 4.0])
+
+    def hess(x):
+        return np.asarray([[[12 * x[0] ** 2]], [[2.0]]])
+
+    result = _trust_region_newton(
+        func, hess, [3.0, 3.0], [(-10, 10)] * 2, tolerance=1e-20, values=values
+    )
+    assert not result.success
+    assert "No step decreasing the objective" in result.message
+    # the stalled element does not stop the other one
+    assert result.x[0] == pytest.approx(0.0, abs=1e-4)
+    assert result.x[1] == 3.0
+
+    result = _trust_region_newton(
+        func, hess, [3.0, 3.0], [(-10, 10)] * 2, maxiter=0, values=values
+    )
+    assert not result.success
+    assert result.nit == 0
+    assert np.all(result.x == [3.0, 3.0])
+
+
+def test_numpy_grad_unsupported_objective():
+    pyhf.set_backend('numpy')
+    model = pyhf.simplemodels.uncorrelated_background([5.0], [10.0], [3.5])
+    data = pyhf.tensorlib.astensor([10.0] + model.config.auxdata)
+
+    def objective(pars, data, pdf):
+        return pyhf.infer.mle.twice_nll(pars, data, pdf) ** 2
+
+    with pytest.raises(pyhf.exceptions.Unsupported):
+        pyhf.optimizer.minimize(
+            objective,
+            data,
+            model,
+            model.config.suggested_init(),
+            model.config.suggested_bounds(),
+            do_grad=True,
+        )
+
+
+def test_numpy_grad_batched_fit():
+    pyhf.set_backend('numpy')
+    model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0], batch_size=3
+    )
+    data = np.asarray(
+        [
+            [51.0, 48.0] + model.config.auxdata,
+            [60.0, 55.0] + model.config.auxdata,
+            [45.0, 50.0] + model.config.auxdata,
+        ]
+    )
+
+    fitted = pyhf.infer.mle.fit(data, model, do_grad=True)
+    expected = pyhf.infer.mle.fit(data, model, do_grad=False)
+    assert np.asarray(fitted) == pytest.approx(np.asarray(expected), rel=1e-3, abs=1e-3)
+
+
 @pytest.mark.parametrize('return_result_obj', [False, True], ids=['no_obj', 'obj'])
 @pytest.mark.parametrize('return_fitted_val', [False, True], ids=['no_fval', 'fval'])
 @pytest.mark.parametrize(
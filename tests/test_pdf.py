@@ -3,6 +3,7 @@
 import pyhf.exceptions
 import numpy as np
 import json
+import pickle
 
 
 def test_minimum_model_spec():
@@ -1070,3 +1071,400 @@ def make_model(
         pyhf.tensorlib.astensor(1.05),
         pyhf.tensorlib.astensor([5.0, 5.0]),
     )
+
+
+def test_model_cache(tmp_path, mocker):
+    spec = pyhf.simplemodels.correlated_background(
+        signal=[12.0, 11.0],
+        bkg=[50.0, 52.0],
+        bkg_up=[45.0, 57.0],
+        bkg_down=[55.0, 47.0],
+    ).spec
+    build = mocker.spy(pyhf.pdf, "_nominal_and_modifiers_from_spec")
+
+    cache = pyhf.pdf.ModelCache(maxsize=1, cache_dir=tmp_path)
+    model = cache.model(spec, poi_name="mu")
+    assert cache.model(spec, poi_name="mu") is model
+    assert build.call_count == 1
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+    other_model = cache.model(spec, poi_name="")
+    assert other_model is not model
+    assert other_model.config.poi_name is None
+    assert build.call_count == 2
+    assert len(cache) == 1
+
+    # evicted from memory but loaded from disk
+    loaded_model = cache.model(spec, poi_name="mu")
+    assert loaded_model is not model
+    assert build.call_count == 2
+
+    pars = model.config.suggested_init()
+    data = model.expected_data(pars)
+    assert pyhf.tensorlib.tolist(loaded_model.logpdf(pars, data)) == pytest.approx(
+        pyhf.tensorlib.tolist(model.logpdf(pars, data))
+    )
+
+    # the loaded model follows changes of the backend
+    pyhf.set_backend("jax")
+    pars = pyhf.tensorlib.astensor(pars)
+    data = pyhf.tensorlib.astensor(data)
+    assert isinstance(
+        loaded_model.main_model.nominal_rates, type(pyhf.tensorlib.astensor([1.0]))
+    )
+    assert pyhf.tensorlib.tolist(loaded_model.logpdf(pars, data)) == pytest.approx(
+        pyhf.tensorlib.tolist(model.logpdf(pars, data))
+    )
+
+
+def test_model_cache_failed_dump(tmp_path, mocker):
+    spec = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+    ).spec
+    mocker.patch.object(
+        pyhf.pdf.pickle, "dump", side_effect=pickle.PicklingError("unpicklable")
+    )
+
+    cache = pyhf.pdf.ModelCache(cache_dir=tmp_path)
+    model = cache.model(spec)
+    assert cache.model(spec) is model
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_workspace_model_cache(tmp_path):
+    spec = json.load(open("validation/xmlimport_input_bkg.json"))
+    ws = pyhf.Workspace(spec)
+    cache = pyhf.pdf.ModelCache()
+    model = ws.model(model_cache=cache)
+    assert ws.model(model_cache=cache) is model
+    assert ws.model() is not model
+
+
+@pytest.mark.parametrize('batch_size', [None, 3])
+def test_expected_data_combines_modifications(backend, batch_size):
+    spec = {
+        'channels': [
+            {
+                'name': 'first',
+                'samples': [
+                    {
+                        'name': 'signal',
+                        'data': [5.0, 10.0, 3.0],
+                        'modifiers': [
+                            {'name': 'mu', 'type': 'normfactor', 'data': None},
+                            {'name': 'lumi', 'type': 'lumi', 'data': None},
+                            {
+                                'name': 'norm_a',
+                                'type': 'normsys',
+                                'data': {'hi': 1.1, 'lo': 0.8},
+                            },
+                            {
+                                'name': 'shape_a',
+                                'type': 'histosys',
+                                'data': {
+                                    'hi_data': [6.0, 11.0, 4.0],
+                                    'lo_data': [4.0, 9.0, 2.5],
+                                },
+                            },
+                            {
+                                'name': 'stat_first',
+                                'type': 'staterror',
+                                'data': [1.0, 2.0, 1.0],
+                            },
+                        ],
+                    },
+                    {
+                        'name': 'background',
+                        'data': [50.0, 60.0, 70.0],
+                        'modifiers': [
+                            {'name': 'lumi', 'type': 'lumi', 'data': None},
+                            {
+                                'name': 'norm_a',
+                                'type': 'normsys',
+                                'data': {'hi': 1.05, 'lo': 0.9},
+                            },
+                            {
+                                'name': 'norm_b',
+                                'type': 'normsys',
+                                'data': {'hi': 1.2, 'lo': 0.7},
+                            },
+                            {
+                                'name': 'shape_b',
+                                'type': 'histosys',
+                                'data': {
+                                    'hi_data': [55.0, 62.0, 71.0],
+                                    'lo_data': [47.0, 57.0, 66.0],
+                                },
+                            },
+                            {
+                                'name': 'stat_first',
+                                'type': 'staterror',
+                                'data': [3.0, 4.0, 5.0],
+                            },
+                            {
+                                'name': 'shapesys_first',
+                                'type': 'shapesys',
+                                'data': [5.0, 6.0, 7.0],
+                            },
+                        ],
+                    },
+                ],
+            },
+            {
+                'name': 'second',
+                'samples': [
+                    {
+                        'name': 'background',
+                        'data': [30.0, 20.0],
+                        'modifiers': [
+                            {
+                                'name': 'norm_b',
+                                'type': 'normsys',
+                                'data': {'hi': 1.3, 'lo': 0.6},
+                            },
+                            {
+                                'name': 'shape_a',
+                                'type': 'histosys',
+                                'data': {
+                                    'hi_data': [33.0, 21.0],
+                                    'lo_data': [28.0, 18.0],
+                                },
+                            },
+                            {'name': 'free', 'type': 'shapefactor', 'data': None},
+                        ],
+                    },
+                ],
+            },
+        ],
+        'parameters': [
+            {'name': 'lumi', 'auxdata': [1.0], 'sigmas': [0.05], 'inits': [1.0]}
+        ],
+    }
+    model = pyhf.Model(spec, poi_name='mu', batch_size=batch_size)
+
+    rng = np.random.default_rng(1)
+    pars = np.asarray(model.config.suggested_init()) + rng.uniform(
+        -0.5, 0.5, size=(batch_size or 1, model.config.npars)
+    )
+    pars = pyhf.tensorlib.astensor(pars if batch_size else pars[0])
+
+    tensorlib, _ = pyhf.get_backend()
+    deltas, factors = model._modifications(pars)
+    nominal = np.asarray(tensorlib.tolist(model.main_model.nominal_rates))[0]
+    expected = nominal + sum(
+        np.asarray(tensorlib.tolist(delta)).sum(axis=0) for delta in deltas
+    )
+    for factor in factors:
+        expected = expected * np.asarray(tensorlib.tolist(factor)).prod(axis=0)
+    expected = np.einsum('ij...->ji...', expected)
+    if batch_size is None:
+        expected = expected[0]
+
+    by_sample = model.main_model.expected_data(pars, return_by_sample=True)
+    assert np.asarray(tensorlib.tolist(by_sample)) == pytest.approx(expected)
+    assert np.asarray(
+        tensorlib.tolist(model.main_model.expected_data(pars))
+    ) == pytest.approx(np.sum(expected, axis=-2))
+
+
+@pytest.mark.parametrize('batch_size', [None, 2])
+def test_incremental_expected_data(backend, batch_size, mocker):
+    spec = pyhf.simplemodels.correlated_background(
+        signal=[12.0, 11.0],
+        bkg=[50.0, 52.0],
+        bkg_up=[45.0, 57.0],
+        bkg_down=[55.0, 47.0],
+    ).spec
+    model = pyhf.Model(spec, batch_size=batch_size)
+    incremental_model = pyhf.Model(spec, batch_size=batch_size, incremental=True)
+    main_model = incremental_model.main_model
+    combine = mocker.spy(main_model, '_combined_modification')
+    histosys = mocker.spy(
+        main_model.modifiers_appliers['histosys'], '_entry_modifications'
+    )
+
+    init = incremental_model.config.suggested_init()
+    mu_index = incremental_model.config.poi_index
+    pars = [list(init) for _ in range(batch_size or 1)]
+    data = model.expected_data(pars if batch_size else pars[0])
+
+    def check(pars):
+        pars = pars if batch_size else pars[0]
+        assert pyhf.tensorlib.tolist(
+            incremental_model.logpdf(pars, data)
+        ) == pytest.approx(pyhf.tensorlib.tolist(model.logpdf(pars, data)))
+
+    check(pars)
+    assert combine.call_count == 1
+    assert histosys.call_count == 1
+
+    # only the normfactor is evaluated again
+    pars[-1][mu_index] = 2.0
+    check(pars)
+    assert combine.call_count == 2
+    assert histosys.call_count == 1
+
+    # nothing changed
+    check(pars)
+    assert combine.call_count == 2
+    assert histosys.call_count == 1
+
+    # only the bins of the histosys modifier are evaluated again
+    pars[0][1 - mu_index] = 0.5
+    check(pars)
+    assert combine.call_count == 2
+    assert histosys.call_count == 2
+    assert histosys.call_args.args[1:] == (0,)
+
+
+@pytest.mark.parametrize('batch_size', [None, 2])
+def test_incremental_expected_data_per_modifier(backend, batch_size, mocker):
+    spec = {
+        'channels': [
+            {
+                'name': channel,
+                'samples': [
+                    {
+                        'name': sample,
+                        'data': [10.0, 20.0],
+                        'modifiers': [
+                            {
+                                'name': f'norm_{idx}',
+                                'type': 'normsys',
+                                'data': {'hi': 1.0 + 0.1 * idx, 'lo': 0.9},
+                            }
+                            for idx in range(3)
+                            if (idx + len(sample) + len(channel)) % 3
+                        ],
+                    }
+                    for sample in ['sig', 'bkg']
+                ],
+            }
+            for channel in ['first', 'second']
+        ],
+        'parameters': [{'name': 'norm_0', 'bounds': [[-5.0, 5.0]]}],
+    }
+    model = pyhf.Model(spec, batch_size=batch_size, poi_name=None)
+    incremental_model = pyhf.Model(
+        spec, batch_size=batch_size, poi_name=None, incremental=True
+    )
+    normsys = mocker.spy(
+        incremental_model.main_model.modifiers_appliers['normsys'],
+        '_entry_modifications',
+    )
+
+    pars = [incremental_model.config.suggested_init() for _ in range(batch_size or 1)]
+    data = model.expected_data(pars if batch_size else pars[0])
+    for name, value in [('norm_1', 0.5), ('norm_2', -1.5), ('norm_1', 2.0)]:
+        pars[-1][incremental_model.config.par_slice(name).start] = value
+        batch_pars = pars if batch_size else pars[0]
+        assert pyhf.tensorlib.tolist(
+            incremental_model.logpdf(batch_pars, data)
+        ) == pytest.approx(pyhf.tensorlib.tolist(model.logpdf(batch_pars, data)))
+
+    # all modifiers at first, then each time only the one that changed
+    modifier_names = ['norm_0', 'norm_1', 'norm_2']
+    assert [call.args[1:] for call in normsys.call_args_list] == [
+        (),
+        (modifier_names.index('norm_2'),),
+        (modifier_names.index('norm_1'),),
+    ]
+
+
+@pytest.mark.parametrize('channel_groups', [1, 2, 5, [['second'], ['first']]])
+@pytest.mark.parametrize('batch_size', [None, 2])
+def test_channel_groups_logpdf(backend, batch_size, channel_groups):
+    spec = {
+        'channels': [
+            {
+                'name': name,
+                'samples': [
+                    {
+                        'name': 'signal',
+                        'data': [5.0, 10.0, 3.0][:nbins],
+                        'modifiers': [
+                            {'name': 'mu', 'type': 'normfactor', 'data': None}
+                        ],
+                    },
+                    {
+                        'name': 'background',
+                        'data': [50.0, 60.0, 70.0][:nbins],
+                        'modifiers': [
+                            {
+                                'name': 'shape',
+                                'type': 'histosys',
+                                'data': {
+                                    'hi_data': [55.0, 62.0, 71.0][:nbins],
+                                    'lo_data': [47.0, 57.0, 66.0][:nbins],
+                                },
+                            },
+                            {
+                                'name': f'stat_{name}',
+                                'type': 'staterror',
+                                'data': [3.0, 4.0, 5.0][:nbins],
+                            },
+                        ],
+                    },
+                ],
+            }
+            for name, nbins in [('first', 3), ('second', 2)]
+        ]
+    }
+    model = pyhf.Model(spec, batch_size=batch_size)
+    grouped_model = pyhf.Model(
+        spec, batch_size=batch_size, channel_groups=channel_groups
+    )
+    assert sorted(
+        channel
+        for group in grouped_model.channel_groups_model.groups
+        for channel in group
+    ) == ['first', 'second']
+
+    init = model.config.suggested_init()
+    pars = [[value * (1.1 + 0.1 * i) for value in init] for i in range(batch_size or 1)]
+    pars = pars if batch_size else pars[0]
+    data = pyhf.tensorlib.tolist(pyhf.Model(spec).expected_data(init))
+    data = [data] * batch_size if batch_size else data
+    assert pyhf.tensorlib.tolist(grouped_model.logpdf(pars, data)) == pytest.approx(
+        pyhf.tensorlib.tolist(model.logpdf(pars, data))
+    )
+
+    loaded_model = pickle.loads(pickle.dumps(grouped_model))
+    assert pyhf.tensorlib.tolist(loaded_model.logpdf(pars, data)) == pytest.approx(
+        pyhf.tensorlib.tolist(model.logpdf(pars, data))
+    )
+
+    # the main model of all channels is only built when it is accessed
+    assert grouped_model._main_model is None
+    assert np.asarray(
+        pyhf.tensorlib.tolist(grouped_model.expected_data(pars))
+    ) == pytest.approx(np.asarray(pyhf.tensorlib.tolist(model.expected_data(pars))))
+    assert grouped_model._main_model is None
+    assert np.asarray(
+        pyhf.tensorlib.tolist(grouped_model.main_model.expected_data(pars))
+    ) == pytest.approx(
+        np.asarray(pyhf.tensorlib.tolist(model.main_model.expected_data(pars)))
+    )
+
+
+@pytest.mark.parametrize('channel_groups', [0, [['first']], [['first'], ['first']]])
+def test_channel_groups_invalid(channel_groups):
+    spec = {
+        'channels': [
+            {
+                'name': name,
+                'samples': [
+                    {
+                        'name': 'signal',
+                        'data': [5.0],
+                        'modifiers': [
+                            {'name': 'mu', 'type': 'normfactor', 'data': None}
+                        ],
+                    }
+                ],
+            }
+            for name in ['first', 'second']
+        ]
+    }
+    with pytest.raises(pyhf.exceptions.InvalidModel):
+        pyhf.Model(spec, channel_groups=channel_groups)
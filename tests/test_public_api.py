@@ -25,7 +25,7 @@ def test_set_backend_by_string(backend_name):
     )
 
 
-@pytest.mark.parametrize("optimizer_name", ["scipy", "minuit"])
+@pytest.mark.parametrize("optimizer_name", ["scipy", "minuit", "newton"])
 def test_set_optimizer_by_string(optimizer_name):
     pyhf.set_backend(pyhf.tensorlib, optimizer_name)
     assert isinstance(
@@ -34,7 +34,7 @@ def test_set_optimizer_by_string(optimizer_name):
     )
 
 
-@pytest.mark.parametrize("precision_level", ["32b", "64b"])
+@pytest.mark.parametrize("precision_level", ["32b", "64b", "mixed"])
 def test_set_precision_by_string(precision_level):
     pyhf.set_backend(pyhf.tensorlib.name, precision=precision_level)
     assert pyhf.tensorlib.precision == precision_level.lower()
@@ -51,7 +51,7 @@ def test_set_backend_by_bytestring(backend_name):
     )
 
 
-@pytest.mark.parametrize("optimizer_name", [b"scipy", b"minuit"])
+@pytest.mark.parametrize("optimizer_name", [b"scipy", b"minuit", b"newton"])
 def test_set_optimizer_by_bytestring(optimizer_name):
     pyhf.set_backend(pyhf.tensorlib, optimizer_name)
     assert isinstance(
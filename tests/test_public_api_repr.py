@@ -124,11 +124,17 @@ def test_infer_calculators_public_api():
 
 
 def test_infer_intervals_public_api():
-    assert dir(pyhf.infer.intervals) == ["upperlimit"]
+    assert dir(pyhf.infer.intervals) == ["toms748_scan", "upperlimit"]
 
 
 def test_infer_mle_public_api():
-    assert dir(pyhf.infer.mle) == ["fit", "fixed_poi_fit", "twice_nll"]
+    assert dir(pyhf.infer.mle) == [
+        "fit",
+        "fit_cache",
+        "fixed_poi_fit",
+        "profile_scan",
+        "twice_nll",
+    ]
 
 
 def test_infer_test_statistics_public_api():
@@ -210,7 +216,7 @@ def test_patchset_public_api():
 
 
 def test_pdf_public_api():
-    assert dir(pyhf.pdf) == ["Model", "_ModelConfig"]
+    assert dir(pyhf.pdf) == ["Model", "ModelCache", "_ModelConfig"]
 
 
 def test_probability_public_api():
@@ -219,6 +225,7 @@ def test_probability_public_api():
 
 def test_readxml_public_api():
     assert dir(pyhf.readxml) == [
+        "FileCache",
         "clear_filecache",
         "dedupe_parameters",
         "extract_error",
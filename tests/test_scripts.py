@@ -8,6 +8,7 @@
 from pathlib import Path
 from unittest import mock
 
+import numpy as np
 import pytest
 from click.testing import CliRunner
 
@@ -66,6 +67,18 @@ def test_import_prepHistFactory(tmpdir, script_runner):
     pyhf.utils.validate(spec, 'model.json')
 
 
+def test_import_prepHistFactory_n_workers(tmpdir, script_runner):
+    temp = tmpdir.join("parsed_output.json")
+    command = f'pyhf xml2json validation/xmlimport_input2/config/example.xml --basedir validation/xmlimport_input2/ --output-file {temp.strpath:s} --hide-progress --n-workers 2'
+    ret = script_runner.run(*shlex.split(command))
+    assert ret.success
+
+    parsed_xml = json.loads(temp.read())
+    assert parsed_xml == pyhf.readxml.parse(
+        'validation/xmlimport_input2/config/example.xml', 'validation/xmlimport_input2'
+    )
+
+
 def test_import_prepHistFactory_withProgress(tmpdir, script_runner):
     temp = tmpdir.join("parsed_output.json")
     command = f'pyhf xml2json validation/xmlimport_input/config/example.xml --basedir validation/xmlimport_input/ --output-file {temp.strpath:s}'
@@ -204,6 +217,17 @@ def test_import_and_export(tmpdir, script_runner):
     assert ret.success
 
 
+def test_import_and_export_n_workers(tmpdir, script_runner):
+    temp = tmpdir.join("parsed_output.json")
+    command = f'pyhf xml2json validation/xmlimport_input/config/example.xml --basedir validation/xmlimport_input/ --output-file {temp.strpath:s}'
+    ret = script_runner.run(*shlex.split(command))
+
+    command = f"pyhf json2xml {temp.strpath:s} --output-dir {tmpdir.mkdir('output').strpath:s} --n-workers 2"
+    ret = script_runner.run(*shlex.split(command))
+    assert ret.success
+    assert tmpdir.join('output', 'config', 'FitConfig_channel1.xml').check()
+
+
 def test_patch(tmpdir, script_runner):
     patch = tmpdir.join('patch.json')
 
@@ -235,6 +259,40 @@ def test_patch(tmpdir, script_runner):
     assert ret.success
 
 
+def test_patch_npz(tmpdir, script_runner):
+    patch = tmpdir.join('patch.json')
+
+    patch.write(
+        '''
+[{"op": "replace", "path": "/channels/0/samples/0/data/0", "value": 5.0},
+ {"op": "test", "path": "/channels/0/samples/0/data/0", "value": 5.0}]
+    '''
+    )
+
+    temp = tmpdir.join("parsed_output.json")
+    command = f'pyhf xml2json validation/xmlimport_input/config/example.xml --basedir validation/xmlimport_input/ --output-file {temp.strpath:s}'
+    ret = script_runner.run(*shlex.split(command))
+    tempnpz = tmpdir.join("parsed_output.npz")
+    command = f'pyhf json2npz {temp.strpath:s} --output-file {tempnpz.strpath:s}'
+    ret = script_runner.run(*shlex.split(command))
+    assert ret.success
+
+    outputs = {}
+    for workspace in [temp, tempnpz]:
+        output_dir = tmpdir.mkdir(f'output_{workspace.ext[1:]}')
+        command = f"pyhf json2xml {workspace.strpath:s} --output-dir {output_dir.strpath:s} --patch {patch.strpath:s}"
+        ret = script_runner.run(*shlex.split(command))
+        assert ret.success
+        outputs[workspace.ext] = (
+            output_dir.join('FitConfig.xml').read().replace(output_dir.strpath, '')
+        )
+    assert outputs['.npz'] == outputs['.json']
+
+    command = f'pyhf cls {tempnpz.strpath:s} --patch {patch.strpath:s}'
+    ret = script_runner.run(*shlex.split(command))
+    assert ret.success
+
+
 def test_patch_fail(tmpdir, script_runner):
     patch = tmpdir.join('patch.json')
 
@@ -264,6 +322,83 @@ def test_bad_measurement_name(tmpdir, script_runner):
     # assert 'no measurement by name' in ret.stderr  # numpy swallows the log.error() here, dunno why
 
 
+def test_cls_toybased_n_workers(tmpdir, script_runner):
+    temp = tmpdir.join("parsed_output.json")
+    command = f'pyhf xml2json validation/xmlimport_input/config/example.xml --basedir validation/xmlimport_input/ --output-file {temp.strpath:s}'
+    ret = script_runner.run(*shlex.split(command))
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    from pyhf.cli.infer import cls
+
+    result = (pyhf.tensorlib.astensor(0.5), [pyhf.tensorlib.astensor(0.5)] * 5)
+    runner = CliRunner()
+    with mock.patch("pyhf.cli.infer.hypotest", return_value=result) as hypotest:
+        ret = runner.invoke(
+            cls, [temp.strpath, "--calctype", "toybased", "--n-workers", "2"]
+        )
+    assert ret.exit_code == 0
+    assert isinstance(hypotest.call_args.kwargs["executor"], ProcessPoolExecutor)
+
+    with mock.patch("pyhf.cli.infer.hypotest", return_value=result) as hypotest:
+        ret = runner.invoke(cls, [temp.strpath, "--n-workers", "2"])
+    assert ret.exit_code == 0
+    assert "executor" not in hypotest.call_args.kwargs
+
+
+def test_cls_toybased_n_workers_results(tmpdir, mocker):
+    temp = tmpdir.join("parsed_output.json")
+    temp.write(
+        json.dumps(
+            pyhf.Workspace.build(
+                pyhf.simplemodels.uncorrelated_background(
+                    signal=[12.0, 11.0], bkg=[50.0, 52.0], bkg_uncertainty=[3.0, 7.0]
+                ),
+                [51, 48],
+            )
+        )
+    )
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    from pyhf.cli.infer import cls
+
+    submit = mocker.spy(ProcessPoolExecutor, "submit")
+    runner = CliRunner()
+    results = []
+    for n_workers in ["1", "2"]:
+        np.random.seed(0)
+        ret = runner.invoke(
+            cls,
+            [temp.strpath, "--calctype", "toybased", "--n-toys", "20"]
+            + ["--n-workers", n_workers],
+        )
+        assert ret.exit_code == 0
+        results.append(json.loads(ret.stdout))
+    # the toys are sampled in the calling process
+    assert results[0] == results[1]
+    # the workers received the model when they started, not with the chunks
+    assert submit.call_count > 0
+    assert all(call.args[3]['pdf'] is None for call in submit.call_args_list)
+
+
+def test_model_cache_dir(tmpdir, script_runner):
+    temp = tmpdir.join("parsed_output.json")
+    command = f'pyhf xml2json validation/xmlimport_input/config/example.xml --basedir validation/xmlimport_input/ --output-file {temp.strpath:s}'
+    ret = script_runner.run(*shlex.split(command))
+
+    cache_dir = tmpdir.join("model_cache")
+    results = []
+    for subcommand in ["cls", "cls", "fit"]:
+        command = f'pyhf {subcommand} {temp.strpath:s} --model-cache-dir {cache_dir.strpath:s}'
+        ret = script_runner.run(*shlex.split(command))
+        assert ret.success
+        results.append(json.loads(ret.stdout))
+    assert results[0] == results[1]
+    # cls and fit use different interpolation codes and so different models
+    assert len(cache_dir.listdir()) == 2
+
+
 def test_testpoi(tmpdir, script_runner):
     temp = tmpdir.join("parsed_output.json")
     command = f'pyhf xml2json validation/xmlimport_input/config/example.xml --basedir validation/xmlimport_input/ --output-file {temp.strpath:s}'
@@ -717,6 +852,24 @@ def test_sort(tmpdir, script_runner):
     assert ret.success
 
 
+@pytest.mark.parametrize('command', ['sort', 'cls', 'digest', 'prune -s signal'])
+def test_json2npz(tmpdir, script_runner, command):
+    temp = tmpdir.join("parsed_output.json")
+    command_xml = f'pyhf xml2json validation/xmlimport_input/config/example.xml --basedir validation/xmlimport_input/ --output-file {temp.strpath:s} --hide-progress'
+    ret = script_runner.run(*shlex.split(command_xml))
+
+    tempnpz = tmpdir.join("parsed_output.npz")
+    ret = script_runner.run(
+        *shlex.split(f'pyhf json2npz {temp.strpath} --output-file {tempnpz.strpath}')
+    )
+    assert ret.success
+
+    ret_json = script_runner.run(*shlex.split(f'pyhf {command} {temp.strpath}'))
+    ret_npz = script_runner.run(*shlex.split(f'pyhf {command} {tempnpz.strpath}'))
+    assert ret_npz.success
+    assert ret_npz.stdout == ret_json.stdout
+
+
 def test_sort_outfile(tmpdir, script_runner):
     temp = tmpdir.join("parsed_output.json")
     command = f'pyhf xml2json validation/xmlimport_input/config/example.xml --basedir validation/xmlimport_input/ --output-file {temp.strpath:s} --hide-progress'
@@ -1,4 +1,6 @@
 from sys import platform
+import subprocess
+import sys
 import pytest
 import logging
 import numpy as np
@@ -462,6 +464,17 @@ def test_einsum(backend):
     )
 
 
+def test_solve(backend):
+    tb = pyhf.tensorlib
+    a = [[4.0, 1.0, 0.0], [1.0, 3.0, 1.0], [0.0, 1.0, 2.0]]
+    b = [1.0, 2.0, 3.0]
+    assert tb.tolist(tb.solve(tb.astensor(a), tb.astensor(b))) == pytest.approx(
+        np.linalg.solve(a, b).tolist()
+    )
+    inverse = tb.solve(tb.astensor(a), tb.astensor(np.eye(3).tolist()))
+    assert np.asarray(tb.tolist(inverse)) == pytest.approx(np.linalg.inv(a))
+
+
 def test_list_to_list(backend):
     tb = pyhf.tensorlib
     # test when no other tensor operations are done
@@ -573,6 +586,29 @@ def test_set_tensor_precision(tensorlib, precision):
     assert f'int{precision[:1]}' in str(tb.dtypemap['int'])
 
 
+@pytest.mark.parametrize(
+    'tensorlib',
+    ['numpy_backend', 'jax_backend', 'pytorch_backend', 'tensorflow_backend'],
+)
+def test_mixed_tensor_precision(tensorlib):
+    model = pyhf.simplemodels.uncorrelated_background(
+        signal=[12.0, 11.0], bkg=[50000.0, 52000.0], bkg_uncertainty=[3.0, 7.0]
+    )
+    pars = [1.1, 1.0001, 0.9999]
+    data = [50010.0, 52005.0] + model.config.auxdata
+
+    pyhf.set_backend(pyhf.tensor.numpy_backend(precision='64b'))
+    expected = pyhf.tensorlib.tolist(model.logpdf(pars, data))
+
+    pyhf.set_backend(getattr(pyhf.tensor, tensorlib)(precision='mixed'))
+    assert 'float32' in str(pyhf.tensorlib.astensor(pars).dtype)
+    assert 'float32' in str(model.expected_actualdata(pars).dtype)
+    logpdf = model.logpdf(pars, data)
+    # the log-likelihood is accumulated in float64
+    assert 'float64' in str(logpdf.dtype)
+    assert pyhf.tensorlib.tolist(logpdf) == pytest.approx(expected, rel=1e-6)
+
+
 def test_trigger_tensorlib_changed_name(mocker):
     numpy_64 = pyhf.tensor.numpy_backend(precision='64b')
     jax_64 = pyhf.tensor.jax_backend(precision='64b')
@@ -613,3 +649,86 @@ def test_tensorlib_setup(tensorlib, precision, mocker):
     assert func.call_count == 0
     pyhf.set_backend(tb)
     assert func.call_count == 1
+
+
+def test_jax_compilation_cache_dir(tmp_path):
+    from jax.config import config
+
+    previous_cache_dir = config.jax_compilation_cache_dir
+    previous_min_compile_time = config.jax_persistent_cache_min_compile_time_secs
+    try:
+        tb = pyhf.tensor.jax_backend(precision='64b', compilation_cache_dir=tmp_path)
+        assert tb.compilation_cache_dir == tmp_path
+        pyhf.set_backend(tb)
+        assert config.jax_compilation_cache_dir == str(tmp_path)
+        assert config.jax_persistent_cache_min_compile_time_secs == 0
+
+        pyhf.set_backend(pyhf.tensor.jax_backend(precision='64b'))
+        assert config.jax_compilation_cache_dir == previous_cache_dir
+        assert (
+            config.jax_persistent_cache_min_compile_time_secs
+            == previous_min_compile_time
+        )
+    finally:
+        config.update('jax_compilation_cache_dir', previous_cache_dir)
+        config.update(
+            'jax_persistent_cache_min_compile_time_secs', previous_min_compile_time
+        )
+
+
+def test_jax_compilation_cache_dir_from_environment(tmp_path, monkeypatch):
+    from jax.config import config
+
+    monkeypatch.setenv('PYHF_JAX_COMPILATION_CACHE_DIR', str(tmp_path))
+    previous_cache_dir = config.jax_compilation_cache_dir
+    try:
+        pyhf.set_backend('jax')
+        assert pyhf.tensorlib.compilation_cache_dir == str(tmp_path)
+        assert config.jax_compilation_cache_dir == str(tmp_path)
+
+        monkeypatch.delenv('PYHF_JAX_COMPILATION_CACHE_DIR')
+        pyhf.set_backend('jax')
+        assert config.jax_compilation_cache_dir == previous_cache_dir
+    finally:
+        config.update('jax_compilation_cache_dir', previous_cache_dir)
+
+
+_JAX_CACHE_SCRIPT = '''
+import os
+import sys
+
+import jax
+import pyhf
+from jax.config import config
+
+probe_dir, fit_dir = sys.argv[1:]
+config.update('jax_persistent_cache_min_compile_time_secs', 0)
+
+# whether jax supports the persistent cache on this platform at all
+config.update('jax_compilation_cache_dir', probe_dir)
+jax.jit(lambda x: x + 1)(1.0).block_until_ready()
+print(len(os.listdir(probe_dir)) > 0)
+
+pyhf.set_backend(pyhf.tensor.jax_backend(compilation_cache_dir=fit_dir), 'scipy')
+model = pyhf.simplemodels.uncorrelated_background([5.0], [50.0], [5.0])
+data = pyhf.tensorlib.astensor([52.0] + model.config.auxdata)
+pyhf.infer.mle.fit(data, model)
+print(len(os.listdir(fit_dir)) > 0)
+'''
+
+
+def test_jax_compilation_cache_dir_fit(tmp_path):
+    # the cache is initialized once per process, so the fit runs in a new one
+    probe_dir, fit_dir = tmp_path.joinpath('probe'), tmp_path.joinpath('fit')
+    probe_dir.mkdir()
+    fit_dir.mkdir()
+    result = subprocess.run(
+        [sys.executable, '-c', _JAX_CACHE_SCRIPT, str(probe_dir), str(fit_dir)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    supported, populated = result.stdout.split()
+    if supported != 'True':
+        pytest.skip('The persistent compilation cache of jax is not supported here')
+    assert populated == 'True'
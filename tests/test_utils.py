@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 import pyhf
 
 
@@ -66,3 +67,28 @@ def test_citation(oneline):
     assert citation
     if oneline:
         assert '\n' not in citation
+
+
+def test_validate_numpy_arrays():
+    spec = {
+        'channels': [
+            {
+                'name': 'channel',
+                'samples': [
+                    {'name': 'sample', 'data': np.array([1.0, 2.0]), 'modifiers': []}
+                ],
+            }
+        ]
+    }
+    pyhf.utils.validate(spec, 'model.json')
+    assert pyhf.utils.digest({'data': np.array([1.0, 2.0])}) == pyhf.utils.digest(
+        {'data': [1.0, 2.0]}
+    )
+
+    spec['channels'][0]['samples'][0]['data'] = np.array([], dtype=float)
+    with pytest.raises(pyhf.exceptions.InvalidSpecification):
+        pyhf.utils.validate(spec, 'model.json')
+
+    spec['channels'][0]['samples'][0]['data'] = np.array(['a', 'b'])
+    with pytest.raises(pyhf.exceptions.InvalidSpecification):
+        pyhf.utils.validate(spec, 'model.json')
@@ -7,6 +7,8 @@
 import pyhf.workspace
 import pyhf.utils
 import copy
+import jsonpatch
+import numpy as np
 
 
 @pytest.fixture(
@@ -909,3 +911,213 @@ def test_workspace_without_validation(mocker, simplemodels_model_data):
 
     pyhf.Workspace(dict(ws), validate=False)
     assert pyhf.utils.validate.called is False
+
+
+@pytest.mark.parametrize('mmap', [True, False], ids=['mmap', 'in-memory'])
+def test_workspace_npz(workspace_factory, tmp_path, mmap):
+    ws = workspace_factory()
+    ws.to_npz(tmp_path.joinpath('workspace.npz'))
+    ws_npz = pyhf.Workspace.from_npz(tmp_path.joinpath('workspace.npz'), mmap=mmap)
+
+    sample_data = ws_npz['channels'][0]['samples'][0]['data']
+    assert isinstance(sample_data, np.ndarray)
+    assert sample_data.flags.writeable is False
+
+    assert ws_npz == ws
+    assert pyhf.utils.digest(ws_npz) == pyhf.utils.digest(ws)
+
+    model, model_npz = ws.model(), ws_npz.model()
+    pars = model.config.suggested_init()
+    assert ws_npz.data(model_npz) == ws.data(model)
+    assert model_npz.expected_data(pars).tolist() == pytest.approx(
+        model.expected_data(pars).tolist()
+    )
+
+
+def test_workspace_npz_model_shares_arrays(workspace_factory, tmp_path):
+    ws = workspace_factory()
+    ws.to_npz(tmp_path.joinpath('workspace.npz'))
+    ws_npz = pyhf.Workspace.from_npz(tmp_path.joinpath('workspace.npz'))
+
+    model_npz = ws_npz.model()
+    for channel, model_channel in zip(ws_npz['channels'], model_npz._spec['channels']):
+        for sample, model_sample in zip(channel['samples'], model_channel['samples']):
+            assert model_sample['data'] is sample['data']
+
+    # the specification of the model is still JSON
+    assert json.loads(json.dumps(model_npz.spec)) == ws.model().spec
+
+
+def test_workspace_npz_operations(workspace_factory, tmp_path):
+    ws = workspace_factory()
+    ws.to_npz(tmp_path.joinpath('workspace.npz'))
+    ws_npz = pyhf.Workspace.from_npz(tmp_path.joinpath('workspace.npz'))
+
+    assert pyhf.Workspace.sorted(ws_npz) == pyhf.Workspace.sorted(ws)
+    assert ws_npz.rename(channels={ws.channels[0]: 'renamed'}) == ws.rename(
+        channels={ws.channels[0]: 'renamed'}
+    )
+    assert ws_npz.prune(modifier_types=['normfactor']) == ws.prune(
+        modifier_types=['normfactor']
+    )
+    assert pyhf.Workspace.combine(ws_npz, ws, join='outer') == ws
+
+
+def test_workspace_npz_histosys_integer_data(tmp_path):
+    model = pyhf.simplemodels.correlated_background(
+        signal=[12, 11], bkg=[50, 52], bkg_up=[45, 57], bkg_down=[55, 47]
+    )
+    ws = pyhf.Workspace.build(model, [51, 48])
+    ws.to_npz(tmp_path.joinpath('workspace.npz'))
+    ws_npz = pyhf.Workspace.from_npz(tmp_path.joinpath('workspace.npz'))
+
+    histosys = ws_npz['channels'][0]['samples'][1]['modifiers'][0]
+    assert histosys['data']['hi_data'].dtype == np.int64
+    assert json.dumps(ws_npz, default=pyhf.utils._to_jsonable) == json.dumps(ws)
+
+    model_npz = ws_npz.model()
+    pars = model_npz.config.suggested_init()
+    pars[model_npz.config.par_slice('correlated_bkg_uncertainty')] = [0.5]
+    assert model_npz.expected_data(pars).tolist() == pytest.approx(
+        model.expected_data(pars).tolist()
+    )
+
+
+def test_workspace_npz_patches(tmp_path):
+    model = pyhf.simplemodels.correlated_background(
+        signal=[12.0, 11.0],
+        bkg=[50.0, 52.0],
+        bkg_up=[45.0, 57.0],
+        bkg_down=[55.0, 47.0],
+    )
+    ws = pyhf.Workspace.build(model, [51, 48])
+    ws.to_npz(tmp_path.joinpath('workspace.npz'))
+    ws_npz = pyhf.Workspace.from_npz(tmp_path.joinpath('workspace.npz'))
+
+    sample = '/channels/0/samples/0'
+    patch = [
+        {'op': 'test', 'path': f'{sample}/data', 'value': [12.0, 11.0]},
+        {'op': 'test', 'path': f'{sample}', 'value': ws['channels'][0]['samples'][0]},
+        {'op': 'replace', 'path': f'{sample}/data/0', 'value': 24.0},
+        {'op': 'add', 'path': f'{sample}/data/-', 'value': 10.0},
+        {'op': 'remove', 'path': f'{sample}/data/2'},
+        {
+            'op': 'copy',
+            'from': '/observations/0/data/1',
+            'path': '/observations/0/data/0',
+        },
+        {'op': 'remove', 'path': '/observations/0/data/2'},
+    ]
+    expected = jsonpatch.JsonPatch(patch).apply(dict(ws))
+    assert json.dumps(
+        pyhf.workspace._apply_patch(ws_npz, patch), default=pyhf.utils._to_jsonable
+    ) == json.dumps(expected)
+    # the arrays of the workspace are not modified
+    assert ws_npz == ws
+
+    assert pyhf.tensorlib.tolist(
+        ws_npz.model(patches=[patch[:5]]).expected_actualdata(
+            model.config.suggested_init()
+        )
+    ) == pytest.approx([24.0 + 50.0, 11.0 + 52.0])
+
+    patchset = pyhf.PatchSet(
+        {
+            'metadata': {
+                'references': {'hepdata': 'ins1234567'},
+                'description': 'signal patchset',
+                'digests': {'sha256': pyhf.utils.digest(ws)},
+                'labels': ['x'],
+            },
+            'patches': [
+                {
+                    'metadata': {'name': 'double_signal', 'values': [2]},
+                    'patch': patch[:3],
+                }
+            ],
+            'version': '1.0.0',
+        }
+    )
+    patched = patchset.apply(ws_npz, 'double_signal')
+    assert patched['channels'][0]['samples'][0]['data'] == [24.0, 11.0]
+
+
+def test_workspace_npz_invalid(tmp_path):
+    np.savez(tmp_path.joinpath('arrays.npz'), data=np.arange(3))
+    with pytest.raises(pyhf.exceptions.InvalidWorkspaceOperation):
+        pyhf.Workspace.from_npz(tmp_path.joinpath('arrays.npz'))
+
+
+def test_workspace_operations_skip_validation(workspace_factory, mocker):
+    ws = workspace_factory()
+    new_ws = ws.rename(
+        channels={channel: f'renamed_{channel}' for channel in ws.channels},
+        samples={sample: f'renamed_{sample}' for sample in ws.samples},
+        modifiers={
+            modifier: f'renamed_{modifier}'
+            for modifier, _ in ws.modifiers
+            if not modifier == 'lumi'
+        },
+        measurements={
+            measurement: f'renamed_{measurement}'
+            for measurement in ws.measurement_names
+        },
+    )
+
+    mocker.spy(pyhf.utils, 'validate')
+    ws.prune(samples=ws.samples[1:])
+    ws.rename(channels={ws.channels[0]: 'renamed'})
+    pyhf.Workspace.sorted(ws)
+    pyhf.Workspace.combine(ws, new_ws)
+    assert pyhf.utils.validate.called is False
+
+    # workspaces that were not validated are validated by operations
+    pyhf.Workspace(dict(ws), validate=False).prune(samples=ws.samples[1:])
+    assert pyhf.utils.validate.call_count == 1
+
+    # renaming to a non-string name is validated
+    with pytest.raises(pyhf.exceptions.InvalidSpecification):
+        ws.rename(measurements={ws.measurement_names[0]: 1})
+
+
+def test_workspace_copy(simplemodels_model_data):
+    model, data = simplemodels_model_data
+    spec = dict(pyhf.Workspace.build(model, data))
+
+    assert pyhf.Workspace(spec)['channels'] is not spec['channels']
+    assert pyhf.Workspace(spec, copy=False)['channels'] is spec['channels']
+
+
+def test_workspace_operations_share_unchanged_items(workspace_factory):
+    ws = workspace_factory()
+    # a workspace of at least two channels
+    ws = pyhf.Workspace.combine(
+        ws, ws.rename(channels={ws.channels[0]: 'other'}), join='outer'
+    )
+    channel, other_channel = ws['channels'][0], ws['channels'][-1]
+
+    renamed = ws.rename(channels={channel['name']: 'renamed'})
+    assert renamed['channels'][0] is not channel
+    assert renamed['channels'][0]['samples'][0] is channel['samples'][0]
+    assert renamed['channels'][-1] is other_channel
+    # the observations and measurements are copies
+    assert renamed['observations'][-1] is not ws['observations'][-1]
+    assert renamed['measurements'][0] is not ws['measurements'][0]
+
+    sample = channel['samples'][0]
+    pruned = ws.prune(samples=[sample['name']])
+    assert pruned['channels'][0] is not channel
+    assert all(
+        pruned_sample is original_sample
+        for pruned_sample, original_sample in zip(
+            pruned['channels'][0]['samples'], channel['samples'][1:]
+        )
+    )
+
+    combined = pyhf.Workspace.combine(
+        ws.prune(channels=[other_channel['name']]),
+        renamed.prune(channels=[other_channel['name']]),
+        join='outer',
+    )
+    assert combined['channels'][0] is channel
+    assert combined['channels'][-1] is renamed['channels'][0]